@@ -0,0 +1,85 @@
+import collections
+import threading
+import cv2
+
+from color_stats import color_counts, xmost_common_color
+from ocr import binarize
+
+# Computed / reused artifacts of every context of the process (see analysis_stats)
+_totals = {'computed': collections.Counter(), 'hits': collections.Counter()}
+_totals_lock = threading.Lock()
+
+
+class AnalysisContext:
+    """
+    Images and statistics derived from one crop (text or button image) by the steps of its analysis (text color, text
+    position, button cropping, OCR): each one is computed on first use and kept for the next steps. computed / hits
+    count, per artifact, the times it was computed and reused
+    """
+
+    __slots__ = ('image', 'artifacts', 'computed', 'hits')
+
+    def __init__(self, image):
+        self.image = image
+        self.artifacts = {}
+        self.computed = collections.Counter()
+        self.hits = collections.Counter()
+
+    def get(self, name, compute):
+        """
+        :param name: artifact name
+        :param compute: function computing it, called on first use only
+        :return: artifact
+        """
+
+        if name in self.artifacts:
+            counter, total = self.hits, 'hits'
+        else:
+            self.artifacts[name] = compute()
+            counter, total = self.computed, 'computed'
+
+        counter[name] += 1
+        with _totals_lock:
+            _totals[total][name] += 1
+
+        return self.artifacts[name]
+
+    @property
+    def gray(self):
+        return self.get('gray', lambda: cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY))
+
+    @property
+    def binary(self):
+        """ Binary image of ocr.preprocessing (black text on white) """
+        return self.get('binary', lambda: binarize(self.gray))
+
+    @property
+    def inverted(self):
+        """ White text on black """
+        return self.get('inverted', lambda: 255 - self.binary)
+
+    @property
+    def row_histogram(self):
+        """ Mean of each row of the inverted binary image (uint8) """
+        return self.get('row_histogram', lambda: cv2.reduce(self.inverted, 1, cv2.REDUCE_AVG).reshape(-1))
+
+    @property
+    def column_histogram(self):
+        """ Mean of each column of the inverted binary image (uint8) """
+        return self.get('column_histogram', lambda: cv2.reduce(self.inverted, 0, cv2.REDUCE_AVG).reshape(-1))
+
+    @property
+    def color_counts(self):
+        """ color_stats.color_counts of the whole image """
+        return self.get('color_counts', lambda: color_counts(self.image))
+
+    def xmost_common_color(self, x):
+        """ :return: x-th most common (b, g, r) color of the image (see color_stats.xmost_common_color) """
+        return xmost_common_color(self.image, x, counted=self.color_counts)
+
+
+def analysis_stats():
+    """ :return: dict of the computed / reused counts per artifact of every context of this process """
+
+    with _totals_lock:
+        return {total: dict(counter) for total, counter in _totals.items()}
@@ -0,0 +1,182 @@
+import collections
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+# The disk tier directory is scanned (to evict files and to count the files written by the other workers) at least
+# every DISK_SCAN_INTERVAL writes of the process, and whenever its estimated size exceeds the limit
+DISK_SCAN_INTERVAL = 256
+
+# Once over its limit, the disk tier is evicted down to this fraction of it, so that the next scans are not triggered
+# by every write
+DISK_EVICTION_TARGET = .9
+
+
+class ResultCache:
+    """
+    Two tiers cache: an in-memory LRU of the last max_items results of the process, and optionally an on-disk tier
+    (one pickle file per key) shared by every worker using the same directory, evicting the least recently used
+    files once it exceeds max_disk_bytes
+    """
+
+    def __init__(self, max_items=64, directory=None, max_disk_bytes=256 * 1024 * 1024):
+        self.max_items = max_items
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = collections.Counter(memory_hits=0, disk_hits=0, misses=0)
+
+        # Estimated size of the disk tier (None = unknown, scanned on next write), and writes since the last scan
+        self.disk_bytes = None
+        self.writes_since_scan = 0
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, key):
+        """
+        :param key: hex string
+        :return: cached value, None if missing from both tiers
+        """
+
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.counters['memory_hits'] += 1
+                return self.memory[key]
+
+        value = self.read_from_disk(key)
+
+        with self.lock:
+            if value is None:
+                self.counters['misses'] += 1
+                return None
+
+            self.counters['disk_hits'] += 1
+            self.store_in_memory(key, value)
+
+        return value
+
+    def put(self, key, value):
+
+        with self.lock:
+            self.store_in_memory(key, value)
+
+        self.write_to_disk(key, value)
+
+    def stats(self):
+        """ :return: dict of hit/miss counters and hit rate """
+
+        with self.lock:
+            stats = dict(self.counters)
+
+        lookups = sum(stats.values())
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.
+
+        return stats
+
+    def store_in_memory(self, key, value):
+
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+
+        while len(self.memory) > self.max_items:
+            self.memory.popitem(last=False)
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def read_from_disk(self, key):
+
+        if not self.directory:
+            return None
+
+        try:
+            with open(self.path(key), 'rb') as file:
+                value = pickle.load(file)
+            # Modification time = last use, for the eviction
+            os.utime(self.path(key))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        return value
+
+    def write_to_disk(self, key, value):
+
+        if not self.directory:
+            return
+
+        # Written to a temporary file then renamed, so that other workers never read a partial file
+        temporary_path = None
+        try:
+            fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+                size = file.tell()
+            os.replace(temporary_path, self.path(key))
+        except OSError:
+            # Full or read-only disk: the result is only kept in memory
+            if temporary_path:
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    pass
+            return
+
+        with self.lock:
+            self.writes_since_scan += 1
+            if self.disk_bytes is not None:
+                self.disk_bytes += size
+            scan = self.disk_bytes is None or self.disk_bytes > self.max_disk_bytes or \
+                self.writes_since_scan >= DISK_SCAN_INTERVAL
+            if scan:
+                self.writes_since_scan = 0
+
+        if scan:
+            self.evict_from_disk()
+
+    def evict_from_disk(self):
+        """ Remove the least recently used files, down to DISK_EVICTION_TARGET, if the disk tier exceeds
+        max_disk_bytes """
+
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        target_size = DISK_EVICTION_TARGET * self.max_disk_bytes if total_size > self.max_disk_bytes else total_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
+
+        with self.lock:
+            self.disk_bytes = total_size
+
+
+def hash_key(*parts):
+    """
+    :param parts: bytes or objects (converted with str) the key depends on
+    :return: sha1 hex digest of all parts
+    """
+
+    sha1 = hashlib.sha1()
+
+    for part in parts:
+        sha1.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        sha1.update(b'\0')
+
+    return sha1.hexdigest()
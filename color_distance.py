@@ -0,0 +1,126 @@
+import os
+import tempfile
+import threading
+import numpy as np
+
+# sRGB -> CIELAB table: colors are quantized to LUT_BITS bits per channel (2 ** LUT_BITS levels), each level standing
+# for the center of its range (at most ~1 deltaE from the exact conversion with 7 bits). The table is computed once,
+# saved in LUT_PATH and memory-mapped by every worker
+LUT_BITS = 7
+LUT_PATH = os.environ.get('UI_DETECTOR_LAB_LUT_PATH', os.path.join('cache', 'lab_lut_%d.npy' % LUT_BITS))
+
+# Scale of the color differences compared to the thresholds of image_utils (similar_colors, liken_colors...). Those
+# thresholds were set on skimage rgb2lab / deltaE_cie76 * 1e5 of int colors, which skimage read as int64 images
+# (scaled to ~1e-19): the differences were float rounding noise (< 1e-8), so every pair of colors was similar. 0 keeps
+# these decisions, thresholds in CIE76 deltaE units (scale 1) have to be calibrated on real crops first
+DELTA_E_SCALE = 0
+
+# D65 reference white, 2° observer
+WHITE_XYZ = np.array([0.95047, 1., 1.08883])
+RGB_TO_XYZ = np.array([[0.412453, 0.357580, 0.180423],
+                       [0.212671, 0.715160, 0.072169],
+                       [0.019334, 0.119193, 0.950227]])
+
+_lut = None
+_lut_lock = threading.Lock()
+
+
+def srgb_to_lab(rgb):
+    """
+    Exact conversion, used to build the table
+    :param rgb: array (..., 3) of RGB colors in [0, 255]
+    :return: array (..., 3) of CIELAB colors
+    """
+
+    rgb = np.asarray(rgb, dtype=np.float64) / 255
+    linear = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+
+    xyz = linear @ RGB_TO_XYZ.T / WHITE_XYZ
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+
+    return np.stack([116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+
+def build_lab_lut(bits=LUT_BITS):
+    """ :return: float32 array (2 ** (3 * bits), 3), CIELAB color of each quantized color (see quantize) """
+
+    step = 1 << (8 - bits)
+    levels = np.arange(1 << bits) * step + (step - 1) / 2
+    r, g, b = np.meshgrid(levels, levels, levels, indexing='ij')
+
+    return srgb_to_lab(np.stack([r, g, b], axis=-1)).astype(np.float32).reshape(-1, 3)
+
+
+def get_lab_lut():
+    """ Return the sRGB -> CIELAB table of the current (worker) process, building and saving it if needed """
+
+    global _lut
+
+    with _lut_lock:
+        if _lut is None:
+            try:
+                _lut = np.load(LUT_PATH, mmap_mode='r')
+            except (OSError, ValueError):
+                _lut = None
+
+            if _lut is None or _lut.shape != (1 << (3 * LUT_BITS), 3):
+                lut = build_lab_lut()
+                try:
+                    # Written to a temporary file then renamed, so that other workers never map a partial table
+                    directory = os.path.dirname(LUT_PATH) or '.'
+                    os.makedirs(directory, exist_ok=True)
+                    fd, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                    with os.fdopen(fd, 'wb') as file:
+                        np.save(file, lut)
+                    os.replace(temporary_path, LUT_PATH)
+                    _lut = np.load(LUT_PATH, mmap_mode='r')
+                except OSError:
+                    _lut = lut
+
+            # Plain array over the mapping, indexing a numpy.memmap is slower
+            _lut = np.asarray(_lut)
+
+    return _lut
+
+
+def quantize(rgb):
+    """
+    :param rgb: array (..., 3) of RGB colors in [0, 255]
+    :return: array (...) of their indices in the table
+    """
+
+    q = np.asarray(rgb, dtype=np.uint8) >> (8 - LUT_BITS)
+
+    return (q[..., 0].astype(np.intp) << (2 * LUT_BITS)) | (q[..., 1].astype(np.intp) << LUT_BITS) | q[..., 2]
+
+
+def rgb_to_lab(rgb):
+    """
+    :param rgb: array (..., 3) of RGB colors in [0, 255]
+    :return: float32 array (..., 3) of their CIELAB colors, read in the table
+    """
+
+    return get_lab_lut()[quantize(rgb)]
+
+
+def delta_e(rgb1, rgb2):
+    """
+    CIE76 color difference of arrays of colors (broadcast against each other). Colors quantized to the same level of
+    the table are not told apart
+    :param rgb1: array (..., 3) of RGB colors in [0, 255]
+    :param rgb2: same
+    :return: array (...) of differences
+    """
+
+    return np.linalg.norm(rgb_to_lab(rgb1) - rgb_to_lab(rgb2), axis=-1)
+
+
+def hex_to_rgb(hex_color):
+    """
+    :param hex_color: color in '#rrggbb' string format
+    :return: (r, g, b) tuple of ints
+    """
+
+    hex_color = hex_color.lstrip('#')
+
+    return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
@@ -0,0 +1,118 @@
+import numpy as np
+
+# Regions of more pixels than this are sampled (one pixel out of n) by the functions asked to
+SAMPLE_MAX_PIXELS = 1 << 16
+
+
+def pack_colors(pixels):
+    """
+    :param pixels: BGR image, or array / list of BGR pixels
+    :return: flat uint32 array of the pixels colors packed as b << 16 | g << 8 | r (keys order = (b, g, r) order)
+    """
+
+    pixels = np.asarray(pixels, dtype=np.uint8).reshape(-1, 3)
+
+    keys = pixels[:, 0].astype(np.uint32) << 16
+    keys |= pixels[:, 1].astype(np.uint32) << 8
+    keys |= pixels[:, 2]
+
+    return keys
+
+
+def unpack_color(key):
+    """ :return: (b, g, r) color of a key returned by pack_colors """
+
+    key = int(key)
+
+    return key >> 16, (key >> 8) & 255, key & 255
+
+
+def color_counts(pixels, max_pixels=None):
+    """
+    :param pixels: BGR image, or array / list of BGR pixels
+    :param max_pixels: if there are more pixels, only one pixel out of len(pixels) / max_pixels is counted (None = all)
+    :return: sorted keys (see pack_colors) of the colors present, and their number of pixels
+    """
+
+    pixels = np.asarray(pixels, dtype=np.uint8).reshape(-1, 3)
+
+    if max_pixels and len(pixels) > max_pixels:
+        pixels = pixels[::-(-len(pixels) // max_pixels)]
+
+    # np.unique without its overhead, most regions are thin strips of a few hundred pixels
+    keys = np.sort(pack_colors(pixels))
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+
+    return keys[starts], np.diff(np.append(starts, len(keys)))
+
+
+def top_colors(pixels, k=1, max_pixels=None, counted=None):
+    """
+    :param pixels: BGR image, or array / list of BGR pixels
+    :param k: number of colors
+    :param max_pixels: see color_counts
+    :param counted: color_counts of pixels, if already computed (pixels and max_pixels are then ignored)
+    :return: list of the (at most) k most common (b, g, r) colors, most common first, ties in (b, g, r) order
+    """
+
+    keys, counts = counted if counted is not None else color_counts(pixels, max_pixels)
+
+    # First maximum = smallest key of the most common colors
+    if k == 1 and len(keys):
+        return [unpack_color(keys[np.argmax(counts)])]
+
+    if len(keys) > k:
+        # Colors at least as common as the k-th one, ties included, without sorting all of them
+        kth_count = np.partition(counts, len(counts) - k)[len(counts) - k]
+        candidates = np.flatnonzero(counts >= kth_count)
+        keys, counts = keys[candidates], counts[candidates]
+
+    order = np.lexsort((keys, -counts))[:k]
+
+    return [unpack_color(key) for key in keys[order]]
+
+
+def xmost_common_color(pixels, x, max_pixels=None, counted=None):
+    """
+    :param pixels: BGR image, or array / list of BGR pixels
+    :param x: rank of the color (1 = most common)
+    :param max_pixels: see color_counts
+    :param counted: see top_colors
+    :return: x-th most common (b, g, r) color, the most common one if there are less than x colors
+    """
+
+    colors = top_colors(pixels, x, max_pixels, counted)
+
+    return colors[x - 1] if len(colors) >= x else colors[0]
+
+
+def dominant_colors(image, axis=1):
+    """
+    Most common color of every row (axis=1) or column (axis=0) of an image, all computed at once
+    :param image: BGR image
+    :param axis: 1 for the rows, 0 for the columns
+    :return: uint8 array (rows or columns, 3) of their most common (b, g, r) colors, ties in (b, g, r) order
+    """
+
+    keys = pack_colors(image).reshape(image.shape[:2])
+    if axis == 0:
+        keys = keys.T
+
+    nb_of_lines, length = keys.shape
+    keys = np.sort(keys, axis=1)
+
+    # Runs of equal keys of each sorted line, the first key of a line always starts a run
+    starts = np.ones((nb_of_lines, length), dtype=bool)
+    starts[:, 1:] = keys[:, 1:] != keys[:, :-1]
+    starts = np.flatnonzero(starts)
+    run_keys = keys.reshape(-1)[starts]
+    run_lines = starts // length
+    run_counts = np.diff(np.append(starts, keys.size))
+
+    # By line then by decreasing count, stable so that the first run of a line is its smallest most common key
+    order = np.lexsort((-run_counts, run_lines))
+    firsts = order[np.flatnonzero(np.concatenate(([True], np.diff(run_lines[order]) != 0)))]
+
+    colors = run_keys[firsts]
+
+    return np.stack([colors >> 16, (colors >> 8) & 255, colors & 255], axis=-1).astype(np.uint8)
@@ -1,21 +1,23 @@
+import functools
+import os
+from base64 import b64encode
 
 icon_types = ["search", "login", "lock", "chat", "phone", "home", "help", "down_arrow", "right_arrow", "menu", "plus", "mail", "settings"]
 
-b64_search = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4NGRBS3YLOAAAm0klEQVR42u3deZgV1Zk/8G/fpoGG7gZkE1DoJiqRXTsSBFwhBiVojIH8JgtxScgko2EmJiF5YmaIvyyomZmHSWJCjJMZJu4xxsF9QVS2gCiCgAtL0yCLdDfN0k3T250/mq2hb/e9/b6n3qpT3089yaPP462u76lT7z1Vt+pUFig8uqE3eh5feqE3ugHojizkIA9AV3Q8+u91OASgCrUA9gGoRRUaUI5ylKMM5ShDGcpRjmrrSBRuWdYbEGNdUIQiFKIQRShEf/RCB/W/UY1ybMNWlKAEW1GC7ai3jk1hwgIQpE4YhhE4/+gh38dgC+qxAyUowWasx1psQdK6ScgWC4B7/TEUw1CMoRiOTtYb00wtNmE1VmM91uIj640hCywArgzEBIzFKIxAD+tNSUsp1uFNLMcy7LfeFAoOC4CubHwc4zEBE1BkvSnttgVLsQRLsYEnCP5jAdCRh3EYhwn4JPKsN0XNTizFUizFW2iw3hRyhQVAajAmYSo+FbKze00VeBkv4Wl8aL0hpI8FoL26YBym4joMst6QwGzAQryEV1FnvSGkhwUgc8MwBZMxATnWG2JiH17Ec3iavxr4gQUgE0WYjhkYar0ZIdCI5XgMD2OP9YaQDAtAegbhs5iG8dabETINWIHH8BBHA9HFAtCWgbge0zCOLZVSA1ZgAR7h/QPkl3zMxAokuaS11OBxXI2E9U4j0lCM+ThoflBFb/kQc1FovfOI2q8bZuJN8wMpyksDXsS0mP5GQpFWjPk4ZH4A+bHswlx8zHqHEqWnM76G9eYHjW9LA57BROtdS9S6bpiFHeYHi7/LGszgCQGF02DM46A/gGUX5kTksWiKjWIsQL35oRGf5QDmxejJCQqxLFyLZeYHRByXWjyAYda7n+JtElaaHwhxXhrwKIZYdwKKpwlYZH4AcGkqAudYdwaKl7FYaN7xuZxYarEgwhOnUaSMxKPmHZ7L6csRzEd/685BfjsXT6DRvKtzSbVU4efIt+4k5Kc8zEGNeRfn0tayF7OQbd1ZyC8JzMBu867NJd1lNS6x7jLkj8vwlnmX5pLpspAPEwfLz3luCnEPPm+9ESpqUY7DACqRbPZGYKAA2chGAYBcdEYWeqLAemNVVOMe3M23GgfFvwKQix/hdnS23oyMHcJWlGDH0dd7l6Mce1GGgxmsIafZi8V7oheKUIgBEZylZzu+h0esNyIefCsAV2J+RG4wacRmbDrpxd1ljv5ORww8/gryIpyP7tbB0/Q0voVS643wn08FoBvuxK0h/76rxHqsxwasxluoMtmC8L6r+FTVuBO/5GvJ3PKnANyAX6Gf9UakUIZlWI41WBeq12t1wjCMQDEmYGRof4Jbhq9jg/VGUNidicfMr1+3tGzGAsxCcejLbFdMwGwsRIV5i52+1GJuyEcqZCoLM7HPvJs2X97GPbgWva2bJmPZGI1b8WdUmrdg8+UdXGzdNBROA/GKefc8sVTiz7gFA6wbRawDLsMv8FaIbqBuwL9F8JcdcuzzKDfvmk3LZszDJHS0bhBlfTANC0JzYvAORlk3CIVHARaYd8kkGrEUszz4zm9NB0zCfSgzb+skDuO20F9PoUCMwQfm3XE95sRo5vtsTMA8fGTe6i/w8eG4y8Zs1Jof+udaN4NR20/CAuw3bf2PMNW6GchOEZYadr4y/BvOt24Cc53xZbxqeImwEb9BrnUjkIUvmH37NGIR/o6/SJ9kCH5peEqwHkOtG4CC1QFzjTpbBeZzMusWdcQ0LDR6u8JBTLeOT8Hpi8Um3WwJpnn38562wbjb5OahRtyNDtbhKQjFKAm8ezVgIcZbB4+MPMwy2EdJvIozraOTazNxJOBuVYMFfHlFxhKYiuWBl4AdGGsdnNzphPsC7lB7MAc9rWNH2AQsDPgXghrMsg5NbgzC6oC/Tb7FK/0KhuOxgIvAfdxv/hkT6Ky+ezGbvy4rGo5HAy0CyyP4/CW14npUBdZ5yjDHk0k1wyXYNzJt4nUbf8xCQ0Dd5gDmopt1XI9djJcCKwHluNQ6Lsll49cBdZgjuBs9rOPGwESsCWiPHsY067Ak0xX/G1BneZG3kwYmuPc0NWKOdVhqv354I5BushFXW0eNneDe1Hg/cqzDUnsMw7YAukcZvsVbSI0MwVOBlIBnkWcdlTL1iQDmnanDPJ71G5uMjQGUgGWReQkKAQAmBPBAyRpcZB2TAORgdgAnA2/xzoDouBwHHHeHaszhmWGInBvAjM4bcZZ1TErHFBx23BVe400ioZOFmc7L/tYYzdsYWdMdz/FXiVkhf2dgfPXHE45LwE5O5hJuNzqeUeZxPjEecl/CXqc9YDdGWEekVP7e6S2/BzDTOiCloS+edloC9nHOgHC62enzYitjOnl3FGVhltPfBSrxCeuIdKoZDr/96zGX1/wjZhjedlgC9vJaQLh8DnXOdnYJnwqLpM6Y53BMuAcftw5Ix3zG4ZX//+Gz/RH2Gexx1jO2YaB1PAKAK5397l/Dy36R1weLnJWAD/huQXtjcdDR7t2OT1qHIwUuXwLzLvpax4u30c7eOL+Yu9YjX3Q2JdwaPg5mZ6ijmz4acReyrcORqtHY4qgELOH0rzZ6Y5OTHXqQE0F5qcDZjcIL+XURvK5Y5WRnvs9XdnsrgZ86+mHwX62jxU0Cf3GyIzkfvO++6ujVcLdZB4uXeU524p95NhcDV2Kfg75Tj+usg8XHPzo5/OfxMd+YGObk3cNV/Nk4GFMcPPJbj29ax6IAnenkCtJODLIO5r9iHFLfcQcxxToWBawrnnRQAtZz8lC3BmKX+k7bhVHWschANn7roAS8wJ8E3emEleo7bBuf84+xOx2UgLusQ/nrPvWdtRWDrUORqdnqfaoR061D+Wmm+q7aiAHWocjcP6jfHHSQ04XoG6M+ydObvOmHAAAz1WeTeo8vidfVE1uVd9Eq9LQORaHxd+ozSv0VWdah/NEBLyvvnsV83SM18zn1WaV+YB3JH/co75oVyLeORKGjPa9kAyZbR/LD55Uv0rzJmzWoRTcp97S9nDVQ7izlOX/e40w/lNI/KI81X+dtQTIJ5be+buI0jtQq7QfNfmQdKNruUN0Z21FkHYhC7/+r9rk6vkis/YpVr8zyVQ6UnrtVS8BmXnJunzx8oLgb9mOkdSCKiCz8t2oJ+E/rQNF0v+pA7NPWcShCcvCiagn4f9aBoud61R3A6T4oMwVYq9j/9vEHwcwMQJli8//MOg5FUCF2K/bB1/iDYPqy8IJi0z/Iu7KpXS5SfZ/Q7dZxouMm1crbyToORZbm/JNV+Jh1nGjopfjCr0185JdENG8MWsSxaDoeUWvwA3zLD4lpzkN1k3WY8Jui1tiNuME6DHlAcybKcj6J0roCbFdr7J9ahyFPnI2P1Hrlw9Zhwu1etYZ+iT+7kJorFecK+Kx1mPAaqzY3Wwl6WYchr+jNHryT81G0rBPWKzXxYRRbhyHPZOFRtRLwG+sw4fTPag18o3UU8lA+Nir1zwaMsQ4TPmepvfPvj9ZRyFPDcVipjy7jHQGnekCpaTejwDoKeevbaqPUL1lHCZexStMx1uFi6yjksSwsVCoAO9DVOkx4ZOFvSs36Y+so5Lneau+nvtM6Snh8ValJl/C3f3JustJotRqF1lHCIQ8fqjRoJRuUAvFrpS+sR6yDhMPPlJqTl1UoGJ3VZgu61DqKvUKln1Yesg5CMTJaab7q1UhYR7H2kEpD7kUf6yAUKz9VGgN81TqIreFKd/9/2ToIxUwnbFDpuVvR0TqKpSdUGvFZ6xgUQxcrfXnNtA5ip1jlB5UqDLYOQrH0W5UC8CFyrYNYeUalAb9tHYNiSmv6mtusg9i4WKXx/sabf8iMzgR2u9DFOoiFlxSa7giGW8egWHtMpQTE8J0Bl6s03F3WMSjm+uOgQj/+CHnWQeQyG4r/l8KNu3swHUesY1OsHUQWJorX0hVVeN06SpCuUvn+v9k6BhE6Y4tCX65AN+sgQVqk0GRv8jZKCoUbVL7OvmcdIzjFKg12iXUMoqNeVOjPO+JzT+CDCs3Fh38oPEapvER0hnWMYJyl8CRVNQZZxyA6yXyFArA2HlOF/lKhqX5iHYKomT6oVOjXn7KO4V6BQkPtRb51DKJT3KFQAJ63DuHe9xSa6bvWIYhOk4c9Cn17tHUMt3KwTdxEMb1zmkLv+woF4L+tQ7j1ZYUmiumzUxR6uQrT29bibOsYLq0SN1ApOluHIEphlsIX3C+sQ7ijcQPQN6xDEKXUWWGGgN3IsY7hyu/EjVMSn7ulKJK+qfAld711CDe6Yr+4aW60DkHUqhyFR4OesQ7hxs3ihtmGDtYhiNogHwM0+Hmf6wpxw/yTdQSiNnXBXnFPn2MdQt8IcaPsj9cT0xRZPxH39e3+zXT5H+JGmWsdgSgtfVAt7u1TrEPoykW5sEE8v0GCvCJ/NvCv1hF0fUXcIJ7fIkleOU/81qA69LcOoUk+Bdgo6whEGXhS3ONnW0fQc6Z4vpQYPCZJXrlUXADetI6g5zZxY3h2SYRi4A1xrz/XOkJmUs/R+wXhmnfgOetwRBm6T7wG6XETEmeJL4j8i3UEoozl4YCw36+zjqDjO8JmaMBA6whE7XC/+CRgqHWETKQ6BZguXO+zKLWORtQO8pMA6bETAgPRKKyC11lHIGqnNcK+/651ADnpPGm7/J0egbz3bfFJwEjrCOlr+RRAOoi5H3XWwYjaaQGqhWuI+C8BReILgEXWEYgE/iQ8At6zDpC+lkYA1wjXuRRbrWMRCfxJ+PnzcI51hHS1VACuFq7zUetQRCIvYa9wDZOtI7RfJxwUngB49UQUxdLvhScBT1sHaL+rhNEXWQcgEpsoPAqqkWsdIT2nnwJIBy88AaDoW4w9os/n4lLrCOk5vQDIrgA04C/WkYjE5P04olcBCoVDnxesAxCpuEx4JETkfsBTRwDSXwAesQ5EpOJ1fCj6/BB8zDpCOk4tALKBS71v0yJSbDXiCeEaPm0dIXMdhT8BLrEOQKRmsvAkYKF1gHQ0HwFchDzR2jx9PxrF0mLhMwGXRuFFIc0LwHjh2p61jkOkpgavij5fgGHWEdqmWQB2Y411HCJF0lktpV+oATi5AGThYtG6nkPSOg6RIumINgIF4GRDhBc9PJgKiaiZD0RHRASeij15BCCrVw14yToMkTLZSUAhzrIO0Ba9ArACFdZhiJRJTwLGWQdoy8kFQHYFgDcBk38W44jo86G/CnCiAPTCx0Vret06CpG6auHb/iJUAMYhS7CeeqyyjkLkgOzu1tHItw7QuhMF4JOi9azBIesoRA4sFX06G8XWAVp3ogCMFq2HTwGQn5YK724ZZR2gdScKgOxlBrI6SRRWZXhf9PkR1gFad6wA9BD+YrncOgiRI7Ivt5C/JehYAZBt5lbh5AlE4SUrAMPD/UygTgHgCQD5S9a7c8M9M9CxAiA7U1lhHYPImfdRLvp8qE8CdEYAa6xjEDmTxNuiz4f6MmDi6P9Lpi5IYp11DCKH1oo+HYERwMdEU4GV4IB1DCKHZF9wESgAsk2U1UeisJP18CIUWAdIrakADBGtgycA5Lf1aBB8OgvnWgdIrakAFInWwREA+e0wNok+Lzu+nGIBIGqbrI8XWm9+agnxBkqrI1H4yU5zQz4CyMbZgjVsEJ0fEUWB1wVgADoK1vCBdQQi52S9vNB681NLiDevxDoCkXMlok8XimbbcioB6QClxDoCkXNV2Cv4dC76WgdIRT4CiMDLD4jEZP280HrzU+EpAFE6SkSfDu1lQOkpQBKl1hGIAiAbAYS6AAwQfH4naqwjEAWgRPTp/tabn0oCQE/B50usAxAFQjYCkBxjTiWQjW6Cz/MSIMWDrKf3st78VBI4o9n7ATPFyUApHnaIPh3iEYCsNpVZByAKRDUOCz4d4hGAbNNk0yUSRYfkyy7EBUA2OOEIgOJC8mWXi1zrzW8ZTwGI0iPr6yEdA0hHADwFoLiQ9fWQXgbkKQBRejwdAUg2rAGV1gGIAuLpCCBf8OlKNFoHIAqIbAQQ0qnBE6LZgHgFgOKjQvTpTtab37KEaMOqrTefKDCSG4Eg+qJ1SFYAaq03nygwR0SfDu0IQFKZZE1CFCWy3h7aEYBkwzgCoPiQ9fbQjgB4CkCUDo4ATsNTAIoPT68BcARAlA5Zb+cIgCjSOAI4DUcAFB+ejgAkE4LxtaAUH/WiT+dYb37LEqjzLxSRA7Lv8JCeLidEA5uQntcQOSDr7SE9XU6IKlNIz2uIHJD19tAWAI4AiNLBEcBpOAKg+PC0AHAEQJQOngKchiMAig9PRwA8BSBKh6wASH5ud0hWAHgKQPEh+7oLbQGQDE1COtEhkQOy3l5jvfktS4g2LKRTHRM5IOvtldab37KEaK7TPHS2DkAUENmrPWRzCjuT8PN1B0TqWABaENIXHhGpk33ZhbYAyN53whEAxQVHAC3gCIDiwtOLgBwBEKVD8mV3MLx3Anr50mMiZQn0EHw6pCcA8lOA3tYBiAJxBrIFn6603vxUEjgouhl4kHUAokDIenpo36OdEG5coXUAokAUiT693XrzU0kAoqsAhdYBiAJRKPp0qAtAqeDzBTjDOgJRAGQjAMkx5lQCwFbRGmQNQxQNhaJPh3oEUCJaQ6F1BKIAeDwCKBGtgSMA8l+W8FeAUI8AZKcAhdYRiJzriy6CT+/DQesAqfAaAFHbCkWfDu33f1MBqBTdp3S+dQQi54aKPr3NevNTa3o3cIlgDYWcGZC8N0L06dBeAtQoAFkYbh2CyLGRok+/Z735qTUVANlVAFnjEIWfbASwwXrzU2sqAFtE65A1DlHYnSl86nWjdYDUmgrAO6J1cARAfhsl+vQB7LQOkFpTAVgrWsdIZFnHIHJI9hW33nrzW9NUACqwQ7COAs4KQF6TneSG+ATgWAGQjwGI/MUC0IYLrWMQOZMrvA0oEgVgnWgt461jEDkzRvhe4BD/CKg1AvgkOlgHIXJknOjTh8J8I/CJAvCuaGrQfF4FIG9NEH36DTRaB2jNsQJQLzxT4UkA+SkLY0WfX2kdoHWJ4/8kOwlgASA/DRPOernKOkDrThSAN0XrkZ0nEYWV9KvtDesArTtRAJaJ1nM2BlpHIXJAVgA+Ek6459yJAvAWDonWxJMA8pHsEuDfrDe/LScKQL3wbOVy6yhE6gYKp7wL+QnAyQUAWCpa09XWUYjUSXt1yH8D0CwAZwtvmCQKn8miTyfD/htAcwWoR1Kw3G4dgEhVDipFR0SobwJucvII4IBwg3kSQH6ZgG6izy+yDtC2RLN/WyJa1yXIt45DpEj6lfaKdYC2NS8AsqsAHXGFdRwiRbIC0IhXrQO0TbMAANdYxyFScxaGiT6/FmXWEdrWvACUYJNobSwA5I/JwrkuX7YOkI7EKf/+rGhtZ2O0dSAiJdcJP7/YOkB7XCP62SOJn1sHIFLRHUdER0JdNF+Zl4tqUezNnCKcvHCz8KtQ9nBdYE49BTgsvHI5GMXWkYgUTBN+PgL3AACnFwDgOeEap1tHIhLrhYnCNfyvdYT2Ok849CnlSQBF3kzhUbC7ha/WyNgkDC+bQ43I3svCY2C+dYB0tVSneBJA8dYblwrXENkTAACYIqx+26M8/CHCt4RHwCHkWkeQyMVBYQNcZR2BSGClsP//xTpA+lr6rj6MhcK1ft06FlG7jcRFwjU8aR1B6jphBazFmdYRiNrpN8LeX49e1hGkOglnQkni+9YRiNolF/uEff816wiZaPly3RHxIGYm7wagSJqO7sI1PGodQYP0l4AkpwmnSHpd2O/r0Nc6goYclAsb4gHrCEQZG4JGYb9/2jpCZlL9Yl+HvwrXfEP0L4VQ7MhPXb354rtKfBLAacIpWrpgr7DPH0JX6xBaOmCPsDG2I8c6BFEGpHcAJvEn6wiapL+HJvFF6whEaUvgfXGP92pWzJHi5nibPwZSZHxO3N8/8m3Mu0rcJFdaRyBK01Jxb/+VdQRt0mkRIvejCMXWGHFfT/o3HV4eDgibpBEjrUMQpeFx8eG/wjqCC38QN8v91hGI2jRY+GbsJJK40TqEC/KBUQ36W4cgasO94n5eEe1JQFJ7S9w0/2EdgahVA1Ej7uX/bh3ClVvFTXMEhdYhiFrxe3EfT2KodQhXuqFK3Di/sw5BlFKh8CVgSSSj8SLQ9pJfCKzFYOsQRCn8l8L3v9czYQ9Bg7iB/mgdgqhF56JO3Lt3+XYH4KmeFjdRPT5uHYKoBQ8qfP/fYR3CtSsVGsmb56TJI8MURrdVcZj5YrW4mRow3DoE0Snk9/8lMc86RBC+qNBQL1mHIGpmvHgCsCTq43GBuwNKFErAZ6xjEB2XUHja1bMpQFrzHYXG2oRO1jGIjvqaQo9O4gLrGEHJF78wIQnOE0hhkY+dCv35eesYQbpbocEq0cc6BhF0enMSn7KOEaS+OKTQZPOtYxDhHIXHf5JYbR0jaHcpNFqDf/OmUOQ8qfL9f611jKD1xH6FZlvMqULJlPydF0kk8bc49uM7VZruFusYFGNdsEmlF19lHcRCN/E7A5NIohIDrINQbN2jcvgvsY5h5Q6V5nvMOgbF1CjUqvTgy62DWMkTvzKsabneOgjFUAeFp1qSiNnv/6f6nkoT7kR36yAUOz9Q6btJjLUOYikXO1QakROFUbCKVO5kSeJJ6yDWvqnSjI241DoIxUgWFqn023qMsI5irQPWqTTl+8izjkKxofO1xZErAJ05gpJI4j7rIBQT5yvMbp1EEvvR1zpKOPxVqQR4PZ8qhUQOVir1Vz7PetRglccpkqjAQOso5D2dm384o0UzGo8GJZHEYiSso5DXLlOY+rNpid3jP63RmVIhiSS+ax2FPNYD25T6qdfv/2mPm5UathYXWUchbz2i1EvrMdI6StgklG6sTGIDfxAkJ2Yq9dAkfmsdJYzGqZ1dPWwdhTz0CRxW6p+70MM6TDjdq1Zhv2MdhTxzBrao9U7+XJ1CAUqVmrguvo9YkgMJPKd2+D9jHSbMrlFr5j04yzoMeeMXav2yCkXWYcLtYbWmXsEbLUjFtQqv/Tq2/KN1mLDrhb1qjX2vdRjywHmoVOuRq5BtHSf8blRr7iRutA5DEZePd9R6Yx1GW8eJgiy8oNbkR3gxkAQ64FnFr6O7rONERSEOqjV6JYZbx6HI+o3i4b8ena3jRMe3FRt+C5+6pnaZrdgLj3D4n4ksPKXY+KvQ1ToQRc40tTtTk0hitnWcqOmD3YrNv5BXXykjY5Rm/WlalrD/Ze5qxV9fk/hX6zgUIYOV3ljRtBzCOdaBoknzEkwSs6zjUET0wfuqPY/vr2ynzliruBsa8XXrQBQB3dQeTG9aYj/zv8RopdkCm5Z6fME6EIVcPlaoHv670Mc6UrR9V3V31HImNmpFLl5R7W8NmGQdKeoSeFF1lxzmLqEUOuIZ1b6WxI+sI/mgD7ar7pQqvkaMWpCt+CRq0/I056jWMUb1SkAS+zlxKJ0iC39QPvxL0cs6lD++obxz9uFi60gUItn4T+UeVotx1qH8ol2fD2GidSQKiY54TLl3JXGbdSjfdFZ7I9uxpQqftg5FIdBJ7d2UJ5ZHrUP5aJDiXEFNSw0+ax2KjOVhkfrhvw751rH8NBH1yruqHl+1DkWGumOp+uFfxjv/3fmB+u5qxK3WocjIGeqnlUnU4grrWD7LwgMOSgCf1Y6jImxU70t88Me5jnjZwW67HznWwShQY1Tnmzi28KHzAJyBdx3suhfQzToYBeazqtN9HFue47QfwShyUr3XYqB1MArELNXJvo4tG9HdOlh8jEW1g124HaOsg5Fj2ZjnoOckkcTnrKPFyw1OqvhBTLEORg51xiOODv8k9vEJk2Dd7mQ31vHtbd4qVJ7r59SlHBdaR4yXXznakQ9xGnEPXa460SdHASGQjYcc7ciNON86HCnKwmz1u0hZAkIgBwsd7cgDvKjjjXz8OZCDnyXAQEfV1zeevDRiLn/X9cAQrA/w8GcJCFxXBw90HFueQU/reCTyBcUXzaa/8HJgoAqwytmu3I2rreNRO+U6+82fo4CQ6YV3nO3KRsxDJ+uAlLFP4D2zw58lIHB9nDzbdWxZhxHWASkDWZiFI6aHP0tA4AZhq8OdWYW/tw5IaTobi80P/qaF1wICdbbjQd+T6G0dkdo0HRXmBz5LgJE+WON4d860jkit6IsF5of8qQtPBALVA8sd79Cn+dhwSE1DmfnhzhJgLs/JnEEnL1WYzVuEQmYwXjA/0FkCQqILnne+S5diqHVMOqoDZpnc7sMSEFqd8KTzXVqDf0ZH66CECx0/5Ku18HJgoHLwYAA79X1cax001npjfkBP+bEERE4W5gSyW1/GSOuosZSDWag0P6gzW3giELBbUBvAbq3DfN4hELBJDm/+ZgnwyFXYH8iOrcBsXhEIyHnOZoFgCfDQBfgwoF37Dq5FlnVcz/XDrwIZ1TXtz4nY5mC9vBYQsP54M7D6/jamWcf1Vk/MdfJCj5aX59ANwEBscbBujgICloenAus4SSzHVOvA3snH7EAv+c1Hh6N/mSXACzn4fYDdJ4lFGG8d2Rv5+DH2BbjvjuCmZn+/iCcCfvgGagItAs9ignXkyOuOHwZ8h/9HLew1lgBPXOh0zoCWltWYcXwwSZnphzmBfvMnkcQ6FLW4LTwR8EQfvBJwl0piM27lq0YydCEeRF3ge+ph5KfcIo4CPJGNuWgMvGvtxzwMsI4eEROw0GAP1WF2G9vFUYA3pps8PVaDP2KcdfRQ645bje7w25rWYchRgDeCf13EseVdzOaNwy0oxnwcMtonT+GMNLeSowBvFOBPRt0ticN4AJfzrsGjeuN2p3M6t77UYXZGe4KjAI98yfR5svfxfZxl3QSmOmAyHg74x9nmy05cmvFWswR4ZCBeNex+SSTxBmahv3UzBC6BCZiH3cZt/zh6tWvreSLgkWzMDuzxklRLA5ZgFs60bopANB36O41bPIn9ohmeWQK8MhabzDtkEnV4Hl/zeDSQg8vx79hh3s5JJLEYhcI0PBHwSj7mm3fKY8tmzMMkr2YX6IsZeDTwu/pSLbWYozKrM0cBnrkBu8w754llPx7H1yJ+kTAHV+AuvG3elicvbyu+55GjAM/0wP0G96C1vryD3+ErGGzdNBnpgstwB57BAfPWa77U4mfKb3pmCfDOJXjXvKO2tOzCQszGhFC/qrwvpmIulpj+sJd6WY1iB5l5InCUP7e15OIn+KfQPsNXhVVYg3VYi/U4bL0xAICBGIGRGIlinGu9KSkdwI9wLxqdrLsIix28Lq4Cn8KbrptFkz8FAAAuxB9wgfVGtKEBm7AWa7EOa1GKhkD/djecj5EYiREYie7WDdGmJ3ErdjhcP0sAfCsAQAd8B3OQa70ZaapDKUqw9fj/dimvPxdFKDz6vyIUpn3vvL0PcRuecP5XWAK8KwAAMAh3Y7r1RrRLDT5EGcpRjnKUoRx7UY5yVAE4iHo04MAp/30O8gDkIQfZOAM90Qs90RM90fvoP/ezDtQu9fgtfoz9gfwtlgBPXRrgnMLBLodQgQpUoMF8S9wszwb8Alf+IuCpBGaE6g4BLm0v75lMz85fBLzVFXNC+uMWl1MXy7c0sQR47Bw8at65ubS+2L+nkSXAa1dimXkn59Ly0ojHcL51BwGvBXhvElaad3Yupy4vOrnPr304CvDeJKw27/Jcji1LcJl1hzgFS4D3sjA1ZM+5xXNZhonWXaFFLAExkI0ZoZhKJK7Lcky27gKt4LWAWMjBF729VSi8SyMWtmM6z6CxBMSGzdts4rkcwQIMs97haeKJQIyci3moNj88/F4OYB7Ott7RGWEJiJV++DkqzA8TP5dt+D66We/gduCJQMzk4VasMz9cfFoa8AyuVZnI0wZLQAwVY77JK0h9WyowL2IzIraEJwKxlI+ZWGJ+CEV3eQMzIzMlS1tYAmLrQtxr+g7CKC7bcU/AT/O7xxOBGOuKGXjG/BVkUVj24Q+4AgnrHeYES0DM9cAMLGQZSLHUYCFmoIv1TnKKJwKE3vgmXvF2Iq72LEfwPG6JwOzCGjgKIABAP9yG11BvfvDZLhV4ANNRYL0zAsUSQMflYSrmY7v5gRj8UoL5mOrVK1DTxxMBaiYLF+CHeA115oel+6UaL+GHii/ojCYPRwE+vhcgaN0xCZNxhQc3vpyuDiuxCIuwAjXWmxIK3r1HgAVATz+Mx3iMxwWhfUNh+urxNhZhEZbgkPWmhIxnJYAFQF8XXIjxmIBxEXoV1zG7sBqrsQTLUWW9KaE1EItRpL7WSlyFVcGHYQFwJxtDMfLoyzgHWG9Mqz7CKqzCKqxEmfWmRIJHowAWgGB0x3AMxTAUYzS6Wm8MAGAfNmA9NmA9tmCL9cZEjjejABaAoGVj0PE39haiCP0C2gf12IVSlKIU72E93j3tRaOUGU9GASwA1jqjEIUoQn/0RO/j7/ftJFpnDSpQgX2owHbswHZsQyl2od46qme8KAEsAOGUd7Qc5KMjugLIRwdkowBAl6PFoQaHAVTjCJpeHl5//KCvwGHrzY8JL0oAEbUX7w4kijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYYwkgijWWAKJYK8I2ByWgHBdaByOidLgZBezFEOtgRJQON6OAjehqHYyI0uGmBPzaOhYRpcdFCajHcOtYRJQeFyXgf6xDEVG69C8HVqOLdSgiSpd+CZiSsM5ERGkqxUSUqq7xGhYAoujYikuwVXF951kHIqLMaJ4IvGMdhogypfeLwB7rKESUOa1RwAe8BkAUPaW4XOVawC4WAKIo0vlFYAcLAFE0afwisMg6BBG1n+xaQCMGWAcgIgnJLwLLrTeeiKTaXwI+b73pRCTXvhOBZciy3nAi0pD5KKAaw6w3moi0ZFYCGvEV6w0mIk1F2Jz24X+79cYSkbYzsSyNw78Gt1hvKBG5kIM7cKDVw38Niq03kojc6Y15ONTiwb8BNyG7+X/MHwKI/NMZE3EdhmIA+uEg9qAUr+ApbDz9P/w/Z9kLgc6X4OYAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTktMDgtMzBUMTM6MjU6MTYrMDA6MDC/05GXAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE5LTA4LTMwVDEzOjI1OjE2KzAwOjAwzo4pKwAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAAASUVORK5CYII="
-b64_login = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADdcAAA3XAUIom3gAAAAHdElNRQfjCB4RFg9NccngAAA/u0lEQVR42u3deZxddX3/8dfdZt/3yUxmJjNJJpNlsi9ASABBREABtVRRqqCtW2urdfn1Z3/V38+qP2ut1f6stSqUpWhFpSIIBAIBkpCQfd8zk1ky+77f7fdHJiFAknvv95xzv+fc+3neB0j7eHxnvt8z57zv93zP+X6/LkQic1FOJRVUUEEBueSRRx45pOHCRyYAAUYZZowxhhlhlH46aKeDs7TRxZTuJggruXRXQJjMQxFzqGcu9dRQRhpuXLhx43rTB97464cJE77wv2HChAhN/7uLU5zkOMc5ThvjupsnzCUBkBg81NDIYhqYRTGp+EjBhw+P4b9wED9+/EzhZ5g2jrKPvRxlUHeThRkkAJwtlYU0soiFlJJDJumk4bXst4WYYpxRRhngFAfZzwFO6T4EwggJAGdKo4YVLGMBheSSSy6+uP4tg4wxxCCDnGIHO9jPMCHdB0XETgLAafJoYCWN1FBGKQW4NddnlE46aOcw+9hDC5O6D5CIhQSAc+Qyn2UsZDY1zCBDd3XeJEAPrZzhEDvZQwtB3RUS0ZEAcIIU5rKYRhZQTwXpuqtzWWF6OcEhDrCPg3Toro6ITALA7gpYzBKWsJQ6m33rX06Abg6wl33s4TAB3dURVyIBYF9eKljAcq5lFdna7/Vj5aeFl3mVvRxhlLDu6ohLkwCwpzQqmM9abqbRwX+jMCM8xwb2c4I+6QvYkXNPrsSVzgzmcxO3U6O7Kqbws4Xfs5Vj9EsI2I0EgL2kUMhi7uI2ynVXxVRhdvAYmzjNkDwhsBMJAPvwks083s/7qNZdFUsE2cHDbKBdxgSEeDMXKTTwbZoumpCTiJ8pNnMfpfh0H3Ah7CSdj7GXoPYLNB6fCV7lLsc91RDCMu/gVca1X5jx/AzyGxbrPuxC6FfBw3ThJ6T9ooznJ8QkzXyVNN2HXwh9fLybvQwn2cV//hOkl02stHD6sojIo7sCScvLLL7GXzCbtCR9FuMinTLW4+MYE7ork6wkAPTI5nq+zs1UJPlgmJciGphHM73yfoAOEgA6lPMB/pKryNZdERtwkUcN8xjnrKw4GH8SAPHmYymf4B4Wy7PwC9Kopg4fHbLSYLxJAMRXJtfySe5iVpLe91+OmxnUkEsv3bK0WDxJAMRTHjfxSd5Fvu6K2FIhs8mnn06ZMhQ/EgDxU8qtfJL1DlnWQ4dMailhgE5ZWTBeJADiZSZ38WlWyZ3/FaVSy0wGZEAwXiQA4qOCP+HTNNjqzj9MgBAh3LaqlZcqZjPAGXk3IB7s9KdPXGV8ko9ToeV3h5likimm8BMgSIAAQUJAkFEAsvDgnv7Hhw8vPnykkKrt6yHEUb7Db+WZgPUkAKxXwF/zcYrj+BvDBC5c9mO000Y7rXTTzwCDDDL4lg52CmlkkU4uhRRRTDFFzKCK/OktxlJIiXMYhGnmazw+HVHCMhIAVsvgG9xPTlx+V5gAAQKMcoaD7Ocgh2hDdfEND4XMZg51zKeRIlLw4jFht8Fo29LFl3lMdicWzvaPcZzo28Uf+BLXWPCY0UM99/ADXmMwjtOFBrlH959PCHVpfCkuF8oIz/M/uTou/YwC3sn3ORCnxUumuFmemwhnyuLjjFp8gQTYwKepI4c0vHHpnLvwkUERK/gKG5iwPAI6uJYU3X9KIWKVzd10WHhhTLCHb7CKMrI1jNa78JFLOY38DfuYsrCdQQ5yFam6/5xCxCKTWzlq0UIfQVr4GXcyzwaLa3ooooF7+QWdlt0U+NnECu0tFSJqPtbysiUXxBT7+BY3U0em7kZeJJd63sXfs8eiW4JxHmO+PLGygrwJaD4XC/kcN5r+nRVgLw/xU55hPz34dTfzIpP00sxRdtJMKkWmt9xLBZOcZEB3QxOPBID56riXu00fkT/GY/wHT7KXfluunRNikGaOcZgWUig1+cxKp5JemuXFILNJAJitlDu5z+TXftt5gkf4FTvos/Vs+TDDnOYITfSTbfK7j/kU0UqzrXo+CUACwFzp3MSfscjEnzjFKzzMg2yi25bf/G8VZoRTHKSLIKWkm/iTS0mjmVZkWzETSQCYycVyPsENpi30GaKNJ/g3HqfdERf/G/Ue4BBHmCSdUtMG79xUMMkx+nQ3L5FIAJipgo9yJ1km/bRJDvII32a/I7u9ATrYTA+5FJJiUgikUsgAR2S5EGFH6XyCfSY9+ArQwzP8cQI8+prHv3PKxFeFNnKzfG0J+3Gxmj+Y9Ozfzxl+zGzdTTJJOl9gF2MmBcAoD1Kju0lCvFUBP6bflFN8kiN8jVzdDTLVzTxv2hZoTfyN7Cko7MXNpzhmyuk9xTbuScBObgP/yYBJEbCNGxPg5kgkkGo2mdL9D/Ec1+tujEXK+AF9pgTAGL809QGjEAb9kB4TTuwA/8lS3U2xUDZf5IwpEXCKT+tujBDn3cBhEzq3U/yYhQnY+X+Dixw+zUkTAsDPFip1N0cIgFT+24SFP4L8O0sSftKri3w+zlETIqCbb+tujBAA99Fm+Ps/xM9YkRTLXrgo4hOcMOF26TArdTdGiHy2mfCay6OsSZpHWy7K+CxnDR+zER6RZwFCtz9lyPCp/Dzrk2pU200lXzb8RCBIG9fobopIZi5y2EHA4Il8gNtttb5PPHio4dtMGjxyk9IHEDqlcLfh7n8H95OtuyEaeGngFwaPXYgeliT0cxNhYy5KedHgKeznm+Qm6bdYClezw/Dt0w+TrvckbCKD9xvsxPp5nkrTVg9wnhQ+SIfBNyjbWZrwD0+FDbmYyR8MXv6HuUF3MzTz8H1GDD5E/b8WbIUmRATpvMvQ93+IDr6suxE2MIOXDS4m3swivLqbIZJNJT8xdNqO8N9JOfj3drdz3OCTlD+XPoCILw+raTNwygbYx3rdjbAJF9+l21AAvEh9kg6kCk1K+KKhU/Ys39LdBBsp42VDj1MD3J5UL1KZKHlHoI2p4A4DpQPs5Xu6m2AjHTzIGQPlPdxGue5GiOSRxUcMPbzaz4d0N8FmfDxg6JXqbq6XLzMVctBUzOIWA0dujB08qbsJNuPn5+w3UL6QtZTpboQTSQDEzkWVoQG8ffyGEd2NsJ3tvEqXcmkX76BadxOcSAIgdsUsolS59ACb2YRsb/VWkzzBPgPll1FDiu5GOI8EQOyqWWlgAso+XmBIdxNsaS+v0K5cOoslMhAYOwmAWLmZxXLl0sNsY7vuJtjUGM+xW7m0i5WyYUjsJABiVUQDM5RL72ezbG55WQfYRrdy6Ubq5CYgVhIAsaplsfLss3G28Lrc/1/WCK8ZGAcoYIHcBMRKAiA2bubSqFz6JK/TobsJtraXrcpPSFwsSZj9FONGAiA2ecylSrFsmK3sJ6S7CbbWxQ6OKpeez1yZFxgbCYDYzGKu8g1AL69zWncDbO8Am5VDspTZFOpugLNIAMSmllrlsjs4xITuBtjeGXbTq1jWRS2zdDfAWSQAYuGhVvlRU4BXOKG7AQ7g56iBB6VGAjopSQDEIp8a5S5mJ3sMvOqaTE6ymaBi2WpmySrBsZAAiMUc5QFA2EyrPACMShe7ld8IzKWGYt0NcBIJgFjUGwiAV2nTXX3HaGerctkq5uquvpNIAMRinvKMs072KA9tJZ82XlUuW02D7uo7iQRA9GZQQ5Zi2Rfl/j8G/RygR7HsTObKWR09OVTRm02J8tKTW+X7PwYhOtmiWDadCnkhOHoSANGbRZFiyXH2MKC7+o7SqxwALopkVmD0JACip/4I8ABdBHRX31H62YVfsWyhrA0UPQmAaHmoUt5+YpssARIjP2c5qVhWAiAGEgDRKqaENMWyWxnWXX2HCTPEDsWyBdTIeR0tOVDRmkW+4hDgMAcZ0119xxlWfiE4g1LZKixaEgDRqiNPseQJepRfbU1eo+xWHAVwkS83AdGSAIiWegDsZlJ35R1oihblxVPyqNNdfaeQAIiOi1pyFctKAKiZUN4qJFcCIFoSANFJo5wMpZJh9koAKJlir2LJXLkFiJYEQHRKyFQ8VsMcV36indwmlRcIzaBMzuzoyGGKzgzl7acPMyrTgJVMcUBxcbAU8pVnbSQZCYDoqAfAEVkGVFGAVuUZFGkyHyA6EgDRmaH8EtAReQSoLMhxxZLpBjZvSSoSANGpVBwChEMSAMqCHFYsmU6F7so7gwRAdMqVewBH5RZAWUi5ByC3AFGSAIiO6hjAJE3SA1AWVN4kRG4BoiQBEI1s8pR2nAlxhindlXewEMcUS8otQJQkAKJRRprSRKAQLfII0IAQZxRvoFIpU169KalIAESjSHE7sBCtuqvuaGFG6VeKUC+ZysO2SUUCIBpqNwAQkqXADQpzVrEP4FOeu5FUJACikae424wEgHFtigHgVZ69mVQkAKKRq9wDkFsAo1QDwCM9gGhIAEQjV7EHEFbe4kqc1644jCo9gKhIAERDvQcg24EY1ancA8jTXXUnkACIhvogYL/uqjten3IPQG4BoiABEA21QcAwAUZ0V93xBuQWwEoSANFQ6wGEGZZ5AIapBoDcAkRFAiAaaoOAQdkOzATqPQC5BYiCBEA0chRnAsh+QMbJLYClJAAiS1VcDzAkPQATqA4CemRzkGhIAERWoPgWQFAeAppgkgGlkRS5BYiKBEBkBYpHSQLADGHFfZU85Ml8wMgkACJT7wGoLmkpLtarFABuUmU+YGQSAJHlKR4leQ3IHH3yLqB1JAAiy1G+BRjUXfWEMKgYAG6ydVfd/iQAIlPdEyjMqO6qJ4RRxQBwkam76vYnARBZpuJgUphx3VVPCKoB4JYAiEwCIDLVHkCIMd1VTwhjim8CuGQQMDIJgMgypAeglWoASA8gChIAkamtCCw9ALOMKY8BqO7nmEQkACJLUe4BSACYQf0WIEV31e1PAiAynwSAVuo9ALXF3JOKBEBkqgEQYkJ31ROCag8ACYDIJAAiU+tIhgnIroCmmJBbAOtIAESm3gMQZggpB4D0ACKSAIhMLQDCEgAmUe1HSQBEQQLAOrItqDnUg1T+AhFJAFglLCMAJlG9BQhLAEQmARCZ6jeQ3AKYQ4LUQhIA1pH1aMyhfhylBxCRBIBVXIq7CYm38ihHgARARBIAkandS7oUFxITbyXH0UISAJGpfo9ID8AcXuUegIzCRCQBEJlfqZQLtxxdU6j2AMIEdFfd/uQUjWxS+U006QOYQbUHEGZSd9XtTwIgMtUAkJsAc6geRQmAKEgARKbeA0jVXfWEoL4egwRARBIAkU0oL0opa9KZQX1JNpmOHZEEQGTqPQBZk84MWcrLsksPICIJgMhUA0AWpTRHhnIASA8gIgmAyCQA9FK/BZAeQEQSAJGNKt8CyNZUZlC/BZA1GSOSAIhMfW86GQQ0g2oPQPZmjIIEQGTqAZClu+oJQX1nJgmAiCQAIhtUnJHulu2pTZGvHABDuqtufxIAkan3AAp0Vz0hFCjNBggxIU8BIpMAiEw1ADwU6q56QihQOkuDDMt6AJFJAEQmAaCXWg8gKDcA0ZAAiGwUv9J3iQSAGVIVHwNKAERFAiCyIKNKfQC3BIAJ8hRX95cAiIoEQDT6lZaW8FAgC4MaVqh4DAMM6K66E0gARKNHaVUgNzkyIdiwIsUA8NOtu+pOIAEQjS7FZcE8FOuuuuOVKp6jfrp0V90JJACioRoAbip1V93xZioHgPQAoiABEA31AKjSXXXHUw8A6QFEQQIgGt0SANpUSQ/AShIA0ZAegD7V0gOwkgRANDqUA6BGd9Udr0bpHA0xJu8BREMWro6G9AD0cJGp+C7FJD26K+8M0gOIxjCjSlOCJQCMcVOp+BbApIwAREcCIBohOpTWl3ORQ768DahMPUAnOKu78s4gARCdVsX15dzMkmOszM0cxZJjtOquvDPIyRmdVsYVS86T7a2VeZinWHJcAiA6EgDRUQ+ABgkAZW4JAKtJAERH9RYAGuQYK/MpB4DcAkRJTs7oqPcA5ksPQJGHAkqVSvrpl8nA0ZEAiE4nw4oLg1WTJc8BlHipVVwMZJQOxZWck44EQHTG6FFcYzaDKsXTONmlUK9YcoR23ZV3CgmAaLUzolhyrgSAEh9zFUtKAERNAiBa6gFQT4ruyjuSkR5Am+7KO4UEQLTOMKxYcqEEgAIXacrPAIZp0V19p5AAiNZJ5XHlpaTprrwDeSlTfBE4TD9NuqvvFBIA0TpJv2LJmcyQUYCYZbJYseSwgdu1pCMBEC0jp9Uy2Sc4ZlksVyzZwyndlXcOCYDoNdOrWHIxmbor7zjqPYBeuQGIngRA9JokAOLGTQ4NimV7adZdfeeQAIhek/IqMw3kypGOSSazlW+bJABiIKdl9NR7AFnUSR8gJjksUHyBepQOmQcQPQmA6PXRpTglyMUCcnRX31FyWKBYsoc2mQcQPQmA6AVoMzAKkKe7+g7iIp9GxbJdMhE4FhIAsThDp2LJJRTJsY5aBtXKm6p1ckZ39Z1ETspYnFaeZFLOLBkFiFohixRfnw7TLkOAsZAAiEUTbYqrAnholJ2Co1bCUsWSQ7TIjgCxkACIRQ8tylOCllGiu/oO4aGchYpl2zhDQHcDnEQCIBYhzijPM1tIpcwIiEoOdcxQLNssNwCxkQCIjfoJVkgDhbqr7wgzWap4XoYlAGIlARCbJk4TViy7TDYKi4KLKuURgEkDw7RJSgIgNm2cVF4gfCnVsjxoRClUK68EdJpmpnQ3wFkkAGITooUTimWrmC3vA0ZUo/wIEI7KOwCxkgCIVROHFUu6WKU8wy15zGeVctnDMhE4VhIAsWrmqHLZZcqr3CWLNBqYr1h2hBN06W6A00gAxKrPwGk2g/nyOtAVzTOwhOpBWmQaUKwkAGIV4gwHFMt6WaQ8yy05LKJReaB0j6wFHDsJgNi1sFu5bCNL5JhfVi6N1CqWDbBXdgOInZyMsevggPKjwBIWM0t3A2xrCY2kK5Y9zSlGdTfAeSQAYjdOE8cUy3pZxArdDbApD2uUBwBhF+2KE7WSmgSAina2KZedzSqydTfAlqpYorgdOITZRofuBjiRBICKDrYxqVg2l0YW6W6ALa1lvvJ0qXb2K2/cktQkAFQMc9jA5hPzuFF2C3ybAtYbGB3ZRptMA1YhAaAiTCeblEuXc5UMBL7NahYr3xqFeUleAVIjAaCmh5eVp514mMPNMi3oTdJ4t4FQ7GEHg7qb4EwSAGpG2G/gvfNKbpK1Ad6kgdUUKJd+hbNyA6BGAkBNmF5+r1w6lXncLn2AC7x80MBU6RBPyQCgiLdUrmOKsOJnkudlavAF9ewjpHwszzJbwlSV9ABUTXKMXcqlU5jLHbqbYBt/SoWBS/i39Cuv0iSEsmw+q/ytFWaK10jT3QRbmEOTge//MFfLQ1Whg5tZDBs4cbv5jO4m2MLPDB3F12XTNaFLFg8YOHX9HFR+9TVxXEWHoe//T5GquwkiWXm5hqCBk3eUb+hugmZunjIwlBqim1IZxxK6uMjgNfzKJ3CQVurx6G6GNj7ey7CB7/8JfiKXv9Drs4wa6AOE+GnSPg50U8nLho5dH1frboRIdjM5SsDAadzDB8jQ3QgtcvkqEwaO3DjPJOmRE7byXQYNnMZhNrEIr+5GxF06N3HC0HHr4sO6GyEELOWwoT5AgG9QprsRceahnl8YuvzH2Sj7LRsnQyjG7WWT8qbhAB4+zLokGwko4jZuNfQT+vi1TAEW9rCeA4YeB4Z5jmuT6Hl2Nu/joKHjNcGLzNTdDCHO8fIAA4ZO6BA/ZF6S9MdSuIYnDR2tMGf4ku5mCPGGm9llsA/Qz18mxa5BbubwjwbenQgTZpLnqNPdECHe4OVf6TP4rXaIe8jU3RDLFfNFeg0eqVN8QXczhHiz9bxq6J32MGE2cWuCPxBM436OGzxKfv5b7v+F3bj4Dt0GT+0wv2WN7oZY6i62GT5Gh/kz3c0Q4u2W8rThkzvAozTobohlbmKj4SPk5wFZT1HYkYe/4pThE3yUh5ijuymWuNrQzL/zn63cJQuACXuaxc8Njm+fm+LyM6p0N8V0y3nC0LSpc59Bvkmu7qYkkuSdimqFEXzUUmHoZ7hIo4Ii9hh6u9BuVvBVbiDL8M95hgc4qbsxiUQCwEwhuilgqcF3+lxkMJMKDiTMYtdr+CrXk224697MQzyrvCGLEJZzcy2/M9zRDROki58zW3dzTHE9Txla9e+N4b8fMU93YxKN9ADMFWYQL/MN7HJzjosMaqiglTbdTTLYjtv5a9aZ8oLTFn7OLoK6m5RYJADMNskgWSxV3uj6PBfpzKWCTtoI6W6UYguyuJvPsdaUaU6d/BvPMqS7UYlGAsB8w4xSY8q76l7mUk6ANiZx2tYXXiq5hz9nhSlTnAL8ikdo1t2oxCMBYL4Qg0yw0pTHVS5mU0+YLkYc1Q/IoJF7+YxpU3Z280/sle6/+SQArDDJINksNnwbcE4Jy/AxwQCTuhsWFTdFXMsnuM+0LTu6+Sc2JtRjUZHgPCziOcOTgy5+KrCRP6HKpEixUgYL+HNeM63l5xb/lsk/wmHSuIEmEy+DMC18m9Xk23jZEC+lvJtHTXno98bnNRqkpyqcJ5vPMGLqpRDkdT5NDem6m3YJbrJp5BucNLXFYXq4STZRFc6UxSOG1gu+1GeUZ7iTPFvdDLhIZQafZbfprZ3iC3L5C6dykc8R0y+KMMM8yy02uhXI5M/YZ8JMv7df/r+zUSuFUFDLKQsiIMwEO/mkDZYQK+V/cMrwHMhLfSZ5TWb+Cadz8y5aTHwe8MYnwAgn+Tvma7odSOc6fkwXYwaXQ730x89eGmTmv3C+ND5DqwWXyLkQ6OcMT/Cn1MUxBjJYzv/kFdoN7e17pU+QI7wrwddHtAVJ2Hgo4At8jHLLfv4o/fRziC1s5aiF78u7KGYx17CKWvLIJ8Wi3xPmBN/hPxmzrCVimgRAfFTxee62dAfAMKP00stZjrGfQ5ykx7Sf7WEGc1jIQmopoYh8i0fmj/MjHqbX0t8hAAmA+JnH57grDttZ+hmgZzoKTtNKK+10MBbzTAIPucygnEqqqaGEAoooIisOr+Sc4AEepN3y3yOQAIgfF4v5c95DUZx+X4hxeuinn0EGGWSAAQYYYZQxxplkkjCThAAfXjykkEYGmWSSTS555JNDHrnkUUgBKXE7U07xCA/QFKfflvQkAOLHzUo+we1aNrWeZJRhRhhjggkm8TNFGD8hwIsHD15SSSWNdDLIIptMLUNwp3iMhzim4TcnKRlnjZ8QrxMmyHspjfvvTiXV8CpF1jvNYzwsl388ySSLeApzlnYyqCBbd1Vs6DiP8ohc/vElARBfYTpoJoOZEgFvEuYYP+dhTumuSLKRAIi/bk6SQoVpy2U4X5Aj/IjHHL4AqiNJAOjQyz7GqSdHBmEBP4f5e35j4nsLImoSAHqMcJA2lpOd9LPdJjjAX/ICI7orIkR8pXIdhy2YROukzwR/oFa+hkRyclHMc0kcARP8m2XzCYRwBA9foUf7pRj/T5BT3Kn74AuhXxq3s4NJ7ZdkPD9D/IZGWy1rlqTk7ku/AC08T4jqJHk3IMwJfsC3aCKguypCAsAOAgywlyaKKEv4v8gAv+MbPE2Xo3Y6SliJfro5RZgRzrCXAUoo1F0ZywTYyb/yM/bJJp92IQFgHxN0cIzjBCgnQ3dlLHCKR/gJG2jCr7sq4jwJADsJMUATR2knhbKEmqnZw1P8nMfZy6DuqoiLyauo9uOikBWs43pWJEQIDLGZjWzisLztZz8SAPbkpoi13MA1LHJwLy3MGNt4lRfZyQhh3dURbycBYF9uingnN7CA+WQ67i8VZIBD7OBpNjMhF79dOe20Sj653MAtLKaOPMf0Babo4hi7eI5NTOmujLgSCQAnyGA9t9DITErJsPXfLMQwnZxkK0+zW57025+dTyZxMRezuYGbWUAh2bacQjPOAF3s5Rk2yaLeTiEB4CzZLOdW1lJNBhm2eZd+kjGGOcALPMdRecrvJBIATpTNEm7lZmrx4sOr7a8YIkCASfbwLE9xnEndB0bESgLAuXzUsp7bWU+Wlr9jkG5e4XmepZWg7oMh1EgAOF86V3EVq1lOSVxeHJqgiW28xhYOyDCf00kAOJ8LD168pFLNEhZRTz0zTR8fGOY0RzjMPg7QQZAAAfnedz4JgHhJoZBSspiglx6GLfgNLrykkkIKKeRQQx0VVFBJBeWkx/yXDjJEG+200M4ZTtDOKH6mmGTKogvfTRZ5pDJKj7w9EC8SANbLZh3rWEERKXgIEWCAo2zleQu3wPSQShoppExHQjZ55E5/0kkhnRRSycANTDHJOH7GmGSMIQYZoJ8hxpiavuAnmWDKwrf5ClnHahZTQgpugozRymu8yk55omA1CQBrebmde5hLKXkXPbsPMEIvzWzgUVriVA/fhY8HNx7cuKdHDEKECE7/EyCAnyn80xuHWq+Q93MbtRSSd2EP4hDj9NHJfh7kFXmNWDiTj0V8n92MEbrkunh+mniCtQkx40+Nh0Ye5QgTlzw+IQbZwteZ5ZhXoIWY5qaU+3iSvgiLY/p5gQ8k5PIfkaVzC08yfpl4PP9p5xe8nzzpqwrnyOQqvsO+CKf2+c82biVTd5XjLp31bIzqCAV4ja+znHTdVRYiMg+13M9v6I9hkexnuYpU3RWPqxSW8niUARkmTDeP8SEqkn4jNdPJ3ZW5CljNh/go15IWQ6lZjHKQAd2Vj6NyPsrHYjj7MphPLZmMMySPCIU9pTGfP+M5RhU2ymjhriS6DUjndk4qHKV+fs2HmW2bSVAJQHoA5nBTzlV8go+zWOn0zGGYg0mzQfYs7uFmhXJpNLCMPMaZYFR3I4Q4L5tF/C+OEjCwWdYx3pUkd7hubuKwgSPl5zB/SwNZuhsiBPgo5R62X+ZZdvSfEJ9Jkq3BMvlTQ1EZJswYr/J+iqUHK3Ryk85ynmTM4Ol87vMDZutuUFzU8X1TjtcwD1JPmrwhYERydDqt4aaEr7OZ20x6Ql2YJJ3abIpN+TlZ3Mt2PkeORICINxcz+Dt6TfkmO/95hrW6mxUXa3nG1OPWwl9QJCGgRnoAKoq5j6f5Mvmm/tRQ0iyvYe5ZN4Nv8RT3UqS7WU6UvBNRVBVzC/eymFzTn0aPJsmaepMmbxHmJoOlfJcP8QDP0ae7ec4iARCLPG7kblZREtN7ftHqZ0x3A+Ni3IJ3Hn0UcS1zeDeP8bK8IxA9CYBoZbCO93EVVZY9rDtBt+5GxkUPpyz5uenUUMAiXuVxtsoLw9GRAIhGGtdyK2uYa+G01F5OJslsgD5OMESOBT/ZRS6NVNLIFp7iNQK6m2p/8iJFJCms5X7u4SbqLN2W6yV+S5vuxsZFkCwWUGPRT3eRQSX11FNHiLakGVhVJAFweS7SWM1H+SDvod7iPfnG+H9sZlx3k+PETzrrLex9usmihkXUUckYPRIClycBcGkucljFXdzDB2mIw4acG3mAZpJl9bsJ/Cyg2tLf4SaDOpYxg2LCDMrtwKVJALydm3yWcRsf4V4aSY3DKybH+Ud2MKG74XETZpwJlpFr8e9xkc4CVlJBHt6kecwaEwmAN/NQzGJu4U/4KIvitEpPB//Kb+jX3fS4Gucs6SyMyzJfmSzgampIB8aTKGajIgHwBi/FLOBWPs2fMD9uS3S18Sg/SpqVAN4wxlGKqIzT/Id05rKWOnyECTKRNDdbIkqpzOAqvsI2w9N6Y/lMcZqvJtFKQG/mIodv0mp4anBs04i38iVWUCqrConz0ihhPT+kiWAcT8UgA2zjTt2N18zNpzjEaAzLgxr/+DnC37OSoou2ahFJyUUqOdzC4wzG8QQME8JPKz+kVPcBsIV5/JqeuPYDwoTo5qdcQzY+mUeYrFzkcB+743zqhQkzzibeqbv5NuLlPg5q+Dv4eYE7LJnXIWwulUa+R0/cT7kwYU7yFcsfgDnPDL5Dm5a/x1n+kQYZE0gehdzFb+iNuCmVFZ9+fs5KWcbqEtxkcCNPmLS8WiyfION082vea/L6Do6QXCdiOkt5D9cxi2wNF2GQl/kpL9IrM9UuI40K3svHWBj33xxmgiEO8yxPcTiZ3hpMngCo4nrezSKKLVjKIxrHeIinOckw8gz68jzksYA7+GPKNfz2CQbp5ADPspFW3YciPpIhAPK4inewhGrKyNTS4n5+y6/ZRU8yfbcoS6WcFXyA92gZngsxSgdN7GQDWxL/vcFEDgAX6SxjLSuoppp8TWsfBHiWx9nOqcQ/mUzjIoN6ruODrNBUAz+9NHGM7bzMEfy6D4h1EjUAMpjDClYyh9lUaHvhOcgJHmUjexiTjn+M3BSwinfwQUo1LV0bZopmjnOUvezhRGIu2JZ4AZBNLYtYwFzmMVvju14BOtjABjbQKxe/IjeV3MKtXEuuxjN1lJMcZz/72E9rovXjEicAXBRQRR31LGARdXGZZ3Y5QXrYxgts4LDuw+J4XtZwI9ew3MLl2KIxwFH2c5STHKeZYd2HxSyJEAAeiqmkhnrms4hZmvfXCdPPATbxDNtlyM8kGVzNu1lLvSUrCcZimBPs4QCnaOFMIizi6uQAcJFOCWVU0MBiVjLDBm9zDXKC13iKTYl5x6hRIddzG2uo0tq3O2eCVnazgwO00+HsZzvODIAUcimkkGqWsJJlZNuiHWO0sYXfsIlB3VVJUJXcwm0sptwW8/iCdLKN7Rygkz76GXbi0wI7XDjR85JJDjmUs5g1LKXWNvWfopu9/IJn6dJdlQRXwx28j3oKbbOt3RSH2MVO9tPBMMOMO2kRUrtcQJG4ySCTSpZyDaups8U3wHlBhjjGgzxBh+6qJAUPs/kwf0Q5WbY6fwfYz1a2cpheRmXVIfN4yaSa+/i9ybvxmvEJMcZxvkS5rU7FxOdjPv9CV1zXb4p2alEzP+U9FJMuC+6ZYz3/QVdcV+uJ/vLv5SsUyMWvhZe5/IQp7WfBpT5TnODbzNd9iJzNRSYfYBt+7X/OSyd9G18jT/dBSnrV/DN9GiZ2R/Px8yq32+p21TFclPJXHGbElpe/n6P8DdWky3e/dm4yWMaP6bBlCPgZ5jU+Yt8vCjuewC4quIt7mE2uDe+ipjjAYzxFO8NOGu1NaD5ymMf7uYNqG57RfgbYy3/wrB1fHLLf4SrgJu5lCcU2eK3nrabYxa/YSAsDBHVXRrxJCoXUcRN3ssA2DwjfMEEXO3mIF+32joi9AiCVq7ib66giQ3dV3maUzTzJdprolYvfpnwUU896bmexDfuOI5zmOf6LXXZ6c9BOAVDFXbyHRhuOqvfxEs+zm+P0S7ff5nyUMJ/VvJNVcdvdKVohutnFE/zOPm+M2OVS83IVf8TN1Niu49/KS7zMXo4yhLza4QxeiljAYq7hBtsNv01yguf4LZvt8VVijwDI5Q7u4hoKdVfkTfycYDNb2MUR2VfWcVxksYBVrONqSmx1QxCml1f4Jb9nVHdV7LE5aBUf4ZOsJlt3RS4IM8xenuKXPMZGOuWe35GmaGUnJznDAD6yNC0J93YuMqihDmhhRHdl9AfAAj7Op6i1TdffTwev8wy/5BFepU93dYQhIdrZziHa6cdPOqk26fP6KKMRN+26zzC9h8PDPD7Ph2yzOdMYbRzldV5klx26Z8JEpazhOhqps8lkYggzyoP8mCM6e5g6ewApLOYLfNQWXbMQfZxiC7/kX3mCZifO7BZXNMpRXmI3A4SAFBs8IXCRwkpyOEGfPQYE4yuV5Tyt/VXNMGEmaGc3/8LNybg1VNJxUcG9PMYRumzymvmvWGKTPkkcpbCM32k/9EFGaOcFPm+jMQgRD+ks4+vs5CwjNphD8DiLk+v887CUJ7Qe8hBTDNPCA6y3xS2IiD8XGbyLB+hgVMPW5G/tBTTaYEA+bhbxC80HfJCn+ZDm9YOFPVTxRfZoX1rkARp0H4h4mc+/a730N/JpZuk+CMJW3KzmmxzQuLxIiB8wR/dhiIdZ/IOGPeDDhBnlZb7IUnJIteF8MaGXl3SKuZF/4pCm1adG+D9U6D4MVsvh85yN+6GdYhvf4gZmkpNcgy0iJi5SKaCWd/N9DsV9cDBEK5+L9/uw8X0RyMs9fJ6Fcfz+neI1XmEzTfQxyCQynUdE4iKNPEqZz3qujeudeZA9fI9fxvPFoPgGwI18nhvi8gpGkD52sI0dtNJDr1z6IkZuMimmiDmsZg3zyYjLtTLBc3yPTfFrZjwDoIYv88eWT8+cop297GYfLZyl006LLwgHymAG5cxkIctZTLHlvdc+fsE/0BSv5sUvANL5NJ+izrKfH6aL4xzhGKdpoYUuufSFaVIoo4pZzGUe86ix9AHyCX7Ej+I1AT1+AXAzX2WNJS/djHKG4xzlFM000yYLdwiLeCmkmmqqqKGWWmoteYXXz2b+Ny/Gq0nxUcYfs8Dk3xakm8OcpplmjnOMfpm3LywVoJNOtpNCCbXUUs8saqkny9QbAx+NfJCD8dllMj49ADf38RUTu/9hxjnN4ektmjuScS6V0M5FCrUsZAWLaGCGqb2B4/w9DyVOT3Y2L5r4quUgu3iQ+5mtu1lCAF6W89f8isOMmnaOj7OBGt0NM+8A/S86TTowYxznYe4kV3ejhHiTGdzPb2k27Yuug68kyvSguRw0ZbZVkE6e4X5KdTdIiEuq4fO8Qq8p7xD62W/hM7M48vA9Bk04IFOc5mvU6m6OEFfgZjE/oN2UpUYG+GYizFmppM2ERJxkJ++X6bvCAQq4jyMmzCsM0kKZ7sYY923GTUjDR2hIhDQUScHHap4z4awf4+90N8UYF/kMGf7+D/FNue8XDlPFA4YDIEQf2TZZyFxJKp8x4fL/OqXy7S8cxk0F/2xCBNxvg/WLleWwzfAh+FtK5PIXDuRmBv9i+Px/xUY7ZsUolXcYvP+f5FGKndwFEknNTQXPGBwOHONapy4aXsiPDTV9gpeTZ6FEkaCWs9NgBPwzBbobocLDIs4YaLafg9wk3/7C4TzcxUlDL8KdZoF17wRad3edwzpDSxx28wAvkzDTIUSSCvIs/2loC9Aq1lo3DmBdAORzi4GfPsxmfhmvRRGEsNAoD7HNwGazbm5x3qZ1XtbSpdzpCbCT23Q3QQjT3M1+A4uNn+Uqq1busKoHkMtiipVL97CRFyyqmRDx9wdeNnAbUMoiq24CrAqAYtYrlw1yiF8zblHNhIi/IX7NUeWFa1ysM/B1ekXWBICHMlYrl+5mKzutaa4QmmxhG/3KpddY9TasNQGQTT0zFcuG2MuT+C2plxC6TPA0+5WfatUyx5q5sNYEQBkrlJ/gD7CD1y2plRA6vcpORhTLulhhzYQ4awKgiEXKZQ+yRVb3FQlokq0cUi69kCIrKmVFALgoZoFi2TD72WZFQ4XQbouBm4BF1gwDWhEAhQbuV46wnV4rGiqEdmd5ndOKZfOos+J1ICsCoIx5ymX3s9+CGglhD/vYp1y2wYoFwqwJANU5fAGOcNyCGglhD0c4pPw2wDynBEApcxRLnuaY8jipEPY3xHHOKJada8VzAPMDIJMy5S3A93NC5v+JBBbiJAcVyxZSRrrZFTI/AIqoUJ69fDh++6ILoUUThxVLeplBodnVMT8AipVXARikydC8aSHsr4tTylODK8x/FGh+AJRQqVjyNG3yCrBIcJO00aJYtpISs6tjpx7AUTpNr40QdtPBEcWSDugBeClWTqnjdJndPCFsp0v5UXcpRWavDmh2AGRRqDhSGaRZRgBEEujltOK7AFkUkmFuZcwOgALlJYz76WTM5NoIYT8jnFV+26XQ7CXC7RMApxkwuS5C2FGYAZoVy6pfX5dhnwBoYtDkughhT4OcUiyZwAHQwrDJdRHCnoZpVSyZwAFw1sDK6UI4yQjtiiVtHwC55CqWbJMegEgSI8o9APXr6zLMDQAX2YpLgUzSzYS5TRPCpsboJKBUMpscc/fLNDcAMslUfFGhm3GZByiSRIhRepRK+sg0d0aguQGQq7wUWK/sAyiSyJTyS2+Z5u4RZG4A5JCpWLJfpgGJJDKlvElIprmjAOYGQLbyi4r9TJlaEyHsLEF7AJmkKZbskwAQScSv3ANIU+5lX5K5AZAuASBEFNRvAdLMnQ5kbgBkKAeA3AKIZKJ+C5Bq7wBIVSwpg4AimagHQJqdHwOmGwgA6QGI5KF+C2DrHkAqPsWSg9IDEEnErzz3NUX5S/aSzA0An3IAjCq+GimEEwWVp755la+xSzI3AFLwKpULM6m8YZIQzhNUnvniI8XMipjdA1ALgCn8MhNAJJEQk4p9Xq+dAyBFsXsyLt//IsmEFPsAtu4BqN4CSACIZBNSHAVIyB7AmASASDIhxpXKqQ+0X5I9xgCkByCSTVAxAGzcA/DgU1wORAJAJJuQ4i4YHnxmXrVmBoDq978EgEg+qrcALnOHAc0MgFTlAJiQABBJRjUATL4JMDMAvMo/TQJAJBvVx4DgNnMY0MwAcCmvVyqvAYlkE1ae/aJ+nV2C2fsCqB4MIZKN+mVs4vVijwAwdaVzIRzApXztmfp1aY8AECL52OLas0UlpAcgko6pd/Lq7BEAQiQfW1x7tqiEPbJQiLiyxbVnZiVCysMTEgAi2agPAtr2KUBQ+XUej0SASDIuxXkzECJoXjXMDAC/csXS7dEdEiJu3Mqr+wbNXEHbzAsvIAEgRJTcyuv7B81cQNcuPQDV7pAQzqQeACG7BkBYeRRAegAi2bgVt9ELEbDrICD4FbNJAkAkG9UeQMDcHTTMvfAmFYcnJABEslHtAfiZNLcaZpqQABAiKhIAF0mTQUCRVNzKq/tOJWIA+OQ5gEgqHjIVX35LyABwkWvuaudC2JqPPMWSfuWlxC7JHgEAeRIAIon4yFUsaesewLhyOuWbu92BELZmJABs3AMYUV7qWHoAIpmkkK9YcpwRMytidgCo7XYCedIDEElEvQcwrrip6GXYpQcgg4AimagPAo7ZuQcwrNwDyJcAEEkkRTkAxhk2syLmBsCQcgAUyC2ASCI+GQN4szLFFyOFcKI0ShRL2voWYJRRxQnB5cqzo4VwnjTKFEvaOgCCDCreoWSTo7y3sBDO4iOHbKWSUwwrD7Rfktmz8PrpVyrnoVR5jTQhnCWdEsW5L4MMmLuTtl0CACoVM1EIp8mmUrHkAAPmVsU+AVBFjsl1EcKesqlSLJnAATCfOrkJEEkghUrqFcuaHgBmD7ypB0A9H2Mmmzlu7iCHEDbipYo13MI8xfK2D4A++hRL5nEny3mJ53md02ZufSCELXioZCnruJEG5etO/Qv2MswOgCG6GVd8pu+imo+wlmfZwH6azV39VAiNXJQxnxu4lQYD77yG6FH+gr0MsxfiClHHSuXXHMFFActYTS6TTDFq5groQmhSzELu5HO8lwpDV9wIv+cVc68J81fiK2cx1YZ+gpt8VrCedIaAMQkB4WD51HEnf8MHmGm4v93E0+zX3aBIlvIIYVM+Qc7yzzRSJO8ICgdyk0M1n+UAUyZdEc/zDt2NimwG3zKpuec+Q/yIJeTglS3EhWO4yaCav+S4qdfCf9Cou2GR+fgMQVObHWaEn7Fa5gsKh/BQx9dpNfkqCPNNynU3LRrvp8n0poeZYgMfpEh344S4onTW8RD9FlwBAT7ljJvha/iDBc0PM8UI+/g/LJCbAWFLBdzN7+llkpAF5/9R3mt+la1IlDYO8C4Lfq4PHw1U8V428iu2yXsCwkZmcwfvoZ4cUi36gjpMh/k/1IoA6OQQUxYt8eUllwYquJGDPMkf6LXktwgRvRTW8R5WU0U+qRb+nkO0m/9DrQiACU5zkKWWHQgvBeRRzRI+ylZ+yz7pCwgtXBRwK7dSTyW5Ft+fD3OQLvN/rBWVDtPKqxYGAICbLOZSx3zWsZuNbKHP3IUShLiiDBq5gdXMZhZpcRiV2k+TuZuCnWNNap1lKx+NwwIfHsopZxFrOMROtnHU3CWThbiEFCpZxSoWMo/KuA1Iv0yLFT/WmgAY4yBbuNnSA/KGfFazjLUc5gD72GNNUgqBi0Lms4ylLGROXFewamazFTcAVgVAmBb+i1UGJgXFyscc5nA9J9jNbvZzlE5kDoEwTxZ1LGABS2hkhukL6VxZgCfYb+6moOdZ1YFxUcPXuMeCyUaRhOhmN9vZxwmaGIz77xeJJoVK6pjPClZRbek4/+W8xl+zw5p+rXV3MKk08l3Wxjkrz5uilS1s4zjNnGFcegNCgZcSKqljBdewgCxNtTjB13iSIWt+uJVDGKms5h9YonHTrxAtbOBFTnKWHokBETUf+ZRSwQrWs4ZMbe+ehjnJD3nQqsvf2gAALyv5NgvJ09QPOCfEfjayiRP0MMikxIC4Ai/Z5FPBat7BNVqXqg8zQRP/l8esXCDP+mQr5e94F+WWvSAZLT/72MBGjjPMGBMSA+ItvKSTQQVruIWrKdBcmwC97OZrbNN9WMywjqfpJWDJFKFYJxQd5cfcQTmZ2iNJ2IWHNLJZwKf4Pd3az9EwQUbZy6e0DDhaJI2Psdf0dQJUPwHO8jj3U6z7sAgbcLOC/8EWhrWfl+c/7XyXGboPi/kq+VtOaD+4b3xCjLOBT1Gl4WGl0M9FBrfw77TZom96/tPFT1gcz4MQP25SaOBe7rbNuiZhAviZZC+b2MRuszddEDaVSjXruI515OPDp3WI+mJDPM1P2cY4wXj9ynjfBfvIYQkf5r1xfEswsknGGaebvWxhK8dkb6IE5aac5axlJbVkkE66bS59mOB5HmQrvfF9kV3HMFgaJcznTv6IPA2//fKCjDLMEO0cZAfbOYY8KUgU2TSwjDU0UEwOWTYbXgvwMg/zGq3x3wlDzzi4i1QqWcL7eI8NNwSdYoh+ujjNLvawl34JAsfyMY8lLGUepeRTQJbtxnuCbOS/2MUphnRMaNf3IMxFOrNZwvu5gQwbPpALMU4n3XTRxBGOcoQu/LorJaLiJovZzKOeOZRTTAn5tlxO0892fsl2jjCsazULvReei1SWsIzrWEeR7bL5vEE66aCDdk5ykpO0Mqa7SuKSXOQxi7nMYRbllFFKsS0vfIBRdvEM29jBkM4eph2+edNZyBqu5SrKbRsCAKN00EYbzTTRRDNtsvyITfgopYoaqqigkplU2vjrBML0spPNbOd1s7f6jJ0dAgAgjUVcwypWUK1x8lB0xumgiWZa6KCLDrpoZ0wWJIs7N3nMoIwSKqmkmhpmkmujcf1LCdHFHrbwKrvsMVXdLgEA4GMu17GOxVQ7YhegEIO0cIYWTtFON9300CdzDi3mI4diiiiiiHJmUc1MZjritW4/bRxiOy+yixHdlTnPbofNSx03sI751JCjuzJRC9FFE6c4RRMd9NHPIEOyr7GJUsgmlzzyKWYmtdRSS6UjvibOGecMR9nC8xyy11smdguAc3UqYT230EgFJbas4eUF6OIkxznJGToYYZRRhhljXG4RYuYhnWwyySSbImYyiznMoZJM3RWL0TDtHOA5NtBivwXs7Xt5pbGIu7iFcgpsO5J7JWEmaaWJUxyjiRaGmZh+41BWJLg8D6mkk0YaGeQwk7nUUsNcG4/mX0mYITrYzRNssOvbJPYNAAA3FXyMu5hBDik2r+uVjXKGk5ziGIdpZQw/gQv/2PLEiBsvXrz4pv/JpYa51DGbeiptPqB3JWECDNPHS/yYPfF7sz92Trio8rmLD7GQHFIcfEqcF2aIMzTRPP05wwQhgtP/hBL+VsGFGzduPNP/nkE1VVRTTTWzHPpN/2Zh/Ixykv/iF9as5W8mJwQAgJsl/BHvozYBIuCtBjjDUY5wimZO0ZHQuxq4yaOKamqmP7O1LbVpnR5e5GE2WLOMt9mcEgDnFHID97LOQc8HYjdKG0200k47rXTQSpedu5BX5CKPCiopp5wKKqiiWvP6kNaaZDuP8rT9v/ff4KwAcOEjnTm8lztY4LC6Rys8fSMQvvDvSbrpoodueuihhy766KXfVu8hppNLEUUUUkQxhRRTTCHlZODGfaHbf+6/E1Mzv+dx9jOC30m3cU78c/jIpJhl3MU7bTah2Bphghc+oYv+288QgwwyxCBDDDPGMKOMMc4oI4wxxiQBw/MWUknFO/1ALp0MMsma/ncOOeSSRw65pOK56OOe/l+vI8+vWE3wMr/lFToYYcppQ7pO/QO5yaCIMq7hNlbHZXdW+wkTJEDwwr9D0/++eEjxXD9ijBBjBJm86AQNMXnhqbT7TUtjpJCGhzS8pOHFjQvX9CV9fvDu/CXunf7Hk8Dd+isJsI/f8yKt9DDszBs1Z184HgqYQRVXcR2LEnA4yRxhgtP/nIuE84IX/tv1pqkzbjy4LvwjLmWKVjbxAkc4S7eTp4knwh/YRzkzaWA5VzHHhguMiEQSoJ3XeY19tHCGUd3VMSoRAuCcLCqpYxErWEpVAjxNFnYTpp197OAgJ2miR3d1zJE4AXCuNQXUMY966plPne0nFgtnCNPBEQ5ykEMco9uZd/uXllgBcI6bXGazgAXMZg5zJAaEsjBtHOcoxzjEITqcfLd/aYkYAOdblkE9i1nOLGqo0rjDq3CiKbpo4iSH2MNu+hLpW/9iiX9R+FjAClZQRyXlZCfpAysRrTDjdNNOEwd5nW32WLfHOokfAOf4mMtq1jCPUgrIkdsC8TZBhumlm9PsZRs77LNqj5WSJQDO8VDDKlbTSDk55MhtgQBgimGG6OIgW3mN4wk9HestkvMCyGAO61jLMrLJIF0eGiapEJOMMU4zW3mZ7XQ76S1+cyRnAJzjJpe13MR6KknFh1fGB5JEmBB+/AyyjRfYyKnEG92PVjIHwBtm8g5uZh1lEgFJYZTDvMRLbEqO+/wrkQB4QyZLuJ7rWEKh7qoISwxzkFd4idfp1l0Vu5AAeIMLD158ZFHHStZyNWW6qyRMMcZBtrKZXXThJ5D06zBeRALg7Vz4SCONbOayipUspdTGG02JywnRz162s5ODDDHOBJOJ+jqPOgmAy3ORRhbZZFLKfBaykHnk666UiGiCVvZzgAMcY4RhRmRXhsuTAIhGyvTqN6XUMo+5zKFSXiWymSBnOcFxjnCSzumVkpJ+iC8yCYBYeMmmkPzpDarOrWtbJ28RaNVPM8c5zinO0kc/fQwypbtSziEBoMZHHoUUUshMqqikkgrKyJDjGReTdNM6/emkly666GFChvZiJyesUSkUU0IxJZRQSjlllFNKvvQLTBZiiC7O0sFZOuiiiy666TK86GmSkwAwj4c8yqYDoIh8CiiklEIK8MlxVhJmlB766KKXHrqmL/6z9Ekn3yxyYlrDSz6llFNJOTMoJJ9ccskhhwx5pHgFYcYZYoghBhlggD7a6aSFDjoYk7F880kAWM9DCRWUUU4ZpRSRSxZZZJJFJhlJf6sQYnx6E/VRRhimlw466OQsbQm+TZotSADEWxpFVDCDcmZQTgnZpJFGKimkkU56QmyAeiUhphhngnEmmGCcYbrppH3608moDOXFkwSAbjmUU04xBZRRTiVFpOPDN71htm96nqIz/07n5tyd2wZ9avq/x+ijnbO0c3b639Kx18iZJ1YiSyWfIooppohiiqiimEJSL+zG437TP/r32gsTvrAn0Zv/CTBBN11000M37XTSTRdDcsHbie7TR0QjhVwKKKSQgumnCwUUkE8uOaTietuHt/xz/r/g4r/4xX/78CX+O8y5yzt84b/P/99v/H/D+BlmiL7pl3B6L/xXD/2M6z5wIhIJAKc795pyzvQzhpzpTTzTSCeNNDJIIQsv2Xhx4SaN1OlybjLwTf93+KKd7QJM4AeCjBJgkBCDBBhlknHGGWdk+jXb8x95Du9o/x9Yhb54sfbPswAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxOS0wOC0zMFQxNToyMjoxNSswMjowMGYLhyUAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTktMDgtMzBUMTU6MjI6MTUrMDI6MDAXVj+ZAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAABJRU5ErkJggg=="
-b64_lock = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4RGwKGbssQAAAbOElEQVR42u3deZSVxZnH8V8DdiM7NAIisrmhkRhBjCgmARzREDSazPGYBExCFk/UkHFyxpBkoicnmRhnjo7xZMaY0YlLoojGKBpBpImKG4pLEh3BhSVsCs0mWzfQd/4wqCxN3+6uqqfqre/n/RfqfZ66Vb9+773vvbdCKLr2GqiBGqA+qla1qtVT3dVOnSVVqYOkLaqXtFG7VKt1qlWtarVSS7VEy1RnXTz8qrAuAF5U6wQdr+M1VAPVp8WjlLRKb+oV/Vl/1V+0wbopuEcAFMnBOkkjdapO1qEeRl+m+XpKz2iB6q0bhSsEQBFUapTG6VM6UQcFONt2LdBczdIz2mndOFqLAEjbQI3XWRqtjgbn3qA5mqWHtNJ6EoD89NcUzVODSsbHLs3TFB1mPR1ALnrqO3rOfOPvHQNP6GJ1tZ4aoMja6Azdpq3m272xY5vu1hk8rQTcq9ZULTXf4uUci/QddbaeLqA4jtT12my+sZtzbNL1Gmg9bUD6RupB7TLf0C05dupunWA9fUC6TtEM823cuqNBMzTMehqB9IzQH823r5tjl6brI9bTCaSjn36V6GV/4yFwWys+kwBko6OuiviNvtYcm3WVDraeXiBmE7XafKP6PJboHOspBuI0WLPMN2iIY4YOt55qIC7tNCWxd/pbc2zWFWprPeVALI7Xi+abMvQxT4Otpx2wV6FvaIv5drQ4tmiK9eQDtvqrxnwjWh5/9PLdRUASxqvWfAtaH29rrPXDAITXVlcV7Gaflh47dBUfIUZeembyll+5x/3qZv2QAKGcqL+Zb7nYjoU6yvphAUI4WxvNt1uMR61GWz80gG9TeObf6FGnL1s/PIA/bXWj+SaL/fgJLwiimCo1zXx7pXDcqDbWDxXgWgc9bL61UjnuDPILR0AwXfWE+bZK6XiIbw4Ig+dbIXTRbJ1sXURi5miCtlkXUXw82/Kvo2aw/ZttrP6g9tZFFB8B4FsHPahPWBeRpDN1n6qsiyg6vpbBr/Z6kNtbWuxIDdHvVbIuo8gIAJ/a6Hcab11E0o7ToZphXUSREQA+XauvWpeQvOGq1zzrIoDm+675m2nFOBp0kfVDWVy8DejL5zWNl1gdqddZmmtdRDERAH58VE+po3URBbJOI/SWdRFFRAD4UK3nNMi6iL1s0qt6U0u1VKtUq1qt005t1zZJHVSlg1StHqrWYRqgATpCx0UXXy/pNG21LqJ4CAD32mqmzrAu4u826Vk9ref0Vy1p1v9ro0EaqpM1UiOiiYI79QXrEoCmXWP+sllJ9fqTpmq4g1ch2mmkrtRT2mneU0mXWz+0QFPGqcF0k2zXbE3RIc776qFJmqE641g7xfrhBQ6kl1YZbpBXdIV6eu2vu75h+itGb6iL9UMMNKZCM402xjbdohOD9XmK7lS9Uae3Wz/IQGMuN9kS63SlegXvtZ9+rndN+v2S9cMM7M8x2hZ8M9Tqh4YXxT31b9pkEHj8nBii0yb4d/7U6foIfk6jWlcHf2mQjwchOt8OvAmma6B1y+87NvhrHxdYtwx82CBtDrj839KnrRvexwVaGXAG3vH8bgfQLA8GW/oN+k91sG53v7rqloARcLN1u8BuZwZb9ks1xrrZAzpbKwLNxC593LpZQJIqtSjQor9XXa2bbVJvPRpoNp7l49aIwfeCLPcduiKRj25V6IpAv3/4FetWgd5BbodZq09aN9osE4LcH7BanawbRe5+EWChL9Ix1m0221AtDjAzP7RuE3kboO3eF/kTEdzu0xJ99JL3uVmvHtZtImf/632JPxjpm37l6KbHvc/Pz6ybRL6GeP+ajOmJ/07uwXrE8wxt4ZMBsHKb58V9b+LbX5IO9v624L9bt4g8He75M/H3F2D7S1IHPeZ1njYm+hoJEnet12X9TDRfxtl6XTx/i9BU6waRn+5e3+l+tWCvbh+mpR5naxU/JI7Qpnpc0Gs12Lo9507w+nnJr1u3h7y08Xiby47IP/DTUud5/L7kl6ybQ17Ge/xr9k/WzXnzM4+zxmcDEdAD3hbyQ4l85Kcl2mmet3nj+wEQTD9vNwAtL/g33fTTWk8zt1XdrZtLEZ+obonJautl3JK+orXWzXm1XJd5GvlgXWjdHHLxqqe/YjdaNxbEPZ5m7wnrxpCHEz0t4GWZ/OxVH9V6mb8G9bduLT08BWg+X5eal2uTdWtBrNa/ehm3gi8Lh38Vnu4AeNS6sYDaaL6XOVxg3RiK7xQvS3enjrNuLKhRnp5GHWHdWGp4CtBc472M+hu9at1YUPM8/byXn0cHeN8LHv5ubcvw5avjvXxz8MPWbaHY+nq5n/0X1m2ZuMtLlBbnQ9SI0GQPi7ZeA6zbMnGClzCdYN1WWngNoHnGeRhzmpZat2XiZc30MKqPRwj4u1Ue/madaN2UmTM8zObL1k2huI70sGCfsm7KUIUWOp/PXQX7LiXPeArQHKd7GPO/rZsyVNJNzsdso5HWbaWEAGiO05yPuEn3WDdl6jbtcD7mKOumUkIANMepzke8T9usmzK1RrOdj+k+pgFJHT3cunKmdVPmvuR8TjcV+DuVYOhk50u1Vu2smzLX2cPPqw6ybiodPAUo38ecj/iwdlo3Ze5dPe58zBOsm0oHAVA+98vqIeuWouB+FgiAshEA5RvqeLwGPWLdUhTc3w/o+pEqMAKgfEc5Hu9V1Vq3FIWFWuV4xCOtW0oHAVCug9Xb8Yh8ieVuru+GLN4Pq3lDAJRroPM3l3K+CXhP8xyP17ngv67gEAFQLvd/VfgGu91edD4ibwSWiQAo10DH423T69YtReNllRyPyJOAMhEA5erreLxXuAfgfRu0zPGIrh+twiIAynWI4/EWWTcUFdezwWsAZSIAyuV6Sb1l3VBUXM8GAVAmAqBcrpfUYuuGouJ6NgiAMhEA5ap2PN4K64aistzxeARAmQiAcnVzPF6xfwa8udY4Hq+7dUOpIADK1d7xeK6XfNpc3xRdZd1QKgiAclU6Hm+9dUNRWed4PAKgTARAuVwvqe3WDUXF9Wy4juvCIgDKU6GDnI5X8vBlmCmrczweVwBlIgDK4/ovSr11Q5EhAIwQAOVxPU8N1g1FxvV8sK7LxEQBGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABkjAICMEQBAxggAIGMEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABkjAICMEQBAxggAIGMEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABkjAICMEQBAxggAIGMEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABmrsC7Aoe76qI7SIA3UoapWtTqoSh2si0LytqpOW1WrWq3UEi3R6/qz1lsX5UoRAuBYjdFonazDrQtBNpZpvuaqRq9ZF9JaKQdAT52rMRqtQ60LQbZWqUY1ul+11oW0VJoBUKUzNVHnqtK6EEDSLs3V7ZqubdaFNF96ATBMX9MF6mFdBrCXdbpLN+sF6zKaJ60AGKUrND6xmpGXJ3Wl5lgXUb50NtMoXaHPWBcBlOFJ/VwzrIsoTxoBMEI36OPWRQDN8LQu0wLrIpoW/41A3XS9nmb7IzEjNV+3qdq6jKa0tS7ggCo0SQ9oTAIxBeytQidosjbE/bJgzE8BDtPtGm1dBNBKczRJK62LaEy8ATBWd6iPdRGAA2s0STOti9i/OJ8CtNOP9D/qbF0G4ERHfVE9NEcN1oXsK8YrgL6aplHWRQCOPa4LtNq6iL3FFwCDNUtHWhcBeLBE47TIuog9xfb6+nA9zfZHQQ3U4xpmXcSe4gqA0apRL+siAG966zGdaV3Eh8UUAOfrYXWxLgLwqpMe0HnWRXwgntcARuthVVkXAQRQrwl6xLqI98QSACephrf9kI13NTqOTwrEEQBHap56WxcBBLRGp2uhdRFxBEBfPamB1kUAgb2l0+zvC7B/EbCdprH9kaHBmmZ/J655AfqpvmBdAmBigCo017YE66cAZ+mhCK5CABsNOtv2/QDbAOijF/nEH7L2jk60/LCw5V/fCv2O7Y/M9dJtln+GLQPgIr7uA9BYfdHu5HbZ012vcd8/IOltDdEGm1PbvQtwnT5pdm4gJp3USQ/bnNrqCmC4no3gLUggDg0aqfkWJ7Z6DeCXbH/gfW10ndWJLYzje/6BPZyqsRantQmAH5icFYiZya6weA1gpJ6yaBWI3OmaF/qUFlcAVxqcE4jf1PCnDH8FMCyOL0IAolPSML0U9pThrwC+FvyMQBoqNDn8KcOq1Mr4fzEVMLJOh6o+5AlDXwFMYPsDjeqhs8OesF3gBicGOEeD5qtGC7RQK7VZOwJ3iGI5SJ3UV0M0XGM0IsAfzEm637plfw5RvUpej7/pezrMuk0UVD9N1XLPK3i7eli36c9kr1O3Vher0rpFFFyVvqVar+v4IusW/fmtx2m7k1cXEEhPTfO4km+1bs+XCq30NGU7dLF1c8jMJdrhaTX/zbo1X471NGFb9Rnr1pChCdrqaUUfbd2aH5d4maydMf3UIrLyGU9XAQW9nr2HyULBXOplTd9t3ZYfyzxM1Z3WTSFz0z2s6iXWTfnQw8NE1aqndVvIXLXWOl/XDeoWqvxwtwIP9TDmD7Q2WP3A/tTqKudjVuj4UOWHCwD3r2wu1y3Bqgca82utcD7mUaGKDxcAA52P+Muwn5sC9qtO/+V8zEGhik83AHbp9mC1Awdyhxocj1jAADjU8XjPebjwAlpimZ53PKLr3dKocAHg+vX6OcEqB5oy1/F4wT7XEi4AXH/I8YVglQNNcX0FUMAA6OR4vIXBKgea4no1ut4tjQoXAK4/qb8qWOVAU1yvxqpQhacbAJuDVQ405V3H4wULgHDfClxKtnKgaYmub6tfBwYQAQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABkjAICMEQBAxggAIGMEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABlrZ10AgqrUCB2nYzRE/dVR3dVR0hat1xYt1WtapFf0vOqti0Q4FcHOVEq28mI4VudqtEapQxP/bovmaa7u12vWBSeG9d2EkuMD5eqpyzS/2fP7rC5VtXXpCWF9M0ER6qOrtaXFc7xdv9Lh1i0kgvXNBEWml25SXavnuU436hDrVhLA+maCItJGk7TG2Vyv1xS1tW4pcqxvJigaR+pZ5/P9tAZbtxU11jcTFInztN75bJdU0kZdYN1axFjfTFAE2uoXXjb/7uM6bh1rBOubCTJXqWlet39JJd2n9tZtRon1zQQZ66w53rd/SSU9qs7WrUaI9c0EmarUrCDbv6SSalRl3W50WN9MkKE2ujvY9i+ppPt4W3AvrG8myJDfl/72d1xr3XJkWN9MkJl/DL79SyrpfOu2o5Lo+ubTgOk7QgvU1eC8GzRcb1k3H41E1zfv6qaujX5nsv2lbrqD9ZM6HsDUXayTzc49UpOt20fr8BQgbb30mrobnn+dhmiN9SREIdH1zRVA2n5iuv2lHrrKegrQGlwBpKyf3lSlcQ11OkIrrCciAomub64AUvYv5ttfqtI/W5eAluMKIF09tbTJr/gMYYsGqNa6CHOJrm+uANJ1YRTbX+rI9wSkiwBI10TrAiKsBM3EU4BUHatXrUv4kCFaaF2CsUTXN1cAqfqsdQF7OMe6ALQMAZCq0dYFRFwNysZTgDRVap06WhfxIVvUI/PfFEx0fXMFkKaTotr+UkcNsy4BLUEApOl46wL28RHrAtASBECajrEuIIGKUAYCIE3xbbf4KkIZCIA09bcuYB8DrAtASxAAaepiXUACFaEMBECa4vtpjvgqQhkIgDR1si5gHwRAkgiANMX3sxzxVYQyEABp2m5dwD62WReAliAA0rTFuoAEKkIZCIA0rbYuIIGKUAYCIE2rrAtIoCKUgQBI0xvWBezjdesC0BIEQJr+z7qAfcT0/UQoGwGQppesC9jHy9YFoCX4QpA0VWmjqqyL+JDt6soXgjjFF4LgAOr0rHUJe3gm8+2fLAIgVb+3LmAP91oXgJbhKUCqDtOyaOK7QYdrpXURxhJd37EsITTXCj1jXcL75mW//ZNFAKRrunUBEVaCZuIpQLq6aqm6WhchaZMGaIN1EeYSXd9cAaRro260LkGSdAPbP11cAaSslxab/0LwVg3SO9YTEYFE1zdXACl7Rzdbl6Cb2P4p4wogbT31qg4xPH+tjiMAJCW7vrkCSNtafdf0/FPY/ihPyfGB3WY6n9tyj4etW49IouubpwDpG6i/mHxL8LsaqqXWzUcj0fXNU4D0LdFENQQ/a0lfY/ujfIleIiXi+8Ev/6datxwZ1jcTZKhCdwTd/nfzFGwvrG8myFR7zQq2/R9Re+t2o8P6ZoKMVWp6kO3/ANt/P1jfTJC5trrF+/a/Q+2s24wS65sJikAbXa0Gb5u/QVfz3L8RrG8mKBJjtcrL9l+j8datRYz1zQRFo5eHuwNr1Ne6raglur65E7CYOjj+sc7t6mhws1FKEl3f3AlYTK6XY4ntX0wEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABkjAICMEQBAxggAIGMEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAVBM9Y7Hq7NuCH4QAMW0S9ucjveudUPwgwAoqlURj4ZoEABFtcjpaAut24EfBEBRPed0tOet24EfBEBRzXU6Wo11O/CjItiZSslWnqZ2Wq7ejsZ6Q0c7f/yKJtH1zRVAUe3UXc7GupXtX1RcARTXYC1UOwfjbNEgrbFuJnqJrm+uAIrrLf3WyTi/ZPsXF1cARdZbr6lbK8dYrSHaaN1IAhJd31wBFNnburyVI5T0dbY/XCg5PlCeW1s1y9dYl58M1jcTFKVKzWzxHP9Bba3LTwbrmwmKVCfNbtEM36Mq69ITwvpmgqJVqVuaObsN+g/++jcL65sJitokrSt7blfpXOtyk8P6ZoIi10s3qb7Jed2qa9XVutQEsb6ZoAT01zVa0eicLtaPnX1+IDeJrm9uBMpPW43QGA3TMTpMndSgzVquRXpOc/Qiwdpiia5vAgBwIdH1zZ2AQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGCAAgYwQAkDECAMgYAQBkjAAAMkYAABkjAICMEQBAxggAIGMEAJAxAgDIGAEAZIwAADJGAAAZIwCAjBEAQMYIACBjBACQMQIAyBgBAGSMAAAyRgAAGSMAgIwRAEDGwgXALsfjVQarHGhKlePxXO+WRoULgHrH43UKVjnQlM6Ox6sLVXi6AXBosMqBprhejQUMgM2OxzsmWOVAU1yvRte7pVHhAqDW8XjDg1UONGWE4/HWhio8XAC4bmlssMqBpoxxPJ7rP5eNChcAqx2PN0L9gtUOHEh/DXM8ouvd0qhwAbDYeeUTg9UOHMhE5/vI9W5pVLgAWOJ8xG85f/cVaL4qfcv5mG+FKj5cACxyPmI/TQ5WPdCYb6qv8zFft27KvW5qUMnxUatDrNtC5nppnfN13aAu1m35sMz5RJU0zbopZO5eD6s62CsAYU33MFUlXWLdFjI2xcuaLuiftUu8TNZOnW/dGDI1QTu8rOlvWjfmxxAvk1XSVk2wbg0ZOlfbPK3oo6xb82WFpwnboUutW0Nmpminp9W8zLo1f+7wNGUllTRdvazbQyZ6e3npb/dxq3V7/nzV47SVtE6XcmsQPGuvb2u913U8ybpFf3qqzuvUlbRC39fh1m2ioPrrB1rpeQVvV/eQLVUEnsL79Fnv52jQ86rRAi3UCm12/kUkyEulOqmfjtZJGqPhAe6cvVefD9le6AA4X/cGPiOQknP1QMjThQ6ASq1UdeBzAqmoVd+w16yhvxa8XncHPiOQjjtDP2UNfQUgDdOC4OcEUlDSML0U9pThfxjkBc0Mfk4gBX8Mvf0trgCkkXrK4KxA7EbpydCntPhpsKf1mMFZgbjVhN/+Vr8N+FOTswIxM9kVFk8BJOkpjTQ6MxCjeTrd4rRWATBcz6qt0bmB2OzSCL1ocWKrTbhKvXSy0bmB2Nyg39ic2OoKQOqi1/iBT0DS2xqiDTantnkRUJI26Xtm5wZicrnV9re8ApAqNJtf+EP2ZmucSlYntwwAqbdeUh/TCgBb7+hjWmV3erunAJL0tr6gXaYVAJYa9CXL7W/3LsBuS1SpTxjXAFj5sW6xLcD2KYAktdFs57+uDqTgMY21vgK2DwCpj57UYOsigMDe0Gl6x7oI29cA3rNaZ2q1dRFAUGs03n77xxEA0psaZ/dOKBDcJp2lRdZFSLEEgPRnnac66yKAIOr1eb1gXcR7YgkA6U+6kAhABup0gWZbF7FbDC8CfuBTul9drIsAPNqsz+kR6yI+EFcASEM1U32tiwA8eVufjuXi/z2xBYA0SLOK+/PIyNpijdPr1kXsKZ7XAHZbrE/wnYEooLk6Jbbtb38r8P5s1u0q6fQIwwlomZKu0Ze12bqMfcX3FGC30fotXxiCQlijiZplXcT+xftXdq6G61HrIoBWm62Pxrr9Yw4AaZX+QedouXUZQIut1kUaF/ON7jG+BvBhi3SLOuikqIMK2J8G/Vrnar51GQcW72sAHzZMN+hU6yKAZpiny8L/0l/zpfGX9QWdptP1oHUZQFme1Dk6PYXtn8oVwG6naqrGJ1Yz8vKofqSnrYsoX3qb6WOarAtVbV0GsJe1uks3p/F3/wPpBYAktdVoTdLn1MG6EEBSnWbrNt2veutCmi/NAHhPD03QGI1RP+tCkK3lqtEczdB660JaKuUA2O1ojdEYjdBA60KQjSWarxrVxHdvf3MVIQB266qhOkqDNFB91VPV6qh26mxdFJL3rnZqs2pVq5VaosVapL9qo3VRrvw/YH/osynIbzsAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTktMDgtMzBUMTU6Mjc6MDIrMDI6MDCJL3JxAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE5LTA4LTMwVDE1OjI3OjAyKzAyOjAw+HLKzQAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAAASUVORK5CYII="
-b64_chat = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4NFjGZLI5fAAAyYUlEQVR42u3dd4AW1dX48e826gIL0ntXikqxC1bUEMVolOibKHYwml+MJmoSjZq8UUleoyGmWBI1akSxBDsGFAU1qIAU6VVY6bD0Zevz+2NZdll22Wfn3Jkz88z5zB/UmeecM8+9O/XeNEyqaUAr2tCaHJrRjBya04wm1KMZGeSQSZP9/6/5gTWK2QVAgu0Us4sC9rKXnexgBzvYTh7b2MRmNlOinZxxK007ACOSQXs60ZH2dKE9HWhFuwMN3L0EW9jMRnJZyzrW8A25bNIugZGwDiBq6tGT3nSnB93pQRfqKcezmxWsZAUrWMkS1pDQLpCpC+sAoqA+/elLH46iLz3I1A7nMPawmMUsZDHzWUGpdjimNtYBhFdLBjCAYzmWPqFu9DXZzXzmMJc5zGevdjCmetYBhE1jBjKYwQymT8rsnRKWMItZzOJzCrWDMZWlylcs+joylFMZSt9I/rRP1h5mMZ1P+ISd2qEYsA5AX0/OZChD6aodSKBKmMd0pjOVrdqhxJt1AFpacQbDOIdu2oEoW8kUpvCeHRHosA4gaJkMYTjD6W+1r6SAT3mXd1igHUjc2JcwOK04gxGMIEc7kBDbyH94k0n7n0w0vrMOIAjduJCRnEy6diARsY8pvMnrbNQOJPVZB+CvQVzMxfTTDiOSipnGRP5NrnYgqcw6AL/0YySXc6R2GClgFs/xEhu0w0hN1gG414PLuZz+2mGklBI+4EVeY7t2IKnGOgCXmnIRV3K2VdUnBUzmWSZSpB1I6rCvqhvpnMKV/IDG2oHEwDZe4XFma4eRGqwDkOvI9VxHR+0wYuYLnuBFdmuHEXXWAUikcxajuTiln94Ps12Mt2MBGesAvGrNDYyhk3YYhs/5Ky9SoB1GNFkH4MUgxnAlDbXDMAds4mn+yhrtMEyqy+RyPiFhSwiXQsZzsvYXJGrsCCB52VzHrXTRDsMc1iz+xL9s9OJkWQeQnNbcxP+jhXYYJikreJQnyNcOIwqsA6hdd37OKOprh2HqZCPj+IuNMlAb6wAOrzt3cq3d5ouonfyN37NNO4wwsw6gZv24k++ToR2GEdnNUzxorxLVxDqA6h3Fb7jUqpMidvMnHiJPO4wwsq/4oTpzlx32p5xd/JUH7JpAVdYBHKwdd3GD+nRbLm07sOwGtpOglB1AIXuAfOqTTho5QBbZQAMakk6LA0sj7QQc2sSDPMY+7TDCxDqACk24g9si/IXPYw1rWM0aNrD1QLOXztXX4EBX0JKOdKUznekU4S5yDXfzL5u0rJx1AGWyuIF7aa0dRp3ks4glfH2g2Qc3kGYa7ehCZzrTmR70oUvEvkdfcgdTtIMIh2jtOL8M45GIjOBTxFoWMosFLGRxaJ53q0cv+tKPwfSlW0S+U1O4nTnaQeiLxs7y0zGM4wztIGqxlc/4nK/4ihUUawdTi2b0pT/HchLHhvxCaglPcrfNTBRnzRlHkfpLLDUtxSzgWUbTL6LddBaDuYVnWaFeyZqXbdwS8m7K+CSDH7JF/QtY3bKeV/gZQyN8ObKqjlzKQ3xMgXptq1vmhf4I0Dh3Il+qf/GqLnt4h9s4OqI/75PRmG/zCPPVK33oMp522sUxQclhHMXqX7mKpYSZjGUYDbQLE5jWjORx1qhXvvKymzvtse84uIIN6l+28mUdTzCSI7RLoiSNo7mN9yhU3w/lyxcM1i6K8VMP3lf/kpUtq/gDp9pcgQA0ZxQT2au+TxIkKGYc2doFMX5IZzS71L9gCVYwjiEpfJ7vVUNG8Cw71PdPglWcq10M41pPPlL/Yi3gPjvErEV9hjEuBCdpE2J7YpaCMrmLfapfpzX8ll7aZYiQLEbwmvJNw2+4ULsMxoU+fKH4NdrHBEbYoyaeNGc0HysfB9gokJGWxmh2q319ZnKLHUiK9WMsG9X24Tq+rV0A41VXpqp9bX5HH+30U0g9LuYNpYe2SxlnU8BE0VVKV5Q/5XKytJNPSR15UOnh7cV28TZamvKcwtekgAmcqp16iqvPKOYp7Nsi7rOnNqLieJYF/gXZyFibKDQwQ5ig8DD3FNprJ25qk8Ytgd8++pLRdpYYuO6MZVvAe3oT52unbQ6nNZMD/kpM4nTtpGOsKbexPtD9XcpYu6kbVkPIDfTLMJmTtFM21GN0wPt9mp0KhE8atwT6VtlkTtBO2RxQj9GBvly8yd4WCJfmvB7Yzi/l3wzSTtgcoj43sjqwb0Exd9kLXWFxJIsCa/xv2h3hEMtiFEsD6wTeJkc7YQOXBPaS7zscrZ2sqVUWowO7MLiIo7TTjbc07qQkkF29wG4ARUhj7mRnIN+LnVysnWx8NeOtQHZyLtfYU2CR05FnAvnhUMK9djVAQ3cWBLB79zCWJtqpGo/68nYgPyJeSaEh3CPilABeES3hWRssOvKGBfLuwJf2IHiQrg7gcd//2CW/FJEZyBQwaxmgnWg8pHGf7ztzA6O00zRONedxSn3+1uzmIu00U199xvu8G0t51sbxSUlDWej7d+cO7SRTW3Pfx/adxynaSRrfZHEn+T5/g8bZHSO/dGCur7tuL/dRTztJ47Oe/MfnLuCVGE3yFqD+rPV1t33AkdopmoCMZJOv36VP7CTStTN8HeFvI5drJ2gC1ZJ/+toFzLcbyC5d4OvMcZPs/e5YGu7rOwOrbCoYV77v45v+e7nFHuSMrda84WMXsJ5jtRNMBTf7+ET3DOulY2+Uj2+T5tko0VL3+LZzCrmLDO30TAj05jPfvmW7OUc7vSj7tW87ZhHHaSdnQiOTO307zSywSUa9+q1Pu6SUx2msnZwJmeNZ7FsXYGMG1Fkaf/Rpd2y16R5NtRrzvE/fuUIu0U4uWtL4k0+7YjbdtZMzITbap/dMi7lSO7Uoecin5v+sDdxgajGYVT51Ad/XTi0qHvBlB+Rzg3ZiJhJaMsmnLsCeN03C3b4U/2uO107MRIZfg80W2h2B2vw/X5r/WzTXTsxEzPls9eGbWMAF2omF2Q0+jNpSzC/tYV/jQXdm+9AF5DNMO7Gw+oEPh107+JZ2WiayGvKSD13ALk7UTiyMLqLIealzGaidlok0f0agzLMBRKs6h33OyzyHjtppmRRwjQ+PCX9DN+20wuR0H973n2iP+xpHzibP+fdzOW210wqL/mx3Xt6HbWhG41BfVvpwhNpMO60waOd8VvdifqSdlEk5RzDdeRcwlfraaWlr5Pxd7F12p9X4oj4vOO8Cxsf7SDWDNx0XNNeGYTK+Sef/nHcBD2onpelRx8VcTU/tlEyKu9N5F/Bj7ZS0/NRxIRfbbT8TgB86fmCthBHaKWkYQbHTMi6wkdhNQK5w/NDaTo7RTilox7HbaQm/sLlYTIAuc/xw0GraaKcUpG5scFq+j2iqnZKJmfMdTzP6RXwGq2nCAqele4eG2imZGBrm+Cj2hXi8tZrGBKdle8PmYjVKjnc8ZsAvtBMKwh1OS/YcmdoJmRgbzBaH3+YShmsn5LeznF4/fdWav1E2wOlRwA76aCfkp05O52V/z56kNiEwkG0Ov9WLUveCdgM+d1ioKXbub0LiFKcTjL6aqhcDn3RYpE/sbX8TIqc5vSNwu3Y6fhjtsEBzbJRfEzJnOxzTqoih2um4doLD8iyO11NTJiIudvhw+/rUerC9FWuclWZZapXGpJAxDo9yp5ChnY47rzsryxq6aCdjTI1+6bAL+LV2Mq7c6Kwk2+mvnYwxh+VujIsSztROxoU+7HFUkELO0U7GmFpkMNFZF5BLS+10pLIc3vu/UTsZY5LQyOF3/u2oPxPwe2eluF87FWOS1N7hRe+btJORONvZ4Enjo94TmlgZwE5H3/x8jtZOxqvmfO2oCNPtsV8TMcOdvfa2IKrfflczq66glXYqxtTZDc5OA8Zqp+LF9Y6S30Jv7VSM8eQRR22ghNO1U6mrHo7ejyqKXurG7Jfu7JbgcrK1k6mLNCY7Svw27VSMEch2Nv7l49qp1MV1jpKeYNf+TcT1dXQsXMq52qkkq62jEVIWp+7YKCZGLnP043A1TbRTSc6rTtLdRV/tRIxxYpyjLuDP2okkY4SjA55LtRMxxpEspjlpFSWcpp1KbZqR6yTVSN75NKYGbVnnpF0sCfskOG7G/Xvfhvs2KeZMR+MFPaidyOGcRamDFNfSWjsRY5z7uZMOoJB+2onUpCHLnJznpMQwCMZUkebosaBpYb05PtZJer/XTsMYn7RwdIXsWu1EqtPDybi/s6mnnYgxvhnm5CR5axhfj3vTQWJ77d6/SXFungl4SjuNqoY5Setm7TSM8VkD5jloKaWcpJ1IZZl85SCpSWG9uGGMQwMpcNBaZpKunUiFWx0ktIm22mkYEwg3swdco51GuRZOZki/UDsNYwKSzocOWsxGmmknUuYxB8lE6m1nY4S6Oxk09CHtNACOdfCI41p78dfEzLUOOoACemqnAVMdJPId7SSMCdzbDlrOK9pJXOogiZe1kzBGQVd2i9tOKadoppDBYnEK2+mgvSeMUXGHgx+fMzRvnrsY++967b1gjJJMZjtoQSO1wq/PanHwH9rDPybGTnQwed4ysnSC/5E49H300d4Dxqj6i4NjgDEagTd08GrjL7Wrb4yypg7a0TcaA4XdLg57ntahizEhMtLBMcCtQQedzUZx0MO0K29MKLwhbkubg54z4B5xyK9pV92YkOjKHnF7uivIgHPEc/8U0Eu76saExm/EHcB2coIL90FxuDbuvzEVsh3MGxDYJfWW4kcYN9rLP8Yc5HoH1wECmkL8PnGoN2hX25iQSXfwVODtQQTaiM3CMOeQoV1tY0LnLHEHsIFG/od5szhMm/jDmOq8K25bt/gdYgbLhSG+ql1lY0KqD0XC1rXW73k1vicMsJje2lU2JrSeEB8DXOlvgDOF4T2tXWFjQqw1O4QtbJ6f79dKL1MU0kO7wsaEmvwZ22/5F9wkYWhPaFfXmJBrKn7K9n2/QjtGOLFhAV20q2tM6N0rPgYY5E9gzwvD+ot2ZY2JgGbkCVvaM36E1ZZCUVD5dNSurDGR8GthB7CP1u6DulsY1B+1q2pMROSIjwF+5TqkdFYJf/7b4N/GJOt+YQewzvUDQecLA/qDdkWNiZAjxHMHXu42oDdFwRTSSbuixkTKWGEHMM1lMJ2EE4A+q11NYyLmCHYJu4B+yXxMelLBjBa+wPuwdjWNiZitPC7cgrM5tzL5RtQTTVYupTFR1Fn4bmCeq9EBpDMA+/hssjEp7BVhy7vCTRiTRUF8ZbP/GePJ0DBcCOwlfAPgWu0qGhNZs0Rtr7T2wfdrvwh4legn+EZe0K6hMZE1TrR2GqPkISwT9UE2/acx3tVjvaj9rZUOwHuy6OPzOUK7gsZE2r3C6wBnyz7+UdGHP6ddPWMirjX5ojYoeggvkw2iDz9Nu3rGRN4zoja4RzJv8Hmij15sNwCNERskPAk47NMAh78L8ANR4E+S0K6dMZE3my9F61/mdcUGoiGKC2ilXTljUsKPRUcAhV4vxV8m+tjx2lUzJkUcwT5RW/T4WtBE0YeepV01Y1LGq6K2OMXLRzanQPCRy+wCoDHOXCDqAIppU9OGa74IeKFoVLG/2wVAY5yZxHrB2hl8p6Z/qrkDuEDwgSU2BpAxDhXzL9H6F9V1hfqiQQl9m5zImJjqJ7wTkFP9Zms6AjhT8vwQL2lXy5gUs4AvBGtnMbz6f6ipA5CcABTxWkBFMSY+nhatfXHd/vvXgsONd7QrZUwKaikaI3AX9avbaPVHAAPpLAj0Re1KGZOCtoiG+Mqu/tW86juAEYIPKuD1AItiTHzITq2/nfx//UJwqGHn/8b4oy0lgpa5JNmPaS8aBtTzu0fGmFp8KroZ2PPQDVZ3CjBC8BjvXt7SrpExKetV0drVnARU1wGcJ/iISewJtCDGxInsBHt4Mv8pnS2Cg4xrtCtkTEqbLWidew69FXjoEcAxgpF8E7ynXR9jUprkJKARJ1X9q0M7gDMFHzCLdQolMSY+Xhatfcgg4Yd2AGcINm/PABrjr6XJ386rxrDa/kMGeYJzjBO0q2NMypPM1VFEs4M3VvUIYGBNrw0mYRMztWtjTMr7j2DdzKoPBFftACRXAN6lVKkkxsTHhxQJ1h568B+rdgBnCDb9tk49jImVXXwuWHvo4f4xUzATQJHg5MEYk7x7BVcBCmlUeVMHHwEMpqnnoGawXbsuxsSC5CpAFidW/uPBHYBkMk/Ju8rGmOR9wQ7B2gedBBzcAUhu41kHYEwwipkqWHtIzf/kfSCwItEgosaYurhZcBVge00jgbYSbFQyYqkxpm56C9pqgqMqNlS5L7ATAGOiYanorZtKlwErdwDHCzY5XbkgxsTLZ4J1K/2or9wBHOd5gwk+0a6HMbEyQ7BuDcf6GzyfU3ylXQ1jYuY0wTWAAhqUb6biCKBzzVMI18quABgTrJkUe163Hv3Kf1vRAXg/AYCPtathTMzsZZ5g7WPLf1PRAUjuAdhrwMYETXIVoJoOYLDnje1muXYtjIkdSQcw4NC/8n4J0K4AGBO8XoLLgHnlc3+UHwE0F1wCnKNdCWNiaDlbPa+bQ5ey35R3AEd53hTM1q6EMTGUED0M1L/sl/IOoK9gU9YBGKNhvmDd/T/y5UcA+1ikXQdjYmmBYN0+Zb+kH/xHD+aLhig0xngleQLXWQdgJwDG6FhEied1D+oAGpRfE/RgjnYVjImpfaz0vG4O7aG8AziSDM8bWqhdBWNiS9L6ekF5ByC5CbhUuwbGxJbkMmAPKO8AvF8B2M1G7RoYE1uOOoBenjeyjIR2DYyJLcl9gEodQGfPG7ETAGP0LBGMCtAdyjuAjp43sky7AsbEWIHgPsCBI4B0OnjeiHUAxmha7XnNFjQr6wDakeV5I3YKYIymNYJ1O5V1AJ0Em7AjAGM0STqAjtIOIE/wRrIxRu5rwbr7jwC8XwL0fgHCGOOCpAPYfwTg/SbgN9rZGxNzDjoA70cAG7SzNybmvhG8EWhHAMZEXBHrPa/bxo4AjIm61Z7XbF3WAbT0vAHJFMXGGBe83whsRVo6janneQPeDz6MMW7kel4zk+bptBB8tB0BGKNtm2Dd1uk097xyCZu0czcm9iQP47WWHAFsFNyAMMa4ITkCaJEpOAKI+z2AHIZxOv3oRjPS2Md6ljCDKaJRWoLRi3M4maPoQEMS7GYlC5nOZLZoB1aLDIZwJoPoSWsyKGUTK/iSD5kW66HpJR1AM7jO8wSDU7QzV3QyE8ivoS7zuJmG2gHWoB7X8nkNcRfyOmdpB1ij9vyO9TVEvomHRa+0RdsxgklCb4GfeV7539qZK+nFu7XWZj1Xlc+/GiLfZXWtkX/EMdphHqIxY9lXS9wFPEJT7UBVdBB0APfC/Z5X/qd25ipuqvEnf9VlEq20g62kGROSjLuIn4eq8zqOFUlGvoZTtYNV0EDQATwMf/O88p+1Mw9cJv+oU4XWiCZddakLi+sU+as00A55v8tq/dl/cOd1jXbACvZ6bsNPwXjPKz+onXfAMni5zjXawtHaYQPdyK1z5JOprx02cBUldYy7lJu1gw5c3fdu+fIKvON55V9o5x2wv3qqUq5gxEU3WrDUU+Tj1U8EhlPkIe4Svqscd9Dmem7Db8MUzyv/SDvvQF3huU7TyFSMO403PEf+Y9WKd2arx7h30FM18qB97HkPT4XpnlcepZ13gNqQ57lOCW5VjPxqQdz76K0Y+VuCyKerH70E6QPPdZoBn3le+SLtvAP0lODLmGCn2v2AbDaKIp+oVvELRXEnuFwt8uBN8lyluemCdwF3aecdmM5cIVq/idoxwBhai9b/DoOVIpdeYbpn/6Q3cVDgec1Gkg4gXzvvwNwkmDmhzBiVa+pp/FC8jTEKccOJnCTcQh/OVIlcQ6HnNRtKOoBS7bwDksYPxNtowXkKkZ9aNv2TyEjBN8S7Kx1sQ77XosJ7B5Ap6QDi8i5gX8GgaRU0OgAXn5kj/lmsFfm3FOLW4f0UIMOOAGo3xMlWhlrkSWvj5DZeOwfHP9Hg/QjAOoAk9HGylSPJiGjkR0U0bo3IdSidAsSlA3Dzomk92gQct6tP7BJw3JKB6rUj12GnAL5q4mg7Qb+s6ipuV9sJ/hPj8nqw6BQg4XnluHQAxqSsdMFgSnHpAFw98LTT4g74E4OPXIfgTl664PAhLh3AWidbKWBjwHEXOvpEyQz03ripuGzizChR6gC8nzxEy0InW1mq8NyEm8gXBR63q09cHHjkOkQdgPdTgDAMGBGET5xsZVpkI58eeNwbWe5gK+tYEXjkOrx3AMWSDqCRdt4BWejkkPQ9hcgnOdjGdj6LaOQuthENSqcAcekAEvxLvI1tKh3Apw5+Bk4QfEO8e97BNuR7LSrsCMBnfxM3gsdUmlGCv4q38LhC3PAZ/xVuYSEfqkSuwfvJ+F7JEUBYJ79wbw3PidbfySNKkT8uvBMwkdlKkT8gXP/XsblLJTkCyIf/eh5NJF5Dgm0TjE5zi2LkowRx76W7YuRvCiKfFqshwbyP6zkDPvK88o3aeQfq+57r9KHCa0AV0pjoOXLdYV87scVj3Ntj8x5gmWme9/BU+I/nlW/Tzjtgj3qq0lraK8fdnCWeIte/iHYehR7iLonVaJUAczy34bdJesKoQ5e7tfMOWAYv1blGm+mnHTbQlTV1jvw9lZGAqrqS4jrGXRqzI1PAw94tX16Bxz2vfL923oHL4Ik6VWh1aN5I78zCOkX+Umge87o06bkYEyQojNWVqXJ7PLfhf8BYzyvHb25AgNFJz8T2Fi21g62kSdKTwBXys1BdQhuY9MxGq1WGL9NW33MLTvAw3Ol55QnamSvpnsRcO7l8XzvMalyYxDy774dmQtMKDfnfWrvdffyebO1AVbQXdAD3wGjPK0/VzlzR8Yyv8Sv5JTeG5gC6qiyuqvHGbwH/5jTtAGvUhgdqnARzAw+pz8Cop7+gA/hxGiM9/yRfGIoLXHqacjZn0I+utCCNfNaxhBlMjsA7aN05h1PoQ3sak2AHq1nANKawTTuwWmRwEmczkN60IotiNrOMOXzAJxRrh6bodMEzj1fBMM+9x2btzI0xXCw4AvhOOnmeP7iF6gMuxhiA5oJ1t0k6gHSO0M7dmNiTtMJNkg4A4cSTxhi5FoJ1N6ezQ/DWlHUAxmjzfv+jiLx0StnieQNas94bY8p5n0ZlC4l0INfzBoKe68YYU5X3+Y82QTqSQZi7auduTMxlCE4B9ncA3o8Aumlnb0zMtSfL87prpUcA1gEYo0syAaq4A9AcMMoYI+sAcqWnAE1C9cKrMfEjmUo9V3oEYMcAxuhycArwjeBRIOsAjNHk4AigkE2eN2GXAY3R1NXzmnnsKOsA7EagMdGUJRgAfQWUdwDeZ4C3UwBj9PQSjN28Eso7gKWeNxKWUW+NiSPJmFzLobwD8D6IVQcbE8AYNZIOoNIRwCLBZo7WroExseWoA1hMwvNmrAMwRoukA1gC5R3ATtZ73ox1AMboyKKn53X3t/n0/X/0fhXgGO0qGBNTRwreBFxUdtSffuCPXvU/sA1jTJAkJwD7W3x5413ieUON7VkAY1Q47ADsPoAxUSNpeftP+l10AHYVwBgNJwrWXVD2S3kHsI6dnjc1QLsOxsRQF9p5Xndn2VMAFR1AgvmeN3aydiWMiaGTBOvOK3/yp+IK/kzPG2sjeCPJGOONpAOYU/4bFx0AnKJdC2NiR9IBzC3/TUUH8IVgc3YSYEyw6jNQsPbcQ/8qnR2eZxmfo10NY2LmRM+tNUERjco3U3EEUMosz8EcTTPtehgTK5Kj7vnsLf9t5cd4vV8FSOcE7XoYEyuSZwA+q/itmw7ALgMaEyzJJcBK1/vSq//rOrPLgMYEp7NoYt7PavqHzZ4vK2wnQ7smxsTGdYJLgDsrt9WDX+X1fhmwGcdr18SY2BgmWHcmJRV/OLgD+Fyw2XNVC2JMfKRztmDtjw/eVGUfCTZrHYAxwRhAK8Ha02v+pwbkez6zKKa5dl2MiYU7BVcAimlSeVMHHwHsE5wEZHCmdl2MiQXJFYA57Kr8x6rj+X0o2LSdBBjjvwacKli7yglA1Q5gqmDT5ykVxJg4GUpDwdrTD//P9dkrOL/orV0bY1Le7wUttISWB2+s6hFAATMEodkxgDF+k5xqf8mWg//i0DH97STAmPDqxrGCtd+v+heHdgAfCjY/jKbBV8SYGLlEtPaU2v9LPfYIzjEu166PMSntU0HrLKBx1c0degRQyKeC8C7Vro8xKay9aByAT9hT9a+qm9fvXcFHDD+0jzHGOPJd0UycSbbsHoKDjIQdAxjjmw9EbTPpuQQXCj5kvHaNjElRLSkStMw11W2y+gOKNwVBXiB6TskYU5OLyBSs/VZ1f+m+A8i2dwKM8cV3RWvX4dpehmBwsATPadfJmBTUjH2CVplf/eX56o8ASnhbEOgI6mvXypiU811Ru5p86C1AoMabCpKTgGZcEFhRjImLq0Vrv1a3/54tGBsoUf3lBmOMZ90oFbTI4qpvAZar6Qhgt2h8wPNor10vY1LK1aQJ1v6o6luA5Wp+rkhyEpDJFYEUxZh4SBO2qH/XfZX2FAsOORZpV8yYFHKW6AnAUjp6+dApog+1ycKMceVZUVucVvOGD/dqgeyh3mu0a2ZMisjmYtH6L3lbralofMAdNNKumzEpQTITYIJi2nj94FdFH2wXAo1xYbqoHU72/sGXiD74A+26GZMCjhQ9AZDgeu8f3YDtgg8uTf79Y2NMDf4sav77aCH58KdEH/64du2Mibgcdona4Cuyjx8m+vC9HKFdP2Mi7WeiFphghOzj08kVffzPtetnTIRlsFLU/jaSJQ3hEVEAufIAjIkt2WX4BA/LQzhWGMJl2jU0JrI+Era+AS6CkExFkBDNMmBMnA0UNv/ZbsK4ShiGZCoDY+LrGWHLu9FNGA3ZKgrjX9p1NCaCWosG5UmwO5mZOpOZZySff4oSGUkH7VoaEzk30UC0/ovsdBWK9GHEcdq1NCZimgqPuxOc4DIc2ZRE+TZEmDF1crew+c91G85lwnD+oF1PYyKkMZuELe4GtwHVY4PwGKCddk2NiYyfC5v/tmRn6c5IMqASjmCIIKFMSiXvJRsTI415MdkGXINxdZkILDldRIOEJthNa7WCGhMltwt//hfT1Y+w/i0M6wHtuhoTAQ1YJ2xpL/sT2MnCsHbay8HG1OpWYTtLcJpfoU0TBva/2rU1JuQa8I2wlX3uX3AjhKHtoJV2fY0JtZ+If/6P9C+4NL4SBvdn7foaE2I5bBG2sBVJ39nz5GpheEX01a6xMaH1B/HP/x/6G2AWXwsDnKhdY2NCqhv7hK1ri/D5gSRIBylMcLp2nY0JpZfEbese/4NsQp4wyNlJvYRsTLycJHznNsEOmgcR6IPifuoH2rU2JnQ+Frer3wYTaDvhSCUJVguHOjAm1YwUN/9dtAwq2EfEwd6pXW9jQqQey8Rt6nfBhdtaOF1Rgu32SJAxB9wmbv57vE8C7sX94oCf0a65MSHRRnxhPcH/BRtyjnjEslLO0q67MaHwgoPz/8Bftr9LHPQS6mtX3hh154pbUoJfBx92Y+EgYQkS3KVde2OU1WexuB3lBXP/vyr5e8t76aFdf2NU/dbBz3+le2oNWCsOfZJ2/Y1R1JcCcRta5//z/zUZ46D3stmDTVylCefbKFscDwBeF1ksF4e/nhzt/WCMiusdNP+FZGqmcLmDFGyQEBNHrcW30hMkuEA3iTSmi1MosReETQw956D5f6CdBAyiRJzGqmQmMjYmhVzkoPmXMFg7DYAnHKTyD+0kjAlQawdP0SR4SjuNMq0cPMmc4BLtNIwJSBpvOmgxO8Mz36b8kaAEm4J9m8kYNT900F4S/FQ7jQqZzHeQ0ETtNIwJQA/xy/QJEiwL15s0w5z0aaO00zDGZ5nMcNJWhmsnUtUbDpLaTiftNIzx1b1Omv8b2mkcqpeDp5oTTCFNOxFjfHMCRQ5ayW66aCdSnbFO+rZfaKdhjE8as8RJG7lDO5HqNXIwsGGCInsu0KSop500//lkaSdSk9PFUxskSLCB9tqJGOOci3dnE5RyhnYih+PiqcAEU/2d4dSYwA0Wz6ZRtjypncjhNXUwSEiCBPdrJ2KMQ81Z4aRdrNMZ/KsuLnB0oPMd7USMcSSdt520igQXa6eSjAlOUt1GN+1EjHHiHkfN/0XtRJLTkk1O0v0sXA87GuPJ2RQ7aQ9bovO2zFWOerw/aSdijFAnNjtqDVdop1IXkxwlfaN2IsYIZDmY9LtsmaidSt10dfLGU4JCm0DMRNg/HDX/jcFP/SV1raPUt9FbOxVjPPmlozYQ0eFyxjtKfgUttVMxps5GOhgts2yJ6IB5Oax2VIBp1NNOxpg6OZ49jr79a6M7c8Zpjm6AJPi7dirG1EF3R7fCExRzmnYyEi6mPixbfqadijFJaupkiLyy5T7tZGQy+dRRIUrs4WATCVlMcdb8P9ad+MuFHux0VIxdHKWdjDG1etpZ888L58g/dTXKWUHm0kA7GWMO625n3/YEI7WTceUFOyMysTDGyZA4Zctj2sm404yVjoqygyO0kzGmBj9wduc/wazUOtp1NR6KDRpqwuoiJyP+li15dNdOx7XRjkozVzsRY6oxzNmPuASl0Rj4o66ecVSertqJGFPFUGfP/SVI8HvtdPzRiLlOypOSvaOJsOPY4bD5T43+vf+a9HIykfh92mkYU0l/tjhs/l9H78XfujjHwdsBE7STMOaAnqxz2PzzOV47Ib/dIS7SV9opGLNfD2dvvJYtsZgf+2nxQZIxYXAUuU6b/x+1EwpGQ2aKyrRGOwFjgGPZ6LT5T07di39V3WynACbiTmCb0+a/KLrDftRVPeGDwS9rJ2Bib6jTG38JttJLO6Xg/ERYrHu0EzAxd67Tx34SFER71J+6yRafOQ3UTsHE2oXsc9r8E1ytnVKQfiUs1grtBEysXefwlZ+y5TfaKQWpufjSiY0NaLSkcZ/jxp/gedK00wrSQ8Jy5dFUOwUTU1kOB/sqX94jSzutIPUSnz09oJ2Cials3nHe/OfRTDutYL0nLFg+bbVTMLHUni+dN/9VtNNOK1jfFZcshUZJMxHS1/ET/wkSbOJI7bSC1ZBVwpIVx+lhCRMa5zp5if3gJY8B2mkFTX791F4DNsEb7fy2X4K9DNVOK2jd2CssWmn8+kyjrCHPO2/8CQr5tnZiQUsTX/6zn/8maJ2Eb63WdCJ7mXZiwbvRQdn6aCdhYuVU1vvQ/Eu5Xjux4HV1MDvgP7WTMLEymgJfmv+N2okFL50PHJw1pdw0CSa0GvJ3Hxp/glJu0k5Nw48dlM7u/5ugHOVo8PpDlzu0U9PQnV3iwuXTSTsNExOj2O3TT/+faKemIYtPHRTvYe00TCxk86xPP/tL+aF2cjr+5KB4W20+YBOAvsz3rfnH8twfLndSvjHaaZgYuNHh1J4HL8VcqZ2cjr4Ozv4TzCZDOxGT4tryhk+NP0FhHB/7AchmgZMCxmiwRKNiJJt9a/57GK6dno40Jjgp4AvaiZiUluPbZb8ECfIYop2gltsd9Z92+8/450I2+Nj813OsdoJaLqHESQl/pZ2ISVk5PONj40+wkh7aKWo5Rfzib9mylIbaqZgUdRFrfW3+s+I7dN2Rji6plMRvyAQTiM687mvjT/Au2dpJaunkbOy0cdqpmBSUyS0O3kw9/PJ0tAb6djkpQXumOTrzWcXR7AmwCs04ntZkU0wuy1kZ4Ceb4JzIYz6PKpXgvnjN81NZW0d3/hOUclZgUbfmduZVuWi5nHFxG7E15eXwF0eXpmte9jFKO009HVnirJBBvfzbmAdrnKikhPHWCaSIdK7zZXSfg5dNnKqdqJ5urHRWyDUBTf51AmtqiaSQR2mpXVojdDZzfG/8CebTTTtRPUeT67CU3wok5pFJ3qzM43bqaxfYeHSkj0/5V17ejvOMlcPY7rCUfwkg4vqMo7QOMa3ksnjN4JoSjmAchYE0/4fi/MLa1U6LPI8Gvkfcm9keIvuUk7VLbZJWn1vF09Ant+zmcu1k9WTxR6fF3ENf32O+0vNLyqW8TD/tkptaZTG61qs7rpblHKOdrp62THNcTr9HTM8WP/9dwnibnyDEMriKFQE1/gTv0lw7YT3DWOe4nH6P/D+AxU7iLOF5u0EYQun8j6M9nNy34Deka6espQFjnT9UMZdGPkacyZ013vH3tvsn0Ft7N5gD0hjh6cqO12VzQPeqQmmQD4MnbvN14o+jmeXDl6CIp+1IIASyGOXbcJ7VL9PooJ20lqb8kWLnBS3hfN8izuQuXyZ5Ko/8dXtrUVFTfurzi71Vl1LGkqmdto40vsc3vhT1Z77FPMiX+V2rLjMYGec7wUraMZa8QBt/gg1xHeMPzmCGT0X9u08RN+cvPhyt1LSs4Ec01t5JsdGHvzu9ppPc8g5ttBPXMYB3fSvqVOr5EHEa17Ip8C/IVu6ns/bOSnGZXMKUOj3H6WbJ55Z4Pg3anud8fI1ykS+z/gx2MiGZt6WYN7nATgh80YH7fDoJrW35Kq4P/Fzt61nWWh9+XnbjXwo/H6ouX3M37bV3XgpJYxivUqSyL0t4KIAH1EMo08nMfjUv2+jvOOKWPOLjFf+6LkW8yrnxfVjEmQ7c7nCsibouK+I6NU0zJvla2L2Oh09owi+dvpXoalnFbwN4wyE1ZXMl//F9HJ+al1Iei+vwntm+PDpTseRzrsNoW3AfW9Wb+uGW2fw0vg+PeJDBuTzLbtV99nV8n/bL5G1fS7vP4d3UNvzO93Fe3SwlvM81NNPeuSGXxgn8n9Klvsr76lGaaJdCz+O+FrfA2XN//Xnc0SQkwS35vMZVvtz7iLoMzmBcYC/yHm5ZwCnaxdA00ucGMMJBjBlcxPvqXxTvSzEfcquv7z9ESX2+zZMKz21UtxTw63gPAdfM+Wu+lZedDgb87sDPWaX+RXGzzON/GRzPB0wAaMdVjA/RxdsPbLSHv/pY3m3CYbXqM4IJSneD/Vw2MoHRdNHe9QHKZAhjmRmCJzYqlvWMinFXvF9PH2+65AoG1MpgGI8FNMqb3rKYP3MxOdpfAh+lczS3Mil0V26KedQuzwI84luJv6Sjp4iyOI8nHU04Go2lmM/4Hd9JqRdPGjCUX/BWSLvw6QzSLpCeygc92eT61A++yffZXcd1OnEe3+LslP6JeHir+JTP+C9zKNYOxaPWnMwQTuE4X175cmENdzCBhHYYeip3AGN8mpTrYe6gJOn/3ZohDOUcG4H3gL3M4nPmMZ8FFGoHk4TuDGQAAxgY8oef9vA7HiJfOwxdlTuAd3wY7iCfm3gmif9Xj/4M4iSG2DBbh1HMEr5iLvOZz9fawRykJb05iqMZyIBInE2X8hx3k6sdhr6KDqAe22noeOvLuZS5Nf5rOl04kr70YRD9Q3uQGFY7WcEKVrCSFaxgbR2OsdxoRC9604sj6U1vWmiXo04mcSfztIMIh4oOYDAzHW97Ilez48Cf6tGSVrSlFZ3oRGe60t15hyO1nJKIHoEUspoVbGAdG1nPBjawjr0Ot9+StnSiPR3pSHs60y6yTzPO5g7e1w4iPCoGOHQ95EERnfmAHNLIIT0Ch4UJ/sYdFHAF99JVO5g6q0fvQwYq38037GI7O9jFLnayizx2UQzk7f8fpfs76CZkkkV2pd/l0JzmNKfF/l9Tw1Lu48U4X/I7nN+o347RXNZzwYFKZDHa6XzHtoRhWc3ouI7nezgVA1a01g5F0cv0460DfyriCbozhg3aYRlH1vITjuSJyN5O9VFFBxDXMW23cCnfY1uVvy3kCXrxCzZph2eEVnMTvRhHgXYg4VTRAcTzOeiX6cerNfzbbsbSmTGs1Q7SeLSSn3AUf7PGX7OKDiB+D0Qs4Sy+V8vP+AKeoCfXsUw7WFNHc7ncfvLXrqIDiNfBbgH3cSxTk/q/hTxFH/7nME80mHCZwnAG8hKl2oFEyWj167TBLe97nNv3LN5QHKTSltqXQp5lgHZTiqZT1XdeMMsyLhHVqRd/Zpd6FrYcumxhbMjfPgi17ABn0tNatnGbk0eOc7idr9WzsaVimc11oXuuNHL0JtQKYinkcafPOqQzLCXHJ4raUsybDNNuOqnhbvWd6ddSwgSPZ/216cr9rFfPL67LUu6krXazSR09QjVGm6ullNd8ntoxi0uZnJK1C++Sz/OcEdNnV3w0VX3Hul1KeT2wa8Jd+RVL1TOOwzKDm1Pm9aSQOV9957pbSpjI4MAreAp/C+nId6mwrOa3EX1dOyLS+Fh9J7tY9vKY4helPpcwkX3qVUilZQOPcYbNtey//hSq72zZsomxtNcuI9CIEeoTXKbCsolnGWEv8gbnYfVd7n2ZyQ000C7gQZpyBa+Tr16ZKC4reYiT7UKfvw4tbxM+i+AESbsYzxPM0g6jBk0ZzgUMj+wwWkFbyqu8Gtq9mVKq6197MIOW2oHVwUyeZDy7tMOoVQYncwEj6KsdSGgV8wmTeIuvtAOJj+oPsIYwJRJzpC7nBcazWDuMOurO+ZzDGXGegf4QuUxiElMqDSJrAlHTGdb5vEi2dnCHsZ4JvMDn2mEIZHIiZzOMk8jSDkXRNj7kAz5gkXYgcVXzJZZBvBmKq+lVLeZ1XuezlHnXO5vTOJNTGRyrmRE2MoOP+YA5KbMfI+pw11g78jInaQd4QBEzeIuJLNUOxCcNOY4hnMopKfyUWxFz+S8z+C+rtEMxZQ5/kyWdMTygPD1ngnm8z/tMq/P0otGURl+OZzCDGZAyL7iuZwb/ZQYzYzjwXMjVfpe1LQ9whcJ56j5mMYNPmc5mjcKEQCZ9GcxgBtE3AhOrHGoVc5nHPGaGbB5DU0lyj1l04kaupFMA8RSxgHl8yQxmR2Im3KB0oi/96cPR9Anx3YMEa1jCIhaxgHns1A7H1C7556zSOY7zOIlBzt/ALmA5S1nGAuaykCLtkoReR3rQgx70pAc9lE/QSshl5f5lKUvYo10cUzdeHrRsuv8L2IGOtKUTbep0grCPLWwhl2/4hjXksoI1diVY4Ag604GOtKMz7ehIOx9n6t3HZjawnjWsI5e15LLGjtOizc2T1tnk7F8a7p8INJ1mFLKHYnbtn4IyD9jCFvsZ4btMjjiwtCKHpjSiETk0pCHNgcb7bzjWOzAb1N79o+fvI5+9FLCLYrazgx1sZwfbyWMLm9gYk8uwsfL/AeUzNiaJWAunAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE5LTA4LTMwVDEzOjIyOjQ5KzAwOjAw46f0YwAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxOS0wOC0zMFQxMzoyMjo0OSswMDowMJL6TN8AAAAZdEVYdFNvZnR3YXJlAHd3dy5pbmtzY2FwZS5vcmeb7jwaAAAAAElFTkSuQmCC"
-b64_phone = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4NGAUmG1dkAAAkc0lEQVR42u3deYBU1ZUG8K+r6Q1a9kUB2w1lNe5Ro0aJGDURo3FcECPuJtEMUWM0M6No4mQxi2F0EsmYaFBQdgUEFSQqRNRIcANUWgirCrJKy9r95o+mBdpuuqrOPe+8++73e/+JXXXvrXu+um+p9wrgr874ErrhMByK/bAPWqIMLfApPkMV1mMZKrEQlXgTn1g3kyi5CqwbkIcK9MWpOAXdsvh/I8zDi5iJGVht3WwikmmLyzENNYhy3nZgFq5DS+sOEFF+vobJ2J5H6e++fYYRONq6I0SUiwz6Y7aw9HffZqG/l7s+RAE6EwscFn/d9jKOte4YEe1dVwxXKP7arQbD0dG6g0TUsAx+gs1q5V+7rcWV1t0koi/qiKnKxV+3jUVr684S0e76YWVM5R8hwmKcaN1hIqpzc15n+iXbFlxs3WkiAgpwV8zFX7vV4EfWXScKXSEeMin/2m0orw4gslOMpwzLP0KEPzICiGwU40nj8o8Q4SFkrAeCKDz23/6MACIjxZhoXviMACITJZhkXvR7bn9mBBDFowSTzQueEUBkojmmmRc7I4DIRHNMNy/0xre/MAKI9DTH8+ZFzgggMpH88mcEEClpgRnmxZ3dNhKF1oNFlC4t8Dfzws5+e5wRQOROC7xgXtS5RkAz60EjSoeWeNm8oBkBRCZaOb3BNyOAyCOt8Ip5Iee/PcEIIMpfa7xqXsSMACITbfC6UlkuxgPojz7oiAz2xRG4CH/BR0rv9RjPCBDlri3mqBTkTHy1wffL4Fy8zQggSoJ2mKtQikvxzb2+awaDsFbhfUcwAoiy1x5vKJThDLTN4r0r8JbCe/PqQKIsdcCbCiX4JEqyfP/WKtcdMAKIstBR5Rt4ctblD2hdeTiaZwSI9q6dSvmPRVGO7WiJvyu0gycFifaiJV5TKLsxOZc/oPXzozGMAKKGNVdaeOdT/oBeBOTbHqIUK8YUhXIbJfrGZQQQxaIQoxNX/oBWBOR+TIIoxTIYoVBmbg656dyJiBFA9Ln7FUrsr87Ou5fjJUYAkZYfKpSX28tumqusAsYxAojOxQ7npfWo8zvztsCLjAAi147CpwqF9S46O2+pzk3Jc7tCkShVOmOZQlExAog8sI/Kb/78i4CnGQEUnoz6M37nY1/nrdY5KTgBxdYfB1G8hiiXv94qQOPxpFwFUFBOVzj273cETGEEUCgqsDqW8teLgGkqEVBq/cEQ6StR+dFvvBFQxgggys+wWMvfrwiYygigdLs89vKPoHNGQCcCJvFYAKXXwdhoEgA6q4ASlVOZXAVQSjUzfc4vI4DI1B2G5a8XAZMUWvoMI4DS5mhsNQ4ARgCRkVKlJ+8lIQKKVSLgWUYApcf/mJe+jxFQZv2xEblwOmrMC3/XpnFSsBRTFVrKHQFKgRK8a170cawCJnIVQPRF95gXfFwR8JRCS59jBJDPumOLebkzAohMFKg8WiO0CHgBLaw/SKJ8XOuoBGrwpEJhaRwO1Lk6cBpXAeSf9s5++X8vgNu8WQVohNWLKLf+OIly81dHk3/6zsd83eXJKkDnjMB0NLf+QImydxSqnUz8Jejw+Wv6swqYoNDSl7gKIH+4uXfeZhy7x6syAog8cK6jKX/1F155iEJh6ewIaJwRmMEdAUq+ZpjnZLqPbfDVfVkFFHEVQGG60clUX4a2jby+PxEwXqGlMxkBlGT74CMH07wafffyHqFHwD7WHzJRY9xc/f/TJt5liEJhaRwL0IkAXh1ICdUWGxxM8Fd2nvvfG38iYJxKBPBwICXQzxxM7q3ondV7+bIjUIiRCi2dnEVIEsWqFdY5mNp3ZP1+YUfAoyiw/sCJdufict03c3pgtj8RMEKhpfdYf+BEu7j4/t9e79q/pg1RKCydYwFjFFp6sfWHTlTHxb3/f53H+/oSAc0w2nk71+MQ64+dCADKsUY8nVfkeZGLPxEwynk7X8tpl4lIyfcdTObL8n73kCMgn1UTkVMFWCCeyC+Ljmr7czjwUcet3IEj7D54IgA4WzyNq3GcsA3hRsAsnhAkW/JHY/zJQSvCjYAB8X/kRHW6i5/+s8nR/vYQhQjQOBbg+tKg5bxxKNl5QDyBf+6sLRqrgPdUVgHDnbbxe3F+4ES7tMJG4eRdhzYO2+PPKsDl1YGVKIzvIyfa5Xrx5P2J4xb5swpwde/kCLwqkIzMFk7cjxR+3e7PKsDd4cDX4viwifbUUzxxB6u0K8QI6KH9YRPV9yvhpP1E7e42/uwIPOKodXfrftRE9TXDCuGkvVOxdb5EQMZRBFQqjiVRA74pnLKb0E61fUMUIkBnR8DN4cCjVUeTqJ6xwgl7n3oLw1oF/Fh9PIk+1xJbRNN1GypiaKUvqwAXETA5hvEk2mmAcLo+EVM7fYmAQvFNxNfxciCKj/QmV6fF1lKNCFigEAEtMF/YqqNiG1MKXBk2Cb9D4/wRqy8RcILwh1VXxDimFLTzheVzY8zt9eVw4JOiFv0s5lGlYMl+zbYJrWNvsR+rgD6iNUBcx1UocMXCm4D/n0mr/YiAfwhaM8dkXCk4XxeWzVeN2u1DBEgesPKx0bhSYH4nKpklyJi1PPkRcKKgJZ+ZjSsF5W1RwfzCtO1JPxzYSdCOGl4JQPr2FZ6sOty4/cmOgAy2C9rR0nhsKQDfEZXKm9bNR9J3BCRPWXJ/bQJRPbJTgLdbNx9AkiOgGaq5AqDkKsBKUZkk5c41Sd0R6Cp4/xrDw6sUiD7CEkmOZK4C+gre/VPrIaW02vXN0lf0OhOtO7Kbu3GX89fsgb8JI+Bswd9udN4fonpkT7U5ybr59SRvR0DyoNVXrIeT0q9SMEFXJfA8dbJ2BE4Sve+j1oNJadchhRM0SRHwouhdNW+ySgTgHNEEvcq6+Y1ISgRIb7N6ifVAUtrdI5qgB1o3v1FJiIAO4tus97QeRkq76YLp+YF14/fK+nBgGWYK3+3jWO+yRAHKYINggj5k3fwmWK4CSvGM+L1GWw8gpd0hogk60Lr5TbKKABflH+EG6+GjtDtXNEEPtG5+FiwiwE35RzjMevAo7f5DMD1XWTc+S3EfCyjBJCfv8br1wFH6jRBM0EnWjc9anBHgqvwj3GI9bJR+bwgmqE8XqcQVAe7KvxpdrQeN0q4QmwVTVPIjl/gNUYiA+scCXO37R4jwnPWAUfp1F03R9tbNz5F2BJTiWYev/HXr4aL0O08wQVdYNz4PmhHgtvz/aT1UFIKbBFN0mnXj86J1LKAEk52+5kXWA0UhuE8wRe+3bnyedFYB05y+3vwE/siaUkjy/PrvWTc+bxqrALfbWdZDRGGYI5ikp1k3XiDZETDOengoFKsF07STdeNFhpiXeWPbZ15cYE0p0FwwTausGy+W1Ajg9X8Uk56CabrAuvEOJHFHYCrvAEBx6SeYqOm4Ti1pq4CV6Gg9JBSKDNoJ/nqpdfOd0HiOQP6qcZk3v7Ak7zEAAODuhDzZEABuwgzrJlA4Mmgj+Ovl1s135lcJWQXc7e2lVeSp3wn2VvtbN94p+8OBw6yHgMLziGDCnmzdeMdsDweO4qW/FD/JrSvSd796u1XAGDSz7jyF6GXBpPX7OsCG2UQAy5+MvCWYtiXWjVcxJPbyH8XyJyvv5j1t/b8QuDHxRgDLnwwtynvirrZuuqL4dgS4+CdTy/Oeuj7eDix78UQAy5+Mrcp78i62broy/Qhg+ZO59XlP33etm65ONwJY/pQAVXlP4Lesmx4DvQhg+VMibM97Cs+xbnoshqiUP4/8UyJkEAn+NgRbFV5zLAZih3XHiABgU97fYvOsmx6Db6Oai39KszV5T+T3rZuu7gjBERIu/skLH+U9ldN+GrAcC/jtT2m3NO/JnO4LgYDR/Pan9KvMezqn+VJgYCDLn0IwP+8Jvc266YraC66Q5OKfPDJXMKlbWDdezRP89qcwvCCY1l2tG6/kHH77UyjGCSZ2H+vGq2gl+IUky5+8ksFawV9LbimeXHegi8NXG4sBvOqPkooBUF8XfN/hq41m+VOSyQLA5TdlUtyJMmevxWv+KeEyWCP46/QdBDwIVzh7LS7+KfFkK4D9rZvv3D0odvRKLH/ywlcFx7fT9hjL7s5++8fz/uSJAwXTfKF14x27jyf+KDRF2JH3RN+cqpuClGEtv/0pPPn/HjDCgdaNd+gKJ+X/FMuf/DJLMN3Psm68Q684KP/ZKf59BKVQBsASwd/3sO6AM0fiePFrzMM3UvzANEqhDIClgr/vbt0BZwaIX6EK/4Z11t0gyoU0ANKzAjhX/Ao3BPCoFEqhMwT7vKusG+9IN/He/+PWXSDKTxfRxK+wbr4TNwvLfyP2s+4CUe4yAFaILgc+1roLTvQX/v1d+NC6C0T5min47vuFdeMdaCV4QFqECO+jyLoLRPmovZJvvuAV0rAC+LLw4p17sd26C0T5qA0AyUO+jkOBdSfEZCH2MR6z7gBRfmoD4B3BK7TCYdadEDta9NcPYIt1B4gkOon2gK+3br7YYkHva1L1ewgK1LKAz4C3F8XfLOvmE+Wv7ue8rwpe4zTPjwIcKfrr0dbNJ8qfiwDY1/MLgg8Q/fV06+YT5a8uAF4Rvcpp1t0Qkdza9BMssG4+Uf7qAmCO6Ez21627IdJZ8LczEVk3nyh/dQHwGd4WvMoZKLXuiIDk3saSUSMyt+uefpKdgBb4mnVHBCS7AGm7LSoFZlcAzBa9jvTHNJY6CP6WAUAp0Rk1grPhKzw+FfiJoN/p+DE0BWvXCmCl6CdBnYWX01qS/BBok3XjiSR2v6+/7Iz2BdZdyZvkp7wMAPLa7gHwnOiVLvV2J6Aw77+M+DNgSo8W2CK6Kv5k6w7kSfI8QD4FgLy2+wqgSng94KXWncmT5Bm+5daNJ5LY89l+00SvdaGnN8ZaI/jbltaNJ5LYMwCmiF6rPc607k5eJAFwkHXjiST2DIC5WCR6tWusu5MXSQAcat14Ion6j/eeIHq1c0SX1VqRBID/t0OjoNUPgPGiVyv0cg0gCYDjrBtP5FIGK0WnAlcIb7Bt4Q5Bf7fxRCD5rP4KoEa4E9DZw58FSS6BLsKJ1s0nyl/mC/9FthMA3GjdpZxJbooOnGPdfCKXmmG1aCcgwjHWXci5x5sFvV0puJSYyNgXVwA7MFL4mj+y7lSOduB9wV/v5/kdEYnqOUq4Atjh3eUxI0T9fcK6+URuvSGMgPutO5CjHwgDr5t1B4hcGiwMgCq0t+5CTnoI+/u/1h0gcqkDtgpL4lfWXciR5NFoETZ7t9NDtFfjhQHwGbpYdyEnDwv7K7t6gshIY6ewNmOA6HWLUIyp1p3LQTm+Lfr7HngFH1h3gsiVZlgi/E7cKnzmXrz2Fd0XKEKERWht3QmiXDW2AqhBMc4QvnJLTLTuXtY24TThfnwbHMonBVN6tEWV8DtxO3pbdyIHg4S9jRDhu9adIHJnmLggnrfuQg5a4FNxf7fhLOtuELnSS/SsoNrtW9adyMFwB2uAKv46kNJjmrggKlFi3Yms9XMQABFWoad1R4jcOMdBQdxu3YmsZbDQSQR8yAigdMhgvrgcPvXokqBrnAQAI4BSY6CDcphs3YmsFYmvfqjbPvbqDAhRIwrxroNyuNC6G1kb7CgAGAGUEpc7KIbV3vw6sFR4U1RGAKVMMyeHxh627kbWbnMWADwWQKlwpYNSqBFeWByfUlQyAoh2KcIHDkphOdpZdyRLZzoMAO4IUAq4WANEGGPdjaxNcBoBH6KHdYeIJDKY46QUrrLuSJYqsImrAKJd+jophE3obt2RLP2n0wBgBJD3pjgphNdQZN2RrBTjdccRsJI7AuSzntjupBB+b92RLHVz8PPgPbePuAogn8nvD1C7DbTuSJaudRwAXAWQ1zpig5My2IyjrbuSpT87jwCuAshjtzsqg0q0se5KVsocnf3YcxXgy4FQonqK8Y6jMpjSwGNJk2h/rGAEENU5Xnz77Lrtt9ZdydJRzg8GRvgIvay7RZSfPzkrgxusu5Kls8UPSuMqgFKjlbMfzO7w5pah5zk6BcpVAKXApc6KYBOOse5Mlr7jbNdn17aCqwDy03MOl8K+PEBsECOAqNbB2OisCN7HftbdyRIjgGinqx0WwbvoZN2dLF2CHc4jgMcCyEtjHBbBG55cGMQIINqpPT50WASzUW7doSwxAogAAP2dFsHzKLPuUJauUDkWcJh1t4hy5er3gbXbi96sAjQigKsA8k65o6fp1W3TvVkFXMlVABHwJVQ5XgW0sO5SlrgKIAJwmeMiYAQQeeUhRgAjgMJV6vwGmowAIo8cgE+CjQCNw4Ef8YFi5JdvOi+DsCOAzxQkz9zpvAimeXNS8CqFCFiOQ627RZS9Agx3XgRcBRB5owjPMwIYARSutniPEcAIoHAdjFWMAEYAhetkbGEEMAIoXJcqFMFz3pwRuFqh98vQzbpbRNm7CjUBR4DGSUGuAsgrg52XACOAEUAeuZsRwB0BCtm9jABGAIWrAA8yAhgBFK4MHgs6Aq5hBFDYChV+IeBTBHAVQIFjBDACKGiMAEYABa0QjzICGAEULkYAI4CCxghgBFDQGAGMAAoaI0AjAg6x7hZRtkKPAI0fCy9lBJA/GAGMAAoaI4ARQEHTiYBnGQFEfmAEMAIoaIwARgAFjRHACKCgMQIYARQ0RgAjgIIWegRo3DWIEUAeYQQwAihojABGAAWNEcAIoKAxAhgBFDRGACOAgsYIYARQ0LQioNS6Y1liBFDgClWeJhR6BBxs3S2ibDEC3EfAEkYA+SP0CLiWEUBhYwQwAihojABGAAWNEVDDCKCQMQIYARQ0nQh4hhFA5AdGACOAgtYMoxQiYApKrDuWpRsUImAxDrTulifK0QEHoycOQhsUWzfGvQLrBmSlGUbgIuevOhXnY6t117JyA+53/kn9C6dhiXXHEqk1TkJvHIpuOBRd6v3bdixGJd5HJf6J17Hduqnh4CpAYxVwgHW3EqUU38JQzM369OsmTMed+LJ1s0PBYwE8FqAlg5MxFKvzHsWhONq6CyHQWQU8HfQqYFHwq4DWuB0rHYzka7gQGevOpF0zjA46Am5kBDjVBb/GBodjuRDXe7Oi9FQhRihEQOg7AgdZd8tAGe7CZwpzaRkut+5auoUeAdcxAhzoj0UKs6hum4E+1h1MM+4IcEdAoiMmKxZ/7bYNQ1Bo3dH04iqAq4B89cUK9fKv3V5AV+vOplfoq4AfqKwCKqy7pawZ7lH4kXXj22qcY93l9OIqgKuA3JRgTIzFX7vV4FbrbqeXTgRMZQSkUmu8FHv5125DeX2AFkYAIyA7++ENo/KPEGE4iqwHIK0YAe4j4F+pi4D9UWlY/hEijGMEaGEEMAL2zr78GQGqQo+A6xkBe5GM8mcEqGIEMAIalpzyZwSoYgQwAr4oWeXPCFDFCGAE7Cl55c8IUFWIkYwARsBOySx/RoAqRgAjoFZyy58RoIoRoBEBB1p3K0fJLn9GgCpGQOgRkPzyZwSoCj0CBgcdAX6UPyNAVegR8MNgI8Cf8mcEqGIEhBgBfpU/I0AVIyC0CPCv/BkBqhgBIUWAn+XPCFDFCHDf+2RGgL/lzwhQVYSxCh/YJG+eE3uTQu8rE3ezywp8oFie27Ac8/AxI8BPRRjHCHC8LUxUBGiV/0aMwaDdng9chN74MV5Uuq0oI0ANdwTc935xYnYEdBb/VRiKjo28Yy+MVji6wghQpLMKmMhVgDmdb//J6NzE+56s8mQhRoCa0CPg5lRGQIVKGf4UBVm8d2u8wAjwCSMgbRGgU/43Z/3+pXiaEeCTQjyu8IFN4bEAEzr7/rfn1IZiPMUI8AkjIC0RkITyBxgB3mEEpCECklL+ACPAO6FHgP9nBJJU/gAjwDtaEeDLk4V1IqCLvGFZSVr5A4wA7zAC3Pf+/VgiQKf8fyJuFyPAM0UYr/CBPeXNScFbvIwAnRN/tzhpWwlPCvqFqwD3vV+M7oot7oUlCm2Wf/vX4SrAM4wA971fg68otfZ4rE50+QOMAO+EviPwI4Xeb8JAhZZehc8U2vpfztvJHQHP6ERA2KuACMNR7rCN++AxlVZGeB1tnI8oVwGe4SpAo7TeQz9H7Ttb9V4/L6Ol8xHlKsAzoa8CNH4mFCHCJPFDxQ7BaMXir924CiBGgFJxbcVw9MyzTd0wFJvVy58RQAC4I3CrWnlVYwLOyykKS3EBJqncc6exjTsChCJMYASobevwMAY0eZ+d/XEZhmNDjKUffARkc++TUBRhNM5z/qpP4SJss+5aVm7FvervUYk3sBALsRzrUYUtKENztMH+6IZDcbTpg8hn4yxsdPyaJRiPbzhv6Xhcgu3xDEpoeCwg/u/e5Gw8FkCMAPMyZAQwAkzpRMDTjAAvNkYAMQLMy5ARwAgwpXNGgBHgx8YIoOAjQON+Af5sjABiBJiXISOAEWCKEWBdhpabxqVBjADPMAKsy5ARwAgwxQiwLkNGACPAFCPAugwZAYwAU8V4UuEDm+DNB3ZLrL/MS9oW7M+EaJfQVwHXodq8ENMVAVwFeCb0VcAAbDEvxOw2jajiKoCCXwWciFXmxd30thqn4gFPIoCrAM/ofGDjvfnADsN88wLf+/YGKgAU4EFPIoCrAM/orAIme7MKKMco8yJvfHsULXa2s4CrAOupklahrwIKMDimW3XmtlXh6nrt5CqAVIS+CgB6Ya55we+5zWzgmYRcBTAClIS+CgBKcIfKo7ry2Tbgu43c2ZKrAH9mlGeKg18FAF1jeGhH09tUVOyljVwFMAKUcBUAAP2xyLD45+OCJlvIVYBfM8ojjAAAKMMtWGlQ/IswCIVZtZAR4NeM8gh3BOrG4XIsjLH4V+E2lObQPu4IMAKU8AOrU4QrsCCG4p+JgXkEZOirgLFoZj1B0oqrgN0dg6FYrVT6GzEMR+TdstBXAcP5DDAtxZio8IH5uAqoVYILMQnbHI7FeozCZSgXtiv0VcDPbKZDCHR+KejrKqBWc/TDL/G68E4CizEM/Z09XjX0VcDgeKdASLgKaMx+uAz3YVpOZwpWYQp+im+hi/PWhL0K2IG+DQ0JuVCMsejv/FXT9BzYtuiN3uiE9miH9uiws2hqsAHANnyI5ViOlViGf2GpYisK8Edc7/xVfXmy8EocidXOe08AtHYE0rAKSJawdwSm8CtfD3cE/BD2jsBN1sOfZlwF+CHkVUAVDrAe/jRjBPgh5AgYaT346cYI8EPIEXCa9eCnWzEmKUytsYwAx8I9FjCXhwJ1cRXgh3BXAedYD33aMQL8EGoEvGQ98OnHCPBDqBHwFeuBT78SHgvwQpjHAsZZD3sIuArwQ4irgK1oaz3sIeAtQ/wQYgRcLW8MNY0R4IfwImC69ZCHQudYwBhGgGOhHQvYgU7WQx4KrgL8ENoq4BLrAQ9HCSZzFeCBsFYBf7Ae7pDorAJ4UtA1f1YBZXhJ2Kp3rAc7LFqrAN7y2S1/VgEdhA9lqUF768EOCyPAD/5EwPnCNvWVN4FywR0BP/izIzBb1KJrrQc6PFwF+MGXVUA/UXvutR7mEHEV4Ac/VgEFWCZozQTrQQ6TzipgNFcBjvmxChgmaMs/rIc4VIwAP/gQAd8WtGSB9QCHizsCfkj+jsBRgnYssx7ekDEC/JD0CNhX0Ir11oMbNp3nwHJHwLVk7wiUCNqw1XpoQ8dVgB+SvAroKmjBOuuBJUaAH5IbAccK3l/zQayUJZ0dgVHcEXAsqTsClwjefb71oBLACPBFMiPgEcF7v2o9pFRLZ0eA9wtwLXk7Ahl8LJohlBBcBfghaauA80Tv+3Pr4aRdijGRqwAPJGkVkMEbone90nowaXclmMJVgAeSswoYJHzPU6yHkvbECPBDMiLgAKwVvd8OtLIeSKpPa0eAEeCW/Y5AS8wVvtsc60GkhnAV4AfbVcA+mCV+r99bDyE1jKsAP9itAlrgBQfvdL71AFJjSrkK8ILNKsDFtz8fD5pwXAX4If5VgJtv/wgTrYeO9o4R4Id4I8BV+UcYYD1w1BRGgB/iiwB35V+Fcutho6aVYqrC1HqCEeBYPMcC3Oz7127DrYeMssNVgB/0VwHuvv0jRDjKesAoW4wAP+hGgNvyn2I9WJQLRoAf9CLAbflHONV6qCg3PBbgB61jAe72/SNEmGk9TJS7YkziKsADOqsAl1s1jrMeJMoHI8APSY+AP1oPEOVLJwL4HAHXkhwBa9HeengofzrHAh5nBDimcyzAxTbIemhIhqsAPyRzFTDKelhIjhHgh+RFQKXjB5OTEa0dgULrjqVMsnYEtuAY6wEhV7gK8ENyVgE1+I71YJBLjAA/JCUCfmg9EOQaI8APSYgAPgAklUrxjMJkGcljAY5ZHwv4Ewqsh4B0cBXgB8tVwEPIWHef9OisAp7gA8Ucs1oF8Ns/9XRWAZNRZt2xlLFYBfDbPwg6EfA37GPdsZSJOwJY/sHQiYDXeOd4x+KMAJZ/UErxrMIkep2/HXMsrmMB3PcPTonKKuAD9LDuWMrEsQrgt3+QdCJgDe8g55h2BLD8g6UTAVsw0LpjKaMZASz/oJWpHAuowe3WHUuZUnygUv7c9w+eziogwuNoYd211OiC2fz2Jy0lmKwyvRbwgKATp+BDlj9p0oqADTjPumveuw7bWP6kTedYQIRq3MmJlreWGKnyqXDfn75AaxUQYQa6WnfOS8dhodInwm9/aoBeBKzHAOvOeaYAg7GV5U/x0ouACMNRbt09b3R1/HBPlj9lqQzPqU2993Cidfc8UIArsVbtM+C+PzVBcxVQg2H80fBeHah0MJbf/pQ1zQiIsBhnWncwoQpwHTay/Mme5o5AhAh/RTvrLibOlzBLdcy5+Kcc6K4CIqzFYN5K9HOtMRTbVceb3/6UozKV24fuvr2N0607mQAZXI/VyiP9IL/9KXclGK88MSOMx8HW3TR1Kuaoj/FvWP6Un0I8rD49t2IYOlt31MThGK0+uhF+ad1N8lkBhsYwSaswFB2tuxqrHhiNGvVxrcEt1h0l3xXgNzFEQIQNGBLI8+h74BHsiGFEq3GtdVcpHW6LJQIibMTQlP9w6CgMj6X4I+zAIOvOUnrcGNO0jbAVf0ZP6+6qOBMzYhrDCJ/iG9bdpXQ5B5/GNn2r8RTOTNGZ65a4Ae/ENnoRluNI6y5T+hyOJTFO4gjLcFcKDg32wNAYozNChLdQYd1pSqeumBvrVI6wFY/jdE/XAq1xjfLlvQ1tk/mza9JTjomxT+kIKzAUJ3t0OUsh+mE4qgxGahgvsCZdhbFcGdDQ9h6GoLd195tQgrPwID4xGZ/t+Hfr7lMYLsUmoxCIsBjD0B/F1kPwBW1wIYZjvdm4rOIvKyg+ffCu2VSPEGE9RuFaHGo9DACKcQruwkvKv+ZransR+1oPBIWlJcaaTvnabTkexVXoZtD/UpyIW/GM4VqobqvBb+La8/fnMAzpK8At+EVCDjqtwes7t+Wq79MM3fFlHIfjcTiKrDsNANiIqzAurjdjANCevoqR6GLdiD2swny8u3NbisjBK5biIPRCT/RBT3RHiXUH9/AmLsL78b0dA4Dqa4s/4GLrRjRiC5ZhBZZhOVZiOdZhPdZhHT7dy1+0Q1u0RTu0RXscgArsj/0Tu3ddg9/iDmyN8y0ZANSQgXgAra0bkbVqbASwHhGAamxBCwAtUYhir55nvASD8KJ1I4hqVcT4QxduEUajjfVHTrS7Alxncu1beNs6DLT+sIka0gd/Ny+PtG9jA72BGnmhAJcbXQgbwrYcF1h/wERN6YTh5qWSvm07hvKxauSLvsaXCqdt+yeOs/5IiXLRHP+NzeaFk4btE3zf0zsiUOC6YhiqzQvI520bhqG99cdIlL9j8IJ5Gfm6TcIh1h8fkVy/WG+JmY7tNZxi/bERuVKEG7HcvKh82d7BhbzsntKmGNdhqXlxJX17B5ej0PqjItJRjMtRaV5kSd3eZvFT+hXjOiw2L7akbXNwHpf9FIoM+mOaedElY6vGNPRn8VN4jsawwC8W2ohhKX0SIlFWOuG2QM8PfIDb+Kt+IqAUl+CZ2J4/bL9txhM4i5f3Eu2uMwbjLfPi1N7m4TZe3EvUmJPwEDaYl6nGthK/Ri/r4ZXhkUqKQwlOQX9cjE7WDXFkGSZgEl7ADuuGEPmjECdjqOcHCBd59lzjJqSmI+SNDE7A2TgDx3p1jdwWzMJ0TMHb1g1xiwFAVspxAvqhH46xbkgTFmE6puOZvT5+xFsMALJ2MPriRJyAnok6jbYdc/EqZmMGPrZuiiYGACVFOY7EMTgJp6GDYSs+xBzMwSz8HZutByQODABKns7ohd7ohd44AuUxvN8GVGI+5mE+5mGRdefjxQCgJCvAQeiJg3EAKlCBCuzn5FWrsRJLsARLsQSLMA8rrbtphwFAPilFBTqjPdqj7c6tHcrQEoUoQGsARSgHsAE1qMEGANtQhU1YizVYizVYg7X4BMuwAtutO5IU/w+fGUv2GfCUUgAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxOS0wOC0zMFQxMzoyNDowNSswMDowMK1T4KoAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTktMDgtMzBUMTM6MjQ6MDUrMDA6MDDcDlgWAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAABJRU5ErkJggg=="
-b64_home = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4NFidt+DsOAAAdwklEQVR42u3debxVZb3H8e85BznKJEKK4ogZiF7USkMRBFQsc8ChnELNIbU0ueVLqW6vpNe9t6tWvsIyI/OiOVVqKiYmBiqi4JRjikOIqAQqIKMMh7PvH+ciiJzD3ms/v/V71n4+7/WPEWvt3/Ps/XzZw1q/JQEAAAAAAAAAAAAAAAAAAAAooDrvAuCkvbZXN3XWXM3Wcu9iAORla43SA1qu0kfby7pC/b3LAmCth67SsvWW/vrb/fqCd3kA7BysOa0s/patWZep3rtIABZ+pDVtLv+W7V518y4UQFjt9NsyFn/LNlOf9S4XQDgddE/Zy7+kkpbqcO+SAYTRTVMrWv4llbRaZ3uXDaB6u+jlipd/yxeCo71LB1Cdfnor0/Jv2X7JbwJAcR2sD6pY/iWVdKe28B4EgCyO14dVLv+SSpqm7t4DAVCpkWX96l/O9g/t5D0YAOWr0+WBFn/L9o729h4SgPK01y1Bl39JJS3UQd7DArBpnXR/8OVfUkkrdKL30AC0bTv93WT5l1RSsy7yHh6A1vXVLLPl37KNoYUMEKf+es94+ZdU0u+1mfdAAWxoeKuNPkJvf1MX78ECWN+ZWp3T8i+ppCfVw3vAANYalePib9lmqrf3oAFIDRqb+/IvqaT3NcB76EDqOlbY6iPktlRHeA8fSFk3Peq2/EsqqUnf8J4CIFW9NMN1+ZdE2xDAST+97b78W7br1M57MoC0HKJF7gt/3XYXbUOA/IzQKvdF//Ftmj7lPSlAGsK1+gi5vUTbEMBana5wX+qtbXO0j/f0ALWsUbe6L/O2tsUa5j1FQK3qqofcl/imthU6yXuagFq0vZ43WLDhv01Yowu9pwqoNXvoTYPlP077aLbBccdwQxEgnP1NWn1cJknqqecMjn2j2ntPGlAbhmt58AXapPM+Ov5WmmIQAZNoGwJU7yyDVh8f6isfe4xG/dEgAp7X9t6TBxRZnUYbLMz5OvATj9Sgqw0eaab6eE8hUFQN+q3BonxDu7fyeCPVnEvYANikjvpL7m/LTzO4xmCZjvSeSqBoupu0+tj0F3OHanHwR23SOd7TCRRJL71isPxv0+ZlPPZ+mmfw2Jd5TylQFPtqrsESLP/knF31qsHj0zYEKMOhBq0+mnVxRTX00FMGEXC3OnhPLhC3Uw2+hluZ4QKdjppgEAHTaRsCtM7ih7iFGpyplna61iACXtLO3pMMxKhOPzNYcNU06bA5DWmOPus91UBsGvUHg8X2j6rbdF1gcMHwEh3mPd1ATLrqYYPlH6ZR5zEGlyKt1MneUw7EoqeeNVj+dwZr1X2A3g9eXbMu8Z52IAY2rT5+pYaANe5pUiNtQ5A8m39dRwev0+Zdyu1lnZsI1CiLz9erdbZJrTbfU0zSlt5PAuDD4hv2pfqyWb02v1S8oB28nwggbza/sc/V542rtjhXofUOBUBNsjnL7p/6TA610zYEqIrNefZPaJuc6re4XmHDLoVAjbK50m6iOuc4BosrFtfvUwzUKJtr7a/XZjmPw6ZnAW1DUNOsuu3UOYzFpmvRONqGoFbZ9Nv7ptt4bPoWjqdtCGqRRcfdFfqq65hsOhc/rq29nywgLIsfzxZokPewjO5d8Lp28x4YEIrNXXdmRXL6jM0pTf/S57wHBoRgc9+9uE6gPdPg/oVL9CXvYQHVsrnz7uToLqGxuIPxSp3iPSygGj31nMHyj/Mi2v31XvCRWlzYDORkT802WP7xttGwaW0S73iBNgzRQoN/EUd5D6tN2+kZgwi4I8p3PEAbjtWHwRdCET4Td9VDBhEQ33ceQBu+bdJM+4vewypLo241iIC4fvUAWsXtNOp0hcEMxHLeA9CGdvqdwYu/eDfUGmnwHmiBBnoPC2hLJ91nsPyLeUvNESbXPtA2BNHaVk8bLP+7Cnt13CEmbUP8rn4E2mDT6uO6Ql8f309vG8yJT/8DoA0WrT5q4Ty4XpphEAH5d0AC2jDMpNXHOd7DCqKbphpEQL49EIE2nG7wdddSHeE9rGA66B6DCMivCzLQhlEGrT7e1wDvYQXVoLEGEZDPfRCAVjXoGoMX9kz19h6YgVEGM0XbEDhq1G0GL+on1cN7YEZs2oYc7j0spGkrPWKw/B9QF++BGTpay4LP2Gqd5T0spGdnvWyw/H9f8z9v9adtCIrv3/SWwfIfk8QJLn01y2DurqJtCPIyVB8EfwE36XzvYeVmO/3dIAL+rC28B4YUHG/Q6mOFTvAeVq466X6DCHhQXb0Hhlpnc5nrQd7Dyl173WIQAS9qR++BoXbZtPp4R3t5D8xpNi9nNlEc7XUz/2YFZvN+yv+Gaag5Nq0++NTKNyoogG353trMwSa/qXzLe1ioHZ/WawbLn1+u1+KsCkTsC3o3+IuTc9c+bheT8ypvqPnzKmHuKIOz11fqa97Dik43oysraBuCKnyd217nZnOTaytpG4LMuII9XzbdFWgbggxsXoyvazfvgUXOInTn6vPew0Kx2HSxe1xbew+sACw+di2lbQjKZ9PHdnxhb/CRN4svXlfrbO9hoRhsfpIaV+gbfOSNn17hpJ/JSSmXeQ+rcGxOvvolJ1+hLTanpZ7rPaxCsrnT4p2cfo3WWFyYskxHeg+rsGwuwJqm7t4DQ4wsLk2drwO9h1VoNpdg/0M7eQ8McbFpTvGG+ngPrPCsmrDs7T0wxMOmPdXz2t57YDXiQoP3ZgsTbMOGjbJpUDmppm/wkbfjTNqGnOg9LPizaVF9o9p7D6zGWLRib9ZF3sOCL5ubVIzh12YDtA1BYDa3qbrYe1g1i9uxIaDhBmecr9BJ3sOqaTY3ZP0b39ekx+JW1Qs12HtYNa9RfzKIgNq9JTs2yuKq8znax3tYSWjQrw2evZnq7T0w5KNBYw1eQJxdlqdRag7+DL6vAd7Dgr2OJq0+pulT3gNLzOlaFfxZXKojvIcFW930qMHy5wozD8O0OPgz2aRveA8LdnpphsHy5xpzL/tpXvBnk7YhNauf3ublUmN21asGkX4d3ZtqzyFaFPyFQp85fz30lEEE3MWHutoywuQrIzrNxqCTJhhEAF/r1hCLVh/0mo9HO/3OIAJe4ofdWlCnKwxeHNxtJi42bUM4tavwGnWrwQuD+83F6NsG7/MWa5j3sJBdVz1ksPwncsfZSB1r0jaEy7sKajs9Y7D8r+fi0YgN0cLgzzgXeBfSHnrTYPlfRvuIyO2p2QbPOy1eCmZ/g1YfTfqm97BQhp56ziACaPJWIMO1PPgLYIW+4j0slGkrTTGIANq8FsRZBq0+Fmig97BQgUb90SACaPQePZvfg9/Q7t4DQ4UadLXBK2Emt3qJWYN+a/Ckv6AdvAeGTEYatA3hZm/R6qi/GCz/ydrSe2DI7DSDa0C43WuUupu0+rhdm3sPDFU51KRtyDnew8LH9dIrBsufX39rwb4GbUNKusx7WFhnX80N/gQ36xLvYSEQ2obUNItWHyt1svewEFB3PWYQAXerg/fAcKrB1zxLdJj3sBBYR91rEAHTaRviy+KHHq4Cr03tdK1BBLyknb0Hlqo6/YwnFBWwahvyWe+BpahRf+AtHSp2vkHbED4y5q6rHjZY/vSCTcExBpeK8aVxrnrqWYPlz886qbC4WJyfjXNj0eqDG3ykxaZdDCeO5eAAvR/8ieOOcOmxeRfJqePGLD6/cU/YNNl8jzSJi8fsXGDwDS53hU+XzS9JXD5uwuY33Jnq7T0wOKrTTw1eVTSQCc7mLK4n1cN7YHBnceM42oYE1dHk9o8P0OQRkmyuJ/mQJrKh2NwA+gZu8IGPWFxR2qTzvIdVC2yu5R7DDT7wMXvpHYPXGW1DqrSfQTeXJn3Le1iIkE1XqXGcX5qdRT+3FTrBe1iIlE1fyfG0DcnGoqPrAg3yHhYiZtNZ+nFt7T2w4rFo9fGO9vIeFiJnc2+J17Wb98CKxOauLi9qR++BoQBsTjn7lz7nPbCisLmv24Oco42ynWlwf8kl+pL3sIrA5s6ud3CVFipicYfplTrFe1ixs7m3O9dpo3I2bUNGew8rZntqNlOOaPSlbUiehmghb7oQle30jEEE8IF0I47Vh8Enmq9dUK3Out8gArjn9Aa+bXBJJj+8IIT2utUgAmgb8hGb31059QKh1OkKg1foLNqGSFI7/c5gcjn5EmFZtA1ZoIHew/LWSfcZLH8uv0B4I7Qy+Ct1RdptQ7bV0wbL/3+5ABMmDjZpG/JN72F5sWn1QQsG2Omnt01eswm2p7Fp9XGu97BQ43bRDIMIuD61BnXDDFp9LNOR3sNCArppqkEETFRn74Hl53SDVh80YkZeOugegwh4Qtt4DywfowxafcxUH+9hISEN+o1BBPxTn/EemP3EXWMwcc9re++BITmjDF7JNX72aqNuM5i0v3GDD7g4w6RtyOHew7Ji03P1z6l9f4qI2LQN+Zr3sCzsrJcNln9J53sPDEnrr3eDv6ZrsIfF3ib3XSEA4M/iUraSfpFX25A8HmaoHlbPfIYD1ISRul1b5PFA9gFwnCbQ/gCo0LGaoK72D2MdACN1Gw2QgAyGaKr9vSwsA6BOo/P7LAPUnD013fpuVnbLs71u0qW2xQM1rqcesr2fpVUAdNLddOQFqraVHrC8o7VNAGyrKXTkBYJo1C36ltXBLQLg03pEnzWcECAtDbpaY2zahoQPgC9oGh15gcAutGkbEjoAjtKDdOQFDJymCeHbhoQNgK/rz3TkBYwcqkmh24aEDIBRGkdHXsDQfpoWtm1IqABo0DV05AXM7apH9PlwhwsTAB10l85zmhAgLT30cLi2ISECoJsm0pEXyE1HjdfZYQ5VfQDsokfpyAvkqp1+G6ZtSLUB0E+PcJdTIHd1ulS/rP4f8OoOcLAe4T7ngJMLdEe1bUOqCYDjdS+tPgBHx2iyuldzgOwBMFJ/otUH4Gx/TdFO2XfPFgB1upxWH0AU9tA07Z115yyLuL1u1iXeowbw/3rqIR2UbdfKA6CT7tHJ3iMGsJ6umqgTs+xYaQD01FQdFrz8CVpoMStAMhp1c5a7ZFQWAH31WPZPG60ap+FaZTUvQKTmBD5eg36ln1TaNqSSAOivKdo5+DRcpbPUFPyoQOwG6Zngx/y+bqisbUj5AXC0JutTgctdo/M1UqXg0wDEb64O0sTgRz1V91Vyv+xyA+BM3RG81cdKnaJfB58AoCiW6ij9IfhRD9Ek9Sj3L5cXAKN0XfBWHwt1mP4UfPBAkazSKfpp8KPuq2nqXd5f3XQANGisQauPORqqKcGPChRNSZfo39Uc+Ki99JgGlPMXNxUAHXWXzgk+6Je0v54LflSgmMbo9OC/g3XXRB2x6b/WdgDYtPqYroP0VvCjAsV1kw7X4sDH7Ki79Y1N/aW2AqDstxEVuUsHa37wowLFNlkD9U7gYzZo7KbahrQeAP30iPoEH+bVOl4fBj8qUHwvaJBeCXzMOl3a9hf4rQXAIZqq7QMXU9KPdUHwrzuAWvGGBuix4Ec9U7e33jZk4wEworKTCcrSpHPDdDEDatYCHaZ7gx91eOsn8W0sAEZWejphGZZpuK4NPjCg1tislFbbhmwYAHW6wqDVx3wN04TggwJq0Rqdqx8HP2pfTdc+n/zjjy/1Rt2ii4M/9BsaoGnBjwrUqpJG6+zgl8htpykatuEfrh8AXXW/Tgo+mKd1gF4NflSgtl2nrwb/vayz7tlwha8LgJ6aosHBhzFRQzTPYHqAWneXvhS8UU6jbtaF6//B2gDorgfUL/gQbtKRWmo0PUCtm6KBmh34mPUaozHr/uFv+Y+Ould7BC//Cp2m1aYTBNS2lzRQ/wh+1At11dr/bAmA/1L/wA9R0sUaRasPoEpvaaDBdbPn64fr/kc/rVYp6LZCJ1RY0NyMj5ShDSIQ0OjMq6T8Bjub647AK7SkZg2XWt4B/E/gZh+L9CVafQDBrNAJwXtn1WmMOkj16qEvBj3wHA3SQ7lNDZCCNTpfPwz8kXpnXSzV68Sg//6/rAP0Qr5zAyThv4P3zz5HDfUaGPCAj+ug4D9bAGgxTodrScDj9dTQ+nKbB5bhbg3V+/nPCpCMv+lQvRfweEfXa9dAhxpLqw/A3BM6UDODHW2P+kBfLFyu87TGa06AhLymAXo60LF2r9fyqg+yRufpe75zAiRknoboviBH6lKvd6s8xHIdo7HeMwIkZamO0c0BjrOyvsoeZO/rEP3FezaA5KzSqQHuKbS8Xo9WsfssDdJ075kAklTSJbqwyia7z9drfOYbEryoQZrhPQtAwn6pr2hFFftPq9dijcu06yQdqLe9xw8k7k59WYsy7z2pXtIvMvx+f6u+HPxWRgAq96AGa06mPZ/U4/WSZumiCne8UiOC38wQQDbPaUCmD+O/WPsfdbq7guuIv2swBPoBoJjy6AdQju56rMLHf1j1azsClXSKHizrYVZphK70nnMAG5ivobq9gr+/VGeqeV1T0GU6UrdscqdZGlLG3wKQv5U6qex7Cq3WqfrnJ//4FP2r1TcMTbpeW5oVz0cAFFMsHwHW+l4ZDf4W66jWdu+gC/X8J3ZYoGu1m+k0EgAoptgCQBqoN9t83Onqu+4vb9gNaLmu0lXaRQPVV59SO83TXE3X01zpBxTEVO2pc3SRem7k/3tVP9GN6589uPF2YLM0y3sUADJaqit1tYZomA7U9tpGdZqvVzRN9+oxbXD5f9h+wADisFL36/5N/7XQNwIHUCAEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBACSMAAASRgAACSMAgIQRAEDCCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEEQBAwggAIGEEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBACSMAAASRgAACSMAgIQRAEDCCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEtfMuAGXZWn3URzuqkzpry2hje40Wa5GW6U3N0Cta6F0ONo0AiNtOGqahGqqe3oVkMEsP6kFN1DzvQtA6AiBWXXSMTtUhqvMuJLNddIbOULOm6fe6RUu9y8HGxPpmMm1ba7Te1A06tMDLf616HaixekeXqZt3KfgkAiA2W+pKvalL1dW7kKC6aJTe0KXawrsQfBwBEJej9IK+U6PLpItG60Ud4V0G1kcAxKObxmu8dvQuw9Su+ouuV0fvMrAWARCL/fSUjvIuIhen6ynt5V0EWhAAcThOj6iXdxG52V2P6XDvIiARAHE4X7ep0buIXHXUXTrFuwgQADG4WL9K8Hlorxt1uncRSO+FF5sRuty7BCf1uk7HeheROgLA1+EaVwMn+2TVoJv0Be8i0kYAeNpRNyZ+MnYH3a7u3kWkjADw00638uLXjroh4fdA7ggAPz/Qgd4lROEIneVdQroIAC+f1ve9S4jG5drau4RUEQBertLm3iVEo5t+4l1CqggAH4P1Ze8SonKm+niXkCYCwMd/eBcQmXo+EPkgADzsp2HeJUTnawldCxERAsDDed4FRKgdvwV4IADyt4WO9y4hSqfyaswfU56/Y7WldwlR2kmDvUtIDwGQv6O9C4hWGg1RokIA5K1OQ7xLiNbB3gWkhwDI257q4V1CtPbijMC8EQB56+9dQMTquDg4b2lfjOqh2jPeFuhNNXsPolU7VPn+Znfd6z2EtBAAeasmAGboO5oY8fKXpAP18yre5fT2Lj81fATI226Z93xG++uvkS9/6VEN1v2Z984+O8iEAMhb14z7rdEILfIuviwrdZqWZNx3K+/iU0MA5K1zxv2m6CXv0sv2ru7IuGfW2UFGBEC+6jLfFut579Ir8mzG/QiAnBEA+WqXecaXepdekWUZ92vvXXhqCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEEQBAwggAIGEEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBACSMAAASRgAACSMAgIQRAEDCCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEEQBAwggAIGEEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBACSMAAASRgAACSMAgIQRAEDCCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEEQBAwggAIGEEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBACSMAAASRgAACSMAgIQRAEDCCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEEQBAwggAIGEEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBACSMAAASRgAACSMAgIQRAEDCCAAgYQQAkDACAEgYAQAkjAAAEkYAAAkjAICEEQBAwggAIGEEAJAwAgBIGAEAJIwAABJGAAAJIwCAhBEAQMIIACBhBACQMAIASBgBAFRjs8x7NnuXLhEAQHW6ZtyvWSu9S5cIAKA6XTPut1wl79IlAgCoTteM+y33LrwFAQBU4zMZ91vmXXgLAgDIrpM+nXHP+d6ltyAAgOz2yryCZnuX3oIAALIblHlPAgAovOMy7/mmd+ktYgmArCdFNHgXjoTtqP0y7zvLu/gWsQRA1u9Ee3gXjoSdq7rM+z7rXXyLWAJgScb9+nsXXqHsL5hiyXqSSzvvwivQSd/MvO983gF8XNYAOEg7eZdekezvWCL53bhMWU9z6Zz5xJr8fVfdMu/7tHfxa8USAPMy7reZrvAuvSLDMu+ZNSJ9ZK/2GO/Sy9RXP6hi76e8y18rlgB4JfOeJ+oS7+LL1knfz7xvKgHwY3X3Lr4MXXSrGqvY/yHvAcRmhEpVbNdoS+8BlKGL/lrFGL/oXX5Fdq9ipH/PfHZdXrppclWv1yVVhUdQsXwpta+erGr/+bpZkzVbi7wHslEN2laDdIG2q+IYvWL52qgs7bWsii/0VulOTdOH3oNoRQ99QztWdYTxGu49iLViCYB2WqDO3kVEbIU6aY13ERV5Tbt5lxCt8zTWu4S1YvkOoElTvUuI2ssFW/7Si94FRKtJd3uXsE4sASA96F1A1Io3O1O8C4jWvZrrXcI68QTAeO8CovaQdwEVm+RdQLSu9y5gfbF8ByBJ0wt3Xl9eVmvrSL/ebF2d5mob7yIi9K520GrvItaJ5x2AdKN3AdGaULjlL5X0J+8SonR1TMs/rncA3TRbHb2LiNJXdbt3CRnspye8S4jOEu2shd5FrC+mdwAL4vlxJCoLdI93CZk8qZe8S4jONXEt/7gCQPp5HL3SI/Orws7Kz70LiMwyXeldwobiCoA5uta7hOgs0RjvEjK7KZbGV5H4SeaL3szEFQDSpXrPu4TIXK0F3iVktkqXe5cQkddifEcUW0utD/V+POdJR2CuTirsBwBJekZHa1vvIiJxmmZ4l/BJsb0DkK4v4Flvdr5TwB8A19ekC+K4BZa7mzTBu4Si6Kl5VV1sWTtbbbxkxrrPo//2urp4Pw0bF9N5AOscrInRfTjJ3zztE9NZ45ltruna27sIV006SNO8i9i4+D4CSNJk/dC7BHdNOqEmlr+0QicXrKNhaBfFuvxj9nP3t22+27e9n4CgjtRq9xn12n7mPfnFVK+b3J86v+3H3tMf3Flqdp9Vj+0Pkb7LLoAG/cb96fPZfuE99Sa+m2AE3BlP979iGuX+FOa9NWu096SbOVWr3Oc3z+3GQt3oJFKnaIn7E5nftkJneE+4qSO0yH2O89p+FulvbIXTW8+6P5n5bLMSaImys6a7z7P9tlgne090LdlC/6kV7k+q7dasG2I9WSSwRl2pJvf5ttye0We8J7n29NYD7k+s3faiBntPcK720WPuc26zLdbF2sx7emvVUE1yf4LDb2/o3ARfMvU6WS+6z33YbY1u1vbeE1vrBugmLXN/qkNtT+vrCS7+tep1nKbUyI+Dy/Rr3vjnpbO+rgla6v6kV7O9psu1p/dERqGXfqTnCxwDqzVJFxTilqYbUeQfKjZTfw1RP/VWH23hXUyZ3tMMvaKpmqy3vEuJTA8N1SD1VR/19C6lTAv1rJ7T07pP871Lya7IAbD+KLZRJ3VVl2ivIVyppVqk+QW/uj8fHdVDndUp2lBfow/0gRbqA+9CAAAAAAAAAAAAAAAAAAAAACTr/wD+nWCjSuf4nQAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxOS0wOC0zMFQxMzoyMjozOSswMDowMOli/XoAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTktMDgtMzBUMTM6MjI6MzkrMDA6MDCYP0XGAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAABJRU5ErkJggg=="
-b64_help = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4RGyqz22PqAAA1IElEQVR42u2deZwVxbX4v3OZgWEfdkVQBNzAuIC7uERBibsRjMlLTEwiydMYTPwpeUteyD7Z9I0xKsYlQaMRTVxwR6N5SsQoRlRwYxWUZRCGHWa7vz9mgBmYGe6pqr6n+/b51id+xthVfc7pqnOrq6vOKcIoNEroQx/6UUYZPSijjO50phOdaU93iuneeF0XShr/qmFj419V1LGOajaxmU1UNZa1VLGKSlZRq62cEZYibQEMT/owgAHsxwAGsA996UOfCO9WySoqWcZHLGMJS1nGam0DGD6YA0ga7diXIQxlKEMYyhA6KsuzhfksYH7jPz+kXttAhgRzAMmgP8MYzjCGcwSdtYVpg2rmM5d5zGUe71KnLY6xJ8wBxJcSDmQkIxnJkXTSFsaBGj5gNrOZzets1hbGaBlzAHGjHYdwLMdzDIdQrC1MIGqZxz+ZxSvMs1eEeGEOIC50YxQnchxH01VblAhZz6vMYiYvsUFbFAPMAejTlWMZzSiO2fFRLg3U8R4v8SzP21cEXcwBaNGRUYxhDIen+hnUM4cZzOAltmqLkk7S3Pm0OIyxjGaU+ge8OLGFF5nB07ylLUjaMAeQP0oZxWgu5EBtQWLMEp7mMWbYfCBfmAPIB704j/MYE+sv+HFiE8/wKI+yRluQwsccQLT05izGc2aqFvhCUccsHmAay7UFKWTMAURFPy5mPCeS0RYk4dQxk2lMo1JbkMLEHEB4OnIOl9qvflDqmMVU7rPdA6ExBxCSYsbyJc619f2I2Myj3MNTdsYgHOYAQnEQn+cr7KctRgpYzgPcwZvaYhQG5gD86colXMbx2mKkjJncxf07ApkYjpgD8ONgvsIEemiLkVI2cB83M0dbjCRjDsCV9pzPBE43C6ozm9u4my3aYiQT674u9OcKJkQaesuQsYrbuNl2DMgxByBlBN/gUkq1xTB2o5pHuIGXtcUwCpUM45hJ1kqsy4t81jZf5Y7NAHKjA5dyLQdoiyGijrVNwnqvp5a11LCRLY1HbepY33hlN9oBUEpHulJMD4rptiOoeBk9Ezak3uNX3MM2bTGSgDmAPdONb3I1e2uLsQfWsZjFLGYJlaxgBZVUBgu/laEPfenHXvRhPwYxiEE7sgvElY+5gSm2c3BPmANom558h6ti2dk3sYhFLGoc9otZm+f792D/RlewP4PYP5YnHau4kf/Nu2UShTmA1unFVUykTFuMZixnNnOZx2zeiVl4zf6MZBjDGclBjS8U8WAjv+OXdrC4NcwBtEwvruLqmPzyVzG3cdD/i03awuRAew5odAZHsZe2MABs5E5+xkptMYxk0IVJVKmvZmdZwFQmMDzRTro/46ngNerUrbmB8pg4dCPGtGcCK1Q76iZeooLx9NI2RVC6MprJTFd2rKuZZDs4jNYo5mt8qNY51/MQV3N0wSQDaZkSjuU7PMIGNTsv4bJYrVEYMWE0c5S65AIqGE0HbQPklWJGUc5r1KtY/B3GahvAiBPDeEyhG25kOhPYV1t5VfpxKdNYq2D96QzRVt6IA/25I+9LVG/xc04u8Mm+hBJOpZy5eX4KWykv6DRsxh4pYSLr8trpFlLBCG21Y8twJvNOXp9HJRNtRSCtnJ7X35xFVDBKW+VEMJzJvJvHJzObk7VVNvLNQKbmrYMtoYJRif6ar8FwJvN+3p7RdPbXVtjIF8V8j8156VZruJGjtdVNMEUcy015WiLcxLW2KpMGDufVvHSo15gQywMyyaMD45mRlw+Gb5i7Lmw6MpnqPPzuT+FT2qoWHAdSzsrIn10NFea2C5WTI19aquMlJlhakMhon5e5wAJGaytqhKYnd0bccVbzMwZrq5kKhvBzPon0WdZzu4V6LyTOZVnEvxkTbeKYV0q5NOL53Aou1VbSCEF/Hom0o8y0IJRKtGMcL0f6bB+KfSA4Yw9cQGVk3aOO6ZyorWDqGclUaiN7xpWcr62g4UpHKiLrGFuZysHaChqNDKaCTZE966l00VbQkHMU70XUITbwkwIL11EI9ObnbIzoib9j5zeSRRET2RZJV9hERUzi3Bm705vyiPZ41jDZDg0lhYE8H0kn2MYU+msrZ+yBPpSzJZLn/zcGaCtn7JmLIvlGXM1UOy6SGAZSwdYIekEVX9BWzWiLrvwhkunfnQzSVs0QMpg/RPJ14A5bEowrB0cSTOLBhGUENHZyEA9F0CPmcpC2YsbunBdByOl5nKmtluHJp3kjeL9YzzhttYymtGNy8J3+qy1YVIGQ4dLg5wjrKbfeERd68Uzgx1tNhWWRKSjKKA++LPg8fbXVMuBIFgV+sDMYpq2UEQEHMC1wT/mQY7SVSjtfC/zN923GaKtkRMhY5gXtL1u4TFul9NIh8F7/LUymvbZSRsSUMCnwy8BUCwGjwd68EvQxvsCB2ioZeeJgXgzad1627eH5ZjiLAz7AKibamf5UUcSEoClhlnG4tkpp4vSgoaKnM1BbIUOBvXkwYC9abwlH88VXAkb2XW6Bn1JNyGBxNUzQVqfwKWJysAdWz1Q71596ypgScBNZhWWAipL23B3sUa3kbG11jJgwho+D9av7KdVWp1DpEfCc/1MW7tFoQh8eDda3XqK3tjqFyP7BzvptZqJN1IzduDRYXMEP7ARpaI4OdpxjtgXzNFphOHMC9bIVFkUwJKcE+mZbTwUdtJUxYkwHyqkL0teqLGR8KM4NFOhxuX2pNXLg9ECfBjfZuZIQfJmaII/jYXpqq2IkhN48FqTPbeEcbVWSzsQg32hr+U9b9jMEZPhBkFeBai7WViXJ/L8gfni1BfYyHPgMa4L8+HxVW5GkMinI8P+XhfM2HNmXVwP0wHqu1lYkiYQZ/nfTSVsRI8GUckeQfvg/2ookjR8FMHoNk7TVMAqACUHSzJVrq5EkfhLA4Ms4XlsNo0A4MchZgR9qq5EUfhjA2DPpp62GUUDszawAvfI6bTWSQIiV/wctSpsRmFLuC9Azv6utRtz5bgAjV1h4LyMCQsSiqOdybTXizERvA9fwDW0ljALmSu+Eo7W2Nag1vui992qDbb00IuZM74Np1ZyrrUQcOc97z/9HdgTTyAOH8aFnT91mx9J25dPeGX7eZF9tJYyU0J9/efbWTZysrUScOJr1ngZ9iq7aShgpojszPHtslc1Xt7M/KzyN+YiF+TDyTHv+4tlrKxmqrUQc6Mm7nob8E8XaShgppB1/8Oy58+ihrYQ2JTzracQp9tXfUCLD7z1779/TPXctYqqnAW+yQB+GIkX8xrMH35fmHvxjT+PZCStDH9+D65O1FdDiMk/DfV9bAcMAfF1APV/WVkCDU71OWdczUVsBw9jBN712sVYzWluBfHMoVV7D3+KsGfHi617ha9cyTFuBfLI3i70mTXao0ogfV3r16UXspa1AvujAK16msrAKRjz5nle/fpn22grkB79vp5O1xTeMVvELZneLtvj54EteJqrQFt8w2uRXXv274Ne2jvTK83dHmjdNGImgiFs9evgWjtJWIEp6stDDOHfbpl8jAWT4k0cvX0JvbQWiM8xTHoZ5yI78GAmhHdM8evqztNNWIBrKPYzyVFpWSI2CoIPXIbefaosfBed7bJR4m+7a4huGiG7Mce7v9VykLX5oDvIIpfgRA7XFNwwx+7DUuc+v5xBt8UPSlXc8THGEtviG4cRINnrMertoix8O98gptRZC2UgwZ3nEur5dW/hQXOSxHHKltvCG4cUEj97/OW3hQzCAT5wNYAE/jORzvXP/X5v8UPcZnnNW/wHb+GMUABmP+MF/T/qeAPfzUTMp1RbeMILQ0SO5+LXawvswwjnqz8fsrS28YQSjH8scR0I1R2sL70pn54j/1YzSFt4wgnK884/hPDppC+/Gbc7Tnm9qi24YwbnKeTzcrC26Cxc4q3u3tuiGEQl3OY+J87RFl9Kf1Y6qzqajtvCGEQmdeMNxVKxKWsTAhxwV/YTB2qIbRmTs5/zDOF1bdAkXOypZx1ht0Q0jUsZQ6zg6vqAteq505yNHFf9DW3TDiJwfOI6O1fTTFj037nRU8GGL+GekgAyPOY6Qadqi58KnHQN/LKOXtuiGkRd687GjCxinLfqe6MR8x7f/07VFN4y8McbxZ3I5PbRFbxvXqOi/0BbcMPKK6xnBWG8KOpxqJ6Vet5CfRsro4LgnoI4TtEVvjWJmO6m0iYO1RTeMvDPMMUnOW5Roi94y/+E4qbGd/0Y6cT0dEMv0uIMd/dkj2oIbhhJFPO44Z45hpKBHnFRZmZTNDYYRAX1Y7jRuHtAWfFfGOqlRz5naghuGKmc7fhCM1Wfz9o6hP27TFtww1LnLaezMjdNS4CQnFWK/qcEw8kBPVjiNn+9oC76d/mxwUqDg8p8ZhhOfcxo/60Ksn4U4fnMnlznUesxy/kRMb/ZmIHuxF90po4wyMrSnc+N/rWM9sJYNrKeKFSxnFUv5mKy22KnkYc53qHUb3/C9sb8DOJzZDrHL1zOMj7zvbezKYEYwnIM4gAPp5lB/KwtZwLu8xZu8Q7W2OqmhP/McMmDXcSRvaYv+jNP0ZYK22AVFZ8bwU55jjdOzaK1U80/+l4vpr61eKviW0zN6Ulvss53EfsFO/gfiSP6HmY4nMHIvb3M9Z1qilkjJ8KLTs1H9kN6Otx1E3lpYuc9VKOIEfsuSiAd+87KOe7jA3EBkHMQWh6cyl2I9kS936kgW+MuPwUx2jLoQolRxS3Jz1cScyU5P5Cta4pbyoYO4b8dpA0PCKGIsj1GnNvh3ljl83eYCwXHbULeYDjriXuPUdWzzrxslfI331Ad+07KSyRbGLTBua2pXaYjalZUOotrZPxc68O8sVh/wLZX1/Nj2cwblCYensIqu+Rf0Rw6CbuNAbfsmjiIuZqH6QG+rVHGd1iS0ADnY6ZvOf+VbzN6sdxDz19rWTRzHMFN9gOdS5jvtZDNaosLJCed5HvZzByFXOux1SjOdKHfOIqNRHmegtskKgh5UOlj/h/kUsZfT7//l2pZNFGfG9K2/7d+hCbbFKwBXOtk+j3OAnzoI+IbDiYG00oHyWHzscylPJy2PbQxpx5sOlp+cL/F6ss5BvFO1rZoYhjFHfRj7lI/iFa0mkZzmYPe8zQF+7CDcg9oWTQznOLnXeJVaJtmrgCcuMTZ/kA/BulElFqyGA7TtmQiKmJTYqf+u5T46aZsz0RzssAD8yY5oDxHiEv7rDm1rJoJS/qI+bEOWf9g+QS+mOtg88j2BHfhILFQ1g7VtmQC6MEN9yIYu78Qxfn1iGOKwJWhh1EvtExy6wS3alkwAezlmiot7WcZB2qZNMLc7WDzSBOLteF8s0BbbHrJH+jBXfahGVVYwXNu8iWVftort/c8oBRrn0AEqtK0Ye3rzlvowjbIst+SvzvzOwd6johPnH2JhNltEuT1Qxr/Uh2jU5UObBTqyt0PGzYeiEmakw6P/pbYFY077Alz6a6nMpae2qRPKDWJb10U14/qTWJQN9NW2X6zJcJ/60MxXeZH22uZOJH0c0u7cHIUg/dkmFuQn2taLOeXqwzKf5XZtcyeUX4gtvZk+uTae+1fD6/i0UPBNfI4t2taLMRdzQ942zNZSyQoWsZwPWcFytlAF1Of1V3kEa3klj/crFObwLWEczRI28vfcLs21A3Zgae5epZHf8a3IjZNcDuVlukTY/jre4A0+YBGLWcb6Vq7qwT7sxwD25XCOCpFrrk1qOJlZEd+jELlVnAJsJfuGzev0RfE0pJah2naLMV0ddlTkVlbyJy533H4zgAv4Be9E+BqwkDJt0yeQAxxOiFwSVoSXxAI8oG21WPOHCAbXKn7LqUG2gh7EJGZF5AL+rG36RPKw2M4vhLz9MIcHfby2zWLMJcGH1QtcEjww5wimOiz87rlEulm1QDnJwc6Hhrv9zeKbv6RtsRgzgLVBB9STnBCZrHvzc6eEVW2VFXZK0IGXxXYOtge3i0OIigu17RVj5NO51ssbnBy5vEN4LLALuEv7ESSQ8WIrV4WKDiDPAPiBxf9rlYuCDaONXJk3O5/HsoAOoJ5jtR9D4mjHArGdvxLm1vLJxxXa1oot3RziKbRcXs7zV5a9HBaCWy+zLGSYmG+LrZzjXoC2OZB64W3zEpgooch3dbVcfquQFLo9UwK6gM9rP4rE0YnVQhvXh/iRkHfZn2lbKrYMdjjfvXup5utqGvx3MAfwrr0mipFvHffejF/Mx2KvM0TbTrElRMy/bcoLrL8M5gIu1X4ciWOweDa+zNfNniN+rM9oWym2HB1g0GxVT69e5BSoqqXyHhntR5I4/ia28hl+N7xffMPx2jaKLf4f0+piYd12PB/IBZynrUri+LzYxnf73K4rm4S3q7RE0a0Q4vf/29pKNNKfVUEcwPPaiiSO9mLLb/RZkv+y+JH+SttCscUl00vzMlVbhSacGSiBScDtqinhBrGNPY4FPSW+2SHa9okpLue5mpe3Y/Zx9cYgDuB6bTUSxyFiGz/qequ+1AhvFWTjQUHyW8+BUsMIbRV2oWuQvYGrLVCYGGlo3mrXsxdXiR/nl7RtE1PKHOK6NS8/1lahBS4OMgc4V1uNxHGZ2MbScCKNSLd+rrV0kK1whecgeT+mS6shIhr/QVuJxNFRfJr0OZfb9BO/td6obZnY8qrnIInr2crjAjiAtfYSIOZWoY1rxeH8gH8XP8qjtO0SU4Z7DpEXtRVogycDuIDTtZVIHCeIbfw1+U2eFd5ioZ3vagXfzbNxHiAh5gDl2kokjiIWC238hPQWvcRfAH6ubZWYIn9YzUukyR4D4B878FVtFRLIr4U2rqaH7AbylcYjtW0SU47yHB4XaSuwB77m7QDqLG2YmGPEVhZ+oZOGrZqvbZHY4hcBwPs0V+S4BIzbtZytrUQCmS+0cStRuls+j9VB/N55n7Y9Ysv5XrXvpk5bgT2wkQe92zhGW4kEIrX6WMmn5LPEPvxT2vaIKft5/jZGlOc1KBd4zwCe1FYhgYwQW3l07o3/Ttj0O9rWiC3ygKpNS9wXABvo4h3naIW2ColEmlvqhpYaafkV4CyhKPdr2yK2+IVjeERb/JzIORFlq/SzTAEOTBNen3P0hcPEHnyYti1iShGVXr+Mh2srkCOTvF8CTtRWIYHIx2kLL5QtzQDGCgV5m3natogpB9Lbo/aHzNFWIEde824hCWsdceNN3hXWaGFkt+QAxgibna5tidjilx8xOdEVZ5P1bGE/bRUSyWPC61tYBtzdAZSKp2O2htsafjn7ZmqLnzNV3vtABmqrkEikI+/U3T8F7u4ATqKjqNH1zNK2Q2w52qt2khKsSiejuzJAW4FE8hIbRNd33n1OursDkL4AzKBG2w4xpcQrQNrKRO2u/NCz/l7aCiSSanFY1d1Gt78DsBeA1jjQK4xHsuZVSz3rC4+qGI1IR98eHUBPDhM2mZylqnzjtzvyTW3xRfjOAMq0FUgojwuvH7mrpXd1ACcLs7W85e37C5fhXrWT5QA+8azf2eICObFUuPqS2XWJf3cHIMNeAFrHLzPrG9rii9ji3UI8ox7GH+kI3GWE7+oATon49mlisEfdzSzUFl/EJu8WbAbghnQEtjnCu1Er2lq43h5bG0izuTctyXoBcElXsWux7wBudBCGnK+ha9PqzWcAo4ThJ56jWlv/2NLN64DLIm3xhfjuBIRibRUSyjZeEF1f3HwvQHMHIN0DaJmAWqe/V+1kvQAQICPENm0VEot0FDYb5c0dgHTvepL2quUbvylt0mYA/g7A5pKuSLeMH9f0XzLN/h4pamhTYk6radDXq/YSbfGF+If1NAfgymtsFl1/bNNR39QBHEo3UUP/tE3AbeA3A0hajJx9POtn7RXAmRpmi67v3vTwdVMHcKzwxsk5raaB3+bWldriC/F1AOup11YhwXi8BJgDiArZbGpXkjYD8A3okTSHFy+kI7HJSG/qAGTBmesTdlwl3/g4gCq2aosvxDd4WaW2AonmH8LPsE1G+k4HUCr04m9Tpa13rPFxAEkbDl28dj0CrNZWIdGsEcblHk7p9j93OoDDKBE1Yi8AbdPFo+56beGFnCA8QrY7vqcJ045sNJbsDOO788FJc/uZA2gbmTttzjpt4YV82ruF97VVSDjS0bhjtJsDiAqfra2yQE/6nObdwgfaKiScAA7gCFEDq1msrXPM8XEAyXoFGMBR3m3YDMCP+awRXb/DAWzvpu2EkYDe0tY49sz32B6brDwL47xXANYlbudj/HhLdJT/MDLNd14cGCLPmJFKXvY+CjxDW4UC4EahzfdvqLbdd0vDV9kMwGjgsOaHS5x4RVuJAkA6IhtH/HYHIM3ul7SAFUZU/HuANswB+CN1ALuM+D+Jpg+1AY5/GoVAD9Z7vwBs89w2bQB0pk5k9T80VHObAXwgPIBoFCoTmweYcuL/EvbVI55sEsaQaBzxmcZ/HiSqbCsABkA3vh2gFWlse6NlZK/lh1AE2x3AfsJ8gOYADIBrAmT0yfKIthoFgswBdGk4wt3gAKQR7G0J0IABXBOglRcSF/4srkh/loeCOQDDnV/SOUArd2mrUTB4OIAhooobbRuwwWlcEqCVKv6irUjBMF+Yn8l5BrAoQBR4I9l0YkrDIpInv7PvScGoF26oHgKuDsBIOz/xzHzYwGYqtBUpKGQjc8cMoGj7vuAcsYMbaefUIJ//4NbExT6KNzIHsGMG0Fu4r89mAOmmL38SppBrmTX8XFuVAkP209yVsgYHMFB4m8XaehqKZLjHM+3Zdv7TIgEGRvrTvK85AENKOWOCtDOb27VVKTgWC68f6OYA7BUgvVzOtUHa2cpl1GkrU3DkZQawzsKBp5azuDlQS9fZdvIIWC2MJtk4AxggqmS//2nlJKZ5RTrcyZPcpK1MgbJYdHWjA5At6chuYRQKJ/B4kK2/sJRLbStZRCwWXb13gwPoJ6pkM4A0cgJPBTj5D1DDJbb6HxmLRVf3a3AAfUSVlmnraOSdUcGGP1zNP7TVKWBkGZb6QoYSeokqJS1vreHLKJ4INvzvCLaMaLSELMtyb4oz9BUe6rBEzuniJJ4MNvyf5pva6hQ4q0RXZ+iVoa/wFuYA0sTJPOGV5rQp87iEWm2FChzp6OyXEa4ASH2MkWROCTj8V3CW7SCJHOno7JMRRnWrsxXc1HAGTwb68AdbuNBOkeaBVc0Tfu2RsgzdRRXWCG9gJJWxPCIMFds69fwbs7QVSgW1wtTyZRl6iiqs1dbQyAuf4SFKg7V2HQ9pK5QaqkRX95DOAGTNG8nkXB4OOPxv5jfaCqWIKtHV3TOURdi8kUTO5gHaB2vtL4GiBxm5IZuji2cAlsSp0LmIh+gQrLXpfN6O/eaVKtHVZRnhZ5412voZkTKO+ygJ1trfuJgabZVSRpXo6s4ZYTzAjdr6GREyPujwf4UL2KqtUuqQRQTolBF+6rEo7oXL57kv0Hl/gDf5jLAzGiGQjdCO0hmALPeIkRzGMTVIrN8G5nOmfTJWQTZCO5kDMAAuCvrrv4wxdmpUCdkMwF4BDOCzQYd/JWMsbpQasp/ojhnhhg9zAIXHBfw54NLfJ4zmXW2VUswm0dUdM0LPv01bPyMwZ3N/wOG/mtMtebwq1aKri6UOwDZ1FBbHcX/AXX9rGcscbZVSjmyEtisWrvyaAygkPsUTwQ78QiWj7ddfHVnIlWJzAOllCE8Lo0G0RSWnW7KPGCCcAWTMAaSUvjzB3sFas+EfF4QzAHMA6aQTj3FgsNZW2fCPDeI1ACN9ZLiXo4O1torTeVtbJcONjNRjaAtsBOB6zg/Wlg3/eCGc0ZsDSB9fZ2KwtlZymg3/WCGb09cWmwNIGWdwS7C2lnOa7fqLGTYDMNpgX/4UbNf/Stv0G0OEM4CM8LOBOYAk04G/0DtQWys4jXnaChm7IZwBFAsdQLhocUb+uYmjArW0gtN4R1sdowVkG7tri4VBm2TRA4w48VW+HqilZXya+drqGC0i29q9JSONIKKtn+HIUCoCtVTJmTb8Y4swwE9GGkNMWz/DiWLuCZTmcx1j7d0/xggD/JgDSAc/5Ngg7WzmHF7XVsZoA7EDsFeAwmcUk4K0s41zeUlbGaNNIn4F6KqtnyGmA7cH+Xyb5XL+pq2MsQe6ia7enBGm+gh3ftzIF//FQUHauYa7tVUx9ogs1d+mjDSXmLZ+hpADuDZIO7/hBm1VjBzoKbp6jTmAQueWIIm+H+E6bUWMnCgTXV1lDqCwGcfpAVp5iy9Rr62KkRNloqvXmQMoZNrxowCtfMKFluUvMZSJrhbPAHrYcaAEcRmHeLdRyzgWaCti5EiJcBFwbUaYwrFdsNNkRtSU8j8BWvkfXtBWxMiZPhSJrl+XoVJ4i77aOho5chkDvdt4kl9oq2EI6Ce8fmWGlRHfwtChiKu821jGpbb4lyiko3NVhkrhIzYHkAzGer//Z7mc1dpqGCJko7OOTzLUsibCWxha+P/+/56ntJUwhPQRXf0JdRlglaiS/3ulET37cKZnC4v5f9pKGGL2FV29AjIgXAUYpK2jkQOXkPFsYaJ9+08gg0RXr2pwAMtFlfbX1tHIgS941n+WR7VVMBwYJLp6eYMDWBrhLQwNDmKEV/0avqWtguHEINHVH7o4gO52JDj2nOtZ/4+8p62C4UAfYbyOpS4OwOYA8cdvAbCOX2orYDgxSHi9owOwVYB405mTvOrfywfaKhhOSEdm4yvAh8Jqg7T1NNrkVM/0LeFyBxr5ZZDw+sYZwCfCuIDS2xj55RSv2m/zsrYChiODRFevZx2NX4sXRngbI98c51X7Tm3xDWdkrwALYLsDkOV5GaStp9EGJZ75/x7WVsBwZpDo6vng5gAGC88cG/nkSK/kLXNYpK2A4Ug7oQNoMgOQRXzpzGBtXY1WOdqr9mPa4hvODBWGf20yA5CGfDpMW1ejVQ71qv28tviGM9JR6bwGAJ/S1tVoFR8HUMsr2uIbzkhHZZMZwBJhhkBzAPFlmEfdfwnzRBlxQjYD2MhHsN0B1PNuhLcy8kd/YWaY5szSFt/wQPazPI8ssOPUuCzj+1A6a2trtIhfFsC3tMU3nOkq3AXQOOLdHEDGa6JpRIffOY03tcU3nDlU+HHeywHYS0BcGeRRNyvuBUZ8kI5ITwdgy4DxZJBH3aUWBCzBSEfkLg5ggfBAkM0A4onPK4DtAUwyss+/G1nS8Md2B1AnXAAyBxBPBnjUXawtvOGBbETO2Z4NZGfs2H+JGuhl24FjiU/iNpsBJJcDhIH6Xt/+h6sDgBO1dTZ2ozOdPGpLA8MY8WGU8Po3tv+x0wG8LmzCHED88EvcukJbfMMZ6Wjc8XO/0wG8RU2ktzSiR5YYalekeaKN+CAbjdU7v/rtdADbeEfUyDALDx47envVtkSgSaWXcAfoPLZt/7NpAinZSbAMx2vrbexCN6/ashyRRnw4UbgLsMmZD3cHYC8B8aOLR91q4U4QIz5IR2KTkW4OoJDwcQB2EDi5SEdiKzOAeawTNXMM7bU1N5phDiCNdGCk6Poq3t/5L00dQD2viRrqyBHauhvNMAeQRo4SxgKctX0XILBLFnlpQAh7CYgXPvGAN2kLbzhygvD6Zq/6zR3AS8KmTtXW3WhGsUfdrdrCG46cKry+2Shv7gBmUitq6nTPLHRGWNp51K3TFt5wolToAGqap35r7gA27NwjnBOd7SUgVvjMAGSu34gLpwjPf7zW/GUvs8t//j/h7cdq6280wRxA+pCOwF1GuK8D+Iy2/kYT7BUgfUhH4C4jfNcthD2p3M0ptM1+dow0NnT22JlRYx8CE8j+wszedfSmqu1LXicrKpdr28AwUssVwtG6227f3X/tZwhFsFUAw9BCOvpyGN2jhT5lHSXaVjCMVNKeDcLResqeGy1lc/hGDcMIjvTHeuPu+3Z2fwXYKt4PaC8BhqGBdOQ9vzMQyHZaWvF/Rtjsedp2MIxUcq7w+hzX9w4VTiyyXjnpDcNw4QjxOG0hcFhLM4C3xRHiL9a2hWGkjs8Jr1/Ae7v/ny1v+nk8YlEMw/BlnPD6R3K/dKx4cnG4tjUMI1UcLR6jp7XUTMszgOfFeWLtJcAw8ol0xK2Xfd37q9C7LBAGJjYMw50iFglH6P0tN9TawZ9HhQINZoS2TQwjNRzLIGGN6bLLy9gm9DC/0LaJYaSGG4Sjc5s8j9czwlsssZcAw8gLRSwRjs7HWmuq9bP/fxEKtS/HaNvFMFLBKPYV1pCOZqAftUIvc5O2XQwjFUwRjswat7SxfxfepkoYntAwDDmdWSccmW2c7mkr/NcDQsG6i/cmGYYh5RJxFugH3W7Uhxqhp3lR2zaGUfDMEn8B6OV6qyeFt8oyTNs6hlHQyM/qPtxWc21HAL5XLN7XtO1jGAWNPAjvfe4368xGobdZbcnCDCMyOlApHJEb6dxWg23PADa1voGgFXpxgbaNDKNgGSf+oPdXv7zPZ4vfOJ7VtpFhFCzPi8fjGL8btmOp8Ib1DNW2kmEUJEOoF47GpXtKF7enNGB13CMUssgWAg0jEr4hPm9z155yPu65wQN5V3jbtexreeYUOJYrvdt4lqnaahit0Jklwi/6WQ5ggf+NZ4rfO67StlUquUT8nHYvN2srYbTK1eKn+fyeG80lE/CdDqL6JKo2DGNXipkornPXni/JxQHcz3rhjQdzYV6MYhhpYZw4BlBVLmcAcnEAG8ULgXBdPmxiGKnhanGNP7J5zxfl4gDgd2SFNz+aE6O3iWGkhFM5Vlzn97lclJsDmMdM8e2vidgkhpEe5KPpBebmclluDgBuFQtwPgdHahLDSAsHcZa4To4jNlcH8CCVQgEyfDtSoxhGWrgm53G6nZU8lNuFuTa8zWEO8GW3SGSGYTShL18S17mV6twuzN2z3JJrkzvoxHcjNIthpINrKRXWEPxc5+4AljNNLPq36ReZWQwjDezFFeI697Ii10sl7xY3iAXpbPsBDMOL/3SItX1jVMK8KN6NvIV9VM2XJuwsQOHRn83iZ/ic5Aay1UX5HKCU7+la0DASzPfpKK7zv9GJk2Gu2B9tE+9hNtywGUChsZ84RW+WebIfddkMoJ7rxUq05z90rWgYCeUHtBfXKac+SpFK+FDsk6oZrGbCNGEzgMJiqDgxT5alUpch3WFU47DCWML39axoGAllMsXiOr8W79YR05W1Yr9Uy0EqJkwXNgMoJIaJs3NnWU0X6W2kMwDY4DAHaEe5jhUNI6H8yiGqVkV+YnF2d5gDZDkj7yZMGzYDKBxGOzy7KsrkN5LPAGAdNznUusHhjcYw0kixw44buJ4qeSUXBwC/cbjVMIe0hoaRRq7kUHGddW4bgN0cQJXTVPEn7nnKDSM19HT6anaDy++/qwOA68WRgqEn/+1uFcNICT9y+KFcS4XbzVwdwCcOewLhWwx3NothpIFhfMOh1q/cfv996MIKh5XKx/MtZoqwrwCFwNMOT20lXV1v5zoDgI1O3/bP4jP5sKJhJJLznT6X/4gNGsJ2YImDt5rncMDByAWbASSdDnzg8MwW+owo9xkAbGOyQ61DmBSxGQ0jmfw3Qx1qTY5+/39rtOMNB4+1lWFaAhc0NgNINp9yOP2f5V9+iXh9ZgBQx3ccanXgDs/7GkahkeFWp6n81dT53daP53NNQNCM45w+dRhG4fJtTnCoNY2/aws+mC0OE5d1DNQWvOCwV4Dksi8bHJ7WFv9we/4HdBZS4bCs141bOTsSU6aXtczxbmOpthIp5Sb5SX7g1yzWFhygKx87/dpcrC24YcSCLzqNn2VOTiMSvuqkQKXlDjQMerHSafx8UVvwnWT4p5MKd2oLbhjq3O00dmZRpC14U0ZR76BEva0DGCnnPKfhX89x2oLvyp+dFFnFXtqCG4YafZ2O1GWZqi347uzHJidVHo/XVMYw8kaR09m/LBvimXHzOidlsnxLW3DDUOE7jiPmam3BW6aY15zU2cJh2qIbRt4Z7pD5N0uWf/rt/o+Sw6l2UultSrVFN4y8Usocp7FSw5HaordFueOk5jfaghtGXvmt40j5sbbgbdOBd5zUqucsbdENI2+c6fTZPMt78Z8rn+Ko2gr6aYtuGHmhD8sdfyZP0xY9F253nNw8ZlECjBSQ4SnHEXKrtui50Z1ljgr+QFt0w4icnzqOjo9dcv/pMM5RxTrbGmwUOOc6viJnuVBbdAl/dVRyDUO0RTeMyDiAKseR8YC26DL2ptJR0TfopC28YURCZ95yHBUrk7dE/hnnqc692qIbRiS4HZjLUs+52qK7cKujulmu0hbdMILzXefxcJO26G50ctwUlKWak7WFN4ygnOC4TT7LvOS+FI9wSnWQJcuKeB54NAwn9nKMm5llK0doC+/DJOdpz6t01hbeMILQkZedx8F3tYX3I8NzzqpPj++xR8PImQwPOY+BZ5K/O3YfVjurb2cEjeRT4dz/1xRG+pzPOhvAvgcYSedqj94/Xlv4UNzpbIJaztcW3jCcOZta574/RVv4cHRhrrMZNjBCW3zDcOIYx0C5WbK8WViL4O57oLN8zH7a4huGmEGOIb+zZFnLUG3xQ3Oe89bgLHOTcxDSMADoxpvO/b0+WSf/csX1HHSWLDPooC2+YeRMKc979PYfaYsfDRme8DDKw5RoK2AYOVHCdI+e/kzh7n/pyQIPwzxQuIYxCoh23OfRyxcXds7swz3WRbPcZWnEjJhTxG0ePXwLI7UViJovepgny43a4htGm/zGq39fpi1+PrjFy0QxT4xgpJqfefXt32qLnx86eJyNypLle9oKGEaL/JdXv55Je20F8kUfPvAy1TXaChjGbnzLq08vTF7UPx+GsdbDWPV8XVsBw2jGBI+NblnWcLC2AvnmFLZ6uYCrtRUwjB1cQZ1Hb67mdG0FNPi8l8+0PEJGXHCPe9XwY3aptgJaTPYyXJZybQUMgx969uLvayugRxF/9DTe75IfMslIMEXc4NmD70335rYSnvU04N0UaythpJR23OHZe1+wQ24+xyYbyp/tmJChQAnTPHvuXHpoKxEHfAInNJTplGorYaSMDh6xfhvKcgt0s50RHvGCGsqzdNdWwkgRPbzO+2fJsjbZCT9CcxwbPA36tvlTI0/szzzP3rqJk7SViBunscV7SnWUthJGCjja+5V1M5/WViKOnOm1NzBLlo2cp62EUeBc4BXRIkuWas7RViKufJYaT+PWWioRI0Imem35beihl2grEWcu9TZwlgrbHGREQDuPJF/bix1j2yNXehs5y0PJzahuxJTOPBJg+F+hrUYSuC6AC5jF3tpqGAXEPrwaoFdeq61GUvhRAGOvspVWIxAnsTxAj5ysrUaS8Dtg2VBqmKSthlEATKA6QG+0k6tCrvOMFtBQ7i2sFItGnunCnwP0wlQf+XXnmwG+CGSZwxBtRYyEcoD3QbUsWeqZqK1IUvk3730BWbKs4wJtRYwEcrZX3MrtpTYdsf6j4nzv3YENPrjc9gYYAoqYFGT+uY1x2qoknXO8zwg0lMcKO+eaEZB+PB2kz23mbG1VCoFTWB/kcay0x2HkwBl8HKS/bWS0tiqFwtF8EuSR1DPF9ggabVBKeZCpf5a1nKCtTCExwvsI5vYyh+Hayhgx5TDeDtTLlnOktjKFxiDmBno4W5hkS4LGLhQxwfug7/ZiwWkioYy/BXpAWZ6hv7Y6Rozoy+PB+tZzlGmrU6i0984jsLOs4lxtdYyYcGaQvf4N5a705PjVoIhJQbYIN5Rp9mkw9fRgSrAeVc/kdKf5yA+fC7QzIEuWlenNy2YA41kVrC9t40va6qSFE6kM9tiyPM6+2goZCvT3juzftKzhVG2F0sQBvB/w4W1iEu20VTLySIYJgbaXNZSFHKKtUtrYi5cDPsAsMxmmrZKRJw5lVuC+01dbpTRSTHnQx1hNuaVqLHhKmBTkgNnOMsXW/fX4YrDNGw3lfcZrq2REyOhg28kayha+qq1S2jmCBUEfaZZn+ZS2UkYEHBRws09DWcLR2koZ0JOnAj/YGqbQR1stIyA9qAgSXKZpeYKe2moZDYQK39C0rGEixdqKGQEoZkLAr/0NxULMxI5zggRwal7e5SxttQxPTg8S1695WceF2moZu3NgsMOcTcsjHKytmOHIMKZH0CPeZKi2YkbLdOH2CB54LX+0yMKJ4wDuCf5amCXLbRZoPt5cyOoIHns1U80JJIZ9mRJ8yS9LlrWW2TcJ9OOJCB5+lmqmsI+2csYeGEBF4I0+28uz9vSTQhETI+oE25hiaUdjSx/K2RyR859sq/7J4kjeiaQrZNlIue0SiB19+VXgXaE7y1yO0FbPkFNKRcDgIc3LVqba+a/YMJSKyAZ/lqm27JdczgwU472lUsd0i/yuziimURvZM7bAcYlnLx6JrHtkyTKL8RZLQIViLuafkT7bB+mnraQRgpCBn1oqi5hEd20lU0UXJvBepM90uWX1KyT6Mi3S7pLlE8pth1heOIBfsCbSZ1nPrebQC4+LAgZ/bq3jPMfnLahIZJTyBZ6PbGF3e3mXk7UVNaKhOxURLhhtL2uZwuHaqhYcB1MeNBRsy6WGckq1VTWiZASvRt6NsmR5jQl00Va2IChlPDPy8sxeZ6S2skb0lHBdhF+Nm5Z13MIJlirCmQyjmBI0em/rZSNX29ec9LAPU/PSrbJkWUoFo8wNCBnO5ODB3lor9UyzdJ7p41TeypsTyLLE3ECODGcyH+TxybzKidoqGzoUM5GqPHa1LIupYJS22rFlOJMj/rq/a/mICXbIJ930Y0oevgw0L+/wS06zaPI76MDp/DrPQz/LFn5iu/wNgIMj3ybUUtnEDCYySFt5VQYxgWmsU7D+dPbXVt6IE6N5Q6EbZsmygCmcm7Kvz6WMppzXlCz+um31MXanHV9hsVKXzLKRx7iG4wv8xaADJ3Atj+fpM2xLZSGX2lu/0RolTIjwAHEupZrXqGA8vbVNEZRujGYyMyKK15NrqWRSymZahgOdmRRBjgF5WcBUJjA80Z8O+zOeCl6LJD6vrKynnG7a5ogfSe5cUdKVK5hED20xAFjH28xlHrN5g43awuRAew5gJMMYzjExSZu9gZv5BWu1xYgj5gBaJ05OYDvLmd3oDN6lTluYZvRvHPQjOThW79g2+NvEHEDblDGRb8cyCeRWFrGIxSxmMYtYzOo83783+zOIQTv+Gcd360+o4EbWaYsRZ8wB7JnOXMZ3GKwtxh7YyCIWs4gPWUUly6lkFbWB2i6hD33Ym770ZSD7sz+DYn/ScSnX83s2aYsRd8wB5EY7LuQajtMWQ8haqlhLFVVUsZ5trKeWKmp2rCRUkQWKKGv89y6UUEYx3ehAN8ooo0fj/5LFXH7FvdRoi2EUGifyUAzWs620Vf7GufazZkTH4Ehj0FtxL9uYxrHa3SNpmK90oTdXcGVMPnEZACu5lVtYqS1G8jAH4Ep7zmcCp5sF1ZnNbdzNFm0xkol1Xz8O5Kt8nV7aYqSUddzPTbylLUaSMQfgTycu5jJOMlvmkSz/x508yGZtQZKOddpQDOQLfMPOmOeBj7iH25mvLUZhYA4gJBnG8CXOj/0mmaSygYe5m+eo1xakcDAHEJ7SRjdQ2Cf780sdz3M3f03EYahEYQ4gKnoxjvGcarHmPanlBabxF9ZoC1KYmAOIlp6cw3jOsNmAA3XM4gH+bF/3o8QcQD4o41zO4wwLSJEj63maR5lu5/iixxxA/mjH8ZzDeRyiLUiMWcizPMbTVGsLkhbMAeSfgxnLGE6xmPRN2MjfmcGTvK8tSNowB6BFe05gDGdwZKqXCet4nWeYwcv2m6+DOQBtunAcoziRk+igLUoeqeMNZvISz9nqvi7mAOJCF07gRI7jWLprixIhVbzCLF7iZYvVEw/MAcSNDAdzLMdxDMMp0RYmEDXM5RVm8QrvktUWxmiKOYD4UsKBjGQkwxgRy7Cke2Ij7zGP2cxmth3WjSvmAJJBf4YxnGEM5zC6agvTBttYwFzmMZd5vGN79uOPOYCkUcQAhjKEoQxlCEPU3cF6FjKf+SxgPvP5yKb4ycIcQNLpwQD2YyADGEh/+tGHPpEl5qinkkpW8jFLWcoylrCUKm0DGD6YAyg82tGHPvShJ2U7Sie6UkpHOtOe7o0OopSOjTW2sBWAetZRzSY2s40NbG4MKN4QXLySSlbZpL7Q+P+hamob2Oej0AAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxOS0wOC0zMFQxNToyNzo0MiswMjowMA1lfIsAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTktMDgtMzBUMTU6Mjc6NDIrMDI6MDB8OMQ3AAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAABJRU5ErkJggg=="
-b64_down_arrow = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4RBwyHobtKAAAJ10lEQVR42u3d2evldR3H8feZn/5mshJkDAcpqYuioD8gJKiLiCAkuishWsy8MGrMFuqmRVvuSnMqr7JcAsEWW/+ANrpJo4tCK0o0qbtyYmCW08XJxp+/7Szfz/54nGuHz/eDz9c5Z+bHTAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQD6zSX+1l8U1cSKujNPx93g6/hjnSj8edOCKeGVcFSfibPwznorH4pnSB9rtdXEqnoj5jte/4+G4Po6WPho06+Xx6Xg0Luzo6mz8Mm6Jl5Q+2kWvj58/L/3nvp6MD8YlpY8Izbkm7ouz+3Z1Or4cV5Q+YsRlcffz9mmv12/jNaUPCk25OU4f2tU/4m1lD3l1PHroIRevZ+K60jcKjdiO+5fs6kLcNvHv463gpfGXJY+5+ObyrtL3Cg04Fj9doat53FXmmJfH71c65jzOmQA4xKr5z2Menypx0AdWPqYJgIOtk/88zsUbcx/0ujWOOY95nI93l75jqNR2/HDNrh7P+8ftR+IPax7UpwDY23rv/s++TuY86ts3OKgJgN2OxU82qupvOX/a5gcbHdUXAdhpOx7esKl5vDnXYV8QZzY+rE8B8Kyj8eONi5rHqVzHfcMEhzUBsDBN/vP4Xa4D3zDJcX0RgGk+/C9eZ+JIniN/cqID+xTA6I7GjyaraR5XrX6AdTbjxGSPvxXfNAEM62g8FG+d8Nd74er/yToDcGbCI2/FPb4IMKTteHDS/Kct8wC3TPihxRcBxnR07Z/62//31I7lOfo7Jz64CWA06//Q7/6vP+c6/GsnP7o/EWAk2xv/KN1erwdyHX8WTyc4vk8BjGG6P/jb+cr4FnpnkgcwAfQvzbv/PE7Hi/M9xKvjfJKH8EWAvm3H95OUM4878j7IQ4kew6cA+pXq3X8e/4qr8z7KK+I/JgBWkC7/eXwo/+PclOxhfBGgP5fG95IV83CZvxn47mQP5FMAfUn33X8ev4nLyzzUVjxoAuBQ2wnf/R+J4+UebGvpf8Bg9ZcvAvQh5Yf/R+LKsg9nAuAgXecfYQJgf5fGd/vOP8IEwN6GyD/CBMBuW/GdMfJfPKwJgIuGyn/xwCYAFobLf/HQJgAGzX/x4CaA0W2t9S9nd5D/4uFNACMbOv/FBZgARjV8/otLMAGMSP7/vwgTwGhS/l/fVP6pL8MEUB/5Z7wQE0Bd5J/5UkwA9ZB/gYsxAdRhK+6T//6XYwLomfwPvSATQK/kv9QlmQB6JP+lL8oE0JutuFf+y1+WCaAn8l/5wkwAvZD/WpdmAuiB/Ne+OBNA6+S/0eWZAFom/40v0ATQqq34tvw3v0QTQIvkP9lFmgBaI/9JL9ME0BL5T36hJoBWbMW35D/9pZoAWiD/ZBdrAqjdEfmnYwKo25G4R/4pmQDqJf8MTAB1kn8mJoD6yD8jE0Bd5J+ZCaAes/iG/HMzAdRB/oWYAMqTf0EmgLJm8XX5l2QCKEf+FTABlCH/SpgA8pN/RUwAec3ia/KviQkgH/lXyASQh/wrZQJIT/4VMwGkNYtT8q+ZCSAd+TfABJCG/BthApie/BtiApiW/BtjApiO/BtkApjGLO6Sf4tMAJuTf8NMAJuRf+NMAOuTfwdMAOuZxVfl3wMTwOrk3xETwGrk3xkTwPLk3yETwHJmcaf8e2QCOJz8O2YCOJj8O2cC2J/8B2AC2Nss7pD/CEwAu8l/ICaAneQ/GBPARfIfkAlgYRZfkf+ITAAREV+S/6hMAPIfmgkYm/yHZwLG9UX5YwJGJX/+xwSMR/48hwkYi/x5HhMwji/In91MwBjkzz5MQP/kzwFMQN/kzyFMQL8+L38OZwL6JH+WZAL6I39WYAL6In9WZAL6cbv8WZ0J6IP8WZMJaJ/82YAJaJv82ZAJaNdt8mdzJqBN8mciJqA98mdCJqAt8mdiJqAdn5M/0zMBbZA/iZiA+smfhExA3eRPYiagXp+VP+mZgDrJn0xMQH3kT0YmoC7yJzMTUI/PyJ/8TEAd5E8hJqA8+VOQCShL/hRmAsr5hPwpzwSUIX8qYQLykz8VMQF5fVz+1MUE5CN/KmQC8pA/lTIB6cmfipmAtD4mf+pmAtKRPw0wAWnIn0aYgOnJn4aYgGl9VP60xQRMR/40yARMQ/40ygRsTv40zARs5lb50zYTsD750wETsB750wkTsDr50xETsJqPyJ++mIDlyZ8OmYDlyJ9OmYDDyZ+OmYCD3SJ/+mYC9id/BmAC9iZ/BmECdpM/AzEBO52UP2MxARfJnwGZgAX5MygTIH+GNvoEyJ/BjTwBJ+OC/BndqBPwYflDxJgTcJP84VmjTYD8YYeRJkD+sMsoE/AB+cNeRpgA+cO+ep8A+cOBep4A+cOhep2AG+UPy+hxAuQPS+ttAuQPK+lpAuQPK+tlAuQPa+lhAm6M8/KH9bQ+Ae+XP2yi5QmQP2ys1QmQP0yixQmQP0ymtQm4Qf4wpZYmQP4wuVYmQP6QRAsTIH9IpvYJeJ/8IaWaJ0D+kFytEyB/yKLGCZA/ZFPbBMgfsqppAuQP2dUyAe+VP5RQwwTIH4opPQHyh6JKToD8obhSE/Ae+UMNSkyA/KEauSdA/lCVnBPwjjgnf6hLrgmQP1QpxwTIH6qVegLkD1W7JB5MNgHnEuZ/vPTFQR9Sfgrw7g/Va2sC5A8Ta2cC5A8JtDEB8odE6p8A+UNCdU+A/CGxeidA/pBBnRMgf8ikvgmQP2RU1wTIHzKrZwLkDwXUMQHyh0LKT4D8oaCyEyB/KKzcBMgfKlBmAuQPlcg/AfKHiuSdAPlDZfJNgPyhQnkmQP5QqfQTIH+oWNoJkD9ULt0EyB8akGYC5A+NmH4C5A8NmXYC5A+NmW4C5A8NmmYC5A+N2nwC5A8N22wC5A+NW38C5A8dWG8C5A+dWH0C5A8duSTuXSH/X8Xx0gcGpjSL2+P8UvnfH5eVPiwwvTfFY4fE/2RcX/qQQCpH4+b40z7x/zVujReVPiB5zUofgOxmcW28Ja6NV8XVcSROxxPxVPw6fha/iAuljwbktFX6AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAjOO/0kGkeaFYQNsAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTktMDgtMzBUMTU6MDc6MTIrMDI6MDAd6csuAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE5LTA4LTMwVDE1OjA3OjEyKzAyOjAwbLRzkgAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAAASUVORK5CYII="
-b64_right_arrow = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADdcAAA3XAUIom3gAAAAHdElNRQfjCB4RBjcvsWMvAAAQNUlEQVR42u3dXYyl9V0H8O/M7iy7yL6yC25ZBFlYYkHabRvbSBv7hjGtpIkmUGNommoam2B6o1eaeOeVMdpU2pq2JvWKGLVGhZhoY2uNaaO2KQVpAPcFKK/7xjLLvjAzXmxHoMwsM7PPc57/Ob/PZy8JJ89/k+e7c5453+9JAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgM5NDX0BzduVq7Ilm7Ixczmd2RzJ0zmZhaEvC7ogAJYznS25Lnvy5vxsrszWbM65nMyxHMyDeTSHczinhr5EuFgCYClTuTR7887cnluz43X/9Wwez7/mvnwnhzM39KUC3VqXnbk9X83ZLCz7Zz7P5p7sz8ahLxbo0rrsyadz8AI3/+Kfs/lePphLhr5goCtTuSp/kGMruP3P/xxwNB/MRm+kYDJsz+/n+Apv//N/TuQ2bwRgEqzL3Tm0qtt/IQuZzZ3ZPPSlAxfrF/MvmVt1AMzn6Xw0W4a+eOBibMlncnLVt/9CFjKXg/lYtg19AFitdUNfQEPenzuzd00P9KayJTfnaA7lpaEPAashAF5xV25b83v5qWzLvpzK4cwOfQxYOQGwaHs+nrddxN/HdC7PtTmdgyKA8SEAFu3Pr+bai3qFqVyePTmdg1oCjAsBsOgX8sFccZGvMZ1duSpnc8hPAYwHAbDovXn3EsWf1ZrOFbk6Z7wRYDwIgEW35Z3Z2sHrTGdXfiov5n/9RoD2CYBF78vbO/owz3R25rqcyEERQOsEwKL9eUe2d/Ra09mZm/N8DuT00MeCCxEAi/blXdnV2atNZVvenifyWM4NfTBYngBYdHnekz0dvt5ULsut+UEOWA2C9u3I366hCPRGNaHZfDib7AXQqumhL6AZR/NIjnX8mlO5NPfm/VaDaJW3AK/YkJtydQ+vensezGHPAmiRAHjFk7kxN/Xwr/WGfCCHc9hvBGiPAHjFy5nPdfnpzl93Kpvyjvwwh0QArREAr/ZMLsuNPQx7TGVzbsmJHFIToi0C4NXO5plcmp/Jps5feSrbcn1eEAG0RQC81sk8nUtyYw87v1PZkWtySlmYlgiA11rIsTyZ9dnXQwRMZ1euzjllYdohAH7cXJ7P49nQWwTsyVllYVohAF5vPkdyKJuyr4dfCZ6PAHsBNEIALGU+R/NYtub6niLgmpzKAc8CGJ4AWNp8juWhXJG92dD5a09nZ67PCzlgL4ChCYDlzOd4/ivX5rqs77zMM5UdebO9AIYnAJa3kJP5Rt6aN2Wmhwg4vxdwIGeHPiawvN25Pycz33FR+HxZ+Lnc6cvFoW27c39e7CkC7AVA83bnvpzqIQAWspAX8+EePnEAdOjK3LvGbw5+4z+zuXPN30kIF8VDwJV5Kd/O7lzXy7bP+rwvh+wFMAQBsDILeTHfz/bs7SECprIpP5dnfbk4oycAVmohJ/JILs0NvTQFL8vNOa4szKgJgJWbz/EczCW91ISmsi03ZFZTkNESAKsxn6N5vKey8FR25NqcVhNilATA6sznSJ7M+p4mQy7PHl8uzigJgNWaz5E8YS+AySAAVs9eABNDAKyFvQAmhABYG3sBTAQBsFb2ApgAAmDt7AVAefYCoDR7AVCavQAozV4AY8lDwG7YC2AsCYBu2AtgLAmArtgLYAwJgO7YC2DsCIAu2QtgzAiAbtkLYKwIgK7ZC2CMCIDu2QtgbAiAPtgLYEwIgH7YC2AsCIC+2AtgDAiA/tgLgPLsBUBp9gKgNHsBUJq9AJrkIeBo2AugSQJgNOwF0CQBMCr2AmiQABgdewE0RwCMkr0AGiMARsteAE0RAKNmL4CGCIDRsxdAMwTAEOwF0AgBMAx7ATRBAAzFXgANEADDsRcA5dkLgNLsBUBp9gKgNHsBDMJDwDbYC2AQAqAN9gIYhABohb0ABiAA2mEvgJETAC2xF8CICYC22AtgpARAa+wFMEICoD32AhgZAdAiewGMiABok70ARkIAtMpeACMgANplLwDKsxcApdkLgNLsBUBp9gLohYeA48FeAL0QAOPBXgC9EADjwl4APRAA48NeAJ0TAOPEXgAdEwDjxV4AnRIA48ZeAB0SAOPHXgCdEQDjyF4AHREA48leAJ0QAOPKXgAdEADjy14AlGcvAEqzFwCl2QuA0uwFsCYeAk4GewGsiQCYDPYCWBMBMCnsBbAGAmBy2Atg1QTAJLEXwCoJgMliL4BVEQCTxl4AqyAAJo+9AFZMAEwiewGskACYTPYCWBEBMKnsBbACAmBy2QuA8uwFQGn2AqA0ewFQmr0AluQhYA32AliSAKjBXgBLEgBV2AtgCQKgDnsBvI4AqMReAD9GANRiL4DXEADV2AvgVQRAPfYC+H8CoCJ7AfyIAKjJXgBJBEBd9gKIAKjMXgCUZy8ASrMXAKXZC4DS7AUU5SEgib2AsgQAib2AsgQA59kLKEkAsMheQEECgFfYCyhHAPBq9gKKEQC8lr2AUgQAP85eQCECgNezF1CGAGAp9gKKEAAszV5ACQKA5dgLgPLsBUBp9gKgNHsBUJq9gAnlISArYS9gQgkAVsJewIQSAKyMvYCJJABYKXsBE0gAsHL2AiaOAGA17AVMGAHA6tgLmCgCgNWyFzBBBACrZy9gYggA1sJewIQQAKyNvYCJIABYK3sBUJ69ACjNXgCUZi8ASrMXMKY8BKQL9gLGlACgC/YCxpQAoBv2AsaSAKAr9gLGkACgO/YCxo4AoEv2AsaMAKBb9gLGigCga/YCxogAoHv2AsaGAKAP9gLGhACgH/YCxoIAoC/2AqA8ewFQmr0AKM1eAJRmL6BRHgIyCvYCGiUAGAV7AY0SAIyGvYAmCQBGxV5AgwQAo2MvoDkCgFGyF9AYAcBo2QtoigBg1OwFNEQAMHr2ApohABiCvYBGCACGYS+gCQKAodgLgPLsBUBp9gKgNHsBUJq9gIF4CEgL7AUMRADQAnsBAxEAtMFewCAEAK2Yz/EcysaeImBb9uZYDnoj8FoCgHac3wvopyk4lR3Zk+fzWM4NfcyWCABaMp+jeSIzPZWFd+ayPJEDQx+yJQKAtszlSB7PJb2UhddlV07lf3Ji6EO2QwDQmrkf7QXc0EMEbMzGPJUHhj5iOwQA7ZnP0Tyarbmhh7Lw1pzIt8yFLBIAtOj8XsCVua7zCJjJbB72HGCRAKBN8zme/+xlL2A+j+c/hj4e8Eamc2Xu67wp+FK+nJmhj9aK6aEvAJY1n2fym/n3zGahw1fdmCuyfeijtUIA0LYf5uP5Zk51HAEC4EcEAK17Kp/INzr9CO8lAmCRAKCiLn+eGGvrh74AeAO78+W8p9OPBp/J8aEP1QoBQNvelL/Iz+fSTn8VeDrHhj5WKwQA7ZrOrnwxt3Z8+7+UZwTAIs8AaNW6XJ3P5L0d3/7JU3lQJRjatj778pe9DIV+PR8Y+nDAhczkpnypl9t/Nn+eK4Y+HrC8mbwlX8iJXkbCv5Nf90Uh0K4N2Z/P9XT7H80f5+qhDwgsZ0PelntyvJfb/0z+Ie8f+oDAcmayv7fb/+V8O7+WTUMfEVjaTN6Sz/V0+8/lwfyGDgC0an1uyud7u/0fzSezc+gjAktbl335Uk+P/uZzOJ/IjqGPCCxtOtfkK3mhp9v/udyVrUMfEVhOv18PfkcuG/qAwHJ2576c6un2fzEf6uFbhoCO7M79nQ9/Lv7wP5sPZZNP/kGrduf+nOzp9n8ud2Sj2x/a1M/s9/k/czmcu7z3h1atyzW5N6d6uv0fzSc8+YdWrc++fKWnJ/9zeSif9Ht/aNX5vn8/v/d/OQ/kUz71B62ayS35fE+f+ns5383d2TX0EYGlzeStPTb+vpPftvgDrZrJ/ny2t9v/u25/aNdM3prP5lhPj/4eyN1uf2jVTG7p7Yf/uTyUT3nvD63S94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEvfH8rS94ey9P2hLH1/KEzfH8rS94ey9P2hLH1/KErfH8rS94ey9P2hLH1/KEvfH8rS94eyNuRt+bMeb3+FX2jW+tzS69zHb3nvD+3amz/K0Z6e/D+o8Ast25LfzeGebv9H3P7Qsqn8cr7R0+1/MB/LtqEPCCxva76Q0z3c/vN5Oh/NlqGPB1zIR/KtXv79fyG/kp8Y+nCwlPVDX0BD3p3re3jV2Xw0X8vpoQ8HXMjOfDVznf/wr+9P06aHvoBmvCU/2fHfxnyezV35Wk5nYejDwdIEwKI92dzp683nyfxO/sntT8s8A1i0o9NlvvkcyB/m7zM79LHgQgTAos3Z0NlrzeXh/Em+mhNDHwouTAAsmuvsR/W5PJR78jc5OvSR4I0IgEUv5EwnrzOX7+eL+Wu3P+NAACw60snv6ufyvXwpf5Xnhj4OrIQAWHSgg3fsc3kgX3T7w/jZnntz9iIrPw+Y+2C8+BzAomN5OM9fxP8/l4dzT+7Ns0MfBFiLX8q/rfk7AObyA1/wDeNsc/50jd8DoO8PE+C2/PMaCkH6/jAR1uXuHFp1AMzmDt/xB5Nge34vx1Z1+5/IbZ22CGCE1g19AY05k8dyJvtXeEsv5PnckW929BlCYHDrclU+nYMr+Lf/TL6dd+WSoS8Y6NK67Mzt+bucu+CDv+fyudzSYYMQBmCsailTuTTX5535SG7N1tf913N5Il/PP+a/czDzQ18qXAwBsJzpbMne7MlNuTlXZGs251xO5lgO58E8ksM5lFNDXyJcLAFwYVPZlauyOZuyMXM5nVM5kqfzgpkvAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJbxf8BiNNep7Qb9AAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE5LTA4LTMwVDE1OjA2OjU1KzAyOjAws8aQZAAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxOS0wOC0zMFQxNTowNjo1NSswMjowMMKbKNgAAAAZdEVYdFNvZnR3YXJlAHd3dy5pbmtzY2FwZS5vcmeb7jwaAAAAAElFTkSuQmCC"
-b64_menu = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4RBzXYpDNCAAAIwklEQVR42u3d24+cdR3H8U+3RSgVaFE0ilKlJLQGBQNVKqKFVkmk0iBnFBS9MMbES/Ef8EJDEBO8UGMQ0BhIOFkMVhFBqRA5l2g5HwuBkFIoBbS0XW+6mdl2KUV2n+9vpq/X/APvzD7PZ367szubAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB0Z1p1wADZLyPVCeySrXm5OmFQGICd2y/LsiRH5JDsU53C27Ihj+Te3JQV2VCd0jID8OYW5Ps5M3tVZ/COvJ4r8uOsqc5gsMzKRXkjox5D8XgjP83e1ZdUm5wAJrIgV2d+dQST6p6cnCerI9pjAHa0MDfkPdURTLoXsjy3VUe0xgBsb0H+7vYfUutydB6pjmiLARhvVu7IguoIpsyDWZT11REt8c72eD90+w+1Q3NRdUJbnAD6LcjqzKiOYEptzadyV3VEO5wA+p3v9h96I7mgOqElTgA9++a5zKyOoANH5u7qhFY4AfSc5PbfTZxbHdAOA9BzXHUAHTmxOqAdBqDnk9UBdOSQvL86oRUGoGdedQCdOaw6oBUGYMyIP/jdjRxYHdAKAzBmhndEdiPGfhsDMGZT3qhOoDMbqwNaYQB6nqkOoDNrqwNaYQB6HqgOoDO+1tsYgJ5bqwPoyGNOe2MMQM/11QF05A/VAe0wAD33ZXV1Ap34TXVAOwxAvwurA+jALflndUI7vPfdb0buzserI5hSo/ls/lEd0Q4ngH6b8+1sro5gSv3c7d9venVAY9ZmU5ZWRzBl7s3pJr6fAdjeqrwvC6sjmBKPZ6mPBB3PAOzohszMMdURTLrVWZJnqyNaYwAmcmPWZKnPBxoio7kkp+TF6oz2+CHgxK7M/Pwim6ozmBR35Ph8K69VZ7TI24A786F8PaflE56lgfVCrs9lubk6o10u7bd2QA7PvMzObM/WwNiYV/NU1mRNRqtTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYABMqw4YCLNycObkXdUZ7LJNWZ/H8mp1RvsMwM6MZHFOz+IcWh3C/+WB3Jwrc0u2VocweEZyXh7MqMfAPx7MeRmpvpxa5QQwsQW5NAurI5g0d+areag6okUGYCKn5teZVR3BpHopZ+WP1RHtmV4d0KDzcln2rI5gku2Vs/Jc7qrOaI0TwPa+nGvM4pDanGVZWR3RFgMw3tzckznVEUyZl7Moa6ojWuKno+Nd7PYfavvlV170+hmAfkuzrDqBKbYoJ1cntMQa9vtTvlCdwJR7JPOzpTqiFU4APR/OkuoEOnBIvlid0A4D0LPcs7GbOLs6oB0u+Z7PVwfQkRN86zvGAPQcVh1ARw7IR6oTWmEAeuZWB9CZj1UHtMIAjJmRmdUJdOYD1QGtMADsjvaoDmiFARizOa9XJ9CZDdUBrTAAPU9WB9CZx6sDWmEAeu6vDqAjW/1B0BgD0HNLdQAduS/rqxNaYQB6rvUb4ruJa6oD2mEAep7JjdUJdGBzLq9OaIcB6Pej6gA6cEWeqE5ohw+/6vdEjvQ/AIbc6zklL1VHtMMJYLzv5sXqBKbU+V7/+xmA8Z7OOdlcHcGU+V0urk5oi28BtvdwnsxJhnEorcyZ5n08A7Cj+7I6y/wr0KFzac7OpuqI1nilm8i1OSq3V0cwidbnm/mG239HTgATW5dL8mgW5L3VIbxjr+ZnOSOrqjPa5KORdmYkx+b0HJf5nqeB9GL+lhW5Ki9Xh7TLhb0rZmZeZmev6gx22Wheyto8X50BAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA2JadcCA2DN7Z7Zna0CM5qW8lv9WZwwCl/TOHZivZEkOz0EZqU7hbdmap3Jv/pKr82x1CoPp6FyXLRn1GOjH5lyXo6svpXY5AUxs/1yUr3l2hsRofpvvZX11Rotc4hM5KlfloOoIJtXDWZ411RHtMQA7WpwVeXd1BJNuQ07Nn6sjWmMAtndk/pp9qiOYEq/kmNxfHdEWAzDe7Nydj1ZHMGWezKfzfHVES7y5Nd4Fbv+hNjcXVye0xQmg3xG5yyQOudEcm1XVEe1wuff7gedj6E3LhdUJLXEC6Nk/z2bP6gg68JncVp3QCq94Pcvd/ruJc6oD2mEAehZXB9CRL1UHtMMA9BxRHUBH5uaD1QmtMAA9B1cH0JnDqgNaYQDGTPfrv7sRJ4BtDMCY6dUBdGhWdUArDMCYTdlUnUBnXqkOaIUB6FlbHUBnnq4OaIUB6Pl3dQCd8ckA2xiAnlurA+jIQ3muOqEVBqDn99UBdGRFdUA7DEDPmtxRnUAnLq8OaIcB6HdBdQAdWJn7qhPa4a8B+41klY+QHnJbsjD3VEe0wwmg39Z8x/+TGXI/cfv38/tv4z2XdTmxOoIpsyrnZmt1REsMwPbuzB75XHUEU+JfOSEbqyPaYgB2dFP+k+P9dGTorMoJWVcd0RoDMJFVuT1L/HeAIbIlF+Zcr/47MgATezS/zLQc7kPChsLKnJHLfO8/EQfdnZmTs3JaFpmBgfVQrs9l3vd/cwbgrc3MgszLnOzrvDQwXsnGPJ01fucfAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAl/wOvMK8fXCDzgAAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxOS0wOC0zMFQxNTowNzo1MyswMjowMD/UzmAAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTktMDgtMzBUMTU6MDc6NTMrMDI6MDBOiXbcAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAABJRU5ErkJggg=="
-b64_plus = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4NCCQgsFVrAAArWUlEQVR42u3debxXVb3/8dfhwGGUwQPIJBxElEAGxRmyMjStbLj34nDrkplpg1esNHrUz6Ku3bDx4q1rZpqieQvNm2k54BSCU6AogooCR8CBGWXmDN/fH4AiMpyz12ftz977+37uhyU9+i4+n73X/nzX3t+91wIRERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERMVfhHYCkqi1t6EglUEHnXf73dZSAetazhc3eQUp6VACKphXVVFNNV6rptuPft/+pig5NbGM9daxi9dvbyl3+VOedoFhSAci7VnSjJ4e8vfWjMurft5ZFu2xLqPfeARJCBSCP+jKUoRxOf2roE/mE37d6llFLLS8wl2dZ5r1jpLlUAPKiioGMZCSDGUZ372D24k2eYx7zmc0cNngHI02hApBtHTiOUQxnOP1p4R1MMzSyiGeYw6M8wUbvYGTvVACyqSdHM4rRHEOVdyiBGniRGcxkOrXeoch7qQBkSSWDGMVoRjLYO5QIXmcGM5nB0zR6hyI7qQBkQx9O4zTG0Mk7kBSsZRr3cA+vewciKgDeKhnBGXyco8rwSCziLu5kOtu8Ayln5dftsuIgPsLHObUsvvP3ZSMPcSd3s9Q7kPKkApC+QZzJWI7wDiNjnuZWprLQO4xyowKQpn58irGM8g4jw+ZzKzfzsncY5UMFIB19+TRjOVH7u0nmcytTWOQdRjlQh4ytN2dxFsdoTzdTI48ylT+ywjsQkWRaMIapbKOkLfFWzzTGur7tUHD6XoqjN5/ly/TzDqMgXuVmruYV7zBE9q+SMUyl3v27s2hbA9MYS0vvw1s0GgFYGsj5fI6DvMMosFe5nus0FpDsGa3v/dTGAndyovfhFtmpBWfwmPtpUW7bLMbp5qB468B4at1PhnLdXmY87by7QL7pHkByPfgS/86B3mGUuZVcz1W85h2GlJdBTNEv/JnZNnG1fnKVtNRwDXXunV7bu7dtXENv764hRddXJ3+Gt61cQ0/vLiJF1Z1JbHbv5Nr2vW1ksp7EaDrdBGyarlzKxbT1DkOaZAO/4krWeoeRByoA+9eZb3ER7b3DkGZZy0/5hdY5lDAtGMcb7sNabcm2ZYzTV9y+affsy4f4BcO9g5AgT3IJj3kHkV15Wm0mXX2ZwoM6/XPvWGYyhR7eYWSVnqbek478gN9zlHcYKdjAttyvPbQ/FQznQhqZRYN3KNmjS4DdteDz/DD3PyQ1sJrVrNrxn6t2/PtWNlBHiXXAtnet2deeKqAzFbSiA22opppqutKVarru+FPevywWchn/5x1E1qgAvNsIruVo7yASKPE6i1lMLbUsppal1Bn/Da04mP7U0J8aauhPL++UE7mPL7HYO4gsUQF4R1u+y6U5mnOmnpeYyzPMZQG1bE35b29DDQMZxjCGMTBHo4ONXM5VuhjYSQVgp9FcyyDvIJpgHfOYx3xm8xSbvIPZoRWHMZLBDOHoXNxum8P5zPYOQrKjE5NpcP/Vet/bQqZwAUO8d9V+9WIsk5mV8f1ZxyTaeO+qLNAIAM7gf+jjHcRebOJpZjCTR1ntHUozHcBxjGYk78/s6ocLuYAHvYMQX7243f3baE9bPY/zPY7L0R2JvWnFCUzkiUyOCBq5OrPlSVLwr6x174S7b8uZwjl09d415rrxGW5mhfv+3X1bysneu0Y8dOJm986369bAY1zOMQV/NrMFx/I9Hs/UeKCBKwv/MJTs5nhedu9472zzmMgh3rskVX0Yzwwa3ff8zm0uQ713iaSlJRMzM4P/PCZyqPcOcXNwhsrAJsbrlng5qGGGe2fbeeof5r0zMqEf4zNyTO7JxVMMEmAc69272TquYYT3jsic9zGJVe7HZjkf894REksnbnPvYNP5N00stlft+Jz7WKCRn9PKe0eIvUHMd+1Ya7mGYd47IRcOZ5Lzz4Uzcvqqk+zVOWxw7FAzOZvW3rsgV1pzDo86HrHXGO29C8RKSya5daQG7mSU9w7IrZFMcfu9po4J3umLhW484NSFtjAlF+8XZtshTHYbvd2iuaDzbhSvunSd5Uyk2jv5wujEeKfj+AwDvJOX5C5iq0OnWcj5uuI314YLWOxwNNfoh8F8quJGh+6yhAv0I1I0VXyZpakf0wa+4524NFcXHkq9o6xggiaZiK6KCxwuB27Q60J50j/13/xXMYF23mmXjXaMT329pgfo7J22NM3xLE+1a6zh23TwTrrsHMDlKc/m8Bz9vJOW/fs0G1PsFA1MoZt3ymXrQCZTl+LRfj2XU8aXlfGpTjXxgB7udTeIv6V4xDfwCe+EZW8q+WWKXeElxnonLDuckeL0LvVc7J2u7El7/ppaJ3iTy3RXOFNaM4G3Ujv+P9fUIVnTiUdSOviNXJf7lQOLqQe/S212oetztBZSGejC4ykd+IV82DtZ2Yf380JKPeGPeuArKw7imVQOeR2T9XJI5rVlYkoPgN+lqV2yoC8LUjncc/QTUG4M48lU+sRDHOCdarnrz8IUDvQmJmrAlystGZ/KS8RPcqB3quVsCK+lcJAf0CuhuXQoD6bQO/6h1769HMXK6Id3CxMKvlZPkVUwni3R+8h8zSDo4RjWRT+0z+lJv9wbwbzo/eRFrSeQtqHR55Bv5Bq931cIbZgc/fmAuboQSNPA6Nf+y/m4d5Ji6NToPeZpungnWS76Uhv5YN5LT+8kxVh37ozcax7VS+Fp6MOiqIdxGxfrSe9CquBrbIvad+7TjFCxdYt8S2c5H/JOUSIaHflS4G69JBZTZ2ZHPXwzNPQvvF7MjNqHbqOld4pF1THyA57XqHqXhdgrRd2gJ0diaM3DEQ/aRj7jnaCkaBybIvamn3mnVzwVTIl4wF7Riz5lZ0TUt0j+3Tu9ovlhxIP1gH7BLUvVEceU9XqOxNIXIp7+WvKhfFVFHFdu5Djv9IriQ9EmeGhkon7zL2sVTIz2mPBrWkfAwpBoyz9sZZx3cpIB50b7gpmn1YRC9WJJpIOzRo/8yA4nR/uSeUgXmCEO4OlIB2YR7/NOTjJkSLT3S673Ti2/Krk70kGZrYm9ZTc9mROpt33bO7W8ivW8luZxkz3pzKNR+lsDH/VOLY8+Genu7MOayVX2oj33R+lzazSrZHMdzptRDsXfNJe77ENr7ojS757R7FLNcUCkl37voLV3apJxVdwWpe/93jux/Kjg1kiHQC9qyv5VckOU/neRd2J58Z0ou/8avaQpTVTBVRF64DZO8k4sD06lPsLO/7Ue+ZVmqOA3EXrha5pwZn/6RVns4yZ9+0szteDmCD3xUT0ZuC9VzIqw0zVJkyTRktsj9EZNFrIPP46ww+/VnX9JqIq7zPtjox4L2psPRLj6f0C/+0uAtjxk3iff0IPoe9KFV8x39WN66k8CtecR8375Z++ksuhP5rt5tt7GFgNdIrwmdIF3UllzvvkuXqyBlhjpaf6y8EYGeSeVJQN4y3gHv8lQ76SkQAabTxkyWz8I7tSSx4137jY+7J2UFMwHzScOm+SdUlb8yHjHNmquP4ng88b9tIGTvVPKgtE0GO/Y73mnJAV1hXFPXUJH75S8tTZ/8fcWPfUvkdivT/Ur75S8WdfUv+u5P4moigeMLwNGe6fkaRjbTHfny1rkSyKrZrFpn33e9yvLc7jcghmcYNjeZkbzlGM+edKW4zmCGjoA66llHo+z2TuonBjOo6YTfP0H3/VOycc3jIf/n/NOKBda8CnuYMt79t4W/swn9dp0k3zWtN/WMcI7IQ81rDfdjZO9E8qFj/H8PvfiPE7zDjEXrjbtu09Q6Z1Q2iq4z3QXaqKF/TugiVNc3EgH71Azr5XxK0LjvRNK23mmu+91enknlHm9eLbJ+3OOpq7ar568ZtiDN3KId0JpOojVhjtvG6O8E8q87ixo1j59gW7eIWfeB6kz7MV/804nTdeZfv9f7J1O5lUleNtiJq28w868S0378Se800nLkaYP/96tJ//2K9kqi1d4h515FfzVsCe/XC4PsU033Gkr6OGdTuYNSfi41VYtob5f3XnDsDdf6p1OGs4x3GGNfNw7nRyYmnj/3uIdeg6cbriI7VvFv/na1nRulau808mBvgFTrdbTxzv8HLB8JuBa72Rim2i4s+Zpxt8mmBC0j8tiUBqoDXPN+nQDR3unE1MfNpjtqi0M904nFx4K2sv3e4efC0cazhY0s8g3tf/X8Pv/a97J5EILNgXt5Y16O6BJLjPs2WO9k4lllOHtkgeKXCcN9Q/e0/28U8iFFoYLiCwu5qVtBU+Y7aKNDPBOJydOCN7Xx3qnkBMDA8dau27f8k4mhk8ZDpJ0a6qpPhy8rzW/clN9y6x/ry3ekjYVhqurzNFDqk12avDePtU7hdxoyWyzPl64iW3PMts1dRzlnUyOqACkabjZFHfrODCdkNO5x1tpWNF+omm/JKOeMZuWphPf8E7G0jiz7/8FxbxDGo1GAOlqx0tGPX0D3dMIOI0RQCuzSQ9LfFlTV0qGbeKLlExaas83vZOx8kWz7//rvFPJHY0A0nejUW/fVIxXg6pYZLRD3tKrv82mApC+g3jTqMen8LJb/EuAC+lv1NIPeCN6tCKhlput+3shNd7JhKpimVE1fEnz/iagEYCHNiw06vXR1w6MPQL4DL2NWvo622LvDBETW7jMqKVz6Ro31NgFwGq+8we5M3KkInZuZ5pJO+34incqIU43GgjVM9Q7lZzSJYCXIUaThi+P++RL3BGA1dNMVzM3apwi1ubxW5N2uvNv3qkkNcLo+38N1d6p5JZGAH66sdak/z8f82s65gjA6qXdn7I6YpQicazkFybtDMrn3Nd9jN6MWskB3qnkmEYAnjqwwuQc+Hu8EOONAC4xemt/EuvjpS8S0QZ+ZtLOSRznnUpzdWSdSe17jXbeqeSaRgC+2hutHPSHWAHGGgGcTyeTdn7Eplipi0S30eix4H+mb5wA4xUAC0v5TaT4RNLxa5YZtNKSL8QJL04B+IDRspJXsDVO2iIp2cKPTNo5j8oY4cUpAF80aaWWG6JEJ5Kma1ls0EofTosRXIwCcCD/bNLOD/X6jxRAHT82acfma3U3MQrAONoYtLKCm2MkLJK6G1hu0MrH6GUfWowCYHMD8Cq2RIhNJH1b+LVBKy051zuRphhl8rvnRj3/b0LPAWRDtcm62Ivsv7DtRwA2VyrX6/l/KZDV3GTQSn9O9k5kfzqx0aDS1XOodyIFoRFAVgykweDM+KN1WNYjgM+aPLr7Z162TlTE1Uv8xaCVT9HNNizrAmAzeYHNKxQiWfJTgzaqGGsblG0B6GuymvwMHrNNUiQDZpr067Nsg7ItAGdTYdBK9KmQRVxY9OzRZvNsA9YFwKI6reb/TGMSyYrbWBXcRgv+xTIkywIwgKMMWrlRLwBJQW3lFoNWzrQMybIAnG3SihYAleKyeCLwBPrZBWRZACwuAB5hvmFEItnyPI8Ht1FheRFgVwAGmSzeca1daiIZZNHDDS8C7AqAxQXAOv5kl5pIBv2BdcFtHMsAq3DsCoDFAwo3aQZAKbhNJhN8ml0EWBWAIxhs0IouAKT4LHq52fOAVgXAYu2Sp7UCoJSBp5gX3MZRVpODWBWA0w3aMH/TSSSTwnt6hdVbmjYFoCMnGLRym01KIhln8VVnNEWoTQE4xWAZsH+w0CYlkYxbwJzgNk6lpUUoNgVAFwAizTE1uIUuJm/emhSACoPhSEkXAFJG/kgpuA2Lr12TAjDM4AXFx3jFIh2RXFjE7OA2MlMALAIJHxKJ5En4Je9RHBQeRjYKQKMuAKTMhF8EmPwUGF4AOhn8BPgEr4anIpIjS5kV3IbB2Du8AJxs8BPg3eGJiOTMPcEtnBp+/oYXgJMMdoUKgJSf8F5fzftCmwgvAKOCW1jJU8FtiOTNkwarXwWffaEFoC3Dg5O4h8bgNkTypoFpwW24F4DjqQpOQhcAUp7C7wK4F4DwC4BG7g9uQySP7g4e+w6gZ1gD/gXgSVYGtyGSRysMXgo6MezjYQWgBccHJ6ALAClf4b0/8Cs4rAAMoXNwAvcGtyCSV+53AcIKwOjg8DfqJ0ApY/9gS2ALR9Iu5ONhBSD8DsAT1AW3IZJXW4MfCG4VNi9AWAEIfwvg0eAWRPJsRnALQV/DIQWgM/0zkL5Ins0MbmFEyIdDCsAwKgJDbzRYKU0kz2YGPwsQtCRfWAEI9RxvBrchkmdreSGwhUNDbgOGFIDwxUDDhz8ieRd6FlQyJPmHfUcAKgAi4WdBwFdx8gJQEVJ3zFIXybvwG+EuBeAQDggMeyW1wamL5N3C4HkBAsbiyQtA+DwAzwS3IFIEzwZ+PuBcTF4Awu8AhKYtUgyhZ0J18peCkxeA8N8AtBi4CFicCYm/jlUARLyFj4VTLwCtOCQw5HrmBactUgTP0RDYwsCkH0xaAA6mMjDkBcEvQooUw2YWBraQ+K2cpAUg/DUg3QIU2Sn0bMhhAdAdAJGdQs+GvklH5EkLQI17yiLFEToCaEXvZB/0GwG8GNyCSFEsCG6hJtnHvEYAJZYEpyxSFIuDFwtP+JXsNQJ4Xb8BiLxtMysCW6hJ9rFkBaANPQLDXRz4eZFiqQ38fKojgJrgycBUAER2FXpG1CT7WNICEKo2uAWRIgktAKmOAPoFp1sb3IJIkYQWgN60TPKxZAUgcEVSg3RFiqU28POVHJjkY8kKwEHB6aoAiOwq/IyoTvKhZAWge2CoDSwLTlekSJYErw/QNcmHkhWA0B8BV2lFQJF32caawBYSjQAS3TgIvgQInQQxXR0YxRH0p0PYOqwuwi/Wjgz+ZkrfFtazhLXeYTTT6mTf4W9L9OlkBSAs0PwUgEo+zec5hVbegTia5B1AYq8zg79wB+u9A2miVRwe9PnU7gFU0jE41Tz4BM9zKx8t69M/z3oylptYxk+SnRqpC/1aTK0AdA5+DjD7BaAjt3BH8omWJDM6cikv8a/eYTRB6FmR2k3AzsGpZv0SoAfTOcc7CDHThd9zTeZHcjkaAXinGld3phsseyLZcgF30to7iH0KPStyNALI8iVAKw39C+oj3Ogdwj6FnhWpjQBC1wQk+BfPmL7P8d4hSCRncZF3CPsQOgLonORDSQpA+K/h2R0BDOZS7xAkoh9xsHcIexV6ViQ6L30KwMbgFmK5PPO3iiREBy73DmGvNgV+PkcFYFtwC3H0Yqx3CBLZ5+jmHcJebA38fCVVzf+QTwEITTWWs4PXO5Ksq+Is7xD2IvxrMcGZmaQAtM1AqnGc5h2ApOB07wD2IvxrMaUCEP5rajYLQIXu/5eFUd4B7EV4AUhwZiZ7F8A/1Rh6GfzAKdnXyWBGqxjCvxYTnJk+BSCbI4DwV2clH0IntIkj/GtRBSBI/t72l2Q6eAewR+FnRYKX+z0KQD0NwanGkM0LE7G32TuAPQo/L3IyAsjm93/WX1ESO1l9FD30zEhpBFBUSzJbmsTSVpZ6h5AdSQpA6EAlwfNKqajnae8QJAWzM3oJGn5m1Df/Ix4FoGVmn7e73zsASUFWj3L4eZHgzPQoANkdA9ziHYCkYKp3AHsRflbkZASQ3QIwn0e8Q5DIHmKedwh7Ef6EbW5GANmdmun73gFIZD/wDmCvwr8WUyoA4b+XZ3UEAA9wm3cIEtEfeNg7hL0K/1pMcGYmKQDhj1FktwDAhbziHYJEsjTTU4KFF4AEU4okKQChM5dk+RIA1vAJ1nkHIRG8xScz/bBX+NdibgpAlkcA8CxnqAQUzho+mvHnPEK/FhuSPMjmUwCy+TLGO2ZwIvO9gxBDczmRmd5B7Efoy2iJzkufApD9tdqe5xh+pEeDC2ErP+Q4XvQOY79Cl9xNrQCsC041+wUANvFtDuUXGZ7CXPZvJT/nUP5fRt//e7fQApBoOfQky4OHnxKhqaZlKV9nAu/ngwyhH128w0mgbfDsN6/n4uTZ3Vpe4Tke5pEkT8c5CT0rEt3gTFIAwu+k5mEEsFMdD/KgdxCJncq9gS2cy33eSZSJ0LMi0RdzkkuAVZScUxUpntCzItEXc5ICUMf6wFDzcgkgkp7QsyK1EYDTSuYihZabEUD4bUCNAER253IT0GcEoAIgsrscXQKEjgAO1Bq8Iu9SRefAFhJNdeozAqjM8CrtIh76BU/QuzLJh3wKANQEtyBSJDXBLaR4D2BFcLD9g1sQKZLQM6Ih2aPAyQrAkuB0a4JbECmS0ALwarKHnpMVgFr3dEWKpSbw84uTfSxpAQh9GDg0XZFiCf1KTLUAbGa5c7oixRJ6RtQm+1jSnx4S/nVv60mbwBZEiqMd3QJbSHUEkPive1sF/QJbECmO/lQEtlCb7GNeBQAOC25BpCgGBrdQm+xjSQtA+Nz5w4JbECmK4YGfr+PVZB/0GwEMDW5BpChCz4ZXki7Y53UTUCMAkXeEng2Jv5CTXwI0BoZ8GG0DWxAphvYMCGyhNukHkxaAbcEXAZUMDmxBpBiOCH4TMPGqB8n/4meD09ZFgAhYnAmJz0bPAqDbgCJgcSY4FIC5wUFrBCAC4WfCyuSP5usSQMTbEYGfDzgXkxeAhWwMDLsbhwS2IJJ/A4MnBHcpAI3MC059VHALInkXfhYEXI6H/PwQfhGgAiASfha4jAAsbgOqAIiMDvx8A/OTf9h3BDCEA4PbEMmzrhwe2MJLIQu4+xaACo4LbkMkz04Mngkg6DwMKQBrDF4K1kWAlLcTg1t4JuTDYc8gPxYcfOj1j0i+vT+4hZkhHw4rAEF/NQDHUhXchkheteaowBbq+EfIx70LQFtGBrchklfHBU+O+xSbQj4eVgCe5c3gXfCR4BZE8uq04BZmhH08rAA08GRwAqcHtyCSV+EFIHAUHjoRQfhFwNF0D25DJI96MCK4jcAb8f4FoAWnBLchkkenBT8D8BJvhDUQWgAeT7Ym6bvoIkDKU3jPD/4CDi0AGwzeCPhIcBQi+VPJmOA23AtA8F1IoKt+CpQydLzBmzCFKADwUYM2RPIl/BeAVbwQ2kR4Abg/6Zoku9BdACk/4b3+PkqhTYQXgDUGzwIcS9/gNkTypG/wQ8Bwd3gYFrffwsOo4J8N4hDJj3OCfwJs5L7wMLJRAOAsgzZE8uPM4BZmsyI8DIsC8FTyWcnfdlzw6mgi+TEgGxcANgXAZCiiiwApI2cbtHGPRSA2j+BY1KLwIZFIXoRf8q41uPmOVQG41+CnwJEMNIlFJOsGGawGaHHOYVUA1oTNSrLDWJNYRLLO4gLA5A6AVQGwuR7RLwFSHsK/6kpMswnFqgDcZdDGMIYbRSOSXUczOLiNWbxuE4xVAZjNywatfNEoGpHssujlU62CsXsR91aDNj5LO7N4RLKovcEdgBK3WYVjVwAsalIn/sUsHpEsOpuOwW08Tq1VOHYFYA7PG7SiiwAptkxdAFgWAEyGJaMZYhiRSLYMNVgNs8TtdgFZFgCbuvQFw4hEssXi+38GS+wCsiwAzzHPoJVxwWuliGRTGz5j0IrhBYBtAbAJrZpPm8YkkhX/YjALYKPlBYB1AfijSSuXmMYkkhVfNWjj77xmGZJtAXgxbK3yHY41WDNdJGtO4niDVkwvAKwLANxs0sqlxlGJ+Pu6QRtb7R4B2s66ANzAVoNWPqlXg6VgDuMMg1b+j1W2YVkXgFX8xSSqS4zjEvH1DZNz7VrvNPbvFEoG20a6eidSCKcGH4lTvVMohO5sMjgrFtovome/Kt/9LDRopR1fMY9MxMtFtDVo5VoarQOzLwAlfmfSzldNdpmIv3Z82aCVeqbYhxZjXd7fGSwZDt35twixiaTvXJML2rtsnwDYLkYBeI2/mrTzbaoiRCeSriouM2nnNzGCi1EArO5V9uO8KNGJpOlCagxaWWay+sZ7xCkAdxu9r3S57gNIzrVhgkk719lMA767OAWgketN2unFBVHiE0nLV+lt0Eq90RmVmm4mv3uWeF2zBAbRcwC+2rPc5Dy4JVaAcUYAsJKbTNrpYfIGlYiP8XQ3aee/vBNpvsNoMKl9qwwmUSxfGgF46sRqk3PgwXghxhoBwAKTxUKgmovjpS8S0dcMJgAB+Jl3IsmcZFL9SqzVewGJaQTgpzvrTPr/fCriBRlvBADTedyknc78IGKUInFcQSeTdn5GyTuVpM40GgPUM8w7lZzSCMDLCOpN+v7yuJPkxhwBwJ9M3gyEyjzeBZWy9l9UmrRzFVtihhm3ADRwlVFLH9JcwZIjY/mASTub+LV3KmE6GP0QUuJlWnsnk0O6BPDQhsVGvf6/Y4cadwQAG/i5UUsDNE2Y5MSlJq//wBau9E4lXAejhyFLvEVP72RyRyOA9PVmvVGP/6/4wcYeAcAGfmLU0gH8Z/RoRUJNooNJO5uY5J2KjTYsM6qIjYzxTiZnwqdoPcU7hZw5mUaj3l6A4f9OFxvtkhKLaO+dTK6MDt7jJ3inkCvteNmop683eo0oE1qzxKwEFKgupmBQ8P4+zDuFXPmZWT//D+9UbF1otmPqGOmdTI60DnwerY5W3inkyDFGT/+VWGf0GlFmtGKhWQmYo07ZDLOD9vWT3uHnSEueMuvjl3snY+/zZjunxDe9k8mRK4P2tH53abpvm/XvQs6B0ZIXzHbQJg71Tic3jgza00O9w8+Nw9isL7h9O8NwDPBQCk8wFMWMxHv5Ue/Qc6MFfzfr24vivv/n6W7DEvAN72RyI/nTgB/2Dj03Jhj27H/yTiae97HNbDdtYYR3Ornxp0R7+I/eYefGUWw169cR5//LgqsMK+V8TRneRN0SPIu5VBOxNVE7njfr0/UM904nri6sNCwBv/ROJzeGsbZZe/ZNjvQOOTd+Y9ijr/ZOJr6LDHdXI2d4p5Mbo1nT5P26mhO9w82NTxn25zc5yDud+Cp51nCXraCHd0K58T7mNmmfPsPh3qHmRi/TEe3XvNNJx8mGu6zEPTEnTS6YtlzBln3uzc18v7g/QplrwTTDnvwSVd4JpeUO0xJQJnXTSG9+wht73I+vc6WmXGkWyx//SnzMIwWfb88BzDVc+LuOMUx3ySOvKjmBD3IENXQE3qKWuTzM43EWoC6sk7nPaOZfgLvK636Wbe18w2QJZpGmO5gVhj34LQ72TihdLZllWgIe05zBkqLWPGnafy/yTih9ww2fCixR4lfeCUkZuda07z5ueCmRI2Evqr53+7x3QlImxpn2260M8U7IR1teMt2RmzVXkKTgSDaZ9tuJ3gn5sZtBdfu2qGgTKUnmdOMV0z47r7zvXv3W+DJgennvTomsTcDsCnvaGhjtnZKvTmZrBuzc/qAnAyWSCm427q3R1/7Lvn8y3qWFm1BZMmOScU99hQO8U8qCG8xLwIXeKUkBfcG4lzZwsndK2dCBF4137TYtaCXGPkKdcS/9oXdK2XG08UNBJd5kmHdSUiBDWGfcQ2eVz7t/TfFd88uAZfTxTkoKopfh0nbbtw2ac+HdKnnEvATMoYt3WlIA1U2cSKU52xe8k8qeg5sxZVVTtyd0l1UCdTR+7adEidu9k8qmseY7usRMLScuAdoZLvixc1tGtXdaWWX9mEWJEvfp2UBJqIq/mffHBi23snedWBShBNxOS+/EJIdaGU9dt3270jutbBvOxgg7/dbyfN9aArTg9xF64gwtbb8/n4uw20v8Rm8ISDNUmL+mVqLEsnKY9z/cryKVAK0nLE1TGeX031bub/41VSumRykB/6vhlzRBJTdG6X9f8k4sP3rwapRDcKcWvZD9qEq4lvL+tpu8E8uXEw0XXN51e5AO3qlJhrXj3ij9bo5Wsm6uS6IciBLT6eidmmRUBx6M0ufWcIh3anlkP0/A9m2WnsSSPejC41H6WwOne6eWT+2ZHakEzNEaeLKb3hFe+dm+fcs7tfzqaTwD6zvbMkZ4JycZMjRaT/utd2r5Npi1kQ7Mej7qnZxkxCnm033s3B7UtB+hPhjp94ASdfplVoDzzOej2rk9R2fv5IrgvEiHp0SJyXo+sKxVMDFa33qNvt7pFcUVEUvArbT1Tk+ctI7yws/2bT1HeqdXHBURD1SJv+tnwbLUzXiVn123Ot1hslXFAxFLwBKO9U5QUnYUiyP2qK96p1c8B/J8xAO2WYuLl5Xz2RyxN/3YO71i6s3CiAetxBTdDSgLrZkctR/9TnNPxNKX2qiHbhb9vFOUyPrwWNQ+pNmnohrI61EP30rGeKcoEZ3EG1H7z58150Rsw1kd9RDWcamGcIXUggnUR+0792oG6jQcy1tRD2OJ++ntnaQYOyjCFN/v3mZqrom0nMiGyAdzJZ/0TlIMfYpVkXvM03rsN01jov6Ms32bolWFCqFt5Lv+JUo8q4fJ0vbJaK9wvLPN1+OcuTeSF6L3kxc03beHj7Ip+qHdxkS9LpRbFYyP9i7pO9s8enknWq4+HP1eQIkSDzHQO1FJ4LAIC3u+d3uSA70TLWfHRP5RcPu2mYma2CFXWjI+lS8HTTHr7khWpHCgSzzDMd6pShONYFYqfUKTzGfCIJalcrjrmKwDnnltmRT5cZ+dm5aZyYwaXk7lkJdYxCneyco+fIAXU+oJWmguUw5O7cA3cqMmFc+kXtyUUh8oca1+G8qaHtFWEXjvtp5vafiXKW34Tio3/bZvP9bbIlnUnjtS6wIlljDOO2HZ4YzIM0XsutVrtp/squSqFEtAiYcY7p1y2RvBwyke8fV83Dth2bfxNKTYIRqYQnfvlMtWNZNTuuO/fXuNkd4py/59mo2pjgPW8l0O8E667HTie7yZ6nF+hoO9k5amOSbyvC/v3VYzUc+EpaY941me8hGeRifvtKXpapiXcgcpsZIJmlY0uiouiDwt3J626/Srf950YVrq3aTEMr6itwaiac1FvJb6MW3QAt/5VMmVNDoUgVq+pJGAuXZ8hSUOR3M1H/FOXZI7I9ry4vveVjBJb4mb6cZEVrocx6c5xDt5CXMYc126ToktTOF93unn3gAmp/yrzjvbTbTzTl/CdWCqUwcq0cCdWmkgsZFMSfV3/l23OiZ4py9WKriMOrciUOIxPqN3B5qlDZ/hcccjtowTvHeB2DrJ4cejXbd1XMMI752QC4OY5HTFv3ObTg/vnSD2DuYR125VosSjfF6Tje9VB74QeeW+/W8NXElL7x0hcbRIZZbY/W1vcg2jvXdF5oxkcirzO+57e4PTvHeExHUMC9y7WYkS85jIIO+dkQn9meDw3Oaettu1vEc5aJfCSjHNKQOHee8QN/0Yzwz3Y7B928R4790h6fmn6GvFNbcMHOq9S1J1MOOZ4fKc5p63f5RxGS5TfXjAvdvtujXyJD/gBCq9d0xUlZzIfzArQ6d+iQb+U6/6lKMWfDMDtwR331bxv4wr4FpzPTiXP2TgNt/u2yt8wHvXiJ/BzHTvgnvaGpnFFYymtfcOCtaak/ghT2XqO3/n1sAvNZVLuavggpRnlmnOVscsJjOWrt67qdk6MoaJTEthGfek2wI+5L2TJBt68if37ri/bSFTuIAhmZ+QuhdjmcysVGdmbP62jUkFGF0ZyHp3Ss8ZXE1v7yCaYB3zmMd8ZvM0G72D2aGKgYxkMEM4Jhd3Lx7ji8zzDiIbVADecSA/5dwc7ZEGFvIszzKXBSxmc8p/e1v6czhDGcpwBuRonZz1fJv/odE7jKzIT3dPx4f5dU5/kX+DWha//c8Sthm3X0Vf+tOfmh3/5OGb/r3u4iss9Q4iS1QAdteaS/hO7u8Nl1jF6re3lTv+tJktbAbepJE6Nuzy/+9AK1rQCWhLG9pSTTVd6Ub1jq0r1bnvKy/yDf7qHYTkQQ+uy/hNLKttfYor6nlua/m6HvbZk7xX9XiO4hec5B2EGGjk91zGcu8wskkFYF/OYDL9vYOQIA9zCc94ByF51ZYJvOU+gNWWbFvCOH3FSaje/NZ1RkFtSbZVfFPzMIqVflyjIpCb7S0m0dm7y0jRDHKcpFpbU7cNTKKLd1eRohrM1Ey+16atRImNTM7pA0qSI0NVBDK4beUaLcYmaTmOv5TJo0J52Dbw3/Tx7hL5pB9JkhvAxZyv1eOcreBq/pvV3mHklQpAmG6cx3h6eodRpl7ml/wm9fcgRd6lNeOY7z4MLrdtBmMLPoGq5EgLzmCa+0lRHlsDd3K89wEvCl0CWBrJFzmHjt5hFNhSrud6lniHIbI3bRjLNP1MaL7VM42xWrbTmkYAcQziXM6jm3cYBbGUW/gffe9LvrTWWCB428pUxuhrKh7t2tgO5WzOZKh3GLnTyHSmMlW/8MelApCO/pzJOAZ7h5ETs7mJW3nNO4xyoAKQpiGM5SwGeYeRYfO5lSks8g6jfKgApG8EZzI2p5OPx1JiNlOZyivegZQbFQAvhzCGMZyW+wnIQ63hAe7nr7zqHUh5UgHw1YbRjGEMI70DcTCfO7mfv1PnHUg5UwHIhv6cxul8iA7egaRgFfdxD/eywjsQUQHIlkoGMYrRvJ8a71AieJ0ZzGQGT2tlvuxQAcimXoxiNKM4MkfLbu5ZPQuYwUwe1pN8WaQCkG2dOJHjGc4wanJ1rBp4mWeZw0z+wSbvYGTv8tSpytsBHMYQRjKY4Zl9x2Ad85jHfGbzNBu9g5GmUAHIo34cwVAOoz819HF9Q24bS6hlMQt4lmd5w3vHSHOpAORfFw7ZZesXeZ6ctSzaZXuFBu/0JYQKQNG0pJquVFNNNd12/Pf2rRWdmtjGOupYwypWs5rVrGIVq9/+k074QlEBKC9VtKcdrQE44O2Lh3rWA7CVTWzQgzkiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIkH+P7JHk717cPIZAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE5LTA4LTMwVDEzOjA4OjM1KzAwOjAwYYy+BgAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxOS0wOC0zMFQxMzowODozNSswMDowMBDRBroAAAAZdEVYdFNvZnR3YXJlAHd3dy5pbmtzY2FwZS5vcmeb7jwaAAAAAElFTkSuQmCC"
-b64_mail = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADdcAAA3XAUIom3gAAAAHdElNRQfjCB4RFhogrC0LAAA430lEQVR42u3dd4BTVdrH8W8yvcFQht472FBRwQaKYkWxC4qFYl/L+rq2fbepu+qqa6+IiopiV7CAomBBkCK9S+9lYJieTJL3D3RfQMrMzZPclN8n/+yqc3JPcs+Tc095DoiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIRJYniu/lJY100kgllRS8gDeq7y8SmwJAkAABqvDjw08gWm8d+QaYQhbppJNOHg1oTEPqUptaZOAhm5RoVVQkRoUoIYSPYrazjU2sZyNF+PFRSQVVkX3zyAUAL6mkkEZTenAYnelMA9IjWxmRhOBnMwtZyCx+ZBVVVFEVqT5BpAJAGk04mu705Ah180UcW8YUJjOepVRGonj7xplKW/pyPkerey9iZgljeIdZlNsWaxkAPLTmFPpxJHmkkRrVj0cksQXxUcZCxjKa2XYPBFYBIIVjGcAJNCKHDHX6RSIghJ8yNjGZt/gan0WRFk01lRPpzzE0J0/dfpEIC1DKembxLqPDHxcINwB4OZuL6UJrNX6RqAlSxipm8w6fhPc4EE4ASKUdV3AaHclWp18kykKUs5iveY0F+J0W4vRXO4VGXMgNnEs70tX8RaLOQxqN6EhH8tlAKUEnhTgLALU5jqFcyonkuv0piCS1LDrQjmb42EpFzf+85gHASzPOYSj9aKpffpEYUI+DaUYaW9hBqGZ/WtMAkEEX+jOIHqS5XWsR+VUqbehAFtvZVrPdAzULAHU4hiFcTmu36ysie6jHwdRjB4U1WS1YkwBQj9O4jb7UcrumIrIXWXSmFSVspLS6f1L9AFCP87mVYzTbLxKzUmhJJ3wsq24IqG5zrsMV3MpBGvYTiXEFdMbDvOrNCVQvAORxBzfR0u2aiUg15HMQtZhSnYXC1QkA6TzBVRS4XSsRqaZcDqIVXxx4mfCBA4CHJ7mM2m7XSERqIJMOdOTjA60LOHAAeIAh5OnZXyTOpNKGeozd/3+0/wCQwbXcTS01f5G44yGNgyhj5v4eBPYXALLpx30UqPmLxCUPGRzGWpbte7fgvgNABofzMO3croOIhCGPTsxkw74WCO8rAHhpy585Ub/+InGuHg2YTuHehwP3FQCaMogBZLp97SISJg/NqGIhRXv7l3sPAPU4mxto5PaVi4iBNFqwhpV72yS0twCQQQ9u4TC3r1pEjNSiDktZ+/uRgL1l72/FufSI0IX4KKaIHZRQhR9/TdMXiCQcD2mkkUoutahNXoQO0OtBP1axYM9//PsAUIuenG2+58/PFjazmQ2sYz0b2UoFFZQrAEjS85BFJpnUoxGNaEIjCmhAPeOUOymczSzWsmP3f7xnAPByGGfRwvCNQxSykVXMYCZzWEVZRD5EkcSQTQsO4XAOpwUNqWs4D9eMs5jP9/tPHlrAfRQTMnoFKGQOT9PXtCIiic5LPc7haWaxmYBZeyzmvv1v6kvhYqaaNf5ilvAU7fC6/WmKxCUvLXiARRSbBYGpXLK/x/vGvGjyVkH8rOVF5Q4UCVsbhrEOP0GTn+WXaLLvt7qMn03iTDkTOMXtz00kYfThW8pN2uZMBu7rTeowHL/BW6zlX9R1+xMTSSj53Mdqkz7AiH2NA/RnhsEbTOZSnRUoYsxDDgOYYtIHuHxvb5DLK5SGHV0+5wyy3f6sRBJSDqcxJuxRujJeJ/+3Iv9/RLAPF9MirF/uAB/wBJM00y8SEX7Ws4pcOoY1s5ZKgJUs2vl//j8AXENPcsIoNsRonmOymr9IxPjZxEZq0SmMn2oP6ZTsmSqsBV+FOQA4lrPIc/vzEUl4uZzJl2G1VT9f02pnYb8tBT6B5nvdGFRd8xjO9xS7/dmIJLwSfiCPhhziuIRUmnE8K4BfnyVS6E2DMC6pkOFM2HvCARExVsQ3DGdrGCU0oPeuKwLbMY2qMMb+X6C1FvyKRI2X1jwfxnxAgOk7833ubLbH0SCMDcBzeYm1+99jJCKGgqzlZeY7/nsvBRy3838AdA9j+K6cF1mEz+1PRCSp+FjIS9U7AHSv8uj+2/9MZxKVjjsT39JA6/5Eos5DQ35w3G59/EjGzoLasyqMYi6IUAojEdm/dC7B57jtrqbTzkeA48hyeAEBljJG3X8RV/j4kKUHPgF4HzI5ZmcAOMZx/v9KnqnOGeQiEhE+nnPcAjN/S/071WE3IshGbfsVcVU9NjlMFeJjKnjJoY3D/KNlfEGh2/UXSWpbGedw/00qrUj30tnxEuASPnS79iJJ7yNKHf2dhzRae+nocAlQiBK+d7vuIknvO0pwdr5GCm1TaelwEW8FC00fAHLpysG0pIA0KihkEXOZoyFGiXsptOFgOlKLbPxsYCXzWbyv47od2MJiGjuayfPSNpXmDgNACT+bLf9tw7mcQCvyySYDLwF8FLONFXzKxxQ5jG8i7vKQzVn0pQ11yCONFIJUUEYhi/mGz9hi8i4BZtDNUQBIoV0qTR0GgPIwViLvKocL6cehNCFjtxWFDQlxMAdxOi/yYxhLHkXckcHRXMOhtP1djswgh9CNU3iPz/EbvNN8h8OAXlrCjw4TgSzimLAv3EM+DzBzvwuRK5nADRRoubHEEQ/1uYavqdjPJHopP3AHWQZ3dg8WOWrDfibBIocbgWfRKMzL9tKI+6o1i7mAP2vDscQNL624h7kHvK8DrOQOg2PzmjDbURuuYiFscLSrOMDksE8vzecOtlbz/VbxIAcbn5cqEgmpdOYBVlbzzl7L9WGn0ktnssNWvB52OFpH5GN8mBedw7ksr8E7buEpuv22f0kkRmVwOP9hYw3u7Pmc7Hg3zm++cfQgH2Q7+3lK2d+rnDFhXbCXLoyt4XsWMYzjw8pcLBJZWXTnBbbV8M5+i7ZhPgZ86ujgsCBlOEwrVMK7YV1wPlc7GHso511OVe5hiVE59GSkg+N1yjg/zB+29yhx1I6rvA6H1oJhTl8040IHKxAzOY8/cZJCgMSgXI7jdi5wcDJWFn1pHNZ7+xyuyUkJJxW4cyk0o5fDvzyZXDL5XCnIJabkcCq308PhD2ofXuEXXFjw5s7UWj7tHZ8g6KU793Ol4xwGIvYy6cffONZxe2pCs7AHAh1xJwDUpVNYf9+eu7g9jDzGIpa83MQ/OTSsgbxO7uTWcCcAZFEvzBKacgcvuBMzRXaTzuPcTYswS6mXTD2AFIP5/FpczNvUd+X6RX6TwzAGUifscjLc6dG6tbw2/PXPHnLpzSjHm5lEwuWhAe9yLrUN7mevO7td3Gk85Ww2KMVDNsfyBodpibC4IJX2DKcXeSZNd7PDHX1hcicAlLDOpBwPmRzL45zoeE5BxJlMuvM0J5ns5gNY5zCxV5jcCQCFLDQ7TSCdHvyds8h3pSaSnHI5ib/T0+yHp4Tl7HCjIu4sBCpnOQs4zKi0NHqQRh0+YYMrtZFkU48+XMuxho+eM1ltkhqkxtwJACHWMs4sAICXo8kgh/dZ5Up9JJk04Ryu5GjD3nOIsWxwYx2ge7MAWxjHEtMSD2MoV9FJcwISQR5aM4Dr6G56n81jolsnbLjVXMqZzZvGOX87M5hBHKQVghIhXjpyJUMN+64A5YxggVv5r937vdzKW3xpmBwZoAUDuY7DdV6xREAqXRjCIDqYllrFON5nm3vVcrKLOMQORob9zmkczg8O8xHs+7WdkfTQViExlkZXXmCT8d0a4HuTdSwj2eHwClwMAJDKMcykwuHhhvt6lTCaE7RPQAxl0I13KDJu/pXM4miTgfg4DQAAXfmBUuMQ4GMSpyoEiJF0ujOOMtN7NEgZP3GU0RXGcQCAlnxOsXEICDCfvhoLEANpHM9UfMbNv5SJYW6K31VcBwAo4B3HFdj3R7yBq6J+s0jiOZMV5iNVJXwYZhKw3cV5AIBsHma98YccopwHo3uvSMIZRJFx7zTEJp4wzmsZ9wHAQx538YvxBx2knKeUQlQcyuAW8/GpECv5K/nGm3/jPgDsPCdwCD8bf9ghdvAqzbQ+UGrIQ30eqfbJVdV/zeFG6pjv/U+AAACQzyVMNI+423mPQ13a9SDxyUtbhrHFvPlP5qqI5P5zHABiq1lsZyylbOdM0+Zamz5k8TA/Ue52BSUupHIIt3OGcVMN8hUv8bVbq/73VdXYsp2JlFPCBaanAObRizSeYoJOE5ADyuIYbqK3cYYJPx8znB/Z7nb1dhdrAQCK+ZFySuhvOniXzYmkU4uxbHG7ghLTcunJdfQi17TUct5jONMocbt6e4q9AABlTKeMCi437YJlcBwZ5PIJ692uoMSsuvRhEMcbryIt4m2GMycWH0FjMQBAJXN5hgoup4lpXXemDfmQ5W5XUGJSQ85kEMcYJ5ndwpu8yBJ3Mv4cSGwGAKhiKY9TxhW0MSzVy+Fkk8fbLMaV/CsSw5pzDldxuHE+ibWM5BnWEHC7evsSS9OAu/OQy+0sNV+GuYpHOUgrA2Q3LbmTBeY7Ulbw1wjM+v9egqwD+D0vNzPHeCNGiE28zKHKHCS/8tCGf7DC+C7zs4S7otTHTtgAANCf6VQYfzlFvE9XHSgi7Fz084x5qo9K5nFT1PqZCR0A4DR+oMy4e1bOtxyhEJD0UmjDu+Z7USuYQf8o1iLBAwB0Y6z5tgw/8+kWs8OgEg1eWvG1ef+yku85Oar1SPgAAB153zgnS4ggWzlOISBpeWnNIqqM7yof4+gW5ZokQQCAhjxOofGXFaKUS3SyYFLKoCcbzO+nEobTOup1SYoA4KUhf2Wd8RcWpIjbqRf12oi78riIdeZTzIU8SksXppiTIgCAlwJuZpF51N7Ko7R0oT7ilgL+wFrz5r+ae2nmyvRykgSAnWkaruAn8xCwhRc5OAoLNiQWtODPrDbPO7GYm2ni0gKzpAkAAHU5ny8jEALeoIcWByWBzjzCavP7ZxpX09C19aUJkhCkegr5inLK6Gv6i12PM8nmBSa4dUqbRIGXbgzmbNNNZgATeZbxFBJ3O0ziMQDADr6jgh1cYrqQpw6nkEE24yh1u4ISEakcz2BOo8C01CBjGMa3FLldPWcfSXwq4UeKKWWg6RReHr3IIpcxbh7WKBGSxUkM4iTjRF9VfMBz/ESZ29VzJl4DAFQwk8fwcSV5ho8C2RxHDjl8xAa3KyimcunDUI43zfQTopJ3eJpZ+NyunlPxGwB25gx4ELiQBoaDd+kcSQ5ZvMsatysoZupwBtfRzTTTT4giPuF+fiHodvXCq0a8zQLsrg4Psgy/6YhukGXcY5qKRNxUn6uZabypvIr1vBgzq0eSahpwT7n8hflUGk/rbOJh2mllQAJoyPUsNV7x72cF/6G+21X7r6QOAJDGzcw039NVzHDaKATEuQbcySbz4+cXc39MHTmX5AEAvFzJZMqNQ4CPD2kR1+Mkyc1Lff5hvoe0kjncFmNHzyd9AAA4lS/NHwRCTKSD0obEJS+NGGZ+P/iZysCY6xcqAADQnY/Nd3eHmMeRCgFxx0NzPjS/F4J8R1+3q7YXCgC/ascz5g8CIVZztnIGxJVUjmSK+X0Q4F2Odrtqe6UA8CsvrbmfIvMvfh1DInKqq0RCJqcyw3hqOEQFz3JwjI4IKQD8VwrN+CPrzUPAWu4w30IikVCbAcw1TyVfwr/oGLOPggoAu0ihEYNZbHwDBFnLg3Rwu3JyAAVcz3zzX/9N3EmbmG3+CgB78FKfS/nZPASs4wWOcrtysh8tuYdF5s1/FTfRPKZzRSgA7MFDbc5lgvGNEGITb9BLx4rFqI48wC/mib7mu5rqo3qSKiFIdYQoYhzlFHO2abkFnEEmWXxJldtVlD105SrOo7nxHP0MHuFzioi7VB/Vk6gBAKCcrymjgrPJNCy1LqeQTQ6fxuJp70nLw3FcyVk0Ni21iik8yheJ/E0ncgCAKr6nggr6Usvwd6E2Pckjg48pcbuCAkAKPbmWU4wnasuZyLOMSdTf/p0SOwAATOMhyjmHAsOnuGyOIocMPqLQ7eoJ6fTmJk4w3ZwTYgfjeYav3a5c5CXmIODuWvE4K40XCVexjBtp6HbVkl425/CD8erPIJt5I+rHe4VDswAH0Ih/ssR4cUiQrfwp5seHE5mHXC5gofG0XxXreIkubleuRhQADqg2dzLXPGeAj7tpEdMzxInLSx0uYKPxXv8qVvEozd2uXA0pAFRDJkOZbr5hOMh/aJsEYymxxksBgx3f9vt6+VnO343ThkeDAkC1pHAxk8xXiYcYSWeFgKjy0ojbzPtzVSzmZtO8wdGiAFBNHnrxhXkACPEph2ksIIqa85D5ir8Q87mCDLer5ogCQA0czHDzgyFDzOD0GEsTlbgOYkQEgvgEesdtEFcAqIEU2vOg+VhAFQu4Ii67j/HFy/GMjkDqtzEcF8O7/Q5EAaBGUmnF3ZQY30J+FvEHpQ2JqDTO5RvzNJ8BnqNrnHb+d1IAqKFUmnIdm81DwC/8lWZuVy5hZTGQSebN38dDdI7zxzcFgBrz0oArWGV8M1Wxgn/T3u3KJaR8bmK6ecbHYu6ibRx3/ndSAHDAQz4XstB4iXCANTzHEW5XLuE04E7mGD/7BynkFpomwEIuBQCHMriQKRE4VmwEJ7hdtYTSin+YZ/qpYhk3Uy/mcvw7oYQgDlXyMX6u53hyDEstoC855DI2vs+NjRldGMxFNDWdpPOxiGcZyQ63K+euZA8A4OcTyiniVOoYlprP6dQinU+VOShsXbmWC41/qcuYyTBGUeZ25dymAAAhxlFMGWdSYHiTZXMiuaT/OmctTh3DDZxnfBBnMVMYxgf43a6c+xQAdvqRMso5h8aG3cx0juYBYBw7FAIcSecI7uJM4zH6bXzHMD7V49lOyT0IuKsO/JsV5mcLrmQgDRJgnDnaPGTTk6+Nv40QmxlJT7crZ06zACaa8GeWmGeV38KNNFNfq0Y81KIPPxl/E0E28SKHu125CFAAMJLPDSwwDwGl3EtrhYBq81KH81lk/C0E2MjDtHW7chGhAGAmmwHMMQ8BPv5NBz0IVIuHulzBmgg0/3sT9nRHBQBDaZxq3vkMEWQEh7pdtbhQwG1sM//8NzCEfLerFjEKAKa8dOVz81swxHhOTYh1Z5HUiofNt/uEWMrZZLldtQhSADCWQnueN78N/fzABXoQ2I/DGE6JebqWnziBrIQOvQoA5lJpxcPmaacqmMG1pkeVJZJjGUWxedj9im5kJnTzVwCIiBSa8T/mG4UqmcfdCfw06pSXfr8ewmn7eotD4nyvf3UoAESEhwbcxmbjLqmPJdyvM4V2k8pAJprnaKpgBB2T4pFLASBiCrjWfHGQn5U8QRu3qxYzsriRKZSafsZBtvIwB7ldtShRAIigfK5gqnEO+gAbeCHOjp+KlFrczmzzz3c1f0+iEKsAEFE5XMoE4w5qkG2M4Gi3q+a6BhFYfu1nAXfG3fFe4VAAiLAMzmO0+fKUCt7j+CReIuylCfezwXiupZIZ3BKHx3uFQxmBIqySTyiljJOpb1hqBueTwdN8l5SJKVJpw0BuIcc81cdrvMN2t6sXHxQAqivAl5RRwumm68k9nE1tHmFi0uUMSKcTV3OD8RRdCT8xjI+TMqA6ogBQfSG+ZxtFXEwT09+sE8jhYcZTmEQpKjI5hKEMMp6iK+IHXuALfG5XL55oDKBm2nIfq81XCC5hMI3i9mS6msrmBN42/gRDbOddTkyaz3B3GgSMokbcyirzELAmQTLUH1gOpzPevPkX8TpHul011ygARFU+V0YgBGzj77RM8F8wD9mcz1Tz5l/Kf2jnduVcpAAQZVmcxvII3MaJvj4wiyEsMf/cKrkzyZdWKwBEXSoHRSBtiJ/36eZ21SImnz+z3vwz287FSX8suwKAC1Jpw7gI/JqN53S3qxYRTXmcTeYPThs4ndwE3+x7YAoArkihGW+bbxiuYDIDE+6W7syrbDFu/gGW0IPshPusak4BwCUeWvGE+S72CmZwfULNCHTjPQqNt1VXMpnjkmCvf3UoALioFfexwTwEzOUest2umpFT+Ywi4+ZfzGi6G58ZFL8UAFzVkjtYYty99bOU+6ntdtXC5qEfXxvv9Q9RyBscnVB9pPAoALisCdczA5/pTV7FGh6jYVyvDPAykB+M9/qHWM9zHKkn/10oALiuHlfzvfGtHmQ7j9MhTndseMhlEDONT1sMsoyHOMztysUYbQd23VY+oJxB9DCck/ZQm6Fk8BLzqHS7gjXkpS4XczMdTUsNspC3GMUSt6uXKBQA7BTxMaWU09P0yT2bQWQynBmUul3BGkilCRfyB1qZllrFXF7jXda6Xb3EoQBgqZyxlFFOb9O0IelcQR7DmMQOtytYTWm04hJuMl6eW8kshvERm92uXiJRALDl4xuKKOUs05vfy/nUJptv2OZ2Bashg/YM4Hrjsw/Kmc5TfBE3QTBOKABYCzKNhyhigGkI8HAKtcnhMwqJ7cxBmRzEIAYZn35Uxk88xETK3a5e4tEsQCQ04V7zA0VCzON66sf0tGAmPXjdeDo0RBmfcrR+rPZD04Axpw43sM08BKzmXgpidgY8jVP5zLzOFbxPh5gOe+5TAIhBWZwbgbPuNvOI6RCjHQ/n86N5fUM8n2Qpvp1QAIhJKRzCGvMNsKWMisG0IancGoFUH0H+RpbbVYsDCgAxKoXDmGX8TBykhE851O2q7Sab+1lhHOqCbOdasmL2gSeWKADErDS68Ln5wZelfEcft6v2X3V5mjXGS34DrOKypM/0U10KADEshS6MND9WrJxpXOB21QBoxgg2GDd/Hz/Tj1puVy1uKADEtBQ68yTrjEOAj5lc4XbV6Mi7bDXu/JczgTP1618DCgAxzkMH/mo+SFbFPK5zcZAshUMYTbHxxF8RH3FKwiRDiQ4FgDjQituZZT5LvoA/Us+VgbJMevGx+aKfLbzBiUr0VUPaDhwHVvA25VzJkaaZbDpxIzmMYA2BqNYml578gVONF+isYzSvMo2qqNYliSkARNNa3qOUq+lOhmGpbbiOTF7nF/xRq0ld+jCE3salruQDRjA7iQ5JdZ0CQHRt4iOKqeAE02fcJlxDFq+zgIoo1MFDQ85iKMcYl7uEd3iThcT2ZqcEowAQbUV8wQ4qOYk8w1LrM5Q8XmVmxNOGeGlOP4ZykGmpQRbyGqNYGeGrlz0oAERfGd9SjJ9TTDMH5XIFtXiRKZRE8NpTaUl/htDStNQA83iKT9gUwSuXfdAsgBtS6MQbbDceQa9iDGea9ix2l0ZHHmaj8VWHKOE66rr9lcQ1x7MA2mTpjgCL+QvTjEtN4Uzu4YwIhYA0OvBHrqWBeckZtKFAvVE36EN3h4ccuhg/R+8s9zjqUp9XKTMuOZUu3EPfiCw7SuV/yOZZFkV5KlPQI4A7anEpW8270r+9VvM386U0PRiPP2JXHCLIazG2wzGeaCVgXCngZkoi2JhCFPKS6YNAX2abr2H8/esLerr91cQprQSMI824mj9GeK17PhdRn+vZYFLaVdxDmygsNz4ZSOcrtBIgitQDiK52PMiWKPyaBtnBONqGfb0p3MPyiHb+d32VM55+SgFSY3oEiBMH8xSbotD8d4aAUibRNaydB+k8ZJ7qY/+vUr6lv1KA1pACQFzoxksRmEXf38vHJE5zmKPfSwFPsDFK4WrXEDCJQaS5/WXFFQWAONCDV9kU5cYUIsBkLnGQWyeFNjzH5qhfb4gQZfzE9aYbphKdBgFjXi+G0seFhN5ejuZ/qMMHNVpom8FB3EQ/6kT9egGyOJRr8DA8KpubkpoCQDR46c21nOxSc/LQjUxyeYfVVG98PZsjuY5zXEzKlUEXbsDLK3F1JnIcUgCIvBT6cCMnuJri8mCuIZe3WFqNtXa1OZbBnGV8ul9NpdORW/EynNJqhi1xQAEg0tI4ldvp7nqOu/YMJofXWXCAtCH1OYlBnBIDd0YqrbkLH++yTSlCIsX9rzmxpXMKf6VrTOS4a8aV5PAKs6nc53/TkDMYzHExMhPvpTF/x8sHbFIIiAwFgMjxkM2xPEIH0xyA4SjgcmrxHDP2esy2h0acx2COcPsyd9OAv+HlI9Zro1AkKABEioc8jucJ2rl9IbvJ43xq8R9++t3gmpdGXMHVdHD7En+ngPvI4D3WKlVoJGgdQCR4yOc8Vrsyi36gl5/vOYuc3a7XS1P+zVrXr21fr2LupbV+rvZJC4Fiioc6DIjymr+avILMZ8AuC228NGZYBLcnW7zKeYA2WiK8DwoAMaUe11HkepPZ/2s11/33epszxvj40hAh82PRK3iE1m5/tTFKASCGNOUvlJk3JvsV+UU8hBc4lJ/Nz/ep4Ft68qpxqX6GRyCLUiJQAIgZbfk3O4ybazE3cgfzjZtTkB28xmksNm/+xbxHe1KpzzPGJZfzFke6/RXHIAWAGNGFpyk0bv7bGUoDanE+Pxh3q4OUsN58s+8WXqQdKYCHejxEuWnpJXysvEG/owAQE47kZfNkH5sZSAFeII8+jKbSuLlav1bxL9rssvKhEf9gm+k7FPMpp7j9VccY7QaMAcdyA6dTz7DEIJu4lXEUEQSK+QEfJZzj+rLifVvMa7zJ6l3W7W3gBQJcRyOz98jlBNLI5SO3K5sIFABseH7d72d5vEUVy/gHn+6yGaaUKVRQxCXku13hvZrJK3zIGnbfvLOW4fgZSkuzBcZ5HEs66byLtgmFSQHAgpczuJYTTY/68jGPR/hoj/z+5cyggmIuo7Hbld5DiO95lc9Zv5d/t5oR+BlMe7N5/ByOJhUUAsKnMYBwpdCPsRSbPueW8QP997EhN5WO/IPlrj/t7/qqYhwX7/fxpwm3Mst0wLGSyQyImX0W7tIgoGvSuICJxvP+xXzFRfvZQeilJXeZTws6f1XwCWcfsP/TkD8wwzQEVDGTiyNyVlG8UQBwSToXMtV4ZH47n9LvAA9nHupzEzNdb/ohQpTyHidUa2CyAdcz1XjVwSz6UztGti+7RwHABR5y6ccC43n0Qj7kzGo9K+cykKlRz9m756uIt2uQ76Aug5hiHDAXcBn1kjwEKABEnZc6XMBS4+ZUyChOqvbNnMYZTHdxZUCQQl6hRY2ew2vRn8lUmF7HIq78da1EslIAiDIv9ejPKvPm/wbH1vBKejGJUlf6AQE28iK5Nf7tzeFcJhuHreUMoWEShwAFgKjyUp+B5rvnt/O8o/NxD+EriqMeAqpYy6MOc/dn0cd8LGAtN9EoaUOAAkAUeSjgWrYYN6gSHqW9wytqw8cURTUEBFjBn8Jobul0Z5rx6Mkm/kTDJB0LUACIogbc7vjj3tfLx19pFsY11We48Yr7/b+Wck2Yn2IKnZlmfFVb+V8Xjl6JBQoAUdPSfH9biFKuD3sPQTZ/i1IKsgCTOcPgk/TSiPHG11bMk2EF0nilABAlHXnG/Hl7OwOpG3bX1UMut7Ao4s3fx6ccZ3R0p5cGjDc9ejxIES8bHIoebxQAoqIrr7DduPlv4gLyTQavPNRiIFMi2vzLeJOjDE858NCC903TkQXZxptJlzdIASAKjuUt4+fsAOs4m1qGA1e16cfYiA0HbuNpDjU+tddDG15lu3EIeC/J8gYpAERcL943bv5+FtCPbONx61qcyijTbvVvr3XcTyejzv+uPHTgGdOD04Ns50OOitatEQMUACLKw9mMNv2VClHBVPpFZCNLDicw3Hygchl30zZie+868bjpuoogO/iE4yN5U8QUBYAI8nI+Xxpv9y1lAudG7PzdLLrxpGnAms3NtIjoMpvO/JNlxp/x5/SO4BXHEgWAiEnhEr413u67g8/pG9EDQ9PpzMNsNrreaQyhQcSX2LTnbyw2/Zx9fEXvpEh6owAQIWkMMN/uW8iHnBHx2zKFlvzDZGXAt1wepRRkbflfFhoPYY7j9Ij1tGKHAkAEeMjlIuYZL1jdwtucEpU16x7qche/hJVKvIov6RvFlButuYv5xiHgK84mL2o1cIcCgDkvdejPQtNbMcQmRnBCFNerp3E78xxuuwlSyjiOjXIXuhm3Mdf4/INvOS9G06haUQAw5qUBV5jn3dvIS1GfnPJyLdMc7L8Psp3RjnYnhqsh15n3uyZzEXUSeKOQAoCpFBoz1Hy77yae5GBX6nMBk2o4jBlgM+/QzqXPvw4DWWjcC5jGpQkcAhQADKXQhJuNt/sG2cKDLq5R781XlFT72TrABobR0MXvoBYXhTl68fvXXK4iP0FDgAKAGS/NuNv4cO8gRdxLU1fr1ZUPqxkCAqzlMdMzDpzI5jRWGIeAJVxvuvA6digAmGnOP80P9y7jRtMjw5xpz+vVqtly7jJe7+9MOj1Yb/xNrOC2GD5YzTkFACOdeMn8sOwSBsTINFQd/nSAgc0A33JOzPxGemnNMuNewAbup5bbFTOnAGDiCEaa//pv5kwHiTMjw0M2ffiQkn1c63IeoEsEtvs45+VgZptubQqwnsdMz3CMBQoABo7fT9NwerOt42RyYqT575RJU87gOebu1qy2M4G7OYo6MbdwNpWufGeaRjzAep6lgdsVM6XjwcPWh1s4gRzDEqtYyi1MopJYOsCygnUUMpt8CmhBHTIpopCVFLKNHfjcvrzfqWIet3K/4XfjpQHnk8FfWOt25WKBegAAffjCeL9fJdM4I4ZXoXtIoxb1aUhdcmP8iM00uvG2aTaGAJsYQWu3K2ZGjwBh8HCB+XbfMibEdPOPNyl0Y4Tp2owghYykg9sVM6IA4JiXAXxnvt33M06Piam0xJHCUbzIBtMQUMwoOsd476d6NAbgUCqXcROHmu7N38Y3vMA3+N2uXEIJMJ0glZxntqDKQy7n4ec/zInBsY8oSeYA4CGbftxBJ9PfgC18yUt8S8Dt6iWcIDOowscFtDQrM41L8PAUM6lwu3puSdZHAA91uJL5pl3/EBt4heOT9oS6aOjMg6ww/c6qeJMT43x9oB4BashLAX25y3h7zgY+YRjTiKVpv0SzgOFUMcBwBD+FS0nneaZQ4nbl3JCMPYAUmnKD+eHe63iKw9yuWlJozj3GvYAgn3BGHC8RVg+gBlJoygXcZbwWbAOv8TJL3a5cUljNy1TwR8P9lR76kkUqEyh2u3LRlXwBIIVmXMb/UMewzBBbeJrXWON25ZLGRl7Fx/9SYLjM+hTSSWMspW5XLpqSLQB4ac5QbibXsMwQRdzH22x2u3JJpZBXKOJJahuGgBPJJpMPkmtGILnGANrwVAQO9x4Yx0+P8SyNvpQb5xCey+A4XBqklYDVcihvm5+aV0gfLfl10UmsN84YsJy7YmpLdHUoAFRDdz42/vUPsonjyYyp7b7JJpVTWWKaQzjAcv4SZwu5FQAOqDdjTc+hD+FnET0jesCXVEcmvZlumsepihU8GFdLgxQADuBsvjFu/hX8RM84+51IVFn0ZqJp0pAqVvNEHI3sKADsh4dL+c64+Zcynl5q/jEji5P5zPQ7rmIdz8VN6jAFgH3ycjVTjJ/9i/hYnf8Yk8nJfGSa1SHAZp6nXlyM8Ggl4D6kMpjrjRNdFvIlzzKJKrcrJ7uoYBIhKjjd7EQDL/W4BB+PsDZx93YmcgDwkMOl3Ep703ndTXzGMCYn7i0Rtyr4gQA+zjLruHvI50o8PM2yRM3ukLgBwENdLuI246RP6xjNK0wl6Hb1ZC98/IgfP30pMCuzFlfh5UUWUul29SIhUQOAl4ZcwG20MS11NR/yKjPRdt9Y5ecnfAToZxgCcrmaFF5iXiIuEU7MAJBCUy7kNpqZlrqSd3iV+W5XTvYrwEyeJkQ/w92eWVyJh+HMptzt6tlLvFmAVFpzl2n6yBBBVvB3F0/3lZrw0J6n2Wh6B1TyKsfH7OIgTQP+Vypt+F82Gzf/VfzJ5dN9pSY8NOMx47vAzyh6xWgIUAD4VSrt+CfbjZv/Om6gvttVkxqqa34nBBjNKTG59UvrAABIoQ03Mcj0gK8Q27iHDylyu3JSQ4XcT4DbDTdreTmLDDxMSKRJwUTqAXTiVSpNY36IYs4ly+2KiWN3mp/3PImz3K7U7+gRADiKMca7/YNs5ZgEnSlJHkONxwJCLGCI25XagwIAvRhvuh8sRBVL6aHmH/cyGMxK4ztjAdfE1B6BpA8AZ/Gd8YafSqbRQxt+EkIulzHfNHWYn8X8MYYOgEnyAHABk42bfxlf00PbfRNGLS5hqmneID+/8OeYyR6YxAHAw9VMNe787+BjjtWvf0KpzQVMNB0jqmIF98XIXZK004BeruV6Oplu993GFzzFtESa6hGK+IoQfk40u1dSaM4gKnmSYuJ2d0h8B4BsruAW2hlv9x3DS0zTbv+EU8R4AlTS2+zRzksTrsHLC2yO1/2h8RsAPNRlADfS0bTUdXzEK8yI169T9quIr/Hjp4/hyo7mXEMqw1kdnxki4jUAeGnEpdxgvD1nFe8zglnx26GTAyhmAj6qON1wtWhThpLKqyyLx15jfAaAFJpxCTfSwrTUFYxiBAvU/BNaGd/jI8TphsfDNWIoXkawJP7GjeIxAKTSiku5gcampf7CSEbodN8kUMEUKglxOnlmZdZnCCmMYBE+t6tXU/E2DZhGJ+4z3+77C3cYpw+RWJbKIYyiyPQu2s6TdHVpWjBp1gGk0YVHzLf7LucGwxRSEg9SaM3bjpvN3l/FvMQRriwfS5IAkMYhPEeJcfNfzeVxdAaMWPFQwJuUmS4RLmck3VzoBSRFAEjhMN4wXvMXZANna7tvkvKQxfuUmIYAHx9zVNSXCCdFADiCT8y3+xZybFwOhIqVdEYY9yn9fMmRUa5FEgSAk/je+Bz4KpZyWJRrIbEnhX+zxfTOCjCNk6Nah4QPAH2ZanoAdIhKpnJYzOzmEjdl8xfWmN5dfmbTN4o1SPAA0J+Zxqm+yhhHV9MtRBLP8rmTZaZ3mI/5XBq160/oANCf2cbNv4j3OVzNX3ZRwI3MMb3L/Czk8ihdfcIGAA83MMe487+V1zhcQ3+yhwKGMt30TqtiMUOisi4gQQNAFjey2HjobwPP0VXP/rIXDRjMZNNJwRALuCEKq0wSMCGIhzpcyXW0Ny11De/xCnO13Vf2YhOj8ePjOMNsf534A17eYqvbldu7WA0AXhpxOdcYb/ddzijeYD7a7yd7t4nP8OGnp2EfsRM3kMYo1sfifRebASCF5lzGUFqalrqEkYxkSSx+DRIztvAFPgKcZNg2OnMdaYxiVezde7EYAFJpwwCGGB/GuZARvM1ytysnMW87X1IB9DKcJ+rAtaTxNstj7eEz9gJAGu25nMGGp7tDiAW8xDusc7tyEheKmYgPDycabutpw7Wk8QbLYi0ExNYsQDqH8hhbTcdhg8xnqE73lRrJoAdfGW89W8MDtI/IDFSCTAOm05XnjfdoB1lMf233lRpL5WC+Ng4BG3ksIiEgIQJAOkfwuvFZrgFW0E/bfcURL8353jhjQCEvGCeyh4QIAKl04yPjJb9VrKNnDI5zSPxoxkTjEFDMm7Q1PlcwAQJAd742PbstRICVHBO9O0USVAFjjfulpXxonNE67gPA6fxsvOTXx3Q6R/M+kYRVm9eN81BW8h2dDK8wzgPARcwzzvVTzni6aMW/mPBQn2eMM1FX8BOHm11hXAeAq1hk3PyL+YCD9OwvZjw05lHWG4eAn+lhdH1xHABuZqlx89/Cy3RR8xdTHprzAKtM71Qfs+hucqfGaQBI43xWGD/7b+QZDlLnX8x5aME9LDa9W6v4kW4GS47jMgBkcDwzTD/OECt5WM/+EiEeWnAHC4xDwGiD/qrjAGA7G1mzD7MeN9PVtMzljOBlFsTnQc0S80KsYhQvMNuwzBR6c7V7C9XdCwB5nMRpeAxLXMhwRrCYmNtyKQlkFe/yIj8blpjFxRxOtjvVcS8A1GeA6Qr9uQzjde32l4hby3s8zzTDEltwDg3dqYxbASCd1hxnWN4cXmAkK12qjSSXjbzP00w1/LE5g1bujFy5FQDyOYLaRmWFmMVTvM16l+oiyWcrH/IIM8xCQAs6kudGRdwKALU51KikIHP4F6PY4lJNJDntYDT/4Gej9B4eDnHngHq3lstkGSX8CrKQexlPuUv1kORVzmds51k6mKQOa0quG5VwqweQYTLx4ecXhvKFmr+4oopvuZFF+AzKqu9O1gq3AoDH4J39LKE/k6hyqQ4iMJEhzDcIAdnuHFXnVgCooiTMEvzM4xKmu3T9Ir+ZwkCm4w+zlGKTfkSNuRUAKsM8KaWcbziXuS5dvciu5nIlX1ERVhlJFgCKmBPGXxczhutY49K1i+zpF27lE0rDKGEp2924cLcCwHZmOP7bQkZxN6tiLb+6JLEgy/groyhyXMJsNrtx4W4FgDIWMc/RX25gBA+yQht+JKZUsZRHeINCR3+9kqVhjYo5XpDkdfg76g1zzDLIOt528HereYVnWK7mLzGniiU8zTA2OPjbj1gZVo+2zGGLCHgdjl56yQjjcgG2M4b5NfybpbzEy7F3uJIIsDMEDOflGh9Bt5YxbAzrnVMd7asN4fPic9R9SA17+6KfpTxao4GP+bzI62r+EsMCLOU1XqzRtjQfLzE7zDmEbIdbiXywwVFKrgCTwl5G7KEeD1f76KWZ3EzzMN9RJPK8tOZellXzvg7yNh3CbkufOTrCLMA6WOTwOI6ZBpsXvLTkOTYfMARVMYlraOT2NytSLR6acyfzq9GK/HxE97DPIM5kkqNWXMV8mOQwJ+9Cupl8WM14iNn7jV/b+YQLqeP2typSbR4KuJ7v99u2AmxhFN0M8gC0Yo6jNuzn+xTOdXhUYSnTHE7k7W4HUykhRDpZvxvKCFHCLMbyKD+EvXRYJJrKmMdqckgnby/tK8gOZjOah5hrkFPgcM6jroO/CzArlbUOB9Wy6Gj0URUxjPH05QRakU82GXjx46OYrSzhLb6l0uidRKKnnC+YxqWcSRPqkkcGqYTwUcYONrKA9/jKaCNbJ4c7CYOsTXW8oi6HIx2vIvi95TzJMLpwCM2pTwY72MISprHKqHyR6Auxmad4nW4cRXsKyKOKQtYwl8ksNtzFepTDXAJBVsEAShw9PwRZTL7bn7BI0stgusNxvBIu9bLY4RoiD3lmJ5uJiFOH0NDhNGKARV4WOO6K5HKu23UXSXr9HCcT87MQYCo+hw8B69zJZCoiv0plocOVPD6m7NwNOM3hKLuHWlzodv1FklofGjtcSVDBtJ0BYLLjdciZ3KSDOEVcdKPjZKIV/Ljzf7QP49TzCs50J5mhSNJLpTvFBB223VW021lMOj9Q6TgEjKWu6RGfIlI9ubzluN1W8h3pOx8BfMyizPFFHEs/ctz+JESSThZ96OP4r0v5Gd9vKcEmU+y4oFyup41rJwyJJKcUmnGjox0AOxUzBX4LAD+wKYwkW4dzFY30GCASRfUZEMb52gE27xwC3BkAVjArjD5ACv05M4xYJCI1k88pXBlGWr5iZu7MWrQzAAQYz6YwLqcRgzlOi4JEoiKboxhC6zBK2MiXu/f5W/Clww0Fv60K/JDeGgwUibgMuvOGo0R+v738fEmznYX9Nni3ilkcFkaSLw/nUEEl08JMbigi+5NOF67korBO9NjGrN/O1fr/dXxpdKVJGEN5HjqSylq26rRekQjJoDNDuIrMMMoIMZ9XWLLnP85lOKVhdCt2di3ep5c755yLJLwMjuJVysNspaW8svfxuv7MCLPoEEHGcxaZmhQUMZZBL8Y43Pm362s6l+z9DfJ5OayBwN9ey7nb8Q5lEdmbdAY7zP27Zy99+L4zbA8w6AOECFHMJxzp9icmkjC6MJJtJm1zGpfu+20a8XxY0wv//yDgYzn/Mjg6RCTZ1eZellLpeNffrq8qnqXBvt8qhYv4ySTOhKhiG7P4Cw1dO4JcJL55yOcWfmKrwZP/ztePnL97e9x9E0+ACRxCJ5M1fSnkk0sj+vI5Y/k5jP2GIskni4Ppw1m0or5Zxo0dfMHE3VP577mLbytjOdQs2WcqDahPU/qylKn8zDw2aZWAyH6kUJ8udOUoOtKQRqYZt8Yzjm27/6M9A0CQ2YyhKy3N3tRLYxrTkW5sYjOrWc0GNlBIGZX4I/YxisSPVDLIpi4NaExzmtGABjQ0X1i/nDHM3fMon9/v4y/mO8ZwrfEO/yxa0YoQpWxjBzsoxUeVegMiQAqppJNDHrWpQ05ERs2qGM13v9/zu7dmvoKPOYQTI3ARHnK1QkDEBd/zyd4O2tvbE0aA7VRwiA7kFkkQK3iCiXs7YXvvQwzlbCGdw8NIOCAisaKYl3mHjXv7V/saYyxhDa3oqDl8kTgX5DP+wwpCe/uX+woAIUpYzjE0dPvqRSQsc7iX+fsacN/3LGOAQjbSg1puX7+IOLaae/h+32l69rfMwM9SijiRDG3uFYlDIYr4M+/tL0vX/tcZBZhODoeTrhAgEmdCFPM4j+0/4f+BFxpOoCmdNR8gEmdKeYs7DvQfVWel8Zc0p11YWchEJLq2M5I/HPi4n+oEgCATSaO98v6LxIkNDOMvlB/4P6zeXiMfMymlLfXcrpeIHNAynuJpiqrzn1Z3s2EFSyikBQ01HCgS02bzBCPZWr3/uPq7jctZyTrq0dR0h7KI2KlkAk/wKVuq+wc1aczlrGUpAZppR59IDNrMezzLd3sm/difmv2aV7CWpWynHo3crquI7GYurzKCnymtyR/VtDsfYDPL2EwmTcwylYlIeMr4iuG8z5KaJtlx8jxfzDJWUE42DTQkKOKyEEt4n2GMZ3PN/9jZgF4lq/iZrYSoo/EAERdtYTwjGc5cZ+dyOx3RD1HCHGYQJJtapKknIBJlO9vgBzzGOLbtfbf/gYUzpRdkK9+whhRCZJKu5CEiURJkB0v4hqd4nk17ZvqtCYtf7lRO5FKOpgW1tEZAJMICFLOG6XzAF/jCLcyq6+7hKK6gJ43JUf4AkYgI4aOM9UzkLSYdeKNPdVg2VQ+tOYVz6UYeacbnCogktwB+SpnLZ3zG/HA6/buz/61OpS19OZ+j9TggYiTIfD7hXeaH3+nfXaQ66ykUcBS96MkReiAQcWwZE5nARNZF5iC9yDVOLymkkkZjenAYnehEY+UVEqmGStazkAXM4kc2UoWfKrtO/+4i/+ucQiYZpJNGLg1oQgPqkE8tsvCQpZECSXpVlBOinB1sp5DNrGUzJfjxUUmFzVDfvkWze+4ljXTSSCWFVLyAV48HkvRCBIEgVQSowo8Pf6R+70VEREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREou//AM+l0dVL55i0AAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE5LTA4LTMwVDE1OjIyOjI2KzAyOjAw2WyaWwAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxOS0wOC0zMFQxNToyMjoyNiswMjowMKgxIucAAAAZdEVYdFNvZnR3YXJlAHd3dy5pbmtzY2FwZS5vcmeb7jwaAAAAAElFTkSuQmCC"
-b64_settings = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAQAAABecRxxAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QAAKqNIzIAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfjCB4RESMw6DPEAAA+WElEQVR42u2dd5xV1bXHv1NgaNKLiNIUlF4VC3ZsUTQaTawQjWIXY0wwUV+IsRATNZjEqIkasWMPKgrYYkFFkTaDgMAASh/pzFBm7vuDAQZmbtt7nbP2uXd/1x/Pz3vvDOu3zt7r7rPL2jl4ok0+PTiKrnSkHc2owz4B/lsbKaOExSxgNpP5mm3a4j2e7KUxF/MKG4gp2SbGcSnNtMPg8WQffXmETWpdv6ptYSyDtMPh8WQPA5ik3u33to85WjssHk/msx8vUqHe3Wu2cbTXDo/Hk8lczhr1bp7INnADOdpB8ngykQY8r97BU7E3aKIdKo8n02jPLPWunap9SxftcHk8mURXlqh363SshCO0Q+bxZAq9KFHv0unaep8CPB4JOrJUvTub2Fp6aYfO44k6jZir3pVNbQkttcPn8USZHF5W78Y29h552iH0JMa/IJe5kV9qu2BFByr4UNsJTyL8tg13accsGmg7Ycl2+jNd2wlPfHK1HfDE5eHId3/I55++jXk86XOK+he8lP1MO5Se+PhPAFf5jAHaLggxl25s13bCUzN+eOYmp2VM94fOnKftgicePgG4ybXaDohyjbYDnnj4TwAXacf8DFug7cEsbRc8NeFHAC5yfoZ1f7hA2wFPzfgE4CJnaTvgFWUL/hPAPVqwPAMT80HM13bBU53Ma2jR58iMfCtHaTvgqYlMbGpR51BtBwIhc5Y1MwqfANyjv7YDgZCZaS3y+DkA9/ie/bRdCIDN7EOFthOevfEJwDWa8IPF09v4hq2B+daGfS2ePpAFgXnm8WQIAy2O3XxJ20B9y+E6i2tJBmuH1lMdPwfgGt0tnv05iwP1Lcbfec346W6B+uYxwicA1zDvJt+Fst12vIIyT2D4BOAa5iOAcHbbFxo/2TUU/zxp4ROAa5j/ToaVAGKGT3bNuBMOGYBPAG7RihbGz5r/NqfDOpYaPlmHDqF46EkDnwDcwmYKMJwEYPPv+FkA5/AJwC3ME0AFRSH56BNABuETgFuYd5FiNoXko08AGYRPAG7h+hQg+ASQUfgE4BI5FktlYc0AQJHxOsAh5IfmpSclfAJwif1pbPxseAlgPd8ZPlnAgaF56UkJnwBcwmYNIMyim/4jIGPwCcAlzBNAOXND9NMngIzBJwCXMO8e31Iaop8+AWQMPgG4RBTWAMAngAzCJwB3yKWL8bPhJgDzdYCDqR2qp54k+ATgDh2ob/xseGsAABuN6w7U4qBQPfUkwScAd4jCOQD7f89/BDiFTwDuYJ4AtjEvZF99AsgQ/M4sdzDfBTiHbSH7ap4AbMY54dGIAyigEdvYzBpWsUHboaDIzATQgE50pi3NqEcBMdayliUsYCYbtV1LgOu1gKqSmSOANpzMYfTlEBru9X9Zxlym8wH/o0TbSU986vJjRjOd8jh1acuZzcOczT7ajtZAPmXG9XZvC93b+nFjnMy2UaAd6hpoy2+ZloL35XzKtTTXdtdTneN5gnUpNsLNPMepjt2J0MWiHPiPFfydb+xtT+1Q78XR/DfNdLaVpyPyKZMV5HIuXxk0xEIudegT6FyLBNBJwd9xxt5eoB3qKvTjfUMVFbzGwdrue+AYZlh0nSLO0BZQyUhjDZtVim2OMvb3Tu1QV9KIfxl/yOywLdxNPW0Z2UxzxljcVLPTXqaVthDgRWP/v1Lx9xJjf1/VDjUAJ7PYuuXEiDGPftpSspWBLBF5hTFWc462GGYbez9Gxd++xv6GeW6xZgq4X+CHY6eVcb22oGzkV2wTe4UxYjyiOpgrsFDzGxWP6xkPn7dTVzHS0I3poi0nRox/+jsPwiSHe8VfYYzZ9FFT1MvC79OVfP7W2OPeanHOYRibAmg7MV5TTmtZRB5PBPIKY5Rxo9Li4IUWXrdXeg+vG3t8sZLHLXkjoJYTI8Y71FHSlVXkMSbAlxhjIvspqLrb2N8NavsZzH2+W8Xfk1gaaMuJMcGPAoImj2cCfokxlnNq6LrMf00/U3sXFxn7/EbovtbhQcFpv/jmRwGBksezIbzEGBU8EOqG1X0oNvb1MbW30dsiwrP4Az1C87QHM0NpNz4FBEoeT4X2GmPMCqWB1mUwY9ho4ecv1d5HHbZbxngBoxkY8CdMcNN+8cx/CARCuN0/RoxShgeopw6DGcN6ay9PUnwn80TivCjANBDstJ9PAaGRz/MKLzLGyzQV11KLM3laoOvvMI0py528Khjpb7mV/YX9G8xKlVbjPwSEyeNppRcZYxmnCCrpxCiWC3r3g+p7uUs41uVMZIjQr2cdRocy7RfP/ChADM3uHyNGBaMFatkWcB4TxZvk/1TfjM3uhfi2hkest2QFsdvPpwAV8hmr/ipjTKajhYbujKYkEL/+qfpuegYY8S+43HAYncOvLIqrSJr/ELDGje4fI8Y6o/1refyUTwP06jrVt2NzgiEVW8kf2TdNn/Zjonpb8SlAiLDW/VO1sWnd3tuAYcwJ2KPjlN9Q0PpibGEsA1L258esUm8le5r/EDDGte4fI0YxR6Xk+76MDGjQv6e1UH5Hr4QU9485L+l5u7qMVm8fPgWIUYuX1V9dTbaN3yW5TaE3T7E1FF9WaL8k7ggx8vO4KsFkbD++UW8b8cx/CKSNq91/h70fd8V6AG+H6Me72q+Jn4Uc+UU1JoFcfsMW9VaRyHwKSItaoQ0tTW0t51fzugdjQ155Hq39ouihEPvFDN+jO+3LePX2kNz8h0DK1BbdYRacVa0h1JNXFbadDNN+VdQO6WNnb1vM1ZXHtc4NZa5FwvwoICWi0v1jxCiiN9At9F/+nZb67HhwTFaL/mKu4TH1NpCO+RSQlNq8pv6a0rEyxluWlja39U7camBeHjwbzbkU4NbtOLV5kTO1nYgMr3G2tgtAT6ZruxAQS3idBvxE+CK5CZxFmbY0N6nNf4XzbSl3cDq/ZJl65g/CfqT9wir5WD0S8lbB6Mrf6gNZIPy3nRsFuIF899/IsZV/u7lFyS1XbUaS3QjhMVD11F0QtmKPSsvtfAoIngKLu+Zqtt3dfwdXhVwXJmg7TvuVVeE/6tGQtLernT/wKSBgCsTrtuzd/QG6MFW9cUnZX7Vf2R7Ut7qf0SUr46Ya58V8CgiQcLo/QG3+rDZnL2mTqKX90vainVB5MF1LdDWMTwEBUcCbwoGN1/13MIjv1Ruanb3l5I20rflSPTJ29miSuPoUEAAFvCUc1MTdH6BZhLYa7W3ljHLu138ntbnb8R358a0kpethfQoQpo5C99/BMKtS3Fr2CQO1X1kS2vMI69TjlK69n3I5Up8CBKkjfogj1e4PcDBfqTe81G0tT3CC9gtL+b2eyT8trg4N17YmPd69Jz4FCCG/8LeJ49PyIJ+R1ldbBG+FjGKQQFHS8OnIMMY6flRnYYoFXqpygHhyy8KTgnXEz82n8+u/mxP4Tr0R1mxreJoL1Cv+2JPHMdzn6HjgScNtvn4UYEld3nGi+wM0da70yDIe5pRI/uYnoju/4wv12O62tVxoocanAAsKHOr+O7jckSnBFTzIQGe2+AZBR34X4kWd8e1TOlgqkU8B/3XidGfg5PGSY90foDNTVBvkJp7l9OxoAEB37hLvPqnbdu4QibR8CnjSsdO5gfCwg90foBb3KO0S/IihwkdOo0AOJ/AMpaFHexFHi2mQTwG3ar+WoLlCOGDpzvwn5oiQf5fW8gg9tV+JKo0YFuoJjZeEL3uVXhEo52TtVxIkvdgsGi6pX//dNOHFkJriZwzNvsWfOAzgmRD2EG7gsgB8lx4FLKeZ9usIiny+Fg2V7K//boawIdCGWM44Bmm/DOdoxQiWBBj1L+kckOfSo4DHtV9FUNwiGib5X//ddOLzgJrhWv5CO+0X4SwFXMK0QFLunwJdVpUdBVQ4VetBjDaiw/8guz9ALe4S3yW4nF9n4WRfuuRwunCRse9DGG/JpoDPtF9CEDwkGKCgBv97cjjzBTv/CCcP8brKQMYJFRp7O+37hc2Q/RAYrP0CpGkrOMkT9K//bprwgoC/xVxVeYmFJx36WheK2cw1Ia6sS44CPtUOvjRy1ePD+fXfzXmssfB2FSOyZ4tnABzOJOPYF4a+xCo5Cuhj74471GaFUFjC+/XfzYF8ZuTrOm6ngXboM4ATDW4f2l3WO1zkRgH/0A67JOdEuPsD5PPHNKcEt3AfzbXDnkH8mLlpRH/Pst7hIpUClmXSmZCnREIS9uB/Tw5PY3g3ka7aIc84ajGMVSlGfz9VT6U+BI7QDrkU+SJFIbR+/XfTmOdS8LOQk7QDnrE05+9sSxj9DdzowIEamVHAHdoypOiXEd1/B+ewKIGXq7g+a070aXEIz8T5HNvKUynX9gsaiRTwjrYIKa7NmO4PUI/rKKrBxzn8ivrazmUJHbiFT6vc9FTKe/xWeeC/N/YpYE0YY5kwhkv/YajV85s4nQ9D8DMdunA8XWlLXTayghl8zAxtl7KOXPanKbksZzkV2s7UQDvetyw7sj/fa4uQwG5jp+7Un8djju10oOtF4FPEpuymS4N/jydd7D4ELtZ2X4Jcizo7vvt7ok5Hi4tSrgneveA3G9S1+Deude7b3+NJjwU8ZfxsCMfHgk8A5jPjZTwbfAA8noBZbfxkCLdAurzdMIeYtgsejzWnGD+5OXjngk8Am4yfLOD84APg8QTKZRxu/OxGbeclyLGYBFzl2OYOjyc9OlnVlzxT230ZbEo9TnD6I8XjSUS+wUHmqtZNW4AMH1gF4SZt9z0eQ+6yavkVmVJE7l9WYSijl7YAj8eAYyzLys4Ow8kwBthfWD1dwLP+Ag1P5GjEGPKs/kLG1AXsbpUHY8T4u7YEjydNUqkdkdh+oS1BilyWW4aiQrHEk8eTPkOsu/92WmmLkONR63CsDKm6u8djTweL/f87LaM2wZ9mHY4YbzlQ6snjSU4+nwq09yu1ZUiSR7FASK7XluHxpMBIgba+PtMukbtNICildNeW4fEk4cgkZUtTs9HaMqRpyUaBsEz3t+x4nKahSD3gzbTRFiLPPQKBiXG/tgyPJwEyN2Dcqy0jCJpY3bG30yosDld6PMFygUj3X0FTbSHBcJVQeDJofdSTQRzADyIt/GfaQoIix/JY0E57XVuIx1ONPP7nW3cyDrI6Hb3brtIW4vHshcQ6V4zltNQWEiyXi4TJLwh63KI/WwXadQVnaAsJnudFUsBUamsL8Xgqqc8ckVb9V20hYdA44fWaqduftIV4PJU8IdKiZ2XLsXfbQgk7rJwTtYV4PMA5Qp+1PbWFhMe9IiH7jmbaQjxZTxtKRFrztdpCwqQWX4gE7RVtIZ4sJ5d3RVry+Gw76yq1IJgxVVM8keQWkVa8IhurXcjsC9zIwdpCPFlLX7YItOGsrXf1mkgK+NIvCHpUqM83Ii34AW0hWjRnqUgA79QW4slK7Avdxciixb+aOIkKgRCWc7y2EE/W8WOR7p9Vi3818YBIGJdk6gFKj6Psx2qRlnuNthDtxYcCPhe5+eclzlNW4j51aEYzmtGcJuSzD1CXOsBWNgEb2cY6VrOaEkoo1XbWaXJ5h0ECf2c8pxPTlaKdAKArX4p8BQ1ljLYUx8ihI13pQAfa054ONErj2Y0spJiFLKSY2XxLubYYp7iZPwv8lZX0ZIW2FBe4XmQwtYFO2kKcoIAjuZZHmCy00yJGjM1M4d8M55hsnrDaRXdKBWKatYt/1clhnEgz/YJa2lIUacZgRvGRSOOMb1uZzP2ck40bVyqpwwyRSPrqllVowTKRoI7UFqJALv0YwceUB9rxq9t8RjMoC/dgPCQSvZm+vvWenCK0IHistpAQqce5PCc0G21q63iJizPtEosEnCbSTkvpoS3EPf4m0iAX0FBbSAgUMJgxrFft+ns26HEMyYI00NL6mtsddrW2EBepw3SR4Gb6WsBhPCpw9WQQtokxHOPAulJwvCQSJ3/LZRx6UiYS4DO1hQREQ4YxVb2bJ7M5jMjQwpYSV9zGWEoLbSHu8kuREBdTT1uIOAfzMJvUO3eqtoWn6K0dMnE+EohMBSdry3CZHN4RaYDqGyxFGchYkSJqYdvHDM6gwW5PkZj4xb8ktGaVQJiLtGWIMViodpKWzeRn5GoHUYTfCURjGgXaMtznLJGGlwllQgbyoXoHlrBCzsuAkcAE6zhspqu2iGjwsECji/pHwDFCF025Yl/yI+2QWrLQOgZ+8S9F6jHbOth/0xZhwQGMUe+wQdi7kT77blv86/UMGAWFhn2ttf9qSzCkPiMD3s2vaeWMiewSod3VX37xL01+bdnU3tQWYMTFQmciXLYSro7ktKDd5qsHtd2PGnUtV72jd2NAG6EiqVGwTyI4HTbNSvF6Vy+xcTUX/9xyM88ibQFpkcswZnOWthuhcSTTGBWxJbGZVk/vw03aAqJEbesLRKN0YUgnJqv/JmvYzEjtFrzEUu06X7cydYZZBruCdtoSUmaIYOWeqNlWRjo7Bt2bRtYnVXz5+hSpZb3m+oW2hBRpxLPqnVDb3qWN9mtIkX9aKvVjgBS5zLpRXagtISWO5jv17ueCrY5Idbx21ovTf9SWEAXy+dYyzN+Qpy0iBYaJ3CuXGVbBqEh8CvzZUqcfA6TAUOvm5P5seh0eV+90rtlbNNF+LUlpxApLlXdoS3CdPOZahvg9bQlJ6WC5ppyp9m0EKuXZTk+vzsBaFaL8xDLA5fTTlpCEw4TqymWibXB+NiDPunDdVdoS3Mb2DNy/tQUk4ewI1fXRsO3On5k73lLhnEjMdijRxzK4G2itLSEhw0Ov3h9FG+14F3nLUp9TB6PztR3Yg+GWzz/AMm0JccnhL+rbQVdQzEpKKGE16ygnxlqgIXnk0qjy6tAWdFBOozfQhEsdvo3wFk6xSlG/5C1tCbtx6YxySxZZ3Zeylo6s0RYRh1we4kqFf3c7c5nJdAr5lmI2p/hUHdrTke70pAddVC5ce5kL2arw76bGWMu7qHszXVuCi/zecmh1q7aAuOTzVMjD6DW8ya0cKzDnXMBR/JrXRGo1pmNvOnwRaWe2WWl7TFuAi9S2PAu/ytmbaWoLXSiRilXwJXdyVABboXI5lP9jcoj1id+ngfari4vdPo6yLL5cNS4XWzaXm7UFxCGP50PqMIWMpGPgepoyhHGWv4Cp2sfU1359cWhnWSHodm0B7vG5VUCXO7rBIpcnQ+goC7k15POPrblJoHJjcnvT2fuH7cYACxxf6Qid7pYN5RZtATWSY32CLJlt52XLOWkbjuYpoevc4ttLjq1U7eQgy4+hE7UFuMX9VsFcR2NtATVie3gksa3nr3TQlkhr7qIkUJ1POrVWtZsXrFQ9q+2+S+RbTgDeoy2gRm4IsFOU8DuHkl59hgdazvQubYE10osKC02l/mTgbs6yah6lTs6pnh7YfPkGRjnU+XdSwLAAk4CbG4THWWm6Ttt9d7Crh/uQtvs1cGhAe/63MtrV+rJAA+4M6FaDrU7eqnuclaavtd13hZZWSyoVDt4D2C6g38LxdNGWlpT2vBiI9nV015ZWA19baeqr7b4b/MqyU7hGHb4MoAN8F4FCJzs5gXkBRGCegx8+l1op+oe2+24w0yqI7p0gf0y86VcwJmJTRnUZablVpiZ7x7lib3WsagT94OwuhxDpa/mr4NqGiqvEm/0ijtMWZUS/ALYK/V5bVDX+YKXHqaPBOtxlFcBfaru/F4eLl/p8zsGBb6rUE98IVe5cl2ltNdJ5Qtt9fb6xCN8mxzpHI4Fb5KvaRi7RlmTNmcLbhFaxn7akvXjZQs2abP8I6GHVGJ7Udn8vnhFt6vMiUCQzFQ7gC9G4THDss+9HVmrcm8MKlZFWwTtG2/09uEi0mb8RgTLZqVJHeGJUu7LSnuRSbKHlP9ru6zLLInTzndojfgA/CDZx1+vipY9kPcQyx64VtfkZW2dVBSvidLZqBr/Vdr8KObwv1ry3ZWjp6J8K7hKc4dS38/5W274Ha7uvx++suolLk0G2F0bstk0Z/FV4lOAoya2SGhMslIzRdl6PryzC5tIOwNZiDXsjJ2iLCZSuLBWKVBldtcVU4edWSibyV67gCBppywiLFpzAdTxq1QCGaouowitCjXoNh2tLCZyDWSIUrckOzZM0FPq8WcR4/syl9He2GJoxjenHEEYxTuQ3oNShbHmOUIP+gT7aUkKho9i16C7NlcgfgVrKREYzjIFBlrsLdh69EQfRja50o6twucpX+EmgnqdOXYpoL/B3NnEqH2uLCYlO/E+khsMaOlGiLaaSs3klwL++jK8opIhCiijVlpqYhgzgcu7nHbE8X5P9VFvmLm4X0bM5ovv9TekhtD/wQW0huyhgTYDtfbdtZRYvcDs/obNEtUSZEUD9yl/5HnQJpTrtRlqlfMtNsLRhjsDXWjlnM05bSsgcxSSBFfDt9KJIW0olY0LfuL2F2RQxi0JmUUxFuP94XfpyCaMYxwKr2mgmNjbkQMdH5saf67VlqHCeyNagSdoydiE1F2RmG5nCw1wa9NpII07iVl5hnuo9txdrv+tK+omkvvu1ZagxQqQ1nKYto5L6bFZNATttAQ9wpLy81lzPpJBuhEls25wpjvGmgJrxDi1mhc8YgQhOcWZL+OvqfWO3TedqudsVj+fFAOq7mNp72u+5kiMEtBTTXFuGKjLl01wplmazHSgI+55r7LdMH8NH6kL2tBu133Mlk6yVlNJPW4Q67QTuHZ7pyCiqeYhXp6Zqc2zWl/bnVXUB1S34CzBT4VgBJVdoi3CCswQi6cqy8GT13lHdKnjUbCvRVaxTd766zdV+x5VMtFYS5MaRaPGwdSxnODIPYFffIjibmW7x/AY8p+50zebGNSA9ref/v8/yr/+q1BMoH3qKtggAjlTvH/FsPYNSl9GWQnWH49nZ2u8YkJi9PlVbglP0s15fmqAtAYA80bIwsrYl1Q+lLixWdzaebXeiUFYb69q/rlUz1Ode67bRW1sCAC+p95H4Vp5KCjiYleqOxrfJ2u8XsG+sKxy+30+LenxrGVU3Cmv8Qr2PJLIyTkzs/v4sUncykf1B+/0CdawPslygLcFJTrRu3C7MqjR3YrNcfFvLQfGdr8s0dQcTWy/t94t99d9PHJmxdg/b4bMb1YLfUu8liW1a/B2CT6o7l9gKtd8tAB9YaSinv7YAZ+lgWVfnGydS60D1fpLM4hyiHqruWDJz4Z6czpYLgP/WFuA0d1u2kIHaAgC3zgTUZOU1lZ5rJXyFk7xNd+JuWLsJwM1O1TJ2j4astoqvG6srrazuDA7DZlTvS8+qO5XYSp24KCuX761U/EVbgPPYHRHe5EgxzaPZpN5jEtuQPR3uG3pRj/Ss3JEaAMdaqdhIS20BzlOf5VYxPk9bQCUnsV691ySy+dSq6u54dYcS2Xau1H6flfzDSscobfcjwU1WMX5J2/1ddKFIvecksp/tdrW3ujOJbBUnab/LSvKsfp3KaK0tIBLUt5oHKKWhtoBdFPAb1qr3n3j24W5H/6XuTDwr51FaaL/HXdhtVXlc2/3IcI9VnN3aZlWfyxjv5Lna2M4Tgg0dnbBYwD2OnP3fyd8s1FQ4MYkZDfazOmvhTsnY3eTRlfP4Ay8y26Gdgr/dURb8Ap7Vjs8utjOfWRRRyGQWaztTjW850PjZ95LtwvZU4WkuMn52LS3Yri0gAbXpQhd60JXudFBd2v6cw3OAl5Rv2SlnAbMoYhazmc1WVV8S0Zk5Fk+fzwvaAiLEcbxv8fRAPtEWkCJ16UK3Smsf+j7GCprmk8fJCsIrWFjZ6Yv4hjIFD9LHpvz0al7Tdj9SfMA3HGL89GmRSQClTGVq5X83oAvd6Up3utI2lH89l8Py6cE+IYmtoJhCCimkiNmu33BWAzYlPJ5ki7b7EeNx7jV+9jRu03bfgI1MYUrlfzei666RQZB7RwfkcHWgRbZiFFdeaVhIkSPXeZlRwBqLOuu9ma4tIGK0YbFxrd8YrVilLUCMJrvGBT3EV8Sezqd7AC4v29Xlp7MhjBiFQD+L7j/Hd/+0+Z5PONrw2RyO5HVtAWKs4SM+qvzvJrtu2+4ucr9yu3yxhbYlldN4syjKmE5flaMsnvXTfya8YJwA4KgMSgBVWcPHuy6Rb135iXC0xWxJW/jGYh2xlIk8wOUcQSPtyATOKxZxCmKUlfnsa3H/ZFQmAWUYbhynEiw2t37gzB19wZNjccDTvf0MUeFz45hvkbsXLxKYXkiyOdf4+GSMofygrTs0DrQ4x/emtvORZbzxk7Wz7NK1rwyfK8g1uzQIWMEibdUh0tfiWfNmnO28bfFsH23nQ8V0+1xOrvFSS3ata5vv49/mzG3G0WOKxRjTn7xICTduVXWfnsZPfs1GbecjS7nFZJ75G8sqfAJIDfPmlF3z0dKYR6+7b9up4IOUCg1pZ/zsp9rORxrzBFDfsaPkjuITQCocYnFO6zNt5yPNl2wzfraLtvNRwCeAVOhg/ORqvtN2PtKUWRzBbq/tfBTwCSAVzBPADG3XI495BM3fWhbhE0AqtDd+0icAW2YaP9le2/Uo4BNAKrQ3ftKN2wyjzCzjJ/0IIAV8AkgF8zWABdquRx7zCLbXdj0K+ASQCuYnrxdqux55FhIzfLIxBdrOu49PAMnJNz7svN2vAVhTykrjZ5tpO+8+PgEkp4nxLoClFqvYnp0UGz/pE0BSfAJITnPjJ1dou54R+BFAgPgEkBzzBLBa2/WMwDyK5m8ua/AJIDnm5c6yp2BKkJQYP9lY23X38QkgOeZzyeZN17Mb8yj6VYCk+ASQHPNmtEnb9YzA/DaJ2tquu49PAMkxb0bu3nMYJcxrT/kRQFJ8AkiOTwC6mEfRjwCS4hNAcnwC0MWPAALEJ4AgCfu658zEPIqmm4izCJ8AkmP+C+SHoBKY/477EVhSfAJIjnkzqqXtekZgnkazq3S9ET4BJMc8AfhvUAnMo+gTQFJ8AkiOeTNqoO16RmB6eZ3/BEgBnwCSY54A/GEUCcyjWKbtuvv4BJCcNcZP+sMoErQwftL8zWUNPgEkx/w0mh8BSGAeRX8aMyk+ASTH/DBKK23XMwLzi9n9acyk+ASQnDWUGz7Z2q8DCGBe3XeVtuvu4xNAciqMvyVzaavtfOTZx/gTIObnAJLjE0AqmJf28rXpbTGP4A++ImNyfAJIhWLjJw/Udj3ymEfQl2RPAZ8AUqHY+Mke2q5Hnp7GT/oEkAI+AaRCsfGTPgHYYh7BYm3Xo4BPAKlg/lvS0x8JtsQ8AfgRQAr4BJAK5vfTNfTTgFY08HMAweITQCp8Y7wTAI7Udj7SHEGe8bNF2s5HAZ8AUqGU+cbPHqXtfKQxj95almg7HwV8AkiNGcZP+gRgg3n0ZviCYKngE0BqmCeAbv5IkDG1GWD87Cxt56OBTwCpMdP4yVxO0nY+sgxkH+NnzVN2VuETQGp8ZfHsadrOR5ZTLZ6dqu18qJifl6CCmJF9p605ZBYbxinGMr8XwJCZxjHfmFUFWfMpNozT+lxKDf/R1llW7+YT4yf35TBt5yNJB7obP/tFFh0EyuEe2hk+uynX+ALLXB7Kqrr35gkAfqrtfCT5mcWzH2s7Hzg5dOB0fsN/KOZm47+yJod5HGT8+BLeYiZFzMyC4kt9LL4qv6OtX5RKm6n0MX72VN7Rdj8AcmhPF7rTlW4cIlJzenwOkzhR4A+toYhCiihkeobWYcnjBxoaPz3QagSRjXRirvGz22nOOm0BYuxHV7rRlW70tFgVqZm/5zNfJAE04ahdmzaWUFQ5Lpht/IHhHuW8y9nGT1/iE0CaXGLx7GcR7/47f+m70F3olz4eRfnMFv+jB3AApwAQYyGzKtPB7Mjf0zLeIgFcxK/ZoC0gQuQx1OLpt7XdNyC8Tl+VyTkM4LNQ/qntzGcWhcyikHmRnKPdn8UWC3qX85i2gAhxBuMsnu4XkV0AOp1+NxtokkMt1lIv5H94G0so4isKKbI6aRc2M60Wpsy3tWYfr3GW8bMraO30lGuQ3/Tp8TLn5rOND0Pfq1aLjnTkDABKKaKwcmSwSDUcyRlvkQAO40g+1RYQEQ6qbBtmvONg929J/8pO38WhGyNf3fE/LjfebyVt6/iMf3EjJ9FaOzY1MsBK3cva7keGh6ziPFjb/T1ox10UqfesmqyUxjtcbMFWdWeq20pe4eqdLjpCDgstFJVb7LjIJpqy0SLK66ijLWAXLXmU7eo9KZ49sdvRF9SdiWcb+ZtTx2nvtVLzsLb7keAOqxg/qe3+Lk6lRL3/JLK+u109Wt2ZRLbaoa20/ayUbKWjtgDnacY6qxi7cvbyWod/+2PEmLinu5+pO5TIKviTMyfqvrVS8ri2+85zj1V8Sxw5n/Jz41O2YfWovQ6onaDuUjK7T/udVnK7lYptdNIW4DQtrb7/Y/xdWwAAfdii3l8S29jqTr+t7lQyu0b7vQKwv+XQ7lVtAU7ziGUbMT8+JEctCtX7SmJbw37V3T6QTeqOJbbNdNV+twC8YanjZG0BztLLMrl+oS0AgMvUe0oyu7xmx3+l7lgyG6/9bgE4y1JFIfnaEhzlfcvIXqEtAMhhrno/SWzPx3M9NwKfAS5cs5HP95YqbtCW4CTnW0Z1g/LG2h30V+8jia0oUZSaGdcWC8vcOFBzm6WKjf7CsGo0ZbllVB/UlgDA3ep9JJEtTXbVWg9+UHcyka2hQPsNA03ZYKnjLW0JzvGEZUS3W9wiKMlU9T4S335I5bL1AdaNO1g7XvsNA/B3ax02BS8yj5Ot181f1JYAQCuH1/+Xp7pGcixr1Z2Nb3/SfscAdLDe57WW9toinKGJRdH1nXa4tggALlHvH/Hs23RGSL1Zqu5wPJum/Y4reclayUcWN99mFq8KxNINnlbvHzXb6zRJT8h+/E/d6ZqtwpGjwr0FBnu3aYtwgmECrcKNvRW5rFDvH9VtMzeZbKTP5x62qTtfk9lUi5PEfgxQXlk7MZvpzWbrOLpyC8Bh6n2juk2yOYTel6/UBVS357TfcyXdKLfWUpLlC4JNWSDQIo7TllGJa0uAX9sXR8ljqMgrkrS1jpz4gmcE1ExxqIBF2OTxjkAEJ2nL2IU7lX/KeZuzpE7Q1uJSpqhLqmqunPnuLFJL6XlnjjqHzd8EolfhyPw/HKzeL3bEYwq3BlF7qj/3WZ6Fl7NHtd/1Lv4qoucebRkq3CQSu2e0ZexihGqfWM0H/IVz050iT/e3pysDGcChHKJ6/fJK9nOkmHgT5orcknylQ0ktHM7mJXKt/8pmDmGJtpRKJoc+FimpvI6viEJWhPtP59ORwYxgDIUqpY+OCTnU8blaRM92ztcWEionUCoSt99rC9lF25D2AK7hS8YwgsHulJerQx8uZhRvsDC0jZCjtUXvIo/pIoq2OlbOOkgOF9puvoT62lJ2cUuArX01H/JPruMEWkm7LT39VMBB9Ku8+aRDgJNbK2nD9sD+enocy/siSss4c+9SjRlJPyYJlXs/j5e0xexiBj1E/95a5u8a3i/QFmdGI/oxhNFMZFkAWdGVlQCAR4U0bbG4fjQqHCZWLPsNbSlV6CqiyMHhvRT7MojhPMqnlkWfd5s7s7/QkO+EVG3L8FOCx7FeKFLr2F9bTBVstgAtCmp47yrtOI3f8CRfWm0C3eTQHWtwtlCzjrGdK7XFBMa5lInF6WptMVXIsSqkc5m2+3o0sSqfPETb/T2wPxmw20Zl5NagmwW2Tu+0/wksIcoxyELJVppqu6/JeIvQvaft/B40Fz1C/UKGbRDOt7zwc09b59gJiucttLhR6FaNn1s1hC7a7u/BSaKLoFMda+Q2NGeiYGRiXKQtaA+aWX3YZPEHAEBjq+D9Rdv9vbhftJmvduSUuy39hEvNjrV3SRSbLc1Z/gEA8F+rLuLWQLlAaFPQTtvO/0W8alAONwhO/MWIsZBG2qL2YpaFmiz/AAC42Ko5XKjt/l50Fq+n+Jkj1W5NaMk44WiU7X2ppToDrfT8Qtt9fRpa7Qr/UNv9apwtvh16rWPrHalyZgAFsoZpi6rGixZqttJM230XeMWqSbhwHeSeBFEXZjzttGWlRSvGBBCFMdqyqtHOqmye/wAA4GcZ1ijymBBA49/A8IjcKZjDZWLbfauai7WT7rVSlF0nQONS1+o2oq1ObQndQTPmBNABYsxkkLa0pBzO54FoX8oB2tKqUc8q0bk2ha2I3T07d2q7XwMHsSqQbhDjNQ7WFheXtjwV0IHwDfTVFlcD11pp+qu2++7Q0yqQJQ6dCt/NoWwKKAWUM5ZO2vKq0ZJRQkU+qtt2ztKWVwN5lheB99IW4BJfWIXyWm33a+Q8wb3ve9tWHnUoCRzAAwLV/aP2fi+w0vSFtvtuYXc7zGJnCoXvyfAAO0WMcl7hKG2J9OZpkdrI8e1ubYk1ksMMK1WZe+bTiAaW58Rd3VBxa6BdY8cvyRXso6KtDhfxQeD6HtR+hXE4y0rVZqGaSBnEv60COt/ZJbJ7Au8iMTbwL44O9YDsYTxotXaTqj3u7MHoT610/UfbffcYYNlU3K2kI3H9RSr2HQ9wROBpoC+jQrsr6gVnT0KcZKlM/9PNQewO0hQ521hyQksBMWKs4CkuFLmrYE8acy7/5vsQlTynevdE4jdqt9fBTwDWyGWWDcaVW4NrIowPgapWziwe5hIOsh5Ct+V8/sbXod/+8JizCd2+AJxDOwBd+sIqYGG6FxvtwSIOZou2iLjcqrRhaT2zmMlM5lNMMWUpPFGbtnSgIz3oQQ+aqHj9IDcSU/mXk5PLVKs1/O/pwDZtETtxaepsCw/xR4vn23Gls3PGcBcbuV+hkl1DjuTIyv+OsYxVrGI1JWwkxtpd/z951KMZzWlBS1qr19u7i9uUPUjERZZbeEa70/1do5nl7rkVSgtiqXJOoNtlMsO2c432a0pILeZb6dugNKaKCP+wbD7/py0gCQMCOCOfSbaBM7RfURJ+aanQ3TGqE3Sy3D67nn21JSShI7PVu5mrttTJIz9VaWa5+6Gcg7QluM6rlo3ocW0BSWnKO+pdzUWbTBvtV5MU2wXdV7UFuI9djbUY5fTXlpCUHEYEeFAomvaIo+c5qtLFqv5PjBhHaEuIAp9YBvkTpxY343EGa9Q7nStWyuXaryMl3rLUOUFbQDSwuWhph7lWK7hmDmaaetdzweY6/+W/gxOslfoNwCnyoWWgF1OgLSElajEy6z8Fxjh1yWsibFvlRG0B0eFY62Z1lbaElDlR7Grx6NlaLtAOf8rYVa2KEeNobQlR4l3LYM/VFpAGza1qy0fXJjhYzjU+d1iqfVdbQLQ4yrp59daWkBZnsFi9Q4ZpaxgWiana3dhOTR+rLSBqvG0Z8BHaAtKkEaOzZj5gLC21w50mOayzUvy+toDoYVsg5BltAQYcI3y5qIs2lx9ph9mAxpaqozPX4RB2d8p/ru2+EbkMyeDTAhsZGZH1mb3Z11L5tIjqVuRAy0HXDG0BxjRmlPCV2i5YOWNopR1aY5pa679fW0K0qMVnlgGfqS3Bik48lUEzAhW8Sg/tkFpie81LBSdrS4gSd1k3ure1JVjThTGhF+IKwiZG4HRGcr60jsPSACo1ZijHCvz6/UNbhAi9eDHCSaCCNzPm+IvdPcA77DVtEdGgqciauEOFFy3pwGg2qnfmdG0LY+imHTpBjhCJir8PKAVeEgj0VlpoyxClKb+L0JbhldzlfGGW9JkqEJlNHKItw3WuEGmCz2vLCIBcBjE24Hv4bK2ciQyhrnaoAuEskQh9FYG6B4ocIjLYreBQbSGB0YbbLK+lDsqKuZMO2uEJlDdE4nSvtgx3KRAZZsV4TFtI4HRjpENp4DtGMzBie/tNaMNqgWiVc6K2EFe5T6Q5Lsuw7//4HMYoplGh2PWLuC/ka0l1OVcoYTbVFuIiJ4s05QpO1xYSMvtxGWNDuat3t23gNa6ivbZ0BR4Xid8r2jLcowVLRUKbvVsuOzKERygMtOMvYxwjGJjFE1n1mSMSyV9oC9mBK99tObzOYIG/U8ihlGqLUaYNfelBL3rQSeTqtwoWMJ2ZzGQqxdriHKA/nwrcW7yJfszRluJOAriB0QJ/pYwBET4EJE8dOtOBDnSgPR1oSbOUEkIFJaxiIQspZiELmcsmbSGO8X/8QeCvfMWRbNWW4kYC6MYUkbXj6zJkA3BwNKY5zWlAY3KoTf3K/20pZcAaNlFCCSXaTjpPLu+JVPi5m1u1pbhAHaEyGOMdSWeezKeD5WH1HVbO8dpCXMD2QtAdtiIDN5963OUSkVa7xC8Inia0+Of6rbKeTONZkRTwkrYMXVqxXCSMf9UW4sk6GlEs0naHagvRI9ey7t9Om5Whx088bjNQpFbDBjprC9HiNyLdv4ye2kI8WYp95aoYMaYI7CuIIH3ZIhK+67WFeLKWfOvalTtMYl9BxKjPNyKhe9sv/nkUOZD1Aq24nOO0hYTNYyLdf6Vf/PMoI1PCZjFNtIWEyU9EglYhcn7A47FjrEhrHqstIzz2p0QkZH/TFuLxAE2Erna9SFtIOOTyvki4Cv3in8cRThK5xmUDB2kLCYPfi3T/MnppC/F4dnG/SKv+mDxtIUFzJNtEQnWjthCPpwoFTBNp1xl+PrAe34qEyS/+eVyjG5tFRrYZfXOATNlPv/jncZHrRFr3R5n749ZXZO+0X/zzuEkOb4mkgHO1hQTFBJHw+Ko/HldpyTKBFj5HpJajcxwv0v394p/HZc4QqW9xobaMIJD4/S+jt7YMjychDwm084+1RcjTWSQz3qQtw+NJQj2KBFp6xu1ykdgoMSFz50c9GUQfgYPuo7RFyJIjsFt6Fftpy/B4UuLX1q19rrYEWfoL/P6fpS3C40mRXN61bu+hbAgK617XH1n/hYd5PSRfPR5bKhjKD5Z/40htEZK8Y5kNi6inLcHjSYuzLdv8o9oC5MhlrVUottBHW4LHkzZ2V4lP0XZfjnaWufBmbQEejwF2V4mv1nZfDrs9gBNDm6nweGQZYHX4vVHwDobTtdpbPFvCUCpC8dLjkeZz7rB4ukXwDoaTAGzqnV7B0lB89HiC4G7mGz8bwsR3OAmggfGT43k1FA89nmAo5z3jZzMmAdQxfvLdUPzzeIKjlfGTW4N3LpwEUGr8pK/844k2h1lsgtscvHvhJIBNxk9eTodQPPR4gqAHb1gU91in7b4UQy2WQhbQVtt9j8eIHqy0aPmlmbP8fazVPgCfAjw104imFl/YQWPX/WPMDsPJcGqPLbR6ugMfcByLQ/E0PfahN81oxEaWMZMN2u5kDZ34CSfTk2YAbGE+7/MGE5zaL9KTSZbr+IXaEuTIsb4L0LVRQEtGMHWPGsflfM2ttNF2LOM5lHFxakvN4zJnCsb0tPz1jxHj19oiJLEvl+xOCqjPn+JWfCnjnz4JBEZbnk1SWO5jJ67VkOj+MY7WliHJbQIBcSMFHEdxEj83cQf7aLuZcTTgjyndvLOJYcqeynT/H6ilHXJJeguERD8F1OKeFG+BXc5VmVnbXYVchvJ9Gu3kVZqr+SrT/WM8rR10aZL9brqfAjozJS1fZ/MTZ75Jo8xgpqfdTpZykoqvUt0/xo+1wy7N3UKB0UoBV7DRwNuv/TVmVhzPp4btpIL7KAjZW7nu/33mjR87pDh4TiUFtAvZ92a8YuHv55yqHfxIMsD6KplpdA3RX7nuH+MP2sEPgnFi4Qk3BQxK6/uzZpvMWf5zIA2OY6JIS9nMtSHFXbL7bwijEkD49Be5G2iHLQrpjEAtRoqNXOYxPPRBaRQZZDzsr9neoXXgPvdklaDHd2q/gqD4r2CQwhgFdOVr0aYYYxE3+CXCuNTmEqYJRzxGjOWcFqjfkr/+MVZaFdBxmi6URSYF5HB1SuvO6dtaHuAg7VfhHC25naWBxDtGjAoetKhKkRjZ7h/jEu1XESS/Fw1VcCmgpeCMRU1WzjhO8rMClfTmcUoDjXeMGDPpEYDv0t1/gvbLCJYCgzXd8FPAqSwLvDnGiDGH32R5yZN9uIIvQol1jBilDBdOutLdf1kI8xXKdGad0ymgDqMFJyuT21Ze5XTytF+LAofzbzaEGOkd9rZgypXu/ts5TvulhMG5wh1MMgX0YGboTTJGjO/4cxbdfnQgt1GkEucYMVYKbc6S7v4x9VMMoXGtcOBkFgVzGMYmtWYZI0YRI+mk/XICpSnD+DjUEVbNNob6lkpkF/5ixLhN++WEyZ3CwbMfBezLePVmGSNGBZ9zixOHWmVpyw28t0cFBV0rshpxyXf/e7VfUNj82akUMFh8OGdrs7mHwzKiKlwPbuNL9XhWtzJuNoyv7/4i3CUcRNMPgbCn/dKxVYxlWERLjDRgMI+wSD2Giexd9k9bl3z3v0/7VWnhwiigj+J0VKpWwVTupp/260qZ7tzOpw4N9xPZas5OS5v/9RdFNwXkcnPc4l4u2lwudfyYaC7nM0M9TunaoylPCfruL45eCmjDJPWml77NpJf2K4vLIWmWTHHH5tA/BX2++weCTgo4h9Xqzc7Myhii/cpq5FzlRVQ728otSaYEffcPjLBTQH3+pd7gbKyCq7VfWTUujsg3fyJ7nwPi6vPdP1DCXBHozxz1pmZr5QEfcE2XIyI1lxLf1nJRjfr8zH/ghDMKyOO3bFVvZhK2WrHy7d40FKiZ5I49Ua1ig//1D4XgRwEH8IF685Kzh7Vf2C7uVY+FrC1kYBV1/tc/NIIdBfyUH9SblqRtT/DFGibNQjjLH7Zt4/bKE5r9/K9/mMingB2HaxryH/VGJW9u1I69UT0OwVgh9/OMeHLz3T8J0ilgI8/zWGSX/BLbLO2XBcCH6nGIjvnunwLSKSB409rvXuFA+ejaAVVOTG5fcRH/U3/36Zjv/ikSpRSwlgvIYbDSHrgfab8qoVsf07UvGUwOkMdtbFNvA6mZ7/5pIL0iEJRN5sBdPg9icuj//s3aL4qLQ9c8nfP2qOx3KHPV20Fy8zP/aeJ+CtjGyGq1/AbyXqg+PK79mrgnVL3T9ur8O9iHR9RbQ2Lz3d8Atz8E5jEgjt+DQtxt8Ln2S+L10LS+l/CD53zWqLeJeOYH/4a4OwoYQ4OEnvfhkVBWxzeo3y0wPwSVWxgbN93upq2j6xH+198CF1PAWi5MyfdWjAhhi6zOZek7qSd2c2L8aI9OuWpPLsOd2+jtu78lrqWA99IqIlXAEOGrUPY23UNB/QPVNpfh1EvTo0OZp95GfPcXxZ25gC2MMCojeQJjRW9FrGq66wBDA1JVxvPGV6c15En1lrLD/Le/EG6MAhZwhIWGxgxjagBe6a4DBHEMqIgR1huczqVEvb34X39B9FNAsmm/1OjGKOFtybrrAG+KalnHGAYJeaY9Jei7vzCaHwKr+LGgkrpcxESx+jm66wDFQiq2M4khaX/vJyaP/1PbJegH/wGgNQqYFEhd/mYMYZxIA9VbB2ggcJ9COR8zPLA7kg9TmRL0v/4BEX4K2MrIQG/nkUgDeusAhwt0/aCvww5/l6Dv/gES7odAIb1DUdWa6ywmrfTWAS4z9rmE6wLv+ru5kLWhtRk/+A+Y8EYB9jfIpsM4Yz/11gHuN/b59ZA9DWtK0P/6h0AYKWAlZ4as6k/GvuqtA7xj7PNdofuax4jAdwn67h8SQX8IjA9sUio+Q4y91VsH+M7Y54vs/3EDjmRBgK3GD/5DJLg6tKXcoNKh+ln4bHMxujmNLTzWut6sIU8F0moquE1JUdYyPJArvQvVmqbNsRqddYCjjP3dRoFSlAHOE68OvZ0rFfVkLZcKf9NVMJo6inrMD9bqrAMMM/b3G8UoA3TgE8F2s4wTlfVkLYeL7USLsYxTldWYrwM8oeLvaGN/X1aONORzm9BlZpMU5os8u2jCSyKv8XkH6uuOMvZeZx3A/HJ1N+4z6M5nlq1mJZepF2TxcDrfWr3GBaI7/c2J2jrAMmN/f6od6kpyuICFhho2M5qm2gI8O6jDrwxr76zgZtUJqapEax2gmYW33bRDXYVaXJz2Me21jKKVtuOePSngSr5O6zXO5CrqartdhfoW6wDh3w9wjLGvW6ilHepq9OUBFqfgeymvcZ7qVLEnId25h2lJO9JM/kwfbVdrIErrANcY+zpTO8xx6cr1/Ifp1e462s63jOcPHJ95XT9f2wFhZvFbfkszjqYXB9OJFjSkEbmsZzPfsYQipvI532u7GYciOho+Gf6g2vxfLAzd11Qpoqjyv5qzH7VowkY2sYGlbNV2zZMNROk8gPndB37PnEMEedbdky7mv41dQ18HyMQRQBbiE4BLFBk/2SDkukCtaG78rBuXmnsAnwDcoogK42e7huqp+e9/GQtC9dSTEJ8AXGIzi4yfDXcasLvxk7MpD9VTT0J8AnALm1mAMPEzABmCTwBuYT4LEO4IwCeADMEnALeIyjpAF+Mn/RSgU/gE4BbRWAdoY3EMxo8AnMInALeIxjqA+QfAJotpTk8A+ATgFtFYB7CZATBPcJ4A8AnANaKwDuCnADMGnwBcIwrrAOa7AHwCcAyfAFzD/XWAHIs1AJ8AHMMnANdwfx2gLQ2Nn/WLgI7hE4BruL8OYP6psc7ZSgxZi08AruH+OoDNFGAsFA89KeMTgHu4vg5gngD8B4Bz+ATgHuYJ4PgQpgFzOcH4WfP5DU9A+ATgHubdpD2jyAvUt3zu5QDjp/0IwDn8vSbu0Z8pFk8XM41tAXlWiz5WNxC0ZnlAnnkM8QnAPeqxISNHZiUWZcQ8AZGJDS3qbGahtguB4D8AHMQnABf5UtuBQNC5wtSTEJ8AXOQLbQcCwScAB/EJwEU+0XYgAGJM1nbBUx2fAFxkCsu0XRDniwzUlAH4BOAiFYzTdkGc17Ud8NSETwBu8py2A8JUMFbbBU9N+ATgJh9k2Mn5CczXdsFTEz4BuMrD2g6I8pC2A56a8TsBXaUO89hf2wkhZtDHFwN1k2CPjnjM2c4WTtd2QohfMFfbBY8natRmFrEMsInagfR4oskAytW7r61t5iDtMHri4z8BXOZ7mjFA2wlLRvCWtgseT1Spxafqv+E2Ns5PM3s8NrRnlXo3NrV5NNEOn8cTdQ5lg3pXNrGVdNYOnceTCZxMqXp3Ttd+oLd22DyeTOFY1ql36XRsGb20Q+bxZBJ9+U69W6dqRXTUDpfHk2k0Z4J6107FXqWRdqg8nkwkj1scnw1Ywy+0g+TxZDKdmaTezWu2CsbSWjs8Hk/mcxJT1Lv73jaBQ7XD4vFkD/0Yw1b1bh8jRhljOUI7HB5P9tGSYbzNZrWuv56XuYjG2mHwmON3akefWvTjcA6hI21pQl32CfDfWs9m1lDMfGbzCbMo1xbvseP/AYZ4ugwM9IFEAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE5LTA4LTMwVDE1OjE3OjM1KzAyOjAwW+UtHQAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxOS0wOC0zMFQxNToxNzozNSswMjowMCq4laEAAAAZdEVYdFNvZnR3YXJlAHd3dy5pbmtzY2FwZS5vcmeb7jwaAAAAAElFTkSuQmCC"
-
-b64_icons = [b64_search, b64_login, b64_lock, b64_chat, b64_phone, b64_home, b64_help, b64_down_arrow, b64_right_arrow, b64_menu, b64_plus, b64_mail, b64_settings]
+# Icon images: one PNG file per icon type in ICONS_DIR, read on first use (see get_b64_icon)
+ICONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'icons')
+
+
+@functools.lru_cache(maxsize=None)
+def get_b64_icon(icon_type):
+    """
+    :param icon_type: one of icon_types
+    :return: icon image in "data:image/png;base64,..." string format
+    """
+
+    with open(os.path.join(ICONS_DIR, icon_type + '.png'), 'rb') as file:
+        return "data:image/png;base64," + b64encode(file.read()).decode('ascii')
+
 
 text_types = ["text", "text_input", "rectangle_button", "oval_button"]
 
@@ -0,0 +1,67 @@
+import numpy as np
+
+# Text size of an element not analysed yet
+TEXT_SIZE_UNSET = np.iinfo(np.uint16).max
+
+# One row per detected element: its pixelwise box, detection class and score, then the analysis results stored
+# by the Element objects viewing the row
+ELEMENT_DTYPE = np.dtype([
+    ('ymin', np.int32),
+    ('xmin', np.int32),
+    ('ymax', np.int32),
+    ('xmax', np.int32),
+    ('class_index', np.uint8),
+    ('score', np.float16),
+    ('text_size', np.uint16)
+])
+
+
+def new_table(nb_of_rows):
+    """ :return: table of nb_of_rows elements, with empty boxes and no analysis results """
+
+    table = np.zeros(nb_of_rows, dtype=ELEMENT_DTYPE)
+    table['text_size'] = TEXT_SIZE_UNSET
+
+    return table
+
+
+def from_detections(boxes, classes, scores):
+    """
+    :param boxes: pixelwise [ymin, xmin, ymax, xmax] boxes
+    :param classes: class indices (label map ids, starting at 1)
+    :param scores: detection scores
+    :return: table of the detected elements
+    """
+
+    boxes = np.asarray(boxes).reshape(-1, 4)
+    table = new_table(boxes.shape[0])
+
+    table['ymin'], table['xmin'], table['ymax'], table['xmax'] = boxes.T
+    table['class_index'] = np.asarray(classes).reshape(-1)
+    table['score'] = np.asarray(scores).reshape(-1)
+
+    return table
+
+
+def from_box(coordinates):
+    """
+    :param coordinates: [ymin, xmin, ymax, xmax] box of an element not coming from a detection (e.g. the background)
+    :return: row (numpy.void view) of a one row table
+    """
+
+    table = new_table(1)
+    table['ymin'], table['xmin'], table['ymax'], table['xmax'] = (int(x) for x in coordinates[:4])
+
+    return table[0]
+
+
+def widths(table):
+    return table['xmax'] - table['xmin']
+
+
+def heights(table):
+    return table['ymax'] - table['ymin']
+
+
+def areas(table):
+    return widths(table).astype(np.int64) * heights(table)
@@ -7,22 +7,29 @@ from base64 import b64encode
 from abc import ABC, abstractmethod
 from PIL import Image
 from shortuuid import ShortUUID
-from constants import icon_types, b64_icons, text_types, t_firsts_tags, t_properties
-from ocr import ocr, padding
+from constants import get_b64_icon, text_types, t_firsts_tags, t_properties
+from ocr import padding
+from scaling import crop_full_resolution
+from analysis_context import AnalysisContext
 import numpy as np
 from img2svg import Rectangle, Text, Image, ButtonRectangle, Scene, Tspan
 import img2bmml
+import element_table
 
 PATH_BALSAMIQ = './'
 
 
 class Element(ABC):
+    """
+    View over one row of an element table (see element_table): the box and the analysis results stored in the table
+    are read and written through properties, other attributes are slots
+    """
+
+    __slots__ = ('row', 'xml_element', 'svg_item', 'svg_id', 'bmml_id', 'bmml_item', 'bmml_element')
 
     def __init__(self, coordinates, xml_element=None):
-        self.ymin = int(coordinates[0])
-        self.xmin = int(coordinates[1])
-        self.ymax = int(coordinates[2])
-        self.xmax = int(coordinates[3])
+        # Either a row of a table (numpy.void view), or a plain [ymin, xmin, ymax, xmax] box
+        self.row = coordinates if isinstance(coordinates, np.void) else element_table.from_box(coordinates)
 
         self.xml_element = xml_element
 
@@ -31,6 +38,43 @@ class Element(ABC):
 
         self.bmml_id = None
         self.bmml_item = None
+        self.bmml_element = None
+
+    @property
+    def ymin(self):
+        return int(self.row['ymin'])
+
+    @ymin.setter
+    def ymin(self, value):
+        self.row['ymin'] = value
+
+    @property
+    def xmin(self):
+        return int(self.row['xmin'])
+
+    @xmin.setter
+    def xmin(self, value):
+        self.row['xmin'] = value
+
+    @property
+    def ymax(self):
+        return int(self.row['ymax'])
+
+    @ymax.setter
+    def ymax(self, value):
+        self.row['ymax'] = value
+
+    @property
+    def xmax(self):
+        return int(self.row['xmax'])
+
+    @xmax.setter
+    def xmax(self, value):
+        self.row['xmax'] = value
+
+    @property
+    def score(self):
+        return float(self.row['score'])
 
     @abstractmethod
     def redact_xml(self):
@@ -56,15 +100,35 @@ class Element(ABC):
 
 class TextElement(Element):
 
+    __slots__ = ('ptype', 'text_value', 'color', 'text_dim', 'button_dim', 'ocr_input', 'ocr_box', 'ocr_context',
+                 'text_height')
+
     def __init__(self, coordinates, ptype, text_size=None, text_value=None, color=None, svg_item=None):
         super().__init__(coordinates)
         self.ptype = ptype
-        self.text_size = text_size
+        if text_size is not None:
+            self.text_size = text_size
         self.text_value = text_value
         self.color = color
         self.svg_item = svg_item
         self.text_dim = None
         self.button_dim = None
+        self.ocr_input = None
+        self.ocr_box = None
+        self.ocr_context = None
+        self.text_height = None
+
+    @property
+    def text_size(self):
+        """ Text size in pixels, in string format (None if not computed yet) """
+
+        text_size = self.row['text_size']
+
+        return None if text_size == element_table.TEXT_SIZE_UNSET else str(text_size)
+
+    @text_size.setter
+    def text_size(self, value):
+        self.row['text_size'] = int(value)
 
     def create_bmml_item(self):
 
@@ -154,29 +218,26 @@ class TextElement(Element):
             '<p:property name="strokeColor"><![CDATA[' + border_color + ']]></p:property> \n' \
             '</p:metadata> \n <text p:name="text"></text> \n </g> \n'
 
-    def compute_text_properties(self, original_image):
+    def analyse_text(self, original_image, hires_image=None, pixel_ratio=1):
         """
-        crop the element from the original image, remove its border, calculate its size according to its type, OCR
-        its value, find text color and button color
-        :param original_image: original screenshot of the web UI
-        :set: text_size in pixels and text_value in string format
+        crop the element from the original image, remove its border, estimate its text size, find text color and
+        button color. The OCR is left out: the element can then be OCRed alone (ocr.ocr_data) or with others
+        (ocr.ocr_composite), and its OCR result given to set_ocr_result
+        :set: colors, estimated text dimensions, and ocr_input, the crop to OCR (ocr_box in the original image), with
+              ocr_context, its AnalysisContext (the images derived from each crop are shared by the analysis steps)
         """
 
         cropped_text = original_image[self.ymin:self.ymax, self.xmin:self.xmax]
+        context = AnalysisContext(cropped_text)
 
         if self.ptype is "text":
-            borderless = iu.remove_image_borders(cropped_text)
-            text_height = borderless.shape[0]
-            text_width = borderless.shape[1]
+            # Only used if the OCR finds no text, the dimensions are measured on the OCR words otherwise
+            text_height, text_width = cropped_text.shape[:2]
+            self.text_dim = (0, 0, text_width, text_height)
 
-            self.color = iu.find_text_color(cropped_text)
+            self.color = iu.find_text_color(cropped_text, context)
 
-            bbox, _ = iu.detect_border(cropped_text)
-
-            if bbox:
-                self.text_dim = (bbox[0], bbox[1], bbox[2], bbox[3])
-            else:
-                self.text_dim = (self.xmin, self.ymin, text_width, text_height)
+            text_box = (self.ymin, self.ymax, self.xmin, self.xmax)
         else:
             background_bgr = iu.find_background_color(cropped_text)
             background_hex = iu.bgr2hex(background_bgr)
@@ -186,9 +247,12 @@ class TextElement(Element):
                                                                                                     (self.ymin,
                                                                                                      self.ymax,
                                                                                                      self.xmin,
-                                                                                                     self.xmax))
+                                                                                                     self.xmax),
+                                                                                                    context)
 
-            cropped_text, text_width, text_color, text_height, dim_text = iu.find_button_properties(cropped_button)
+            context, text_width, text_color, text_height, dim_text, text_crop = \
+                iu.find_button_properties(cropped_button, AnalysisContext(cropped_button))
+            cropped_text = context.image
 
             button_hex, background_hex = iu.liken_colors(button_hex, background_hex, .15)
 
@@ -202,18 +266,55 @@ class TextElement(Element):
 
             self.color = [button_color, text_color]
 
-        self.text_value = ocr(cropped_text)
+            text_box = (self.ymin + text_crop[0], self.ymin + text_crop[1],
+                        self.xmin + text_crop[2], self.xmin + text_crop[3])
 
-        nb_of_lines = iu.find_text_nb_of_lines(self.text_value)
+        # OCR runs on the full resolution crop, more pixels per character
+        if hires_image is not None:
+            cropped_text = crop_full_resolution(hires_image, pixel_ratio, *text_box)
+            context = AnalysisContext(cropped_text)
 
-        text_height = 0.75 * text_height if nb_of_lines > 1 else text_height
+        self.ocr_input = cropped_text
+        self.ocr_context = context
+        self.ocr_box = text_box
+        self.text_height = text_height
 
+    def set_ocr_result(self, result):
+        """
+        :param result: OCR result of ocr_input (see ocr.words_to_result)
+        :set: text_value, text_size in pixels (median height of the text lines) and text_dim, the (left, top, right,
+              bottom) box of the text in the element
+        """
+
+        self.text_value = result['text']
         self.button_dim = (self.xmax - self.xmin, self.ymax - self.ymax)
-        self.text_size = str(int(text_height / nb_of_lines))
+
+        # Images derived from ocr_input are not needed anymore
+        self.ocr_context = None
+
+        lines = result['lines']
+
+        if not lines:
+            # Nothing recognized: size estimated by the analysis
+            nb_of_lines = iu.find_text_nb_of_lines(self.text_value)
+            text_height = 0.75 * self.text_height if nb_of_lines > 1 else self.text_height
+            self.text_size = str(int(text_height / nb_of_lines))
+            return
+
+        # Line boxes are in pixels of ocr_input, cropped at ocr_box (full resolution crop of HiDPI screenshots)
+        ymin, ymax, xmin, xmax = self.ocr_box
+        scale = self.ocr_input.shape[0] / (ymax - ymin) if ymax > ymin else 1
+        lines = np.array(lines) / scale
+
+        self.text_size = str(int(np.median(lines[:, 3] - lines[:, 1])))
+        self.text_dim = (int(xmin - self.xmin + lines[:, 0].min()), int(ymin - self.ymin + lines[:, 1].min()),
+                         int(xmin - self.xmin + lines[:, 2].max()), int(ymin - self.ymin + lines[:, 3].max()))
 
 
 class ImageElement(Element):
 
+    __slots__ = ('image', 'b64', 'ptype')
+
     def __init__(self, coordinates, image=None, b64=None, svg_item=None):
         super().__init__(coordinates)
         self.image = image
@@ -254,17 +355,22 @@ class ImageElement(Element):
             ' </p:metadata> \n ' \
             ' </g> \n '
 
-    def extract_image(self, original_image):
+    def extract_image(self, original_image, hires_image=None, pixel_ratio=1):
         """
-        :param original_image: original screenshot of the web UI
+        :param original_image: original screenshot of the web UI (in CSS pixels)
+        :param hires_image: full resolution screenshot the image is cropped from, if different from original_image
+        :param pixel_ratio: device pixel ratio of hires_image
         :set: image element cropped from the original image
         """
 
-        cropped_image = original_image[self.ymin:self.ymax, self.xmin:self.xmax]
+        if hires_image is not None:
+            cropped_image = crop_full_resolution(hires_image, pixel_ratio, self.ymin, self.ymax, self.xmin, self.xmax)
+        else:
+            cropped_image = original_image[self.ymin:self.ymax, self.xmin:self.xmax]
 
-        borderless_image = iu.remove_image_borders(cropped_image)
+        border = iu.detect_border(cropped_image)
 
-        border, _ = iu.detect_border(cropped_image)
+        borderless_image = iu.remove_image_borders(cropped_image, border)
 
         # self.xmin = self.xmin + border[0]
         # self.ymin = self.ymin + border[1]
@@ -292,6 +398,8 @@ class ImageElement(Element):
 
 class Icon(Element):
 
+    __slots__ = ('ptype',)
+
     def __init__(self, coordinates, ptype, svg_item=None):
         super().__init__(coordinates)
         self.ptype = ptype
@@ -300,13 +408,13 @@ class Icon(Element):
     def create_svg_item(self):
 
         width, height = get_width_height(self)
-        self.svg_item = Image((self.xmin, self.ymin), b64_icons[icon_types.index(self.ptype)], self.svg_id, height, width)
+        self.svg_item = Image((self.xmin, self.ymin), get_b64_icon(self.ptype), self.svg_id, height, width)
 
     def redact_xml(self):
 
         generated_id, first_point, size = get_element_properties(self)
 
-        base64 = b64_icons[icon_types.index(self.ptype)]
+        base64 = get_b64_icon(self.ptype)
 
         self.xml_element = \
             ' <g xmlns="http://www.w3.org/2000/svg" p:type="Shape" p:def="Evolus.Common:Bitmap" id="' + generated_id + \
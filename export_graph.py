@@ -1,24 +1,158 @@
+import glob
+import json
+import os
+import time
+import cv2
+import numpy as np
 import tensorflow as tf
 from google.protobuf import text_format
 from object_detection import exporter
 from object_detection.protos import pipeline_pb2
+from tensorflow.tools.graph_transforms import TransformGraph
+
+from nms import box_iou
+from prediction import Detector, TensorFlowBackend
 
 PIPELINE_CONFIG_PATH = "training/faster_rcnn_resnet50_coco.config"
 CHECKPOINT_PATH = "training/model.ckpt-3075"
 OUTPUT_DIR = "trained_graphs/v3/ui_detection_graph_3075.pb"
 
+# Also export optimized variants of the graph, and compare them to the raw one on the held-out images
+EXPORT_OPTIMIZED_VARIANTS = True
+HELD_OUT_IMAGES_DIR = "dataset/images/test"
+
+# Input shape the optimized variants are specialized for: batches of any size (Detector.detect_batch, tiled detection)
+# of images of any size (screenshots are not resized). The raw graph is exported with the exporter default shape
+INPUT_SHAPE = [None, None, None, 3]
+
+GRAPH_INPUTS = ['image_tensor']
+GRAPH_OUTPUTS = ['detection_boxes', 'detection_scores', 'detection_classes', 'num_detections']
+
+# Graph transforms (tensorflow/tools/graph_transforms) applied by each variant
+OPTIMIZATIONS = [
+    'strip_unused_nodes(type=uint8, shape="%s")' % ','.join(str(x) if x else '-1' for x in INPUT_SHAPE),
+    'remove_nodes(op=CheckNumerics)',
+    'remove_device',
+    'fold_constants(ignore_errors=true)',
+    'fold_batch_norms',
+    'fold_old_batch_norms',
+    'sort_by_execution_order'
+]
+VARIANTS = {
+    'optimized': OPTIMIZATIONS,
+    'quantized': OPTIMIZATIONS[:-1] + ['quantize_weights(minimum_size=1024)', 'sort_by_execution_order']
+}
+
+# Two detections agree if they have the same class and overlap more than this
+AGREEMENT_IOU = .5
+
 
 def main(_):
     pipeline_config = pipeline_pb2.TrainEvalPipelineConfig()
     with tf.gfile.GFile(PIPELINE_CONFIG_PATH, 'r') as f:
         text_format.Merge(f.read(), pipeline_config)
 
+    # Production graph: input shape left to the exporter ([None, None, None, 3]), batches of any size are fed
     input_shape = None
     exporter.export_inference_graph(
         'image_tensor', pipeline_config, CHECKPOINT_PATH,
         OUTPUT_DIR, input_shape=input_shape,
         write_inference_graph=False)
 
+    if EXPORT_OPTIMIZED_VARIANTS:
+        raw_graph_path = os.path.join(OUTPUT_DIR, 'frozen_inference_graph.pb')
+        graph_paths = {'raw': raw_graph_path}
+
+        for name, transforms in VARIANTS.items():
+            graph_paths[name] = export_variant(raw_graph_path, name, transforms)
+
+        write_report(graph_paths)
+
+
+def export_variant(raw_graph_path, name, transforms):
+    """
+    :param raw_graph_path: frozen inference graph exported from the checkpoint
+    :param name: name of the variant
+    :param transforms: list of graph transforms to apply
+    :return: path of the optimized frozen graph
+    """
+
+    graph_def = tf.GraphDef()
+    with tf.gfile.GFile(raw_graph_path, 'rb') as fid:
+        graph_def.ParseFromString(fid.read())
+
+    optimized_graph_def = TransformGraph(graph_def, GRAPH_INPUTS, GRAPH_OUTPUTS, transforms)
+
+    path = os.path.join(OUTPUT_DIR, 'frozen_inference_graph_' + name + '.pb')
+    with tf.gfile.GFile(path, 'wb') as fid:
+        fid.write(optimized_graph_def.SerializeToString())
+
+    return path
+
+
+def write_report(graph_paths):
+    """
+    Compare the graphs on the held-out images: file size, CPU latency and agreement of their detections with the
+    raw graph ones. The report is printed and written in OUTPUT_DIR/export_report.json
+    :param graph_paths: dict {variant name: frozen graph path}, with the 'raw' graph
+    """
+
+    image_paths = sorted(glob.glob(os.path.join(HELD_OUT_IMAGES_DIR, '*.png')) +
+                         glob.glob(os.path.join(HELD_OUT_IMAGES_DIR, '*.jpg')))
+    images = [cv2.imread(path) for path in image_paths]
+
+    detections, report = {}, {}
+
+    for name, path in graph_paths.items():
+        detector = Detector(TensorFlowBackend(path))
+
+        # First run = kernels and allocator initialization, not measured
+        if images:
+            detector.detect(images[0])
+
+        latencies, detections[name] = [], []
+        for image in images:
+            start = time.perf_counter()
+            detections[name].append(detector.detect(image))
+            latencies.append(time.perf_counter() - start)
+
+        detector.close()
+
+        report[name] = {
+            'size_mb': os.path.getsize(path) / (1024 * 1024),
+            'median_latency_ms': float(np.median(latencies) * 1000) if latencies else None,
+            'agreement': agreement(detections['raw'], detections[name])
+        }
+
+    print("%d held-out images" % len(images))
+    print("%-10s %10s %20s %10s" % ("graph", "size (MB)", "median latency (ms)", "agreement"))
+    for name, measures in report.items():
+        print("%-10s %10.1f %20.1f %9.1f%%" % (name, measures['size_mb'], measures['median_latency_ms'] or 0,
+                                                100 * measures['agreement']))
+
+    with open(os.path.join(OUTPUT_DIR, 'export_report.json'), 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+def agreement(reference, other):
+    """
+    :param reference: list of (boxes, classes, scores) detection results
+    :param other: detection results of the same images by another graph
+    :return: fraction of the reference detections also found in the other results
+    """
+
+    found, total = 0, 0
+
+    for (ref_boxes, ref_classes, _), (boxes, classes, _) in zip(reference, other):
+        boxes = np.array(boxes).reshape(-1, 4)
+        total += len(ref_boxes)
+        for box, box_class in zip(ref_boxes, ref_classes):
+            same_class = boxes[np.array(classes) == box_class]
+            if len(same_class) and box_iou(box, same_class).max() > AGREEMENT_IOU:
+                found += 1
+
+    return found / total if total else 1.
+
 
 if __name__ == '__main__':
     tf.app.run()
@@ -1,52 +1,47 @@
+import colorsys
 import cv2
 import numpy as np
-from PIL import Image, ImageChops
-from ocr import preprocessing, resizing
-from skimage.color import rgb2lab, deltaE_cie76
-from colormap.colors import hex2rgb, rgb2hsv, hsv2rgb
+from PIL import Image
+from color_stats import top_colors, xmost_common_color, dominant_colors, SAMPLE_MAX_PIXELS
+from color_distance import delta_e, hex_to_rgb, DELTA_E_SCALE
+from analysis_context import AnalysisContext
 
-import matplotlib
-matplotlib.use('TkAgg')
+# Difference to the first pixel color (on any channel) above which a pixel is not part of the border (detect_border)
+BORDER_THRESHOLD = 100
 
 
 def get_main_color(image):
     """
-    Get most reveling color in image
+    Get most reveling color in image (large images are sampled)
     :param image:
     :return: Color Bgr Tuple
     """
-    a2D = image.reshape(-1, image.shape[-1])
-    col_range = (256, 256, 256)  # generically : a2D.max(0)+1
-    a1D = np.ravel_multi_index(a2D.T, col_range)
 
-    return np.unravel_index(np.bincount(a1D).argmax(), col_range)
+    return top_colors(image, 1, SAMPLE_MAX_PIXELS)[0]
 
 
 def differentiate_colors(c1, c2, diff):
     """
     :param c1: color in hex string format
     :param c2: same
-    :param diff: arbitrary treshold for similarity value
+    :param diff: arbitrary treshold for similarity value (see color_distance.DELTA_E_SCALE)
     :return: new c1 & c2 values, differentiated if they were too similar
     """
 
-    r1, g1, b1 = hex2rgb(c1, normalise=False)
-    lab1 = rgb2lab([[[r1, g1, b1]]])
-    r2, g2, b2 = hex2rgb(c2, normalise=False)
-    lab2 = rgb2lab([[[r2, g2, b2]]])
-    cdiff = (deltaE_cie76(lab1, lab2) * 1e5)[0][0]
+    rgb1, rgb2 = hex_to_rgb(c1), hex_to_rgb(c2)
+    cdiff = delta_e(rgb1, rgb2) * DELTA_E_SCALE
 
     if cdiff < diff:
-        h1, s1, v1 = rgb2hsv(r1, g1, b1, normalised=False)
-        h2, s2, v2 = rgb2hsv(r2, g2, b2, normalised=False)
+        h1, s1, v1 = colorsys.rgb_to_hsv(*(c / 255 for c in rgb1))
+        h2, s2, v2 = colorsys.rgb_to_hsv(*(c / 255 for c in rgb2))
 
         if v1 <= v2 < .5:
             v2 = 1.5 * v2 if 1.5 * v2 <= 1 else 1
         else:
             v2 = .75 * v2
 
-        r1, g1, b1 = hsv2rgb(h1, s1, v1, normalised=True)
-        r2, g2, b2 = hsv2rgb(h2, s2, v2, normalised=True)
+        r1, g1, b1 = colorsys.hsv_to_rgb(h1, s1, v1)
+        r2, g2, b2 = colorsys.hsv_to_rgb(h2, s2, v2)
         c1, c2 = (rgb2hex([int(r1*255), int(g1*255), int(b1*255)]), rgb2hex([int(r2*255), int(g2*255), int(b2*255)]))
 
     return c1, c2
@@ -56,17 +51,13 @@ def liken_colors(c1, c2, diff):
     """
     :param c1: color attribute of a text element (either text_color or [button_color, text_color] in hex string format
     :param c2: same
-    :param diff: arbitrary treshold for similarity value
+    :param diff: arbitrary treshold for similarity value (see color_distance.DELTA_E_SCALE)
     :return: new c1 & c2 values, both the same if they were similar enough
     """
 
     c1t, c2t = (c1[1], c2[1]) if len(c1) == 2 else (c1, c2)
 
-    r1, g1, b1 = hex2rgb(c1t, normalise=False)
-    lab1 = rgb2lab([[[r1, g1, b1]]])
-    r2, g2, b2 = hex2rgb(c2t, normalise=False)
-    lab2 = rgb2lab([[[r2, g2, b2]]])
-    cdiff = (deltaE_cie76(lab1, lab2) * 1e5)[0][0]
+    cdiff = delta_e(hex_to_rgb(c1t), hex_to_rgb(c2t)) * DELTA_E_SCALE
 
     if cdiff < diff:
         c2t = c1t
@@ -77,47 +68,57 @@ def liken_colors(c1, c2, diff):
 
 
 def similar_colors(c1, c2, diff):
+    """
+    :param c1: bgr color, or array of bgr colors (each compared to c2)
+    :param c2: bgr color
+    :param diff: arbitrary treshold for similarity value (see color_distance.DELTA_E_SCALE)
+    :return: True if the colors are similar (boolean array for an array of colors)
+    """
 
-    lab1 = rgb2lab([[[c1[2], c1[1], c1[0]]]])
-    lab2 = rgb2lab([[[c2[2], c2[1], c2[0]]]])
-    cdiff = (deltaE_cie76(lab1, lab2) * 1e5)[0][0]
+    cdiff = delta_e(np.asarray(c1)[..., ::-1], np.asarray(c2)[..., ::-1]) * DELTA_E_SCALE
 
-    if cdiff < diff:
-        return True
-    else:
-        return False
+    return cdiff < diff
 
 
 def detect_border(image):
     """
-     find if an image has border (from approximate object detections result) by looking at first pixel color
-    :param image:
-    :return: box border, array Image
+     find if an image has border (from approximate object detections result) by looking at first pixel color: pixels
+     differing from it by more than BORDER_THRESHOLD on a channel are content (what PIL difference / add(diff, diff, 2,
+     -100) / getbbox used to compute), the rest is border. Works on the image (or view) as is
+    :param image: BGR image
+    :return: (left, upper, right, lower) box of the content, None if there is none
     """
 
-    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    pil_image = Image.fromarray(rgb_image)
-    bg = Image.new(pil_image.mode, pil_image.size, pil_image.getpixel((0, 0)))
-    diff = ImageChops.difference(pil_image, bg)
-    diff = ImageChops.add(diff, diff, 2.0, -100)
-    return diff.getbbox(), pil_image
+    first_pixel = np.atleast_1d(image[0, 0]).astype(int)
+    lower = np.clip(first_pixel - BORDER_THRESHOLD, 0, 255).tolist()
+    upper = np.clip(first_pixel + BORDER_THRESHOLD, 0, 255).tolist()
 
+    # Non zero where a channel is out of the first pixel range
+    content = cv2.bitwise_not(cv2.inRange(image, tuple(lower), tuple(upper)))
 
-def remove_image_borders(image):
+    left, top, width, height = cv2.boundingRect(content)
+    if not width:
+        return None
+
+    return left, top, left + width, top + height
+
+
+def remove_image_borders(image, bbox=None):
     """
     Remove image border
     :param image: any
-    :return: same image without borders (if it had any)
+    :param bbox: box returned by detect_border for this image, if already known
+    :return: same image without borders (if it had any), as a view of image
     """
 
-    bbox, pil_image = detect_border(image)
+    if bbox is None:
+        bbox = detect_border(image)
 
     if bbox:
-        pil_image = pil_image.crop(bbox)
-
-    cv2_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+        left, upper, right, lower = bbox
+        image = image[upper:lower, left:right]
 
-    return cv2_image
+    return image
 
 
 def find_text_nb_of_lines(text):
@@ -131,43 +132,46 @@ def find_text_nb_of_lines(text):
     return nb_of_lines
 
 
-def find_text_color(cropped_text):
+def find_text_color(cropped_text, context=None):
     """
     find second most present color in the image = text color ?
     :param cropped_text: numpy image of a text element already cropped
+    :param context: AnalysisContext of cropped_text, if the caller has one
     :return: text color in hex string format
     """
 
-    binary = preprocessing(cropped_text)
-    black_pixels = np.argwhere(binary == 0)
-    pixels = []
+    if context is None:
+        context = AnalysisContext(cropped_text)
+
+    black_pixels = cropped_text[context.binary == 0]
 
     if len(black_pixels) > 1:
-        for pixel in black_pixels:
-            pixels.append(cropped_text[pixel[0]][pixel[1]])
-        b, g, r = get_xmost_occuring_color(pixels, 1)
+        b, g, r = get_xmost_occuring_color(black_pixels, 1)
 
     elif black_pixels.size == 0:
-        b, g, r = get_xmost_occuring_color(cropped_text, 2)
+        b, g, r = context.xmost_common_color(2)
 
     else:
-        b, g, r = cropped_text[black_pixels[0][0]][black_pixels[0][1]]
+        b, g, r = black_pixels[0]
 
     bgr = [b, g, r]
 
     return bgr2hex(bgr)
 
 
-def find_text_position(text_image):
+def find_text_position(text_image, context=None):
     """
     :param text_image: any BGR image of text (aligned = not rotated)
+    :param context: AnalysisContext of text_image, if the caller has one
     :return: upper, lower tuple : y axis value of start of first text line and bottom of last
     """
 
+    if context is None:
+        context = AnalysisContext(text_image)
+
     h, w = text_image.shape[:2]
-    binary = 255 - preprocessing(text_image)
 
-    hist = cv2.reduce(binary, 1, cv2.REDUCE_AVG).reshape(-1)
+    hist = context.row_histogram
 
     count = np.bincount(hist)
     th = np.argmax(count)
@@ -199,7 +203,7 @@ def find_text_position(text_image):
         ymin = limits[0]
         ymax = limits[1]
 
-    hist = cv2.reduce(binary, 0, cv2.REDUCE_AVG).reshape(-1)
+    hist = context.column_histogram
 
     count = np.bincount(hist)
 
@@ -207,7 +211,7 @@ def find_text_position(text_image):
     lefters = [x for x in range(len(hist) - 1) if hist[x] <= th < hist[x + 1]]
     righters = [x for x in range(len(hist) - 1) if hist[x] > th >= hist[x + 1]]
 
-    have_border, _ = detect_border(text_image)
+    have_border = detect_border(text_image)
 
     if have_border and lefters and righters:
         xmin = lefters[1] if 1 in lefters else lefters[0]
@@ -219,15 +223,17 @@ def find_text_position(text_image):
     return ymin, ymax, xmin, xmax
 
 
-def find_button_properties(button_image):
+def find_button_properties(button_image, context=None):
     """
     Get Coord of text in button, main color and border color
     :param button_image:
-    :return: Information on button
+    :param context: AnalysisContext of button_image, if the caller has one
+    :return: AnalysisContext of the text crop (its image attribute), information on button, and the (ymin, ymax, xmin,
+             xmax) box of the text crop in the button image
     """
 
     height, width = button_image.shape[:2]
-    ymin, ymax, xmin, xmax = find_text_position(button_image)
+    ymin, ymax, xmin, xmax = find_text_position(button_image, context)
     text_height = 1.1 * (ymax - ymin)
     text_width = 1.1 * (xmax - xmin)
 
@@ -239,84 +245,53 @@ def find_button_properties(button_image):
     xmin = x
     xmax = width - x
 
-    button_image = button_image[ymin:ymax, xmin:xmax]
+    text_context = AnalysisContext(button_image[ymin:ymax, xmin:xmax])
 
-    text_color = find_text_color(button_image)
+    text_color = find_text_color(text_context.image, text_context)
 
-    return button_image, text_width, text_color, text_height, lst_dim_text
+    return text_context, text_width, text_color, text_height, lst_dim_text, (ymin, ymax, xmin, xmax)
 
 
-def crop_button(button_image, background_color, coords):
+def crop_button(button_image, background_color, coords, context=None):
+    """
+    Crop a button to its body: the outer rows / columns are removed up to the first one, after a change in the amount of
+    text pixels, whose dominant color is the button color
+    :param button_image: BGR image of the button (approximate detection box)
+    :param background_color: BGR color of the screenshot background
+    :param coords: ymin, ymax, xmin, xmax of the button image in the screenshot
+    :param context: AnalysisContext of button_image, if the caller has one
+    :return: cropped image, button color in hex string format, and the cropped coords in the screenshot
+    """
 
-    class Break(Exception):
-        pass
+    if context is None:
+        context = AnalysisContext(button_image)
 
-    button_color = get_xmost_occuring_color(button_image, 1)
+    button_color = context.xmost_common_color(1)
 
     if similar_colors(button_color, background_color, .2):
-        button_color = get_xmost_occuring_color(button_image, 2)
+        button_color = context.xmost_common_color(2)
 
     h, w = button_image.shape[:2]
-    binary = 255 - preprocessing(button_image)
 
-    yhist = cv2.reduce(binary, 1, cv2.REDUCE_AVG).reshape(-1)
-    xhist = cv2.reduce(binary, 0, cv2.REDUCE_AVG).reshape(-1)
+    yhist = context.row_histogram
+    xhist = context.column_histogram
 
     th = 15
 
-    ylimits = [y for y in range(len(yhist) - 1) if ((yhist[y] < yhist[y + 1] - th) | (yhist[y] > yhist[y + 1] + th))]
-
-    xlimits = [x for x in range(len(xhist) - 1) if ((xhist[x] < xhist[x + 1] - th) | (xhist[x] > xhist[x + 1] + th))]
+    # uint8 arithmetic (wrapping around) like the former scalar comparisons
+    ylimits = np.flatnonzero((yhist[:-1] < yhist[1:] - th) | (yhist[:-1] > yhist[1:] + th))
+    xlimits = np.flatnonzero((xhist[:-1] < xhist[1:] - th) | (xhist[:-1] > xhist[1:] + th))
 
     th = .3
 
-    try:
-        ymin = 0
-        if similar_colors(get_xmost_occuring_color(button_image[:1, :], 1), button_color, th):
-            raise Break
-        for y in ylimits:
-            if similar_colors(get_xmost_occuring_color(button_image[y + 1:y + 2, :], 1), button_color, th):
-                ymin = y + 1
-                raise Break
-    except Break:
-        pass
-
-    ylimits.reverse()
-
-    try:
-        ymax = h
-        if similar_colors(get_xmost_occuring_color(button_image[-2:-1, :], 1), button_color, th):
-            raise Break
-        for y in ylimits:
-            if similar_colors(get_xmost_occuring_color(button_image[y - 2:y - 1, :], 1), button_color, th):
-                ymax = y
-                raise Break
-    except Break:
-        pass
-
-    try:
-        xmin = 0
-        if similar_colors(get_xmost_occuring_color(button_image[:, :1], 1), button_color, th):
-            raise Break
-        for x in xlimits:
-            if similar_colors(get_xmost_occuring_color(button_image[:, x + 1:x + 2], 1), button_color, th):
-                xmin = x + 1
-                raise Break
-    except Break:
-        pass
-
-    xlimits.reverse()
-
-    try:
-        xmax = w
-        if similar_colors(get_xmost_occuring_color(button_image[:, -2:-1], 1), button_color, th):
-            raise Break
-        for x in xlimits:
-            if similar_colors(get_xmost_occuring_color(button_image[:, x - 2:x - 1], 1), button_color, th):
-                xmax = x
-                raise Break
-    except Break:
-        pass
+    # Whether the dominant color of each row / column is the button color
+    similar_rows = similar_colors(dominant_colors(button_image, 1), button_color, th)
+    similar_columns = similar_colors(dominant_colors(button_image, 0), button_color, th)
+
+    ymin = find_start(similar_rows, ylimits)
+    ymax = find_end(similar_rows, ylimits)
+    xmin = find_start(similar_columns, xlimits)
+    xmax = find_end(similar_columns, xlimits)
 
     cropped = button_image[ymin:ymax, xmin:xmax]
 
@@ -330,6 +305,43 @@ def crop_button(button_image, background_color, coords):
     return cropped, bgr2hex(button_color), abs_ymin, abs_ymax, abs_xmin, abs_xmax
 
 
+def find_start(similar, limits):
+    """
+    Start edge of a button: 0 if its first line has the button color, else the line after the first limit that has it
+    :param similar: boolean array, whether each row (or column) of the button has the button color
+    :param limits: sorted indices of the lines followed by a change in the amount of text pixels
+    :return: start edge (0 if none)
+    """
+
+    if similar[0]:
+        return 0
+
+    hits = limits[similar[limits + 1]]
+
+    return int(hits[0]) + 1 if len(hits) else 0
+
+
+def find_end(similar, limits):
+    """
+    End edge of a button: its size if its second to last line has the button color, else the last limit whose line two
+    before has it (the line before last for limit 0, none for limit 1, as slices [limit - 2:limit - 1] did)
+    :param similar: boolean array, whether each row (or column) of the button has the button color
+    :param limits: sorted indices of the lines followed by a change in the amount of text pixels
+    :return: end edge (the size of the button if none)
+    """
+
+    size = len(similar)
+
+    if size >= 2 and similar[size - 2]:
+        return size
+
+    limits = limits[::-1]
+    lines = np.where(limits >= 2, limits - 2, np.where(limits == 0, size - 2, -1))
+    hits = limits[(lines >= 0) & similar[lines]]
+
+    return int(hits[0]) if len(hits) else size
+
+
 def find_background_color(image):
     """
     Return background color
@@ -344,30 +356,10 @@ def find_background_color(image):
 def get_xmost_occuring_color(image, x):
     """
     :param image : image (np.array or list of pixels)
-    :return: xmost occurring color in image (in bgr)
+    :return: xmost occurring color in image (in bgr), the most occurring one if there are less than x colors
     """
 
-    if isinstance(image, list):
-        image = np.array(image)
-        pairs, counts = np.unique(image, axis=0, return_counts=True)
-        count_sort_index = np.argsort(-counts)
-        if len(pairs) >= x-1:
-            bgr = pairs[count_sort_index[x-1]]
-        else:
-            bgr = pairs[count_sort_index[0]]
-    else:
-        height, width = image.shape[:2]
-        image = Image.fromarray(image)
-        image = image.resize((width, height), resample=0)
-        pixels = image.getcolors(width * height)
-        sorted_pixels = sorted(pixels, key=lambda t: t[0])
-
-        if len(sorted_pixels) >= x:
-            bgr = sorted_pixels[-x][1]
-        else:
-            bgr = sorted_pixels[-1][1]
-
-    return bgr
+    return xmost_common_color(image, x)
 
 
 def bgr2hex(bgr):
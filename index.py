@@ -1,9 +1,19 @@
 import os
-from flask import Flask, flash, request, redirect, url_for, send_from_directory
+import time
+from thread_budget import apply_thread_budget
+
+# Threads of TensorFlow, OpenCV and Tesseract for this worker, before any of them starts
+apply_thread_budget()
+
+from flask import Flask, flash, request, redirect, url_for, send_from_directory, jsonify, g
 from werkzeug.utils import secure_filename
 from mockup import Mockup
 import cv2
-from prediction import detection
+from prediction import get_detector
+from ocr import get_ocr_cache, parse_ocr_profile
+from analysis_context import analysis_stats
+from scaling import detect_device_pixel_ratio, normalize_scale
+from warmup import warm_up
 
 # Manage Folder
 UPLOAD_FOLDER = './uploads/'
@@ -11,6 +21,9 @@ RESULT_FOLDER = './results_prediction/'
 
 ALLOWED_EXTENSIONS = {'pdf', 'png', 'jpg', 'jpeg'}
 
+# Seconds a conversion may take: text elements not OCRed by then are exported as images (X-Degraded-Elements header)
+REQUEST_TIME_BUDGET = float(os.environ.get('UI_DETECTOR_REQUEST_TIME_BUDGET', 60))
+
 # Init Flask
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
@@ -27,6 +40,26 @@ try:
 except FileExistsError:
     pass
 
+# Warm-up state of this worker, reported by /ready
+worker_state = {'ready': False, 'warmup_seconds': None, 'error': None}
+
+
+def warm_up_worker():
+    """
+    Load the detection graph (once per worker, it is then reused by every request) and run a synthetic request
+    through the whole pipeline
+    """
+
+    try:
+        worker_state['warmup_seconds'] = warm_up(get_detector())
+        worker_state['ready'] = True
+    except Exception as e:
+        worker_state['error'] = repr(e)
+
+
+# Done before the app is handed to uwsgi (lazy-apps): a worker only accepts requests once it is warm
+warm_up_worker()
+
 
 def allowed_file(filename):
     """
@@ -67,18 +100,23 @@ def upload_file():
             file.save(path_to_file)
 
             select = request.form.get("export_type")
+            pixel_ratio = request.form.get("pixel_ratio")
+            ocr_profile = parse_ocr_profile(request.form.get("ocr_language"), request.form.get("ocr_psm"))
 
             if select == "Svg":
-                new_filename = start_prediction_to_svg(path_to_file, filename)
+                new_filename = start_prediction_to_svg(path_to_file, filename, pixel_ratio, ocr_profile)
             elif select == "Balsamiq":
-                new_filename = start_prediction_to_balsamiq(path_to_file, filename)
+                new_filename = start_prediction_to_balsamiq(path_to_file, filename, pixel_ratio, ocr_profile)
             elif select == "Pencil":
-                new_filename = start_prediction_to_pencil(path_to_file, filename)
+                new_filename = start_prediction_to_pencil(path_to_file, filename, pixel_ratio, ocr_profile)
             else:
-                new_filename = start_prediction_to_svg(path_to_file, filename)
+                new_filename = start_prediction_to_svg(path_to_file, filename, pixel_ratio, ocr_profile)
+
+            response = redirect(url_for('send_file',
+                                        filename=new_filename))
+            response.headers['X-Degraded-Elements'] = str(g.get('degraded_elements', 0))
 
-            return redirect(url_for('send_file',
-                                    filename=new_filename))
+            return response
     return '''
 
 <!doctype html>
@@ -114,6 +152,26 @@ def upload_file():
                                 <option value="Balsamiq">Balsamiq</option>
                                 <option value="Svg">Svg (Adobe XD)</option>
                             </select>
+                            <select name="pixel_ratio">
+                                <option value="">Densité de pixels (auto)</option>
+                                <option value="1">1x</option>
+                                <option value="1.5">1.5x</option>
+                                <option value="2">2x (Retina)</option>
+                                <option value="3">3x</option>
+                            </select>
+                            <select name="ocr_language">
+                                <option value="">Langue du texte (auto)</option>
+                                <option value="fra">Français</option>
+                                <option value="eng">Anglais</option>
+                                <option value="eng+fra">Français et anglais</option>
+                            </select>
+                            <select name="ocr_psm">
+                                <option value="">Segmentation OCR (selon l'élément)</option>
+                                <option value="3">Page</option>
+                                <option value="6">Bloc</option>
+                                <option value="7">Ligne</option>
+                                <option value="8">Mot</option>
+                            </select>
                             <button type="submit" value=Upload class="btn btn-primary">Conversion</button>
                         </form>
                       </div>
@@ -142,67 +200,108 @@ def send_file(filename):
     return send_from_directory(app.config['RESULT_FOLDER'], filename, as_attachment=True)
 
 
-def start_prediction_to_svg(path_image, filename):
+@app.route('/ready')
+def ready():
     """
-    Launch prediction to convert screenshots to SVG
+    Readiness of this worker: 200 once its warm-up is done, 503 before (or if it failed)
+    :return: Json response
+    """
+
+    status = 200 if worker_state['ready'] else 503
+
+    return jsonify(worker_state), status
+
+
+@app.route('/stats')
+def stats():
+    """
+    Hit/miss counters of the detection and OCR results caches of this worker, and the images derived from element crops
+    computed / reused by their analysis (see analysis_context)
+    :return: Json response
+    """
+
+    ocr_cache = get_ocr_cache()
+
+    return jsonify(detection_cache=get_detector().cache.stats() if get_detector().cache else None,
+                   ocr_cache=ocr_cache.stats() if ocr_cache else None,
+                   analysis_context=analysis_stats())
+
+
+def build_mockup(path_image, filename, pixel_ratio=None, ocr_profile=None):
+    """
+    Detect and analyse the elements of a screenshot. Analysis runs in CSS pixels (HiDPI screenshots are scaled down),
+    only image elements and OCR inputs are cropped from the full resolution screenshot
     :param path_image:
     :param filename:
-    :return:
+    :param pixel_ratio: declared device pixel ratio of the screenshot (guessed if None)
+    :param ocr_profile: OCR language and page segmentation mode forced by the request (see ocr.parse_ocr_profile)
+    :return: Mockup with its elements translated and aligned
     """
 
-    image = cv2.imread(path_image)
+    deadline = time.monotonic() + REQUEST_TIME_BUDGET
+
+    hires_image = cv2.imread(path_image)
+    pixel_ratio = detect_device_pixel_ratio(path_image, pixel_ratio)
+    image = normalize_scale(hires_image, pixel_ratio)
+
     original_image = image.copy()
-    detection_results = detection(image)
+    detection_results = get_detector().detect(image)
 
     filename = filename.split('.')[0]
 
-    mockup = Mockup(filename, original_image, detection_results)
-    mockup.translate_raw_results()
+    mockup = Mockup(filename, original_image, detection_results, hires_image=hires_image, pixel_ratio=pixel_ratio)
+    mockup.translate_raw_results(ocr_profile=ocr_profile, deadline=deadline)
     mockup.align_text_elements()
-    filename = mockup.create_svg(app.config['RESULT_FOLDER'])
 
-    return filename
+    # Reported to the client by upload_file
+    g.degraded_elements = mockup.degraded_elements
 
+    return mockup
 
-def start_prediction_to_balsamiq(path_image, filename):
+
+def start_prediction_to_svg(path_image, filename, pixel_ratio=None, ocr_profile=None):
     """
     Launch prediction to convert screenshots to SVG
     :param path_image:
     :param filename:
+    :param pixel_ratio: declared device pixel ratio of the screenshot (guessed if None)
+    :param ocr_profile: OCR language and page segmentation mode forced by the request
     :return:
     """
 
-    image = cv2.imread(path_image)
-    original_image = image.copy()
-    detection_results = detection(image)
+    mockup = build_mockup(path_image, filename, pixel_ratio, ocr_profile)
+    filename = mockup.create_svg(app.config['RESULT_FOLDER'])
 
-    filename = filename.split('.')[0]
+    return filename
 
-    mockup = Mockup(filename, original_image, detection_results)
-    mockup.translate_raw_results()
-    mockup.align_text_elements()
+
+def start_prediction_to_balsamiq(path_image, filename, pixel_ratio=None, ocr_profile=None):
+    """
+    Launch prediction to convert screenshots to SVG
+    :param path_image:
+    :param filename:
+    :param pixel_ratio: declared device pixel ratio of the screenshot (guessed if None)
+    :param ocr_profile: OCR language and page segmentation mode forced by the request
+    :return:
+    """
+
+    mockup = build_mockup(path_image, filename, pixel_ratio, ocr_profile)
     filename = mockup.create_bmml(app.config['RESULT_FOLDER'])
 
     return filename
 
 
-def start_prediction_to_pencil(path_image, filename):
+def start_prediction_to_pencil(path_image, filename, pixel_ratio=None, ocr_profile=None):
     """
     Launch prediction to convert screenshots to SVG
     :param path_image:
     :param filename:
+    :param pixel_ratio: declared device pixel ratio of the screenshot (guessed if None)
+    :param ocr_profile: OCR language and page segmentation mode forced by the request
     :return:
     """
 
-    image = cv2.imread(path_image)
-    original_image = image.copy()
-    detection_results = detection(image)
-
-    filename = filename.split('.')[0]
-
-    mockup = Mockup(filename, original_image, detection_results)
-    mockup.translate_raw_results()
-    mockup.align_text_elements()
+    mockup = build_mockup(path_image, filename, pixel_ratio, ocr_profile)
     mockup.create_xml_page()
     filename = mockup.generate_pencil_file(app.config['RESULT_FOLDER'])
 
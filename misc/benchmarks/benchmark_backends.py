@@ -0,0 +1,95 @@
+"""
+Latency, memory (max RSS) and box parity of the detector backends (prediction.BACKENDS)
+Each backend runs in its own process so that their imports and memory do not add up
+Run from the repository root: python misc/benchmarks/benchmark_backends.py [images directory]
+"""
+
+import glob
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from nms import box_iou
+
+IMAGES_DIR = os.path.join('dataset', 'images', 'test')
+BACKENDS = ['tensorflow', 'opencv']
+
+# Two boxes are the same detection if they have the same class and overlap more than this
+PARITY_IOU = .5
+
+
+def run_backend(backend_name, paths, queue):
+    """ Load the backend, detect every image and send back the timings, max RSS and detections """
+
+    import cv2
+    import prediction
+
+    start = time.perf_counter()
+    detector = prediction.Detector(prediction.BACKENDS[backend_name]())
+    load_time = time.perf_counter() - start
+
+    images = [cv2.imread(path) for path in paths]
+    detector.detect(images[0])
+
+    latencies, results = [], []
+    for image in images:
+        start = time.perf_counter()
+        boxes, classes, scores = detector.detect(image)
+        latencies.append(time.perf_counter() - start)
+        results.append((np.array(boxes).reshape(-1, 4), np.array(classes)))
+
+    # ru_maxrss is in kilobytes on Linux
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    queue.put((load_time, latencies, max_rss, results))
+
+
+def agreement(reference, other):
+    """ Fraction of the reference detections found (same class, iou > PARITY_IOU) in the other detections """
+
+    found, total = 0, 0
+
+    for (ref_boxes, ref_classes), (boxes, classes) in zip(reference, other):
+        total += len(ref_boxes)
+        for box, box_class in zip(ref_boxes, ref_classes):
+            same_class = boxes[classes == box_class]
+            if len(same_class) and box_iou(box, same_class).max() > PARITY_IOU:
+                found += 1
+
+    return found / total if total else 1.
+
+
+def main(images_dir):
+    paths = sorted(glob.glob(os.path.join(images_dir, '*.png')) + glob.glob(os.path.join(images_dir, '*.jpg')))
+
+    if not paths:
+        print("no image found in " + images_dir)
+        return
+
+    measures = {}
+    for backend_name in BACKENDS:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=run_backend, args=(backend_name, paths, queue))
+        process.start()
+        measures[backend_name] = queue.get()
+        process.join()
+
+    print("%d images" % len(paths))
+    print("%-12s %10s %12s %12s %12s %10s" % ("backend", "load (s)", "median (ms)", "p90 (ms)", "max RSS (MB)",
+                                              "parity"))
+
+    reference = measures[BACKENDS[0]][3]
+    for backend_name, (load_time, latencies, max_rss, results) in measures.items():
+        print("%-12s %10.2f %12.1f %12.1f %12.0f %9.1f%%" % (backend_name, load_time,
+                                                              np.median(latencies) * 1000,
+                                                              np.percentile(latencies, 90) * 1000, max_rss,
+                                                              100 * agreement(reference, results)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else IMAGES_DIR)
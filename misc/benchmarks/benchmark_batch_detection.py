@@ -0,0 +1,56 @@
+"""
+Throughput of Detector.detect_batch against one Detector.detect call per image
+Run from the repository root: python misc/benchmarks/benchmark_batch_detection.py [images directory]
+"""
+
+import glob
+import os
+import sys
+import time
+import cv2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from prediction import Detector
+
+IMAGES_DIR = os.path.join('dataset', 'images', 'test')
+BATCH_SIZES = [1, 2, 4, 8]
+
+
+def timed(function):
+    """ Run function, return its wall time and the CPU time it used (all cores together) """
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    function()
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def report(name, nb_of_images, wall_time, cpu_time):
+    print("%-20s %8.2f img/s %10.2f img/cpu.s" % (name, nb_of_images / wall_time, nb_of_images / cpu_time))
+
+
+def main(images_dir):
+    paths = sorted(glob.glob(os.path.join(images_dir, '*.png')) + glob.glob(os.path.join(images_dir, '*.jpg')))
+    images = [cv2.imread(path) for path in paths]
+
+    if not images:
+        print("no image found in " + images_dir)
+        return
+
+    detector = Detector()
+
+    # First run = kernels and allocator initialization, not measured
+    detector.detect(images[0])
+
+    print("%d images, %d cores" % (len(images), os.cpu_count()))
+
+    wall_time, cpu_time = timed(lambda: [detector.detect(image) for image in images])
+    report("single image", len(images), wall_time, cpu_time)
+
+    for batch_size in BATCH_SIZES:
+        wall_time, cpu_time = timed(lambda: detector.detect_batch(images, batch_size))
+        report("batch of %d" % batch_size, len(images), wall_time, cpu_time)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else IMAGES_DIR)
@@ -0,0 +1,89 @@
+"""
+Latency of the NumPy border detection of image_utils (detect_border / remove_image_borders) against the former PIL
+implementation, kept below as reference, on crops of screenshots and on random images around the threshold. Boxes and
+borderless images have to be identical
+Run from the repository root: python misc/benchmarks/benchmark_borders.py [screenshots directory]
+"""
+
+import os
+import sys
+import time
+import cv2
+import numpy as np
+from PIL import Image, ImageChops
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import image_utils
+from benchmark_color_stats import load_crops
+
+NB_OF_RANDOM_IMAGES = 300
+REPEATS = 3
+
+
+def reference_detect_border(image):
+    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    pil_image = Image.fromarray(rgb_image)
+    bg = Image.new(pil_image.mode, pil_image.size, pil_image.getpixel((0, 0)))
+    diff = ImageChops.difference(pil_image, bg)
+    diff = ImageChops.add(diff, diff, 2.0, -100)
+    return diff.getbbox(), pil_image
+
+
+def reference_remove_image_borders(image):
+    bbox, pil_image = reference_detect_border(image)
+
+    if bbox:
+        pil_image = pil_image.crop(bbox)
+
+    return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+
+
+def random_images(random):
+    """ Uniform frame around a block of colors drawn close to the frame color +/- the threshold """
+
+    images = []
+    for _ in range(NB_OF_RANDOM_IMAGES):
+        height, width = random.randint(1, 80), random.randint(1, 200)
+        frame = random.randint(0, 256, 3)
+        image = np.tile(frame, (height, width, 1))
+        top, left = random.randint(height), random.randint(width)
+        bottom, right = random.randint(top, height) + 1, random.randint(left, width) + 1
+        offsets = random.randint(-image_utils.BORDER_THRESHOLD - 2, image_utils.BORDER_THRESHOLD + 3,
+                                 (bottom - top, right - left, 3))
+        image[top:bottom, left:right] += offsets
+        images.append(np.clip(image, 0, 255).astype(np.uint8))
+
+    return images
+
+
+def measure(function, images):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        results = [function(image) for image in images]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main():
+    crops, _ = load_crops()
+    images = crops + random_images(np.random.RandomState(0))
+
+    print("%d images" % len(images))
+    print("%-22s %12s %12s %9s %10s" % ("function", "before (ms)", "after (ms)", "speedup", "different"))
+
+    for name, reference, new, same in [
+            ("detect_border", lambda image: reference_detect_border(image)[0], image_utils.detect_border,
+             lambda r, n: r == n),
+            ("remove_image_borders", reference_remove_image_borders, image_utils.remove_image_borders,
+             np.array_equal)]:
+        reference_time, reference_results = measure(reference, images)
+        new_time, new_results = measure(new, images)
+        different = sum(not same(r, n) for r, n in zip(reference_results, new_results))
+        print("%-22s %12.1f %12.1f %8.1fx %10d" % (name, 1000 * reference_time, 1000 * new_time,
+                                                    reference_time / new_time, different))
+
+
+if __name__ == '__main__':
+    main()
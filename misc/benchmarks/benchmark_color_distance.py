@@ -0,0 +1,68 @@
+"""
+Latency and accuracy of the table based color differences (color_distance) against skimage rgb2lab / deltaE_cie76,
+one comparison at a time (similar_colors) and batched by button (the dominant colors of its rows against its color)
+Run from the repository root: python misc/benchmarks/benchmark_color_distance.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+from skimage.color import rgb2lab, deltaE_cie76
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import color_distance
+
+NB_OF_PAIRS = 2000
+NB_OF_BATCHES = 1000
+BATCH_SIZE = 200
+
+
+def skimage_delta_e(rgb1, rgb2):
+    lab1 = rgb2lab(np.asarray(rgb1, dtype=np.uint8)[None, None])
+    lab2 = rgb2lab(np.asarray(rgb2, dtype=np.uint8)[None, None])
+    return deltaE_cie76(lab1, lab2)[0][0]
+
+
+def main():
+    random = np.random.RandomState(0)
+    pairs = random.randint(0, 256, (NB_OF_PAIRS, 2, 3))
+
+    start = time.perf_counter()
+    color_distance.get_lab_lut()
+    print("table loaded in %.1f ms" % (1000 * (time.perf_counter() - start)))
+
+    start = time.perf_counter()
+    reference = [skimage_delta_e(rgb1, rgb2) for rgb1, rgb2 in pairs]
+    skimage_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [color_distance.delta_e(rgb1, rgb2) for rgb1, rgb2 in pairs]
+    table_time = time.perf_counter() - start
+
+    print("%-24s %14s" % ("one pair per call", "time (us)"))
+    print("%-24s %14.1f" % ("skimage", 1e6 * skimage_time / NB_OF_PAIRS))
+    print("%-24s %14.1f" % ("table", 1e6 * table_time / NB_OF_PAIRS))
+    print("max deltaE error: %.3f" % np.max(np.abs(np.array(results) - reference)))
+
+    batches = random.randint(0, 256, (NB_OF_BATCHES, BATCH_SIZE, 3)).astype(np.uint8)
+    colors = random.randint(0, 256, (NB_OF_BATCHES, 3)).astype(np.uint8)
+
+    start = time.perf_counter()
+    for batch, color in zip(batches, colors):
+        deltaE_cie76(rgb2lab(batch[None]), rgb2lab(color[None, None]))
+    skimage_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for batch, color in zip(batches, colors):
+        color_distance.delta_e(batch, color)
+    table_time = time.perf_counter() - start
+
+    print("%-24s %14s" % ("%d colors per call" % BATCH_SIZE, "time (us)"))
+    print("%-24s %14.1f" % ("skimage", 1e6 * skimage_time / NB_OF_BATCHES))
+    print("%-24s %14.1f" % ("table", 1e6 * table_time / NB_OF_BATCHES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Latency of the color statistics of image_utils (color_stats module) against their former PIL / Python / bincount
+implementations, kept below as references, on crops of screenshots. Results have to be the same, except the order of
+equally common colors (color_stats breaks ties in (b, g, r) order, PIL getcolors in hash order)
+Run from the repository root: python misc/benchmarks/benchmark_color_stats.py [screenshots directory]
+"""
+
+import glob
+import os
+import sys
+import time
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import image_utils
+from ocr import preprocessing
+from warmup import synthetic_screenshot
+
+SCREENSHOTS_DIR = os.path.join('dataset', 'images', 'test')
+NB_OF_CROPS = 300
+REPEATS = 3
+
+
+def reference_xmost_occuring_color(image, x):
+
+    if isinstance(image, list):
+        image = np.array(image)
+        pairs, counts = np.unique(image, axis=0, return_counts=True)
+        count_sort_index = np.argsort(-counts, kind='stable')
+        bgr = pairs[count_sort_index[x - 1]] if len(pairs) >= x else pairs[count_sort_index[0]]
+    else:
+        height, width = image.shape[:2]
+        image = Image.fromarray(image)
+        image = image.resize((width, height), resample=0)
+        pixels = image.getcolors(width * height)
+        sorted_pixels = sorted(pixels, key=lambda t: t[0])
+        bgr = sorted_pixels[-x][1] if len(sorted_pixels) >= x else sorted_pixels[-1][1]
+
+    return tuple(int(c) for c in bgr)
+
+
+def reference_text_color_pixels(cropped_text):
+    """ Dark pixels list built by the former find_text_color """
+
+    return [cropped_text[y][x] for y, x in np.argwhere(preprocessing(cropped_text) == 0)]
+
+
+def reference_find_text_color(cropped_text):
+
+    pixels = reference_text_color_pixels(cropped_text)
+
+    if len(pixels) > 1:
+        bgr = reference_xmost_occuring_color(pixels, 1)
+    elif not pixels:
+        bgr = reference_xmost_occuring_color(cropped_text, 2)
+    else:
+        bgr = pixels[0]
+
+    return image_utils.bgr2hex(bgr)
+
+
+def reference_main_color(image):
+    a2D = image.reshape(-1, image.shape[-1])
+    col_range = (256, 256, 256)
+    a1D = np.ravel_multi_index(a2D.T, col_range)
+    return tuple(int(c) for c in np.unravel_index(np.bincount(a1D).argmax(), col_range))
+
+
+def as_bgr(color):
+    """ :return: BGR tuple of a color given as a BGR sequence or an hex string """
+
+    if isinstance(color, str):
+        return int(color[5:7], 16), int(color[3:5], 16), int(color[1:3], 16)
+
+    return tuple(color)
+
+
+def count_of(image, color):
+    return int(np.all(np.asarray(image).reshape(-1, 3) == color, axis=1).sum())
+
+
+def load_crops():
+    """ Random boxes of the screenshots of SCREENSHOTS_DIR (or of the synthetic warm-up screenshot) """
+
+    paths = sorted(glob.glob(os.path.join(sys.argv[1] if len(sys.argv) > 1 else SCREENSHOTS_DIR, '*.png')))
+    screenshots = [np.array(Image.open(path).convert('RGB'))[:, :, ::-1].copy() for path in paths[:20]]
+    if not screenshots:
+        print("no screenshot found, crops of the synthetic screenshot are used")
+        screenshots = [synthetic_screenshot()[0]]
+
+    random = np.random.RandomState(0)
+    crops = []
+    for i in range(NB_OF_CROPS):
+        screenshot = screenshots[i % len(screenshots)]
+        height, width = screenshot.shape[:2]
+        crop_height, crop_width = random.randint(8, min(120, height)), random.randint(8, min(400, width))
+        top, left = random.randint(0, height - crop_height + 1), random.randint(0, width - crop_width + 1)
+        crops.append(np.ascontiguousarray(screenshot[top:top + crop_height, left:left + crop_width]))
+
+    return crops, screenshots
+
+
+def measure(function, inputs):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        results = [function(*arguments) for arguments in inputs]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def compare(name, reference, new, inputs, images):
+    reference_time, reference_results = measure(reference, inputs)
+    new_time, new_results = measure(new, inputs)
+
+    different = [(r, n, image) for r, n, image in zip(reference_results, new_results, images) if r != n]
+    # Different colors are only accepted if they are as common (tie)
+    ties = sum(count_of(image, as_bgr(r)) == count_of(image, as_bgr(n)) for r, n, image in different)
+
+    print("%-28s %12.1f %12.1f %8.1fx %10d %6d" % (name, 1000 * reference_time, 1000 * new_time,
+                                                    reference_time / new_time, len(different), ties))
+
+
+def main():
+    crops, screenshots = load_crops()
+    dark_pixels = [reference_text_color_pixels(crop) for crop in crops]
+    rows = [crop[i:i + 1, :] for crop in crops for i in (0, crop.shape[0] // 2)]
+
+    print("%d crops" % len(crops))
+    print("%-28s %12s %12s %9s %10s %6s" % ("function", "before (ms)", "after (ms)", "speedup", "different", "ties"))
+
+    compare("xmost color 1 (crops)", reference_xmost_occuring_color, image_utils.get_xmost_occuring_color,
+            [(crop, 1) for crop in crops], crops)
+    compare("xmost color 2 (crops)", reference_xmost_occuring_color, image_utils.get_xmost_occuring_color,
+            [(crop, 2) for crop in crops], crops)
+    compare("xmost color 1 (rows)", reference_xmost_occuring_color, image_utils.get_xmost_occuring_color,
+            [(row, 1) for row in rows], rows)
+    compare("xmost color 1 (dark pixels)", reference_xmost_occuring_color, image_utils.get_xmost_occuring_color,
+            [(pixels, 1) for pixels in dark_pixels if len(pixels) > 1], [p for p in dark_pixels if len(p) > 1])
+    compare("find_text_color", reference_find_text_color, image_utils.find_text_color, [(crop,) for crop in crops],
+            crops)
+    compare("main color (screenshots)", reference_main_color, image_utils.get_main_color,
+            [(screenshot,) for screenshot in screenshots], screenshots)
+
+
+if __name__ == '__main__':
+    main()
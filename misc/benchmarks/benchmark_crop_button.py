@@ -0,0 +1,187 @@
+"""
+Latency of crop_button (image_utils) against its former row by row / column by column scan, kept below as reference,
+on synthetic button crops (filled, outlined, rounded, anti-aliased text, several backgrounds and margins). Results have
+to be identical; crops on which the former scan fails (empty slice at limit 1) are only timed with the new version
+Run from the repository root: python misc/benchmarks/benchmark_crop_button.py
+"""
+
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import image_utils
+from image_utils import get_xmost_occuring_color, similar_colors, bgr2hex
+from ocr import preprocessing
+
+NB_OF_BUTTONS = 400
+REPEATS = 3
+WORDS = ["OK", "Connexion", "Rechercher", "Valider", "S'inscrire", "Envoyer le formulaire"]
+
+
+def reference_crop_button(button_image, background_color, coords):
+
+    class Break(Exception):
+        pass
+
+    button_color = get_xmost_occuring_color(button_image, 1)
+
+    if similar_colors(button_color, background_color, .2):
+        button_color = get_xmost_occuring_color(button_image, 2)
+
+    h, w = button_image.shape[:2]
+    binary = 255 - preprocessing(button_image)
+
+    yhist = cv2.reduce(binary, 1, cv2.REDUCE_AVG).reshape(-1)
+    xhist = cv2.reduce(binary, 0, cv2.REDUCE_AVG).reshape(-1)
+
+    th = 15
+
+    ylimits = [y for y in range(len(yhist) - 1) if ((yhist[y] < yhist[y + 1] - th) | (yhist[y] > yhist[y + 1] + th))]
+
+    xlimits = [x for x in range(len(xhist) - 1) if ((xhist[x] < xhist[x + 1] - th) | (xhist[x] > xhist[x + 1] + th))]
+
+    th = .3
+
+    try:
+        ymin = 0
+        if similar_colors(get_xmost_occuring_color(button_image[:1, :], 1), button_color, th):
+            raise Break
+        for y in ylimits:
+            if similar_colors(get_xmost_occuring_color(button_image[y + 1:y + 2, :], 1), button_color, th):
+                ymin = y + 1
+                raise Break
+    except Break:
+        pass
+
+    ylimits.reverse()
+
+    try:
+        ymax = h
+        if similar_colors(get_xmost_occuring_color(button_image[-2:-1, :], 1), button_color, th):
+            raise Break
+        for y in ylimits:
+            if similar_colors(get_xmost_occuring_color(button_image[y - 2:y - 1, :], 1), button_color, th):
+                ymax = y
+                raise Break
+    except Break:
+        pass
+
+    try:
+        xmin = 0
+        if similar_colors(get_xmost_occuring_color(button_image[:, :1], 1), button_color, th):
+            raise Break
+        for x in xlimits:
+            if similar_colors(get_xmost_occuring_color(button_image[:, x + 1:x + 2], 1), button_color, th):
+                xmin = x + 1
+                raise Break
+    except Break:
+        pass
+
+    xlimits.reverse()
+
+    try:
+        xmax = w
+        if similar_colors(get_xmost_occuring_color(button_image[:, -2:-1], 1), button_color, th):
+            raise Break
+        for x in xlimits:
+            if similar_colors(get_xmost_occuring_color(button_image[:, x - 2:x - 1], 1), button_color, th):
+                xmax = x
+                raise Break
+    except Break:
+        pass
+
+    cropped = button_image[ymin:ymax, xmin:xmax]
+
+    abs_ymin, abs_ymax, abs_xmin, abs_xmax = coords
+
+    abs_ymin += ymin
+    abs_ymax -= (h - ymax)
+    abs_xmin += xmin
+    abs_xmax -= (w - xmax)
+
+    return cropped, bgr2hex(button_color), abs_ymin, abs_ymax, abs_xmin, abs_xmax
+
+
+def random_color(random):
+    return tuple(int(c) for c in random.randint(0, 256, 3))
+
+
+def synthetic_button(random):
+    """ :return: BGR crop of a button with some background around it, the background color and the crop coords """
+
+    width, height = random.randint(40, 320), random.randint(16, 70)
+    margin_x, margin_y = random.randint(0, 12), random.randint(0, 12)
+    background = random_color(random) if random.rand() < .3 else (255, 255, 255)
+    color = random_color(random)
+
+    image = np.full((height + 2 * margin_y, width + 2 * margin_x, 3), background, dtype=np.uint8)
+    top_left, bottom_right = (margin_x, margin_y), (margin_x + width - 1, margin_y + height - 1)
+
+    style = random.randint(3)
+    if style == 0:
+        cv2.rectangle(image, top_left, bottom_right, color, cv2.FILLED)
+    elif style == 1:
+        cv2.rectangle(image, top_left, bottom_right, color, random.randint(1, 4))
+    else:
+        radius = min(height // 2, 10)
+        cv2.rectangle(image, (top_left[0] + radius, top_left[1]), (bottom_right[0] - radius, bottom_right[1]), color,
+                      cv2.FILLED)
+        cv2.rectangle(image, (top_left[0], top_left[1] + radius), (bottom_right[0], bottom_right[1] - radius), color,
+                      cv2.FILLED)
+        for x in (top_left[0] + radius, bottom_right[0] - radius):
+            for y in (top_left[1] + radius, bottom_right[1] - radius):
+                cv2.circle(image, (x, y), radius, color, cv2.FILLED, cv2.LINE_AA)
+
+    text_color = (255, 255, 255) if sum(color) < 384 else (30, 30, 30)
+    scale = height / 60
+    cv2.putText(image, WORDS[random.randint(len(WORDS))], (margin_x + 6, margin_y + int(.7 * height)),
+                cv2.FONT_HERSHEY_SIMPLEX, scale, text_color, 1 + int(scale > .6), cv2.LINE_AA)
+
+    if random.rand() < .3:
+        image = np.clip(image + random.randint(-3, 4, image.shape), 0, 255).astype(np.uint8)
+
+    top, left = random.randint(0, 800), random.randint(0, 1200)
+    coords = (top, top + image.shape[0], left, left + image.shape[1])
+
+    return image, background, coords
+
+
+def same_result(reference, new):
+    return np.array_equal(reference[0], new[0]) and reference[1:] == new[1:]
+
+
+def main():
+    random = np.random.RandomState(0)
+    buttons = [synthetic_button(random) for _ in range(NB_OF_BUTTONS)]
+
+    compared, different = [], 0
+    for button in buttons:
+        try:
+            reference = reference_crop_button(*button)
+        except IndexError:
+            continue
+        compared.append(button)
+        different += not same_result(reference, image_utils.crop_button(*button))
+
+    timings = []
+    for function in (reference_crop_button, image_utils.crop_button):
+        best = float('inf')
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            for button in compared:
+                function(*button)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+
+    print("%d buttons, %d compared (the former scan fails on the others)" % (len(buttons), len(compared)))
+    print("%-14s %12s %12s %9s %10s" % ("function", "before (ms)", "after (ms)", "speedup", "different"))
+    print("%-14s %12.1f %12.1f %8.1fx %10d" % ("crop_button", 1000 * timings[0], 1000 * timings[1],
+                                                timings[0] / timings[1], different))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Startup cost of the worker modules: each module is imported REPEATS times in a fresh interpreter with python -X
+importtime, and the best run reports its total import time, its heaviest imports, its peak RSS, and which of the
+heavy dependencies (that should only load on demand) it loaded
+Run from the repository root: python misc/benchmarks/benchmark_import_time.py [module ...] (default: index)
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+
+MODULES = ['index']
+REPEATS = 5
+TOP = 15
+
+# Modules expected to load lazily, on first use only
+HEAVY_MODULES = ['tensorflow', 'object_detection', 'matplotlib', 'skimage', 'colormap', 'scipy', 'pytesseract',
+                 'tesserocr']
+
+CHILD = """
+import {module}
+import json, resource, sys
+print(json.dumps({{'loaded': [m for m in {heavy!r} if m in sys.modules],
+                  'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+
+def import_once(module):
+    """ :return: (cumulative import time in us, name) of every import, and the child report """
+
+    child = CHILD.format(module=module, heavy=HEAVY_MODULES)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', child], cwd=ROOT, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), name.rstrip()))
+
+    return imports, json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main():
+    modules = sys.argv[1:] or MODULES
+
+    for module in modules:
+        runs = [import_once(module) for _ in range(REPEATS)]
+        # Total = cumulative time of the module itself (last line of its own import)
+        imports, report = min(runs, key=lambda run: next(c for c, name in run[0] if name.strip() == module))
+        total = next(c for c, name in imports if name.strip() == module)
+
+        print("import %s: %.1f ms (best of %d), peak RSS %.1f MB" % (module, total / 1000, REPEATS,
+                                                                    report['max_rss_kb'] / 1024))
+        print("heavy modules loaded: %s" % (', '.join(report['loaded']) or 'none'))
+        print("%-48s %12s" % ("heaviest imports", "cumul. (ms)"))
+        for cumulative, name in sorted(imports, reverse=True)[:TOP]:
+            print("%-48s %12.1f" % (name[:48], cumulative / 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""
+Parity check and micro-benchmark of the NumPy non max suppression against tf.image.non_max_suppression
+The selections are first checked (asserts) on fixed box sets and against a plain Python greedy suppression, which
+does not need TensorFlow
+Run from the repository root: python misc/benchmarks/benchmark_nms.py
+"""
+
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from nms import non_max_suppression, class_aware_non_max_suppression
+
+# Same parameters as prediction.delete_overlapping_boxes, 300 boxes = Faster R-CNN output size
+NB_OF_BOXES = 300
+MAX_OUTPUT_SIZE = 1000
+IOU_TRESH = .1
+SCORE_TRESH = .4
+NB_OF_RUNS = 200
+NB_OF_PARITY_CASES = 50
+
+
+def random_detections(rng, nb_of_boxes):
+    """ Random normalized [ymin, xmin, ymax, xmax] boxes and scores looking like a detection output """
+
+    corners = rng.uniform(0, 1, (nb_of_boxes, 2))
+    sizes = rng.uniform(.01, .3, (nb_of_boxes, 2))
+    boxes = np.hstack((corners, np.minimum(corners + sizes, 1))).astype(np.float32)
+    scores = rng.uniform(0, 1, nb_of_boxes).astype(np.float32)
+
+    return boxes, scores
+
+
+def reference_iou(box1, box2):
+    """ Intersection over union of two [ymin, xmin, ymax, xmax] boxes, 0 if one of them is empty """
+
+    area1 = (box1[2] - box1[0]) * (box1[3] - box1[1])
+    area2 = (box2[2] - box2[0]) * (box2[3] - box2[1])
+    inter_h = max(0., min(box1[2], box2[2]) - max(box1[0], box2[0]))
+    inter_w = max(0., min(box1[3], box2[3]) - max(box1[1], box2[1]))
+    intersection = inter_h * inter_w
+
+    if area1 <= 0 or area2 <= 0:
+        return 0.
+
+    return intersection / (area1 + area2 - intersection)
+
+
+def reference_non_max_suppression(boxes, scores, max_output_size, iou_threshold, score_threshold):
+    """ Plain greedy suppression, one box at a time: highest score first, lowest index first on ties """
+
+    # Thresholds stored in float32, like the scores
+    iou_threshold, score_threshold = float(np.float32(iou_threshold)), float(np.float32(score_threshold))
+
+    order = sorted((i for i in range(len(scores)) if scores[i] > score_threshold), key=lambda i: (-scores[i], i))
+    selected = []
+
+    for i in order:
+        if len(selected) == max_output_size:
+            break
+        if all(reference_iou(boxes[i], boxes[j]) <= iou_threshold for j in selected):
+            selected.append(i)
+
+    return selected
+
+
+def reference_class_aware_non_max_suppression(boxes, classes, scores, max_output_size, iou_thresholds,
+                                              score_thresholds):
+    """ One suppression per class (thresholds given as {class index: threshold}), merged by decreasing score """
+
+    selected = []
+    for class_index in set(classes):
+        indices = [i for i in range(len(classes)) if classes[i] == class_index]
+        kept = reference_non_max_suppression([boxes[i] for i in indices], [scores[i] for i in indices],
+                                             max_output_size, iou_thresholds[class_index],
+                                             score_thresholds[class_index])
+        selected += [indices[i] for i in kept]
+
+    return sorted(selected, key=lambda i: (-scores[i], i))[:max_output_size]
+
+
+def check_fixed_cases():
+    """ Selections on hand made box sets: empty input, single box, suppression, ties, iou equal to the threshold """
+
+    no_boxes = np.zeros((0, 4), dtype=np.float32)
+    assert list(non_max_suppression(no_boxes, [], 10)) == []
+    assert list(class_aware_non_max_suppression(no_boxes, [], [], 10)) == []
+
+    one_box = [[0, 0, 1, 1]]
+    assert list(non_max_suppression(one_box, [.9], 10)) == [0]
+    assert list(non_max_suppression(one_box, [.3], 10, score_threshold=.4)) == []
+    assert list(non_max_suppression(one_box, [.9], 0)) == []
+    assert list(class_aware_non_max_suppression(one_box, [2], [.9], 10)) == [0]
+
+    # 1 overlaps 0 (iou .9), 2 is apart, 3 overlaps 0 by a third and comes first by score
+    boxes = [[0, 0, 1, 1], [0, 0, 1, .9], [0, 2, 1, 3], [0, .5, 1, 1.5]]
+    scores = [.8, .7, .6, .9]
+    assert list(non_max_suppression(boxes, scores, 10)) == [3, 0, 2]
+    assert list(non_max_suppression(boxes, scores, 10, iou_threshold=.3)) == [3, 1, 2]
+    assert list(non_max_suppression(boxes, scores, 2)) == [3, 0]
+    assert list(non_max_suppression(boxes, scores, 10, score_threshold=.7)) == [3, 0]
+
+    # Ties: the lowest index is selected first, the same box twice is selected once
+    assert list(non_max_suppression([[0, 2, 1, 3], [0, 0, 1, 1]], [.5, .5], 10)) == [0, 1]
+    assert list(non_max_suppression([[0, 0, 1, 1], [0, 0, 1, 1]], [.5, .5], 10)) == [0]
+
+    # Boxes are only removed when their iou is strictly above the threshold (here exactly .5)
+    assert list(non_max_suppression([[0, 0, 1, 3], [0, 1, 1, 4]], [.9, .8], 10, iou_threshold=.5)) == [0, 1]
+
+    # Boxes of different classes never suppress each other, thresholds may be given per class
+    boxes = [[0, 0, 1, 1], [0, 0, 1, .9], [0, .1, 1, 1]]
+    scores = [.9, .8, .7]
+    assert list(class_aware_non_max_suppression(boxes, [1, 1, 1], scores, 10)) == [0]
+    assert list(class_aware_non_max_suppression(boxes, [1, 2, 1], scores, 10)) == [0, 1]
+    assert list(class_aware_non_max_suppression(boxes, [1, 2, 2], scores, 10, iou_threshold={2: .95})) == [0, 1, 2]
+    assert list(class_aware_non_max_suppression(boxes, [1, 2, 3], scores, 10, score_threshold={None: .75})) == [0, 1]
+    assert list(class_aware_non_max_suppression(boxes, [1, 2, 3], [.5, .5, .5], 2)) == [0, 1]
+
+
+def check_detection_modes():
+    """ Overlapping boxes removal of the detector (prediction.remove_overlapping_boxes) in both NMS modes """
+
+    import prediction
+
+    boxes = np.array([[0, 0, .5, .5], [0, 0, .5, .45], [.6, .6, .9, .9]], dtype=np.float32)
+    classes = np.array([1, 2, 1], dtype=np.float32)
+    scores = np.array([.9, .8, .7], dtype=np.float32)
+
+    nms_mode = prediction.NMS_MODE
+    try:
+        prediction.NMS_MODE = 'class'
+        selected_boxes, selected_classes, selected_scores = prediction.remove_overlapping_boxes(boxes, classes, scores)
+        assert np.array_equal(selected_boxes, boxes) and list(selected_classes) == [1, 2, 1]
+        assert list(selected_scores) == list(scores)
+
+        prediction.NMS_MODE = 'agnostic'
+        selected_boxes, selected_classes, selected_scores = prediction.remove_overlapping_boxes(boxes, classes, scores)
+        assert np.array_equal(selected_boxes, boxes[[0, 2]]) and list(selected_classes) == [1, 1]
+        assert list(selected_scores) == list(scores[[0, 2]])
+
+        # Tiles and the OpenCV backend give a single box, or none, without any padding row
+        for nms_mode_checked in ('agnostic', 'class'):
+            prediction.NMS_MODE = nms_mode_checked
+            for count in (0, 1):
+                selected_boxes, selected_classes, selected_scores = prediction.remove_overlapping_boxes(
+                    boxes[:count], classes[:count], scores[:count])
+                assert selected_boxes.shape == (count, 4) and len(selected_classes) == len(selected_scores) == count
+    finally:
+        prediction.NMS_MODE = nms_mode
+
+
+def check_reference_parity(rng):
+    """ Random detections (scores rounded to get ties) against the plain Python suppressions """
+
+    for _ in range(NB_OF_PARITY_CASES):
+        boxes, scores = random_detections(rng, NB_OF_BOXES)
+        scores = np.round(scores, 1)
+        expected = reference_non_max_suppression(boxes.tolist(), scores.tolist(), MAX_OUTPUT_SIZE, IOU_TRESH,
+                                                 SCORE_TRESH)
+        selected = non_max_suppression(boxes, scores, MAX_OUTPUT_SIZE, IOU_TRESH, SCORE_TRESH)
+        assert list(selected) == expected, (expected, selected)
+
+        classes = rng.randint(1, 4, NB_OF_BOXES)
+        iou_thresholds = {1: IOU_TRESH, 2: .3, 3: .5}
+        score_thresholds = {1: SCORE_TRESH, 2: .6, 3: SCORE_TRESH}
+        expected = reference_class_aware_non_max_suppression(boxes.tolist(), classes.tolist(), scores.tolist(), 50,
+                                                             iou_thresholds, score_thresholds)
+        selected = class_aware_non_max_suppression(boxes, classes, scores, 50, iou_thresholds, score_thresholds)
+        assert list(selected) == expected, (expected, selected)
+
+
+def tf_non_max_suppression(sess, boxes, scores):
+    """ Previous implementation: a new op is created in the graph at every call """
+
+    import tensorflow as tf
+
+    selected_indices = tf.image.non_max_suppression(boxes, scores, MAX_OUTPUT_SIZE, iou_threshold=IOU_TRESH,
+                                                    score_threshold=SCORE_TRESH)
+    return sess.run(selected_indices)
+
+
+def main():
+    rng = np.random.RandomState(0)
+
+    check_fixed_cases()
+    check_detection_modes()
+    check_reference_parity(rng)
+    print("checks         : fixed cases and %d reference cases identical" % NB_OF_PARITY_CASES)
+
+    boxes, scores = random_detections(rng, NB_OF_BOXES)
+
+    numpy_time = timeit.timeit(lambda: non_max_suppression(boxes, scores, MAX_OUTPUT_SIZE, IOU_TRESH, SCORE_TRESH),
+                               number=NB_OF_RUNS) / NB_OF_RUNS
+    print("numpy NMS      : %.3f ms / call" % (numpy_time * 1000))
+
+    try:
+        import tensorflow as tf
+    except ImportError:
+        print("tensorflow is not installed, parity check skipped")
+        return
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+
+        for _ in range(NB_OF_PARITY_CASES):
+            case_boxes, case_scores = random_detections(rng, NB_OF_BOXES)
+            expected = tf_non_max_suppression(sess, case_boxes, case_scores)
+            selected = non_max_suppression(case_boxes, case_scores, MAX_OUTPUT_SIZE, IOU_TRESH, SCORE_TRESH)
+            assert np.array_equal(expected, selected), (expected, selected)
+        print("parity         : %d/%d cases identical" % (NB_OF_PARITY_CASES, NB_OF_PARITY_CASES))
+
+        tf_time = timeit.timeit(lambda: tf_non_max_suppression(sess, boxes, scores), number=NB_OF_RUNS) / NB_OF_RUNS
+        print("tensorflow NMS : %.3f ms / call" % (tf_time * 1000))
+        print("speedup        : x%.1f" % (tf_time / numpy_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+OCR latency of the engines (ocr.OcrEngine) on a page of ~100 text elements
+Run from the repository root: python misc/benchmarks/benchmark_ocr_engines.py
+"""
+
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import ocr
+
+NB_OF_ELEMENTS = 100
+WORDS = ["Connexion", "Rechercher", "OK", "Accueil", "Contact", "Mon compte", "Mentions légales", "Panier",
+         "Newsletter", "Valider", "Sign in", "Learn more", "Download", "Settings", "Help center"]
+
+
+def text_crops(nb_of_crops):
+    """ Rendered labels looking like text elements crops of a screenshot, and the text they contain """
+
+    crops, texts = [], []
+
+    for i in range(nb_of_crops):
+        text = WORDS[i % len(WORDS)]
+        scale = .5 + (i % 4) * .2
+        (width, height), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 1)
+        crop = np.full((height + baseline + 16, width + 16, 3), 255, dtype=np.uint8)
+        cv2.putText(crop, text, (8, height + 8), cv2.FONT_HERSHEY_SIMPLEX, scale, (50, 50, 50), 1, cv2.LINE_AA)
+        crops.append(crop)
+        texts.append(text)
+
+    return crops, texts
+
+
+def main():
+    crops, texts = text_crops(NB_OF_ELEMENTS)
+    binaries = [ocr.preprocessing(crop) for crop in crops]
+
+    engines = {'pytesseract': ocr.PytesseractEngine}
+    try:
+        import tesserocr
+        engines['tesserocr'] = ocr.TesserocrEngine
+    except ImportError:
+        print("tesserocr is not installed, only pytesseract is measured")
+
+    print("%d text elements" % NB_OF_ELEMENTS)
+    print("%-12s %12s %12s %10s" % ("engine", "startup (s)", "page (s)", "correct"))
+
+    for name, engine_class in engines.items():
+        start = time.perf_counter()
+        engine = engine_class()
+        engine.image_to_data(binaries[0])
+        startup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [ocr.words_to_result(engine.image_to_data(binary))['text'] for binary in binaries]
+        page_time = time.perf_counter() - start
+
+        correct = sum(result.strip() == text for result, text in zip(results, texts))
+        print("%-12s %12.2f %12.2f %9d%%" % (name, startup, page_time, 100 * correct / NB_OF_ELEMENTS))
+
+
+if __name__ == '__main__':
+    main()
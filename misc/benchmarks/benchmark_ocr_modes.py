@@ -0,0 +1,60 @@
+"""
+Latency and character accuracy of per-element OCR against one OCR call on a composite of all the text elements
+(ocr.OCR_MODE 'element' and 'page')
+Run from the repository root: python misc/benchmarks/benchmark_ocr_modes.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import ocr
+from benchmark_ocr_engines import text_crops, NB_OF_ELEMENTS
+
+
+def edit_distance(a, b):
+    """ Levenshtein distance between two strings """
+
+    previous = list(range(len(b) + 1))
+
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+
+    return previous[-1]
+
+
+def character_accuracy(results, texts):
+    errors = sum(edit_distance(result.strip(), text) for result, text in zip(results, texts))
+    return 1 - errors / sum(len(text) for text in texts)
+
+
+def main():
+    crops, texts = text_crops(NB_OF_ELEMENTS)
+
+    # Memory only cache, timings must not depend on earlier runs
+    ocr.OCR_CACHE_DIR = ''
+
+    # Engine startup is not measured
+    ocr.ocr(crops[0])
+
+    start = time.perf_counter()
+    element_results = [ocr.ocr(crop) for crop in crops]
+    element_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    page_results = [result['text'] for result in ocr.ocr_composite(crops)]
+    page_time = time.perf_counter() - start
+
+    print("%d text elements, %s engine" % (NB_OF_ELEMENTS, type(ocr.get_ocr_engine()).__name__))
+    print("%-10s %10s %20s" % ("mode", "time (s)", "character accuracy"))
+    print("%-10s %10.2f %19.1f%%" % ("element", element_time, 100 * character_accuracy(element_results, texts)))
+    print("%-10s %10.2f %19.1f%%" % ("page", page_time, 100 * character_accuracy(page_results, texts)))
+
+
+if __name__ == '__main__':
+    main()
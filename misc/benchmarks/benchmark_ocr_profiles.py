@@ -0,0 +1,62 @@
+"""
+Latency and character accuracy of the OCR profiles: language(s) and page segmentation mode (ocr.PSM_BY_TYPE) used for
+the text elements of a page, against the former single profile ('-l eng+fra --psm 3' for every element)
+Run from the repository root: python misc/benchmarks/benchmark_ocr_profiles.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import ocr
+from benchmark_ocr_engines import text_crops, NB_OF_ELEMENTS
+from benchmark_ocr_modes import character_accuracy
+
+# Types given to the crops, in turn
+ELEMENT_TYPES = ['text', 'rectangle_button', 'text_input']
+
+# Profiles measured: (lang, psm), lang None = detected on the page, psm None = chosen by element type
+PROFILES = {
+    'eng+fra, psm 3': ('eng+fra', 3),
+    'eng+fra, by type': ('eng+fra', None),
+    'detected, psm 3': (None, 3),
+    'detected, by type': (None, None),
+    'detected, psm 6': (None, 6),
+    'detected, psm 7': (None, 7),
+    'detected, psm 8': (None, 8)
+}
+
+
+def main():
+    crops, texts = text_crops(NB_OF_ELEMENTS)
+    types = [ELEMENT_TYPES[i % len(ELEMENT_TYPES)] for i in range(NB_OF_ELEMENTS)]
+
+    # Memory only cache, timings must not depend on earlier runs
+    ocr.OCR_CACHE_DIR = ''
+
+    # Engine startup is not measured
+    ocr.ocr(crops[0])
+
+    chosen = {}
+    for crop, element_type in zip(crops, types):
+        psm = ocr.get_psm(ocr.preprocessing(crop), element_type)
+        chosen[psm] = chosen.get(psm, 0) + 1
+
+    print("%d text elements, %s engine" % (NB_OF_ELEMENTS, type(ocr.get_ocr_engine()).__name__))
+    print("page segmentation modes chosen by type: %s" %
+          ', '.join('psm %d x %d' % item for item in sorted(chosen.items())))
+    print("%-20s %10s %10s %20s" % ("profile", "language", "time (s)", "character accuracy"))
+
+    for name, (lang, psm) in PROFILES.items():
+        start = time.perf_counter()
+        page_lang = lang if lang else ocr.detect_language(crops)
+        results = [ocr.ocr(crop, page_lang, psm, element_type) for crop, element_type in zip(crops, types)]
+        page_time = time.perf_counter() - start
+
+        print("%-20s %10s %10.2f %19.1f%%" % (name, page_lang, page_time, 100 * character_accuracy(results, texts)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Throughput (screenshots per second, all workers together) of the whole pipeline for different thread budgets
+Each setting runs WORKERS processes in parallel, like uwsgi, each converting every image to SVG
+Run from the repository root: python misc/benchmarks/benchmark_thread_budget.py [images directory]
+"""
+
+import glob
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+IMAGES_DIR = os.path.join('dataset', 'images', 'test')
+
+# Same number of processes as uwsgi.ini
+WORKERS = 4
+
+# Threads per worker tried (None = derived from the number of cores)
+THREADS_PER_WORKER = [None, 1, 2, 4, 8]
+
+
+def run_worker(budget, paths, start_barrier, queue):
+    """ Apply the budget, warm up, then convert every image and send back the conversion time """
+
+    from thread_budget import apply_thread_budget
+    apply_thread_budget(budget)
+
+    import cv2
+    from mockup import Mockup
+    from prediction import Detector
+
+    detector = Detector()
+    images = [cv2.imread(path) for path in paths]
+    detector.detect(images[0])
+
+    output_dir = tempfile.mkdtemp()
+    start_barrier.wait()
+
+    start = time.perf_counter()
+    for i, image in enumerate(images):
+        mockup = Mockup("bench" + str(i), image.copy(), detector.run_detection(image))
+        mockup.translate_raw_results()
+        mockup.align_text_elements()
+        mockup.create_svg(output_dir)
+
+    queue.put(time.perf_counter() - start)
+    shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def main(images_dir):
+    from thread_budget import compute_thread_budget
+
+    paths = sorted(glob.glob(os.path.join(images_dir, '*.png')) + glob.glob(os.path.join(images_dir, '*.jpg')))
+
+    if not paths:
+        print("no image found in " + images_dir)
+        return
+
+    print("%d images per worker, %d workers, %d cores" % (len(paths), WORKERS, os.cpu_count()))
+    print("%-10s %8s %8s %10s %10s %12s" % ("threads", "tf intra", "tf inter", "opencv", "tesseract", "images/s"))
+
+    for threads_per_worker in THREADS_PER_WORKER:
+        budget = compute_thread_budget(WORKERS, threads_per_worker=threads_per_worker)
+
+        queue = multiprocessing.Queue()
+        start_barrier = multiprocessing.Barrier(WORKERS)
+        processes = [multiprocessing.Process(target=run_worker, args=(budget, paths, start_barrier, queue))
+                     for _ in range(WORKERS)]
+        for process in processes:
+            process.start()
+
+        durations = [queue.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        throughput = WORKERS * len(paths) / max(durations)
+        print("%-10s %8d %8d %10d %10d %12.2f" % (threads_per_worker or "auto", budget['tf_intra_op'],
+                                                  budget['tf_inter_op'], budget['opencv'], budget['tesseract'],
+                                                  throughput))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else IMAGES_DIR)
@@ -3,66 +3,192 @@ from image_utils import liken_colors, get_main_color
 from zipfile import ZipFile
 from shortuuid import ShortUUID
 from constants import text_types, icon_types
+from ocr import ocr_data, ocr_composite, detect_language, OcrTimeout, OCR_MODE, OCR_LANGUAGE, TESSERACT_PSM
 import img2svg
+import element_table
 import collections
 from PIL import Image
 import numpy as np
 import cv2
 import os
 import img2bmml
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from thread_budget import get_thread_budget
+
+
+# Threads analysing elements in parallel (default: the threads of the worker budget)
+ANALYSIS_WORKERS = int(os.environ.get('UI_DETECTOR_ANALYSIS_WORKERS', 0)) or get_thread_budget()['threads']
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_analysis_executor(workers):
+    """ Return the thread pool of the current (worker) process running this many analyses at once, created on first
+    call: its threads live as long as the worker, so that the OCR engine of each thread (see ocr.TesserocrEngine)
+    loads its language models once, at warm-up, instead of at every request """
+
+    # Locked, several threads may ask for it at the same time
+    with _executors_lock:
+        if workers not in _executors:
+            _executors[workers] = ThreadPoolExecutor(workers)
+
+    return _executors[workers]
 
 
 class Mockup:
 
-    def __init__(self, title, original_image, detection_results, elements=None, xml_page=None):
+    def __init__(self, title, original_image, detection_results, elements=None, xml_page=None, hires_image=None,
+                 pixel_ratio=1, analysis_workers=ANALYSIS_WORKERS):
         self.title = title
         self.original_image = original_image
+        # Full resolution screenshot (HiDPI), original_image and every coordinate being in CSS pixels
+        self.hires_image = hires_image if pixel_ratio != 1 else None
+        self.pixel_ratio = pixel_ratio
         self.background_image = original_image.copy()
-        self.boxes, self.classes, self.scores = detection_results
+        # One row per detected element, viewed by the Element objects
+        self.table = element_table.from_detections(*detection_results)
         self.elements = elements if elements else []
         self.xml_page = xml_page if xml_page else ""
         self.generated_id = ShortUUID().random(length=8)
         self.current_id_svg = 0
+        # Number of elements analysed at the same time by translate_raw_results
+        self.analysis_workers = analysis_workers
+        # Text elements turned into image elements by translate_raw_results, their OCR not done before the deadline
+        self.degraded_elements = 0
 
-    def translate_raw_results(self):
+    def translate_raw_results(self, ocr_mode=OCR_MODE, ocr_profile=None, deadline=None):
         """
         Translate TersonFlow predictions to Elements according to type (text, button, etc)
+        :param ocr_mode: 'element' = each text element is OCRed separately, 'page' = all of them in one OCR call
+        :param ocr_profile: dict of lang and psm forced for this page (see ocr.parse_ocr_profile), a None or missing
+                            value = lang detected on the page, psm chosen by element type
+        :param deadline: time.monotonic() time the OCR has to be done by (None = no deadline): text elements not OCRed
+                         in time are degraded to image elements (counted in degraded_elements)
         """
 
-        classes = ["text", "text_input", "image", "rectangle_button", "oval_button", "search", "login", "lock", "chat",
-                   "phone", "checkbox", "home", "help", "down_arrow", "right_arrow", "menu", "plus", "mail", "settings"]
+        ocr_profile = ocr_profile if ocr_profile else {}
+
+        # Elements are analysed in parallel (OpenCV, Tesseract and zlib release the GIL), they only read the original
+        # image and write their own table row. map keeps the elements in the order of the detections
+        elements = self.parallel_map(self.analyse_element, range(len(self.table)))
+
+        self.current_id_svg += len(self.table)
+
+        # Text elements by priority, largest and most confident first: if the deadline passes, the elements left
+        # without OCR are the least important ones
+        priorities = element_table.areas(self.table) * self.table['score'].astype(np.float32)
+        text_indices = [i for i in np.argsort(-priorities, kind='stable') if isinstance(elements[i], TextElement)]
+        text_elements = [elements[i] for i in text_indices]
+
+        # The language of the page is detected once, then only its model is used
+        lang = ocr_profile.get('lang') or (OCR_LANGUAGE if OCR_LANGUAGE != 'auto' else None)
+        if not lang:
+            lang = detect_language([element.ocr_input for element in text_elements], deadline)
+
+        # Page mode: all text elements are OCRed with one engine call
+        if ocr_mode == 'page':
+            try:
+                results = ocr_composite([element.ocr_input for element in text_elements], lang,
+                                        ocr_profile.get('psm') or TESSERACT_PSM, deadline,
+                                        [element.ocr_context for element in text_elements])
+            except OcrTimeout:
+                results = [None] * len(text_elements)
+        else:
+            results = self.parallel_map(lambda element: self.ocr_element(element, lang, ocr_profile.get('psm'),
+                                                                         deadline), text_elements)
 
-        for i, box in enumerate(self.boxes):
+        for i, result in zip(text_indices, results):
+            if result is None:
+                elements[i] = self.degrade_element(elements[i])
+                self.degraded_elements += 1
+            else:
+                elements[i].set_ocr_result(result)
 
-            self.current_id_svg += 1
+        # Background painting once every analysis is done, nothing reads it in the meantime
+        for element in elements:
 
-            box_class = classes[int(self.classes[i] - 1)]
+            if isinstance(element, TextElement) and (element.text_value.strip() == "") & (element.ptype == "text"):
+                continue
 
-            """
-            if box_class in icon_types:
-                element = Icon(box, box_class)
-            """
+            self.extract_from_background(element)
 
-            if box_class in text_types:
-                element = TextElement(box, box_class)
-                element.compute_text_properties(self.original_image)
-                if (element.text_value.strip() == "") & (element.ptype == "text"):
-                    continue
+            self.elements.append(element)
 
-            else:
-                element = ImageElement(box)
-                element.extract_image(self.original_image)
-                element.set_base64()
+        self.elements.sort(key=lambda x: x.xmin)
 
-            self.extract_from_background(element)
+    def parallel_map(self, function, items):
+        """ :return: function applied to each item by analysis_workers threads, results in the order of items """
 
-            # Only for SVG and bmml export
-            element.svg_id = element.ptype + str(self.current_id_svg)
-            element.bmml_id = self.current_id_svg
+        if self.analysis_workers > 1:
+            # The threads already use the worker budget: OpenCV runs single threaded meanwhile (its thread count is
+            # per process, one request at a time per uwsgi worker), else each analysis would spawn a full budget too
+            opencv_threads = cv2.getNumThreads()
+            cv2.setNumThreads(1)
+            try:
+                return list(get_analysis_executor(self.analysis_workers).map(function, items))
+            finally:
+                cv2.setNumThreads(opencv_threads)
 
-            self.elements.append(element)
+        return [function(item) for item in items]
 
-        self.elements.sort(key=lambda x: x.xmin)
+    @staticmethod
+    def ocr_element(element, lang, psm, deadline):
+        """ :return: OCR result of a text element (see ocr.ocr_data), None if not done before the deadline """
+
+        try:
+            return ocr_data(element.ocr_input, lang, psm, element.ptype, deadline, element.ocr_context)
+        except OcrTimeout:
+            return None
+
+    def degrade_element(self, element):
+        """
+        :param element: TextElement whose OCR was not done in time
+        :return: ImageElement of the same box, standing for the text in the mockup
+        """
+
+        image_element = ImageElement(element.row)
+        image_element.extract_image(self.original_image, self.hires_image, self.pixel_ratio)
+        image_element.set_base64()
+
+        image_element.svg_id = image_element.ptype + str(element.bmml_id)
+        image_element.bmml_id = element.bmml_id
+
+        return image_element
+
+    def analyse_element(self, i):
+        """
+        :param i: index of the element in the table
+        :return: TextElement or ImageElement, analysed according to its type (text elements are not OCRed yet)
+        """
+
+        classes = ["text", "text_input", "image", "rectangle_button", "oval_button", "search", "login", "lock", "chat",
+                   "phone", "checkbox", "home", "help", "down_arrow", "right_arrow", "menu", "plus", "mail", "settings"]
+
+        box = self.table[i]
+        box_class = classes[int(box['class_index']) - 1]
+
+        """
+        if box_class in icon_types:
+            element = Icon(box, box_class)
+        """
+
+        if box_class in text_types:
+            element = TextElement(box, box_class)
+            element.analyse_text(self.original_image, self.hires_image, self.pixel_ratio)
+
+        else:
+            element = ImageElement(box)
+            element.extract_image(self.original_image, self.hires_image, self.pixel_ratio)
+            element.set_base64()
+
+        # Only for SVG and bmml export
+        svg_id = self.current_id_svg + i + 1
+        element.svg_id = element.ptype + str(svg_id)
+        element.bmml_id = svg_id
+
+        return element
 
     def create_svg(self, path):
         """
@@ -0,0 +1,129 @@
+import numpy as np
+
+
+def non_max_suppression(boxes, scores, max_output_size, iou_threshold=.5, score_threshold=float('-inf')):
+    """
+    Greedy non maximum suppression, same selection as tf.image.non_max_suppression but without any TensorFlow op
+    :param boxes: array of [ymin, xmin, ymax, xmax] boxes (N, 4)
+    :param scores: array of scores (N,)
+    :param max_output_size: maximum number of boxes selected
+    :param iou_threshold: boxes overlapping a selected box more than this (intersection over union) are removed
+    :param score_threshold: boxes with a score lower or equal to this are removed before the suppression
+    :return: indices of the selected boxes, by decreasing score
+    """
+
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+
+    iou_thresholds = np.full(scores.shape, iou_threshold, dtype=np.float32)
+    score_thresholds = np.full(scores.shape, score_threshold, dtype=np.float32)
+
+    return _greedy_suppression(boxes, scores, max_output_size, iou_thresholds, score_thresholds)
+
+
+def class_aware_non_max_suppression(boxes, classes, scores, max_output_size, iou_threshold=.5,
+                                    score_threshold=float('-inf')):
+    """
+    Non max suppression where boxes only suppress boxes of their own class, done in a single pass: each class is
+    moved to its own region of the plane (coordinate offset) so that boxes of different classes never overlap
+    :param boxes: array of [ymin, xmin, ymax, xmax] boxes (N, 4)
+    :param classes: array of class indices (N,)
+    :param scores: array of scores (N,)
+    :param max_output_size: maximum number of boxes selected (all classes together)
+    :param iou_threshold: float, or dict {class index: threshold} (key None = default for the other classes)
+    :param score_threshold: float, or dict {class index: threshold} (key None = default for the other classes)
+    :return: indices of the selected boxes, by decreasing score
+    """
+
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    classes = np.asarray(classes).reshape(-1).astype(np.int64)
+    scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+
+    if boxes.shape[0] == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    offsets = (classes - classes.min()) * (boxes.max() - boxes.min() + 1)
+    offset_boxes = boxes + offsets[:, np.newaxis]
+
+    iou_thresholds = per_class_values(classes, iou_threshold, .5)
+    score_thresholds = per_class_values(classes, score_threshold, float('-inf'))
+
+    return _greedy_suppression(offset_boxes, scores, max_output_size, iou_thresholds, score_thresholds)
+
+
+def box_iou(box, boxes):
+    """
+    :param box: [ymin, xmin, ymax, xmax] box
+    :param boxes: array of boxes (N, 4)
+    :return: intersection over union of box with each of the boxes (N,)
+    """
+
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+
+    inter_h = np.maximum(0., np.minimum(box[2], boxes[:, 2]) - np.maximum(box[0], boxes[:, 0]))
+    inter_w = np.maximum(0., np.minimum(box[3], boxes[:, 3]) - np.maximum(box[1], boxes[:, 1]))
+    intersection = inter_h * inter_w
+    union = (box[2] - box[0]) * (box[3] - box[1]) + (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1]) \
+        - intersection
+
+    return np.where(union > 0, intersection / np.maximum(union, 1e-12), 0.)
+
+
+def per_class_values(classes, values, default):
+    """
+    :param classes: array of class indices
+    :param values: single value, or dict {class index: value} (key None = default value)
+    :param default: value of the classes missing from the dict
+    :return: float32 array giving the value of each class index
+    """
+
+    if not isinstance(values, dict):
+        return np.full(classes.shape, values, dtype=np.float32)
+
+    per_class = np.full(classes.shape, values.get(None, default), dtype=np.float32)
+    for class_index, value in values.items():
+        if class_index is not None:
+            per_class[classes == class_index] = value
+
+    return per_class
+
+
+def _greedy_suppression(boxes, scores, max_output_size, iou_thresholds, score_thresholds):
+    """ Greedy suppression where each selected box removes the remaining ones overlapping it more than its own
+    iou threshold """
+
+    # Score pre-filtering, the suppression only runs on the remaining candidates
+    candidates = np.flatnonzero(scores > score_thresholds)
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    if candidates.size == 0:
+        return candidates.astype(np.int32)
+
+    # Boxes coordinates may be given in any corner order
+    y1 = np.minimum(boxes[candidates, 0], boxes[candidates, 2])
+    x1 = np.minimum(boxes[candidates, 1], boxes[candidates, 3])
+    y2 = np.maximum(boxes[candidates, 0], boxes[candidates, 2])
+    x2 = np.maximum(boxes[candidates, 1], boxes[candidates, 3])
+    areas = (y2 - y1) * (x2 - x1)
+    iou_thresholds = iou_thresholds[candidates]
+
+    selected = []
+    order = np.arange(candidates.size)
+
+    while order.size > 0 and len(selected) < max_output_size:
+        i = order[0]
+        selected.append(i)
+        others = order[1:]
+
+        inter_h = np.maximum(0., np.minimum(y2[i], y2[others]) - np.maximum(y1[i], y1[others]))
+        inter_w = np.maximum(0., np.minimum(x2[i], x2[others]) - np.maximum(x1[i], x1[others]))
+        intersection = inter_h * inter_w
+        union = areas[i] + areas[others] - intersection
+
+        iou = np.zeros_like(intersection)
+        valid = (areas[i] > 0) & (areas[others] > 0) & (union > 0)
+        iou[valid] = intersection[valid] / union[valid]
+
+        order = others[iou <= iou_thresholds[i]]
+
+    return candidates[selected].astype(np.int32)
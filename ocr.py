@@ -2,30 +2,522 @@
 # coding: utf-8
 
 import os
-import pytesseract
+import threading
+import time
 import cv2
 import numpy as np
-import os
+from abc import ABC, abstractmethod
+
+from cache import ResultCache, hash_key
+from color_stats import top_colors, SAMPLE_MAX_PIXELS
+
+
+# Tesseract configuration: languages, '--oem 1' = LSTM OCR Engine (NN) / 0 for legacy engine, '--psm 3' = automatic
+# page segmentation
+TESSERACT_LANG = 'eng+fra'
+TESSERACT_OEM = 1
+TESSERACT_PSM = 3
+
+# Language of the OCR: 'auto' = detected once per page among OCR_LANGUAGES (see detect_language), then only its model
+# is used, or a fixed Tesseract language ('eng', 'fra', 'eng+fra')
+OCR_LANGUAGE = os.environ.get('UI_DETECTOR_OCR_LANGUAGE', 'auto')
+OCR_LANGUAGES = ('eng', 'fra')
+
+# Number of text images (the largest ones) the language of a page is detected on
+LANGUAGE_SAMPLE_SIZE = 3
+
+# Page segmentation mode by type of text element: 7 = single text line, 8 = single word, 6 = uniform block of text.
+# 'text' elements are labels (a single word), lines or paragraphs according to their preprocessed image (see get_psm)
+PSM_BY_TYPE = {'text_input': 7, 'rectangle_button': 7, 'oval_button': 7, 'label': 8, 'line': 7, 'paragraph': 6}
+
+# Blank columns wider than this fraction of the line height separate two words
+WORD_SPACING = .3
+
+# Ink rows lower than this fraction of the highest text line (accents, underlines) are not text lines
+MIN_LINE_HEIGHT = .25
+
+# OCR of the text elements of a page: 'element' = one engine call per element, 'page' = one call for all of them
+# (see ocr_composite)
+OCR_MODE = os.environ.get('UI_DETECTOR_OCR_MODE', 'element')
+
+# Height of the blank bands separating text images in a composite image
+COMPOSITE_SEPARATOR = 20
+
+# Maximum height in pixels of a composite image, the text images of a long page are split into several composites
+# (one engine call each) so that the memory and the time of a call stay bounded. A taller text image is alone in its
+# composite
+COMPOSITE_MAX_HEIGHT = 4096
+
+# Tesseract level of words in image_to_data results
+WORD_LEVEL = 5
+
+# OCR engine used: 'tesserocr' (libtesseract in process), 'pytesseract' (one tesseract process per call), or 'auto'
+# = tesserocr if installed, else pytesseract
+OCR_ENGINE = os.environ.get('UI_DETECTOR_OCR_ENGINE', 'auto')
+
+# OCR results cache, keyed by the preprocessed (binary) text image: OCR_CACHE_SIZE texts kept in memory per worker
+# (0 = no cache), and a disk tier of at most OCR_CACHE_MAX_BYTES shared by the workers (OCR_CACHE_DIR, empty = memory
+# only)
+OCR_CACHE_SIZE = int(os.environ.get('UI_DETECTOR_OCR_CACHE_SIZE', 4096))
+OCR_CACHE_DIR = os.environ.get('UI_DETECTOR_OCR_CACHE_DIR', os.path.join('cache', 'ocr'))
+OCR_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Hard limit of one engine call in seconds (0 = none), a hung Tesseract must not block the worker
+OCR_TIMEOUT = float(os.environ.get('UI_DETECTOR_OCR_TIMEOUT', 10))
+
+
+class OcrTimeout(Exception):
+    """ The OCR did not finish before its timeout or the deadline of the request """
+    pass
+
+
+class OcrEngine(ABC):
+    """ Runs Tesseract on preprocessed (binary) text images """
+
+    @abstractmethod
+    def image_to_data(self, binary_image, lang=TESSERACT_LANG, psm=TESSERACT_PSM, timeout=None):
+        """
+        :param binary_image: uint8 numpy image (black text on white)
+        :param lang: Tesseract language(s)
+        :param psm: Tesseract page segmentation mode
+        :param timeout: seconds the recognition may take (None = no limit), OcrTimeout is raised after
+        :return: list of recognized words, as dicts of text, left, top, width, height, conf and line (identifier of
+                 the text line of the word)
+        """
+        pass
+
+
+class PytesseractEngine(OcrEngine):
+    """ Tesseract command line through pytesseract: each call writes a temporary image, starts a tesseract process
+    and loads the language models """
+
+    def __init__(self):
+        import pytesseract
+
+        self.pytesseract = pytesseract
+        if os.name == "nt":
+            pytesseract.pytesseract.tesseract_cmd = os.path.join('Tesseract-OCR\\tesseract.exe')
+
+    def image_to_data(self, binary_image, lang=TESSERACT_LANG, psm=TESSERACT_PSM, timeout=None):
+
+        try:
+            data = self.pytesseract.image_to_data(binary_image, config=tesseract_config(lang, psm),
+                                                  output_type=self.pytesseract.Output.DICT, timeout=timeout or 0)
+        except RuntimeError as e:
+            # pytesseract kills the tesseract process on timeout
+            if 'timeout' in str(e).lower():
+                raise OcrTimeout(str(e))
+            raise
+
+        words = []
+        for i, text in enumerate(data['text']):
+            if data['level'][i] == WORD_LEVEL and text.strip():
+                words.append({'text': text, 'left': data['left'][i], 'top': data['top'][i],
+                              'width': data['width'][i], 'height': data['height'][i], 'conf': float(data['conf'][i]),
+                              'line': (data['block_num'][i], data['par_num'][i], data['line_num'][i])})
+
+        return words
+
+
+class TesserocrEngine(OcrEngine):
+    """ libtesseract loaded in the worker through tesserocr: language models are loaded once per thread and language
+    (a tesserocr API is not thread safe) and reused for every image """
+
+    def __init__(self):
+        import tesserocr
+
+        self.tesserocr = tesserocr
+        self.local = threading.local()
+
+    def api(self, lang, psm):
+
+        if not hasattr(self.local, 'apis'):
+            self.local.apis = {}
+
+        if lang not in self.local.apis:
+            kwargs = {'path': os.path.join('Tesseract-OCR', 'tessdata')} if os.name == "nt" else {}
+            self.local.apis[lang] = self.tesserocr.PyTessBaseAPI(lang=lang, oem=TESSERACT_OEM, **kwargs)
+
+        api = self.local.apis[lang]
+        api.SetPageSegMode(psm)
+
+        return api
+
+    def image_to_data(self, binary_image, lang=TESSERACT_LANG, psm=TESSERACT_PSM, timeout=None):
+
+        api = self.api(lang, psm)
+        height, width = binary_image.shape[:2]
+        api.SetImageBytes(np.ascontiguousarray(binary_image).tobytes(), width, height, 1, width)
+
+        # Timeout in milliseconds, the recognition is cancelled by libtesseract
+        if not api.Recognize(int(timeout * 1000) if timeout else 0):
+            raise OcrTimeout("Tesseract recognition timeout")
+
+        words, line = [], -1
+        iterator = api.GetIterator()
+        word_level, line_level = self.tesserocr.RIL.WORD, self.tesserocr.RIL.TEXTLINE
+
+        if iterator is None:
+            return words
+
+        while True:
+            if iterator.IsAtBeginningOf(line_level):
+                line += 1
+
+            text = iterator.GetUTF8Text(word_level)
+            box = iterator.BoundingBox(word_level)
+            if text and text.strip() and box:
+                left, top, right, bottom = box
+                words.append({'text': text, 'left': left, 'top': top, 'width': right - left, 'height': bottom - top,
+                              'conf': iterator.Confidence(word_level), 'line': line})
+
+            if not iterator.Next(word_level):
+                break
+
+        return words
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_ocr_engine():
+    """ Return the OCR engine of the current (worker) process, chosen by OCR_ENGINE """
+
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            if OCR_ENGINE in ('auto', 'tesserocr'):
+                try:
+                    _engine = TesserocrEngine()
+                except ImportError:
+                    if OCR_ENGINE == 'tesserocr':
+                        raise
+            if _engine is None:
+                _engine = PytesseractEngine()
+
+    return _engine
+
+
+_ocr_cache = None
+_ocr_cache_lock = threading.Lock()
+
+
+def get_ocr_cache():
+    """ Return the OCR results cache of the current (worker) process, None if disabled """
+
+    global _ocr_cache
+
+    with _ocr_cache_lock:
+        if _ocr_cache is None and OCR_CACHE_SIZE:
+            _ocr_cache = ResultCache(OCR_CACHE_SIZE, OCR_CACHE_DIR, OCR_CACHE_MAX_BYTES)
+
+    return _ocr_cache
+
+
+def tesseract_config(lang=TESSERACT_LANG, psm=TESSERACT_PSM):
+    """ :return: Tesseract command line options of the OCR """
+
+    return '-l %s --oem %d --psm %d' % (lang, TESSERACT_OEM, psm)
+
+
+def get_ocr_cache_key(binary_image, lang=TESSERACT_LANG, psm=TESSERACT_PSM, mode='element'):
+    """
+    :param binary_image: preprocessed text image
+    :param mode: OCR mode the image is recognized in, 'element' (alone) or 'page' (in a composite, see ocr_composite)
+    :return: key of its text in the OCR cache: same pixels, same Tesseract configuration, same mode and same engine =
+             same text
+    """
+
+    return hash_key('data', tesseract_config(lang, psm), mode, type(get_ocr_engine()).__name__, binary_image.shape,
+                    np.ascontiguousarray(binary_image).tobytes())
+
 
+def parse_ocr_profile(lang=None, psm=None):
+    """
+    OCR profile of a request, from its (form) parameters: unknown or empty values are left to automatic selection
+    :param lang: Tesseract language(s), 'auto' or None = detected on the page
+    :param psm: Tesseract page segmentation mode, None = chosen by element type
+    :return: dict of lang and psm
+    """
 
-def ocr(text_image):
+    languages = OCR_LANGUAGES + (TESSERACT_LANG,)
+    psm = int(psm) if psm and str(psm).isdigit() and 0 <= int(psm) <= 13 else None
 
-    processed = preprocessing(text_image)
+    return {'lang': lang if lang in languages else None, 'psm': psm}
+
+
+def get_psm(binary_image, element_type):
+    """
+    :param binary_image: preprocessed text image
+    :param element_type: type of the text element (see constants.text_types)
+    :return: Tesseract page segmentation mode for this element (see PSM_BY_TYPE)
+    """
+
+    if element_type != 'text':
+        return PSM_BY_TYPE.get(element_type, TESSERACT_PSM)
+
+    ink = binary_image == 0
+    rows = ink.any(axis=1)
+
+    if not rows.any():
+        return PSM_BY_TYPE['label']
+
+    lines = runs(rows)
+    lines = lines[lines >= MIN_LINE_HEIGHT * lines.max()]
+
+    if len(lines) > 1:
+        return PSM_BY_TYPE['paragraph']
+
+    columns = np.flatnonzero(ink.any(axis=0))
+    gaps = runs(~ink.any(axis=0)[columns[0]:columns[-1] + 1])
+
+    return PSM_BY_TYPE['line'] if np.any(gaps > WORD_SPACING * lines[0]) else PSM_BY_TYPE['label']
+
+
+def runs(profile):
+    """
+    :param profile: 1D boolean array
+    :return: lengths of its runs of True values
+    """
+
+    bounds = np.flatnonzero(np.diff(np.concatenate(([0], profile.astype(np.int8), [0]))))
+
+    return bounds[1::2] - bounds[::2]
+
+
+def call_timeout(deadline=None):
+    """
+    :param deadline: time.monotonic() time the OCR has to be done by, None = no deadline
+    :return: timeout of the next engine call in seconds (None = no limit)
+    :raise OcrTimeout: if the deadline is passed
+    """
+
+    timeout = OCR_TIMEOUT or None
+
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise OcrTimeout("Request deadline passed")
+        timeout = min(timeout, remaining) if timeout else remaining
+
+    return timeout
+
+
+def detect_language(text_images, deadline=None):
+    """
+    OCR a sample of the text images of a page (a composite of the largest ones) with each language of OCR_LANGUAGES
+    :param text_images: list of BGR numpy images of text elements
+    :param deadline: see call_timeout, languages whose OCR times out are not considered
+    :return: language recognizing the sample with the highest mean word confidence, TESSERACT_LANG if none recognizes
+             anything
+    """
+
+    sample = sorted(text_images, key=lambda image: image.shape[0] * image.shape[1], reverse=True)
+    sample = sample[:LANGUAGE_SAMPLE_SIZE]
+
+    if not sample:
+        return TESSERACT_LANG
+
+    composite, _, _ = build_composite([preprocessing(text_image) for text_image in sample])
+
+    confidences = {}
+    for lang in OCR_LANGUAGES:
+        try:
+            words = get_ocr_engine().image_to_data(composite, lang, timeout=call_timeout(deadline))
+        except OcrTimeout:
+            continue
+        if words:
+            confidences[lang] = np.mean([word['conf'] for word in words])
+
+    return max(confidences, key=confidences.get) if confidences else TESSERACT_LANG
+
+
+def ocr(text_image, lang=TESSERACT_LANG, psm=None, element_type=None, context=None):
+    """
+    :return: text recognized in text_image (see ocr_data)
+    """
+
+    return ocr_data(text_image, lang, psm, element_type, context=context)['text']
+
+
+def ocr_data(text_image, lang=TESSERACT_LANG, psm=None, element_type=None, deadline=None, context=None):
+    """
+    :param text_image: BGR numpy image of a text element
+    :param lang: Tesseract language(s)
+    :param psm: Tesseract page segmentation mode, None = chosen by element type (see get_psm), TESSERACT_PSM if the
+                type is not given either
+    :param element_type: type of the text element
+    :param deadline: see call_timeout
+    :param context: analysis_context.AnalysisContext of text_image, its binary image is reused
+    :return: OCR result of text_image, from a single engine call (see words_to_result)
+    :raise OcrTimeout: if the engine call times out, or the deadline is passed before it
+    """
+
+    processed = context.binary if context is not None else preprocessing(text_image)
 
     # resized = resizing(processed, 120)
 
-    if os.name == "nt":
-        pytesseract.pytesseract.tesseract_cmd = os.path.join('Tesseract-OCR\\tesseract.exe')
+    if psm is None:
+        psm = get_psm(processed, element_type) if element_type else TESSERACT_PSM
+
+    cache = get_ocr_cache()
+    key = get_ocr_cache_key(processed, lang, psm) if cache else None
 
-    # Define config parameters.
-    # '-l eng'  for using the English language
-    # '--oem 1' for using LSTM OCR Engine (NN) / 0 for legacy engine
-    config = '-l eng+fra --oem 1 --psm 3'
+    if cache:
+        result = cache.get(key)
+        if result is not None:
+            return result
 
     # Run tesseract OCR on image
-    text = pytesseract.image_to_string(processed, config=config)
+    result = words_to_result(get_ocr_engine().image_to_data(processed, lang, psm, call_timeout(deadline)))
+
+    if cache:
+        cache.put(key, result)
+
+    return result
 
-    return filter_wrong_char(text)
+
+def ocr_composite(text_images, lang=TESSERACT_LANG, psm=TESSERACT_PSM, deadline=None, contexts=None):
+    """
+    OCR of many text images with a single engine call: their preprocessed versions are stacked in one image,
+    separated by blank bands, and each recognized word is given back to the image it lies on. Images whose text is
+    in the OCR cache are left out of the composite, and composites are limited to COMPOSITE_MAX_HEIGHT (one engine
+    call per chunk, see split_composite)
+    :param text_images: list of BGR numpy images of text elements
+    :param lang: Tesseract language(s)
+    :param psm: Tesseract page segmentation mode of the composite
+    :param deadline: see call_timeout
+    :param contexts: analysis_context.AnalysisContext of each text image, their binary images are reused
+    :return: list of OCR results (see words_to_result), in the same order as text_images
+    :raise OcrTimeout: if the engine call times out, or the deadline is passed before it
+    """
+
+    if contexts is not None:
+        binaries = [context.binary for context in contexts]
+    else:
+        binaries = [preprocessing(text_image) for text_image in text_images]
+    results = [None] * len(binaries)
+
+    cache = get_ocr_cache()
+    if cache:
+        keys = [get_ocr_cache_key(binary, lang, psm, 'page') for binary in binaries]
+        results = [cache.get(key) for key in keys]
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    for chunk in split_composite([binaries[i] for i in missing]):
+        indices = [missing[j] for j in chunk]
+        for i, result in zip(indices, recognize_composite([binaries[i] for i in indices], lang, psm, deadline)):
+            results[i] = result
+            if cache:
+                cache.put(keys[i], result)
+
+    return results
+
+
+def split_composite(binaries, max_height=COMPOSITE_MAX_HEIGHT):
+    """
+    :param binaries: list of preprocessed text images
+    :param max_height: maximum height of a composite (see build_composite), an image taller than it is alone in its
+                       chunk
+    :return: list of chunks, each one a list of consecutive indices of binaries whose composite fits in max_height
+    """
+
+    chunks, height = [], max_height
+    for i, binary in enumerate(binaries):
+        image_height = binary.shape[0] + COMPOSITE_SEPARATOR
+        if height + image_height > max_height:
+            chunks.append([])
+            height = COMPOSITE_SEPARATOR
+        chunks[-1].append(i)
+        height += image_height
+
+    return chunks
+
+
+def recognize_composite(binaries, lang=TESSERACT_LANG, psm=TESSERACT_PSM, deadline=None):
+    """
+    :param binaries: list of preprocessed text images
+    :return: list of their OCR results, recognized by a single engine call, word boxes being relative to each image
+    """
+
+    if not binaries:
+        return []
+
+    composite, tops, bottoms = build_composite(binaries)
+
+    words_by_image = [[] for _ in binaries]
+    for word in get_ocr_engine().image_to_data(composite, lang, psm, call_timeout(deadline)):
+        # The image a word belongs to is the one containing its vertical center
+        center = word['top'] + word['height'] / 2
+        i = int(np.searchsorted(bottoms, center))
+        if i < len(binaries) and tops[i] <= center:
+            words_by_image[i].append(dict(word, top=word['top'] - tops[i], left=word['left'] - COMPOSITE_SEPARATOR))
+
+    return [words_to_result(words) for words in words_by_image]
+
+
+def build_composite(binaries):
+    """
+    :param binaries: list of preprocessed text images
+    :return: the images stacked in one image, separated by blank bands, and the top and bottom rows of each image in it
+    """
+
+    width = max(binary.shape[1] for binary in binaries) + 2 * COMPOSITE_SEPARATOR
+
+    # Vertical position of each image in the composite
+    tops, bottoms, top = [], [], COMPOSITE_SEPARATOR
+    for binary in binaries:
+        tops.append(top)
+        bottoms.append(top + binary.shape[0])
+        top += binary.shape[0] + COMPOSITE_SEPARATOR
+
+    composite = np.full((top, width), 255, dtype=np.uint8)
+    for binary, top in zip(binaries, tops):
+        composite[top:top + binary.shape[0], COMPOSITE_SEPARATOR:COMPOSITE_SEPARATOR + binary.shape[1]] = binary
+
+    return composite, tops, bottoms
+
+
+def words_to_result(words):
+    """
+    :param words: words returned by OcrEngine.image_to_data
+    :return: OCR result, dict of:
+             text: recognized text (see words_to_text)
+             words: the words
+             lines: [left, top, right, bottom] box of each text line, top to bottom
+             conf: mean confidence of the words (0 if no word)
+    """
+
+    lines = {}
+    for word in words:
+        box = lines.setdefault(word['line'], [word['left'], word['top'], word['left'], word['top']])
+        box[0], box[1] = min(box[0], word['left']), min(box[1], word['top'])
+        box[2], box[3] = max(box[2], word['left'] + word['width']), max(box[3], word['top'] + word['height'])
+
+    return {
+        'text': filter_wrong_char(words_to_text(words)),
+        'words': words,
+        'lines': sorted(lines.values(), key=lambda box: box[1]),
+        'conf': float(np.mean([word['conf'] for word in words])) if words else 0.
+    }
+
+
+def words_to_text(words):
+    """
+    :param words: words returned by OcrEngine.image_to_data
+    :return: text of the words, a line per text line, lines ordered top to bottom and words left to right
+    """
+
+    lines = {}
+    for word in words:
+        lines.setdefault(word['line'], []).append(word)
+
+    ordered_lines = sorted(lines.values(), key=lambda line: min(word['top'] for word in line))
+
+    return '\n'.join(' '.join(word['text'] for word in sorted(line, key=lambda word: word['left']))
+                     for line in ordered_lines)
 
 
 def filter_wrong_char(text):
@@ -36,6 +528,15 @@ def preprocessing(text_image):
 
     gray = cv2.cvtColor(text_image, cv2.COLOR_BGR2GRAY)
 
+    return binarize(gray)
+
+
+def binarize(gray):
+    """
+    :param gray: grayscale image
+    :return: Otsu binary image, black text on white (inverted if there are more black pixels than white ones)
+    """
+
     # converting to binary image
     _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_OTSU)
 
@@ -70,8 +571,5 @@ def padding(image, padding_size, padding_color):
 
 
 def find_main_color(image):
-    im2d = image.reshape(-1, image.shape[-1])
-    col_range = (256, 256, 256)  # generically : a2D.max(0)+1
-    im1d = np.ravel_multi_index(im2d.T, col_range)
-    b, g, r = np.unravel_index(np.bincount(im1d).argmax(), col_range)
+    b, g, r = top_colors(image, 1, SAMPLE_MAX_PIXELS)[0]
     return [b, g, r]
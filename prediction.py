@@ -1,10 +1,13 @@
 import numpy as np
+import collections
 import os
-import tensorflow as tf
+import threading
 import cv2
+from abc import ABC, abstractmethod
 
-from object_detection.utils import label_map_util
-from object_detection.utils import visualization_utils as vis_util
+from cache import ResultCache, hash_key
+from nms import non_max_suppression, class_aware_non_max_suppression
+from thread_budget import get_thread_budget
 
 MODEL_NAME = 'ui_detection_graph_3363.pb'
 
@@ -14,74 +17,359 @@ NUM_CLASSES = 19
 # Minimum confidence score under wich we don't show/save predictions
 MIN_SCORE_TRESH = .4
 
+# Overlapping boxes removal: 'agnostic' = any box can suppress any other, 'class' = only boxes of the same class
+NMS_MODE = os.environ.get('UI_DETECTOR_NMS_MODE', 'agnostic')
 
-def detection(image):
+# Maximum intersection over union between two kept boxes, and maximum number of kept boxes
+IOU_TRESH = .1
+MAX_OUTPUT_SIZE = 1000
+
+# Per class overrides of IOU_TRESH and MIN_SCORE_TRESH in 'class' mode, as {class index: treshold}
+IOU_TRESH_BY_CLASS = {}
+SCORE_TRESH_BY_CLASS = {}
+
+# Batched detection: images are padded to their size rounded up to a multiple of BUCKET_SIZE pixels, and at most
+# MAX_BATCH_SIZE images of the same bucket are run together
+BUCKET_SIZE = 128
+MAX_BATCH_SIZE = 8
+PADDING_COLOR = (255, 255, 255)
+
+# Tiled detection of tall images (height > TILING_MIN_ASPECT_RATIO * width): tiles are TILE_ASPECT_RATIO * width high,
+# overlap by TILE_OVERLAP pixels and are run TILE_BATCH_SIZE at a time. Boxes within SEAM_MARGIN pixels of a seam
+# are considered cut by it
+TILING_MIN_ASPECT_RATIO = 3
+TILE_ASPECT_RATIO = 1
+TILE_OVERLAP = 200
+TILE_BATCH_SIZE = 2
+SEAM_MARGIN = 2
+
+# Detection results cache: DETECTION_CACHE_SIZE results kept in memory per worker (0 = no cache), and a disk tier of
+# at most DETECTION_CACHE_MAX_BYTES shared by the workers (DETECTION_CACHE_DIR, empty = memory only)
+DETECTION_CACHE_SIZE = int(os.environ.get('UI_DETECTOR_DETECTION_CACHE_SIZE', 32))
+DETECTION_CACHE_DIR = os.environ.get('UI_DETECTOR_DETECTION_CACHE_DIR', os.path.join('cache', 'detection'))
+DETECTION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Path to frozen detection graph. This is the actual model that is used for the object detection.
+PATH_TO_CKPT = os.path.join('trained_graphs', MODEL_NAME, 'frozen_inference_graph.pb')
+
+# OpenCV text graph of the frozen graph (generated with OpenCV's tf_text_graph_faster_rcnn.py)
+PATH_TO_PBTXT = os.path.join('trained_graphs', MODEL_NAME, 'opencv_graph.pbtxt')
+
+# Inference engine running the graph, see BACKENDS
+DETECTOR_BACKEND = os.environ.get('UI_DETECTOR_BACKEND', 'tensorflow')
+
+# Path to labelmap = List of the strings that is used to add correct label for each box.
+PATH_TO_LABELS = os.path.join('dataset', 'annotations', 'label_map.pbtxt')
+
+# Draw the detected boxes on the input image (debug only, slow and modifies the image in place)
+DEBUG_VISUALIZATION = os.environ.get('UI_DETECTOR_DEBUG_VISUALIZATION', '0') == '1'
+
+
+class DetectorBackend(ABC):
+    """ Inference engine running the frozen detection graph """
+
+    @abstractmethod
+    def run(self, batch):
+        """
+        :param batch: [batch_size, H, W, 3] uint8 numpy array
+        :return: boxes (normalized [ymin, xmin, ymax, xmax]), scores, classes and num_detections, one row per image
+        """
+        pass
+
+    def close(self):
+        """ Release the resources of the backend (nothing to release by default) """
+        pass
+
+
+class TensorFlowBackend(DetectorBackend):
+    """ The frozen graph run by a tf.Session kept open (with the threads of the worker budget), input/output tensors
+    resolved once """
+
+    def __init__(self, path_to_ckpt=PATH_TO_CKPT):
+
+        import tensorflow as tf
+
+        # Load a (frozen) Tensorflow model into memory.
+        self.graph = tf.Graph()
+        with self.graph.as_default():
+            od_graph_def = tf.GraphDef()
+            with tf.gfile.GFile(path_to_ckpt, 'rb') as fid:
+                serialized_graph = fid.read()
+                od_graph_def.ParseFromString(serialized_graph)
+                tf.import_graph_def(od_graph_def, name='')
+
+        budget = get_thread_budget()
+        config = tf.ConfigProto(intra_op_parallelism_threads=budget['tf_intra_op'],
+                                inter_op_parallelism_threads=budget['tf_inter_op'])
+        self.sess = tf.Session(graph=self.graph, config=config)
+
+        # Extracting tensors (tensorflow variables)
+        self.image_tensor = self.graph.get_tensor_by_name('image_tensor:0')
+        self.output_tensors = [self.graph.get_tensor_by_name('detection_boxes:0'),
+                               self.graph.get_tensor_by_name('detection_scores:0'),
+                               self.graph.get_tensor_by_name('detection_classes:0'),
+                               self.graph.get_tensor_by_name('num_detections:0')]
+
+    def run(self, batch):
+
+        # Run variable through tf.session with our detection graph = actual detection
+        return self.sess.run(self.output_tensors, feed_dict={self.image_tensor: batch})
+
+    def close(self):
+        self.sess.close()
+
+
+class OpenCVBackend(DetectorBackend):
+    """ The same frozen graph run by OpenCV's dnn module (CPU), no TensorFlow needed at runtime. path_to_pbtxt is the
+    text graph description generated from the frozen graph by OpenCV's tf_text_graph_faster_rcnn.py """
+
+    def __init__(self, path_to_ckpt=PATH_TO_CKPT, path_to_pbtxt=PATH_TO_PBTXT):
+        self.net = cv2.dnn.readNetFromTensorflow(path_to_ckpt, path_to_pbtxt)
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+
+    def run(self, batch):
+
+        all_boxes, all_scores, all_classes, num_detections = [], [], [], []
+
+        for image in batch:
+            height, width = image.shape[:2]
+
+            # Channels are fed in the same order as with the TensorFlow backend
+            self.net.setInput(cv2.dnn.blobFromImage(image, size=(width, height), swapRB=False, crop=False))
+
+            # Output: [1, 1, N, 7] rows of [image index, class, score, xmin, ymin, xmax, ymax] (normalized), class ids
+            # are those of the label map (background = 0 is never output)
+            detections = self.net.forward().reshape(-1, 7)
+
+            all_boxes.append(detections[:, [4, 3, 6, 5]])
+            all_scores.append(detections[:, 2])
+            all_classes.append(detections[:, 1])
+            num_detections.append(detections.shape[0])
+
+        # Images of a batch may have different numbers of detections, rows are padded with zero scores
+        max_detections = max(num_detections)
+        boxes = np.zeros((len(batch), max_detections, 4), dtype=np.float32)
+        scores = np.zeros((len(batch), max_detections), dtype=np.float32)
+        classes = np.ones((len(batch), max_detections), dtype=np.float32)
+
+        for i, n in enumerate(num_detections):
+            boxes[i, :n], scores[i, :n], classes[i, :n] = all_boxes[i], all_scores[i], all_classes[i]
+
+        return boxes, scores, classes, np.array(num_detections, dtype=np.float32)
+
+
+BACKENDS = {'tensorflow': TensorFlowBackend, 'opencv': OpenCVBackend}
+
+
+class Detector:
+    """
+    Long-lived object detector: the detection graph is loaded once by its backend (see DetectorBackend), so that each
+    call to detect() only runs the actual inference
+    """
+
+    def __init__(self, backend=None, path_to_labels=PATH_TO_LABELS, cache=None):
+
+        self.backend = backend if backend else BACKENDS[DETECTOR_BACKEND]()
+        self.path_to_labels = path_to_labels
+        self.category_index = None
+
+        # Results of already seen images (see get_detection_cache_key), None = no cache
+        self.cache = cache
+
+    def detect(self, image):
+        """
+        :param image: BGR numpy image
+        :return: pixelwise boxes, classes and scores of the detected elements (overlapping boxes removed)
+        """
+
+        if self.cache is None:
+            return self.run_detection(image)
+
+        key = get_detection_cache_key(image)
+        results = self.cache.get(key)
+
+        if results is None:
+            results = self.run_detection(image)
+            self.cache.put(key, results)
+
+        return results
+
+    def run_detection(self, image):
+        """ Detection of one image, without cache """
+
+        if needs_tiling(image):
+            return self.detect_tiled(image)
+
+        # Expand dimensions since the model expects images to have shape: [1, None, None, 3]
+        image_np_expanded = np.expand_dims(image, axis=0)
+
+        # Actual detection, run by the backend
+        (boxes, scores, classes, num_detections) = self.backend.run(image_np_expanded)
+
+        return self.postprocess(image, boxes[0], classes[0], scores[0])
+
+    def detect_batch(self, images, batch_size=MAX_BATCH_SIZE):
+        """
+        Detection on several images with one session run per batch: images are grouped by size bucket and padded to
+        the size of their bucket, so that each batch is a single [batch_size, H, W, 3] tensor
+        :param images: list of BGR numpy images
+        :param batch_size: maximum number of images per session run
+        :return: list of (pixelwise boxes, classes, scores), in the same order as images
+        """
+
+        buckets = collections.OrderedDict()
+        for i, image in enumerate(images):
+            buckets.setdefault(get_size_bucket(image), []).append(i)
+
+        results = [None] * len(images)
+
+        for padded_shape, indices in buckets.items():
+            for start in range(0, len(indices), batch_size):
+                batch_indices = indices[start:start + batch_size]
+                batch = np.stack([pad_image(images[i], padded_shape) for i in batch_indices])
+
+                (boxes, scores, classes, num_detections) = self.backend.run(batch)
+
+                for j, i in enumerate(batch_indices):
+                    results[i] = self.postprocess(images[i], boxes[j], classes[j], scores[j], padded_shape)
 
-    # Path to frozen detection graph. This is the actual model that is used for the object detection.
-    path_to_ckpt = 'trained_graphs\\' + MODEL_NAME + '\\frozen_inference_graph.pb'
-    # Path to labelmap = List of the strings that is used to add correct label for each box.
-    path_to_labels = os.path.join('dataset\\annotations', 'label_map.pbtxt')
-
-    # Load a (frozen) Tensorflow model into memory.
-    detection_graph = tf.Graph()
-    with detection_graph.as_default():
-        od_graph_def = tf.GraphDef()
-        with tf.gfile.GFile(path_to_ckpt, 'rb') as fid:
-            serialized_graph = fid.read()
-            od_graph_def.ParseFromString(serialized_graph)
-            tf.import_graph_def(od_graph_def, name='')
-
-    # Loading label map
-    label_map = label_map_util.load_labelmap(path_to_labels)
-    categories = label_map_util.convert_label_map_to_categories(
-        label_map, max_num_classes=NUM_CLASSES, use_display_name=True)
-    category_index = label_map_util.create_category_index(categories)
-
-    # Detection
-    with detection_graph.as_default():
-        with tf.Session(graph=detection_graph) as sess:
-
-            # Expand dimensions since the model expects images to have shape: [1, None, None, 3]
-            image_np_expanded = np.expand_dims(image, axis=0)
-
-            # Extracting tensors (tensorflow variables)
-            image_tensor = detection_graph.get_tensor_by_name('image_tensor:0')
-            boxes = detection_graph.get_tensor_by_name('detection_boxes:0')
-            scores = detection_graph.get_tensor_by_name('detection_scores:0')
-            classes = detection_graph.get_tensor_by_name('detection_classes:0')
-            num_detections = detection_graph.get_tensor_by_name(
-                'num_detections:0')
-
-            # Run variable through tf.session with our detection graph = actual detection
-            (boxes, scores, classes, num_detections) = sess.run(
-                [boxes, scores, classes, num_detections],
-                feed_dict={image_tensor: image_np_expanded})
-
-            selected_boxes, selected_classes, selected_scores = delete_overlapping_boxes(sess,
-                                                                                         np.squeeze(boxes),
-                                                                                         np.squeeze(classes),
-                                                                                         np.squeeze(scores))
-            # np.squeeze(boxes), np.squeeze(classes), np.squeeze(scores)
-            # delete_overlapping_boxes(sess, np.squeeze(boxes), np.squeeze(classes), np.squeeze(scores))
-            # delete_overlapping_boxes_by_class(sess, boxes, classes, scores)
-
-            # Visualization of the results
-            vis_util.visualize_boxes_and_labels_on_image_array(
-                image,
-                selected_boxes,
-                selected_classes.astype(np.int32),
-                selected_scores,
-                category_index,
-                use_normalized_coordinates=True,
-                line_thickness=5,
-                min_score_thresh=MIN_SCORE_TRESH,
-                max_boxes_to_draw=1000)
-
-            # display_output(image)
-
-            normalized_boxes = get_pixelwise_boxes_coordinates(image, selected_boxes)
-
-    return normalized_boxes, selected_classes, selected_scores
+        return results
+
+    def detect_tiled(self, image, tile_height=None, overlap=TILE_OVERLAP):
+        """
+        Detection on a very tall image (full-page screenshot) cut into overlapping tiles, so that the model's internal
+        resize does not shrink small elements, and so that memory only depends on the tile size
+        :param image: BGR numpy image
+        :param tile_height: height of the tiles in pixels (default: TILE_ASPECT_RATIO * image width)
+        :param overlap: number of pixels shared by two consecutive tiles
+        :return: pixelwise boxes, classes and scores of the detected elements on the whole image
+        """
+
+        im_height, im_width = image.shape[:2]
+        tile_height = tile_height if tile_height else int(TILE_ASPECT_RATIO * im_width)
+
+        tops = get_tiles_tops(im_height, tile_height, overlap)
+        tiles = [image[top:top + tile_height] for top in tops]
+
+        all_boxes, all_classes, all_scores = [], [], []
+
+        for i, (boxes, classes, scores) in enumerate(self.detect_batch(tiles, TILE_BATCH_SIZE)):
+            if boxes.size == 0:
+                continue
+
+            # Boxes touching a seam are likely cut, they are dropped if the element fits in the overlap (and so is
+            # entirely seen by the neighbour tile)
+            tile_bottom = tiles[i].shape[0] - SEAM_MARGIN
+            touches_seam = ((boxes[:, 0] <= SEAM_MARGIN) & (i > 0)) | \
+                           ((boxes[:, 2] >= tile_bottom) & (i < len(tops) - 1))
+            kept = ~(touches_seam & ((boxes[:, 2] - boxes[:, 0]) < overlap))
+
+            boxes = boxes[kept]
+            boxes[:, [0, 2]] += tops[i]
+
+            all_boxes.append(boxes)
+            all_classes.append(classes[kept])
+            all_scores.append(scores[kept])
+
+        if not all_boxes:
+            return np.zeros((0, 4), dtype=np.int32), np.zeros(0), np.zeros(0)
+
+        # Elements seen by two tiles are merged
+        return remove_overlapping_boxes(np.vstack(all_boxes), np.hstack(all_classes), np.hstack(all_scores))
+
+    def postprocess(self, image, boxes, classes, scores, padded_shape=None):
+        """
+        :param image: BGR numpy image the detection ran on
+        :param boxes: "squeezed" normalized boxes, classes and scores of this image
+        :param padded_shape: (height, width) of the tensor fed to the graph if the image was padded
+        :return: pixelwise boxes, classes and scores of the detected elements (overlapping boxes removed)
+        """
+
+        selected_boxes, selected_classes, selected_scores = remove_overlapping_boxes(boxes, classes, scores)
+
+        normalized_boxes = get_pixelwise_boxes_coordinates(image, selected_boxes, padded_shape)
+
+        # Boxes lying in the padding (or thinner than a pixel) are empty once clipped to the image, nothing to crop
+        ymin, xmin, ymax, xmax = normalized_boxes.T
+        non_empty = (ymax > ymin) & (xmax > xmin)
+        normalized_boxes = normalized_boxes[non_empty]
+        selected_classes, selected_scores = selected_classes[non_empty], selected_scores[non_empty]
+
+        if DEBUG_VISUALIZATION:
+            self.visualize(image, normalized_boxes, selected_classes, selected_scores)
+
+        return normalized_boxes, selected_classes, selected_scores
+
+    def visualize(self, image, boxes, classes, scores):
+        """ Draw the (pixelwise) detection boxes and their labels on the image, in place """
+
+        from object_detection.utils import label_map_util
+        from object_detection.utils import visualization_utils as vis_util
+
+        # Loading label map
+        if self.category_index is None:
+            label_map = label_map_util.load_labelmap(self.path_to_labels)
+            categories = label_map_util.convert_label_map_to_categories(
+                label_map, max_num_classes=NUM_CLASSES, use_display_name=True)
+            self.category_index = label_map_util.create_category_index(categories)
+
+        vis_util.visualize_boxes_and_labels_on_image_array(
+            image,
+            boxes,
+            classes.astype(np.int32),
+            scores,
+            self.category_index,
+            use_normalized_coordinates=False,
+            line_thickness=5,
+            min_score_thresh=MIN_SCORE_TRESH,
+            max_boxes_to_draw=1000)
+
+        # display_output(image)
+
+    def close(self):
+        self.backend.close()
+
+
+def remove_overlapping_boxes(boxes, classes, scores):
+    """ Overlapping boxes removal according to NMS_MODE """
+
+    if NMS_MODE == 'class':
+        return delete_overlapping_boxes_by_class(boxes, classes, scores)
+
+    return delete_overlapping_boxes(boxes, classes, scores)
+
+
+_detector = None
+_detector_lock = threading.Lock()
+
+
+def get_detector():
+    """ Return the detector of the current (worker) process, loading it on first call """
+
+    global _detector
+
+    # Locked, several threads may ask for it at the same time
+    with _detector_lock:
+        if _detector is None:
+            cache = ResultCache(DETECTION_CACHE_SIZE, DETECTION_CACHE_DIR, DETECTION_CACHE_MAX_BYTES) \
+                if DETECTION_CACHE_SIZE else None
+            _detector = Detector(cache=cache)
+
+    return _detector
+
+
+def get_detection_cache_key(image):
+    """ Cache key of the detection results of an image: hash of its decoded pixels and of everything (model,
+    tresholds) the results depend on """
+
+    return hash_key(MODEL_NAME, DETECTOR_BACKEND, MIN_SCORE_TRESH, NMS_MODE, IOU_TRESH,
+                    sorted(IOU_TRESH_BY_CLASS.items()), sorted(SCORE_TRESH_BY_CLASS.items()), TILING_MIN_ASPECT_RATIO,
+                    TILE_ASPECT_RATIO, TILE_OVERLAP, image.shape, image.dtype, np.ascontiguousarray(image).tobytes())
+
+
+def detection(image):
+    return get_detector().detect(image)
 
 
 def display_output(image):
@@ -95,84 +383,91 @@ def display_output(image):
     cv2.destroyAllWindows()
 
 
-def delete_overlapping_boxes_by_class(sess, boxes, classes, scores):
-    """ params: tf.session, raw object detection result and index of a class we want to select
-        returns: new arrays of boxes, classes and scores with boxes of the same class overlapping removed """
+def delete_overlapping_boxes_by_class(boxes, classes, scores):
+    """ params: "squeezed" object detection result
+        returns: new arrays of boxes, classes and scores with boxes of the same class overlapping removed (depending on
+                 the per class tresholds) """
 
-    new_boxes, new_classes, new_scores = [], [], []
-
-    for i in range(1, NUM_CLASSES + 1):
-        selected_boxes, selected_classes, selected_scores = class_selection(sess, boxes, classes, scores, i)
-        if selected_boxes.shape[0] > 1:
-            selected_boxes, selected_classes, selected_scores = delete_overlapping_boxes(sess, selected_boxes,
-                                                                                         selected_classes,
-                                                                                         selected_scores)
-        for b in selected_boxes:
-            new_boxes.append(b)
-        new_classes = np.hstack((new_classes, selected_classes))
-        new_scores = np.hstack((new_scores, selected_scores))
+    selected_indices = class_aware_non_max_suppression(
+        boxes,
+        classes,
+        scores,
+        MAX_OUTPUT_SIZE,
+        iou_threshold={**IOU_TRESH_BY_CLASS, None: IOU_TRESH},
+        score_threshold={**SCORE_TRESH_BY_CLASS, None: MIN_SCORE_TRESH}
+    )
 
-    return np.array(new_boxes), new_classes, new_scores
+    return boxes[selected_indices], classes[selected_indices], scores[selected_indices]
 
 
-def delete_overlapping_boxes(sess, boxes, classes, scores):
-    """ params: tf.session and "squeezed" object detection result
+def delete_overlapping_boxes(boxes, classes, scores):
+    """ params: "squeezed" object detection result
         returns: new arrays of boxes, classes and scores with boxes overlapping (depending on treshold) removed """
 
-    max_output_size = 1000
-    overlapping_treshold = .1
-
-    selected_indices = tf.image.non_max_suppression(
+    selected_indices = non_max_suppression(
         boxes,
         scores,
-        max_output_size,
-        iou_threshold=overlapping_treshold,
-        score_threshold=MIN_SCORE_TRESH,
-        name=None
+        MAX_OUTPUT_SIZE,
+        iou_threshold=IOU_TRESH,
+        score_threshold=MIN_SCORE_TRESH
     )
 
-    selected_indices = sess.run(selected_indices)
-    selected_boxes = np.array(sess.run(tf.gather(np.squeeze(boxes), selected_indices)))
-    selected_classes = np.array(sess.run(tf.gather(classes, selected_indices)))
-    selected_scores = np.array(sess.run(tf.gather(np.squeeze(scores), selected_indices)))
+    return boxes[selected_indices], classes[selected_indices], scores[selected_indices]
 
-    return selected_boxes, selected_classes, selected_scores
 
+def needs_tiling(image):
+    """ True if the image is too tall to be detected whole (see TILING_MIN_ASPECT_RATIO) """
 
-def class_selection(sess, boxes, classes, scores, class_index):
-    """ params: tf.session, raw object detection result and index of a class we want to select
-        returns: new arrays of boxes, classes and scores with only the results corresponding to the class we chose """
+    im_height, im_width = image.shape[:2]
+
+    return im_height > TILING_MIN_ASPECT_RATIO * im_width
+
+
+def get_tiles_tops(im_height, tile_height, overlap):
+    """ y coordinates of the top of the tiles covering an image, the last tile being aligned to the bottom """
+
+    if im_height <= tile_height:
+        return [0]
+
+    step = tile_height - overlap
+    tops = list(range(0, im_height - tile_height, step))
+    tops.append(im_height - tile_height)
+
+    return tops
 
-    classes = np.squeeze(classes)
-    new_classes = []
-    indices = []
 
-    for i, item in enumerate(classes):
-        if item == class_index:
-            new_classes.append(item.astype(np.int32))
-            indices.append(i)
+def get_size_bucket(image):
+    """ Size (height, width) of the batch an image is padded to: its own size rounded up to a multiple of BUCKET_SIZE
+    """
 
-    new_boxes = tf.gather(np.squeeze(boxes), np.array(indices).astype(np.int64))
-    new_scores = tf.gather(np.squeeze(scores), np.array(indices).astype(np.int64))
-    new_boxes, new_scores = sess.run([new_boxes, new_scores])
+    im_height, im_width = image.shape[:2]
+
+    return -(-im_height // BUCKET_SIZE) * BUCKET_SIZE, -(-im_width // BUCKET_SIZE) * BUCKET_SIZE
 
-    return np.array(new_boxes), np.array(new_classes), np.array(new_scores)
 
+def pad_image(image, padded_shape):
+    """ Pad an image on the bottom and on the right up to padded_shape (height, width) """
+
+    im_height, im_width = image.shape[:2]
 
-def get_pixelwise_boxes_coordinates(image, boxes):
-    """ params: original image and already processed (through overlapping removal = already squeezed) boxes
-        returns: an array of boxes, each box being an array containing their pixelwise (detection output coordinates are
-                normalized) position """
+    return cv2.copyMakeBorder(image, 0, padded_shape[0] - im_height, 0, padded_shape[1] - im_width,
+                              cv2.BORDER_CONSTANT, value=PADDING_COLOR)
+
+
+def get_pixelwise_boxes_coordinates(image, boxes, padded_shape=None):
+    """ params: original image, already processed (through overlapping removal = already squeezed) boxes and the
+                (height, width) the image was padded to before detection, if it was
+        returns: int32 array of boxes, each box being their pixelwise (detection output coordinates are normalized)
+                 [ymin, xmin, ymax, xmax] position """
 
     # Getting image dimensions (box coordinates are normalized, we have to multiply them by the image size)
     im_height, im_width = image.shape[:2]
 
-    boxes_coordinates = []
-    for i, box in enumerate(boxes):
-        box[0] = box[0] * im_height
-        box[1] = box[1] * im_width
-        box[2] = box[2] * im_height
-        box[3] = box[3] * im_width
-        boxes_coordinates.append(box)
+    # Coordinates of a padded image are normalized on the padded size, and are then clipped to the actual image
+    scale_height, scale_width = padded_shape if padded_shape else (im_height, im_width)
+
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scale = np.array([scale_height, scale_width, scale_height, scale_width], dtype=np.float32)
+    limits = np.array([im_height, im_width, im_height, im_width], dtype=np.float32)
 
-    return np.array(boxes_coordinates)
+    return np.minimum(boxes * scale, limits).astype(np.int32)
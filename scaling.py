@@ -0,0 +1,88 @@
+import math
+import cv2
+from PIL import Image
+
+# Device pixel ratios a screenshot can be taken with (1 = CSS pixels)
+SUPPORTED_PIXEL_RATIOS = (1, 1.5, 2, 3)
+
+# Resolution written in the metadata of a 1x screenshot, times the pixel ratio for HiDPI ones (macOS: 72 dpi,
+# Windows: 96 dpi)
+BASE_DPI = (72, 96)
+
+# Maximum difference between dpi / base dpi and a supported ratio for the resolution to give this ratio
+DPI_RATIO_TOLERANCE = .05
+
+# Range of the declared pixel ratios accepted, others (and non numbers) are ignored and the ratio is guessed
+MIN_PIXEL_RATIO = .5
+MAX_PIXEL_RATIO = 4
+
+
+def detect_device_pixel_ratio(path_image, declared_ratio=None):
+    """
+    Device pixel ratio of a screenshot: the declared one if any, else guessed from the image resolution metadata
+    :param path_image: path to the screenshot file
+    :param declared_ratio: ratio given by the user (string or number), None or empty if unknown
+    :return: float ratio, 1 if it cannot be guessed
+    """
+
+    declared_ratio = parse_pixel_ratio(declared_ratio)
+    if declared_ratio:
+        return declared_ratio
+
+    try:
+        dpi = Image.open(path_image).info.get('dpi')
+    except (IOError, ValueError):
+        dpi = None
+
+    if not dpi:
+        return 1.
+
+    # Ratios the resolution matches for one of the base resolutions: 144 dpi is 2x on macOS as well as 1.5x on
+    # Windows, such an ambiguous resolution is not trusted
+    ratios = {ratio for base_dpi in BASE_DPI for ratio in SUPPORTED_PIXEL_RATIOS
+              if abs(dpi[0] / base_dpi - ratio) <= DPI_RATIO_TOLERANCE}
+
+    return float(ratios.pop()) if len(ratios) == 1 else 1.
+
+
+def parse_pixel_ratio(declared_ratio):
+    """
+    :param declared_ratio: ratio given by the user (raw form input, or number), None or empty if unknown
+    :return: float ratio, None if it is not a finite number between MIN_PIXEL_RATIO and MAX_PIXEL_RATIO
+    """
+
+    try:
+        ratio = float(declared_ratio)
+    except (TypeError, ValueError):
+        return None
+
+    if not math.isfinite(ratio) or not MIN_PIXEL_RATIO <= ratio <= MAX_PIXEL_RATIO:
+        return None
+
+    return ratio
+
+
+def normalize_scale(image, pixel_ratio):
+    """
+    :param image: full resolution screenshot
+    :param pixel_ratio: device pixel ratio of the screenshot
+    :return: the screenshot resized to CSS pixels (the image itself if it already is)
+    """
+
+    if pixel_ratio == 1:
+        return image
+
+    height, width = image.shape[:2]
+
+    return cv2.resize(image, (int(round(width / pixel_ratio)), int(round(height / pixel_ratio))),
+                      interpolation=cv2.INTER_AREA)
+
+
+def crop_full_resolution(hires_image, pixel_ratio, ymin, ymax, xmin, xmax):
+    """
+    Crop of the full resolution screenshot corresponding to a box given in CSS pixels
+    :return: numpy image (view of hires_image)
+    """
+
+    return hires_image[int(ymin * pixel_ratio):int(round(ymax * pixel_ratio)),
+                       int(xmin * pixel_ratio):int(round(xmax * pixel_ratio))]
@@ -0,0 +1,71 @@
+import os
+
+# Threads each worker may use, shared by TensorFlow, OpenCV and Tesseract (default: cores / number of workers)
+THREADS_PER_WORKER = os.environ.get('UI_DETECTOR_THREADS_PER_WORKER')
+
+# Number of worker processes when not run by uwsgi
+DEFAULT_WORKERS = int(os.environ.get('UI_DETECTOR_WORKERS', 1))
+
+_budget = None
+
+
+def get_worker_count():
+    """ Number of processes sharing the machine: uwsgi workers if run by uwsgi """
+
+    try:
+        import uwsgi
+        return uwsgi.numproc
+    except (ImportError, AttributeError):
+        return DEFAULT_WORKERS
+
+
+def compute_thread_budget(workers=None, cores=None, threads_per_worker=None):
+    """
+    :param workers: number of worker processes (default: get_worker_count())
+    :param cores: number of cores of the machine (default: all)
+    :param threads_per_worker: forced number of threads per worker (default: THREADS_PER_WORKER, or cores / workers)
+    :return: dict of thread counts for TensorFlow (intra and inter op), OpenCV and Tesseract
+    """
+
+    workers = workers if workers else get_worker_count()
+    cores = cores if cores else os.cpu_count()
+    threads_per_worker = threads_per_worker if threads_per_worker else THREADS_PER_WORKER
+
+    threads = int(threads_per_worker) if threads_per_worker else max(1, cores // workers)
+
+    return {
+        'workers': workers,
+        'threads': threads,
+        # Faster R-CNN is a chain of big ops: threads go to each op, few ops run concurrently
+        'tf_intra_op': threads,
+        'tf_inter_op': 1 if threads < 4 else 2,
+        'opencv': threads,
+        # Tesseract runs on small crops, OpenMP threads mostly spin for them
+        'tesseract': 1 if threads < 4 else 2
+    }
+
+
+def apply_thread_budget(budget=None):
+    """
+    Apply a thread budget to the current process: has to be called before Tesseract and the detection session start
+    :param budget: dict returned by compute_thread_budget (default: computed for this machine)
+    :return: the applied budget
+    """
+
+    global _budget
+
+    _budget = budget if budget else compute_thread_budget()
+
+    # Read by the OpenMP runtime of Tesseract (tesseract processes inherit it)
+    os.environ['OMP_THREAD_LIMIT'] = str(_budget['tesseract'])
+
+    import cv2
+    cv2.setNumThreads(_budget['opencv'])
+
+    return _budget
+
+
+def get_thread_budget():
+    """ :return: the budget applied to this process, computed for this machine if none was """
+
+    return _budget if _budget else compute_thread_budget()
@@ -0,0 +1,61 @@
+import shutil
+import tempfile
+import time
+import cv2
+import numpy as np
+
+from mockup import Mockup
+from ocr import ocr
+
+
+def synthetic_screenshot():
+    """
+    Small fake web page: a title, a button and an image block on a white background
+    :return: BGR numpy image and its (boxes, classes, scores) "detection results" (classes: text, button, image)
+    """
+
+    image = np.full((300, 600, 3), 255, dtype=np.uint8)
+
+    cv2.putText(image, "Connexion", (40, 70), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (40, 40, 40), 2, cv2.LINE_AA)
+
+    cv2.rectangle(image, (40, 130), (240, 180), (200, 120, 30), cv2.FILLED)
+    cv2.putText(image, "Rechercher", (65, 163), cv2.FONT_HERSHEY_SIMPLEX, .8, (255, 255, 255), 2, cv2.LINE_AA)
+
+    cv2.rectangle(image, (340, 40), (560, 260), (60, 160, 90), cv2.FILLED)
+    cv2.circle(image, (450, 150), 60, (30, 200, 230), cv2.FILLED)
+
+    boxes = np.array([[30, 30, 90, 260], [125, 35, 185, 245], [35, 335, 265, 565]], dtype=np.float32)
+    classes = np.array([1, 4, 3], dtype=np.float32)
+    scores = np.array([.99, .99, .99], dtype=np.float32)
+
+    return image, (boxes, classes, scores)
+
+
+def warm_up(detector):
+    """
+    Run a synthetic screenshot through every heavy stage of a request (detection, OCR, element analysis, SVG export)
+    so that imports, graph loading, first session run and Tesseract startup are paid before the first real request
+    :param detector: prediction.Detector of the worker
+    :return: warm-up duration in seconds
+    """
+
+    start = time.perf_counter()
+
+    image, detection_results = synthetic_screenshot()
+
+    # The cache is bypassed, the point is to actually run the session
+    detector.run_detection(image.copy())
+
+    ocr(image[30:90, 30:260])
+
+    # Fixed detection results, so that the text, button and image analysis paths all run whatever the model finds
+    output_dir = tempfile.mkdtemp()
+    try:
+        mockup = Mockup("warmup", image, detection_results)
+        mockup.translate_raw_results()
+        mockup.align_text_elements()
+        mockup.create_svg(output_dir)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return time.perf_counter() - start